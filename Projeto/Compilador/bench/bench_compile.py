@@ -0,0 +1,144 @@
+"""
+Módulo: bench_compile.py
+Descrição: Suite de benchmarks de débito (throughput) do compilador.
+Gera programas sintéticos (ver progen.py) variando cada parâmetro de tamanho
+(nº de statements, profundidade das expressões, nº de subprogramas, tamanho
+dos arrays e profundidade de aninhamento), mede compile_source (melhor de
+--repeat execuções) e escreve os resultados em JSON: linhas/s, MB/s,
+instruções geradas, etc.
+
+Modo de comparação: com --baseline, cada caso é comparado com o mesmo caso
+de um JSON anterior; uma quebra de linhas/s acima de --threshold (por omissão
+10%) é assinalada como regressão e o script termina com código 1.
+
+Uso:
+  python bench/bench_compile.py --out bench/results.json
+  python bench/bench_compile.py --baseline bench/results.json [--threshold 0.1]
+  python bench/bench_compile.py --quick
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from dataclasses import asdict, replace
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "bench"))
+
+from src.compiler import compile_source, warmup, COMPILER_VERSION
+from progen import GenParams, generate
+
+
+BASE = GenParams(statements=2000, expr_depth=3, subprograms=4, array_size=16, nesting=2)
+
+# Casos da suite: (nome, parâmetros). Cada grupo varia um único parâmetro.
+SUITE = (
+    [(f"statements={n}", replace(BASE, statements=n)) for n in (1000, 4000, 16000)]
+    + [(f"expr_depth={d}", replace(BASE, expr_depth=d)) for d in (1, 4, 6)]
+    + [(f"subprograms={s}", replace(BASE, subprograms=s)) for s in (0, 64, 256)]
+    + [(f"array_size={a}", replace(BASE, array_size=a)) for a in (4, 4096)]
+    + [(f"nesting={k}", replace(BASE, nesting=k)) for k in (0, 4, 6)]
+)
+
+
+def quick_suite():
+    """Versão reduzida da suite (programas ~10x mais pequenos), para verificações rápidas."""
+    return [(name, replace(p, statements=max(50, p.statements // 10))) for name, p in SUITE]
+
+
+def measure(params: GenParams, repeat: int) -> dict:
+    """Compila o programa gerado 'repeat' vezes e devolve as métricas da melhor execução."""
+    src = generate(params)
+    n_lines = src.count("\n")
+    n_bytes = len(src.encode("utf-8"))
+    best = float("inf")
+    vm_code = ""
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        vm_code = compile_source(src)
+        best = min(best, time.perf_counter() - t0)
+    instructions = sum(1 for line in vm_code.splitlines() if line and not line.endswith(":"))
+    return {
+        "params": asdict(params),
+        "lines": n_lines,
+        "bytes": n_bytes,
+        "seconds": best,
+        "lines_per_sec": n_lines / best,
+        "mb_per_sec": n_bytes / best / (1024 * 1024),
+        "instructions": instructions,
+    }
+
+
+def run_suite(cases, repeat: int) -> dict:
+    warmup()
+    compile_source(generate(replace(BASE, statements=20)))  # aquece caches do interpretador
+
+    results = {}
+    print(f"{'caso':<18} {'linhas':>8} {'tempo (s)':>10} {'linhas/s':>10} {'MB/s':>7}")
+    for name, params in cases:
+        r = measure(params, repeat)
+        results[name] = r
+        print(f"{name:<18} {r['lines']:>8} {r['seconds']:>10.3f} {r['lines_per_sec']:>10.0f} {r['mb_per_sec']:>7.3f}")
+    return {
+        "meta": {
+            "compiler_version": COMPILER_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> int:
+    """
+    Compara linhas/s caso a caso com a baseline.
+    :return: nº de regressões (quebras acima de 'threshold').
+    """
+    print(f"\n{'caso':<18} {'baseline':>10} {'atual':>10} {'variação':>9}")
+    regressions = 0
+    for name, cur in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            print(f"{name:<18} {'-':>10} {cur['lines_per_sec']:>10.0f} {'(novo)':>9}")
+            continue
+        delta = cur["lines_per_sec"] / base["lines_per_sec"] - 1
+        flag = ""
+        if delta < -threshold:
+            flag = "  REGRESSÃO"
+            regressions += 1
+        print(f"{name:<18} {base['lines_per_sec']:>10.0f} {cur['lines_per_sec']:>10.0f} {delta:>+8.1%}{flag}")
+    print(f"\n{regressions} regressão(ões) acima de {threshold:.0%}")
+    return regressions
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark de débito do compilador.")
+    ap.add_argument("--out", help="ficheiro JSON onde são escritos os resultados")
+    ap.add_argument("--baseline", help="JSON de uma execução anterior, para comparação")
+    ap.add_argument("--threshold", type=float, default=0.10,
+                    help="quebra relativa de linhas/s considerada regressão (por omissão, 0.10)")
+    ap.add_argument("--repeat", type=int, default=3, help="execuções por caso (conta a melhor)")
+    ap.add_argument("--quick", action="store_true", help="usa programas ~10x mais pequenos")
+    args = ap.parse_args()
+
+    current = run_suite(quick_suite() if args.quick else SUITE, args.repeat)
+    current["meta"]["quick"] = args.quick
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(current, indent=2), encoding="utf-8")
+        print(f"\nResultados escritos em {args.out}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        if compare(current, baseline, args.threshold):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
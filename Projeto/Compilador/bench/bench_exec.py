@@ -0,0 +1,114 @@
+"""
+Módulo: bench_exec.py
+Descrição: Benchmark de execução do código gerado (nº de instruções executadas).
+Compila os casos OK com output esperado (tests/expected), executa-os na VM local
+(src/vm.py) com o respetivo input (tests/inputs) e mostra, por programa, o nº de
+instruções executadas (dinâmicas) e o tamanho do código (estáticas).
+
+Com --baseline-dir, cada programa é também compilado pelo main.py de outra
+cópia do compilador (p.ex. extraída com 'git archive <commit>') e executado na
+mesma VM, para comparar as duas versões instrução a instrução (uma execução que
+exceda --max-steps, p.ex. um ciclo que não termina, aparece como "erro").
+Com --memoize, os programas são compilados com a memoização (src/memo.py) e a
+referência é a compilação com as opções por omissão.
+
+Uso: python bench/bench_exec.py [--baseline-dir DIR | --memoize] [--max-steps N] [--json] [nome ...]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.compiler import compile_source
+from src.context import CompilerOptions
+from src.vm import run_text, assemble, VMError
+
+TESTS_DIR = ROOT / "tests"
+OK_DIR = TESTS_DIR / "cases" / "ok"
+INPUTS_DIR = TESTS_DIR / "inputs"
+EXPECTED_DIR = TESTS_DIR / "expected"
+
+
+def cases(names=None):
+    """Casos OK com output esperado: lista de (nome, fonte, input)."""
+    out = []
+    for exp in sorted(EXPECTED_DIR.glob("*.out")):
+        name = exp.stem
+        if names and name not in names:
+            continue
+        inp = INPUTS_DIR / (name + ".in")
+        out.append((name, (OK_DIR / (name + ".pas")).read_text(encoding="utf-8"),
+                    inp.read_text(encoding="utf-8") if inp.exists() else ""))
+    return out
+
+
+def measure(vm_code: str, input_text: str, max_steps: int = None) -> dict:
+    """Instruções executadas (steps), tamanho do código e output; steps=None se a execução falhar."""
+    try:
+        output, steps = run_text(vm_code, input_text, max_steps=max_steps)
+    except VMError as e:
+        output, steps = f"erro: {e}", None
+    return {"steps": steps, "size": len(assemble(vm_code)), "output": output}
+
+
+def baseline_vm(baseline_dir: Path, name: str) -> str:
+    """Código VM de um caso compilado pelo main.py da cópia de referência."""
+    proc = subprocess.run([sys.executable, str(baseline_dir / "main.py"), str(OK_DIR / (name + ".pas"))],
+                          cwd=baseline_dir, capture_output=True, text=True, encoding="utf-8", check=True)
+    return proc.stdout
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Instruções executadas pelo código gerado, na VM local.")
+    ap.add_argument("names", nargs="*", help="casos a medir (por omissão, todos os que têm output esperado)")
+    ap.add_argument("--baseline-dir", help="outra cópia do compilador (com main.py), para comparação")
+    ap.add_argument("--memoize", action="store_true",
+                    help="compila com a memoização e compara com a compilação por omissão")
+    ap.add_argument("--json", action="store_true", help="escreve os resultados em JSON no stdout")
+    ap.add_argument("--max-steps", type=int, default=10_000_000,
+                    help="limite de instruções por execução (ex: ciclos que a referência não termina)")
+    args = ap.parse_args()
+
+    if args.baseline_dir and args.memoize:
+        ap.error("--baseline-dir e --memoize são incompatíveis")
+    base = Path(args.baseline_dir).resolve() if args.baseline_dir else None
+    compare = base is not None or args.memoize
+    results = {}
+    for name, src, inp in cases(args.names):
+        r = measure(compile_source(src, CompilerOptions(memoize=args.memoize)), inp, args.max_steps)
+        if compare:
+            ref = baseline_vm(base, name) if base is not None else compile_source(src)
+            b = measure(ref, inp, args.max_steps)
+            r["baseline_steps"], r["baseline_size"] = b["steps"], b["size"]
+            r["same_output"] = (b["output"] == r["output"])
+        del r["output"]
+        results[name] = r
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    header = f"{'programa':<38} {'executadas':>11} {'estáticas':>10}"
+    if compare:
+        header += f" {'referência':>11} {'Δ exec.':>8}"
+    print(header)
+    for name, r in results.items():
+        line = f"{name:<38} {r['steps'] or 'erro':>11} {r['size']:>10}"
+        if compare:
+            if r["steps"] and r["baseline_steps"]:
+                delta = f"{(r['steps'] - r['baseline_steps']) / r['baseline_steps']:>+8.1%}"
+            else:
+                delta = f"{'-':>8}"
+            line += f" {r['baseline_steps'] or 'erro':>11} {delta}"
+            if not r["same_output"]:
+                line += "  OUTPUT DIFERENTE"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Módulo: bench_lexer.py
+Descrição: Benchmark de débito dos motores léxicos.
+Compara o lexer do PLY (pascal_analex.py) com o lexer rápido (fastlex.py) em
+programas sintéticos (ver progen.py): tokens/s, MB/s e o impacto no tempo total
+de compile_source com cada motor.
+
+Uso: python bench/bench_lexer.py [--statements N ...] [--repeat R]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "bench"))
+
+from src import pascal_analex, fastlex
+from src.compiler import compile_source, warmup
+from src.context import CompilerOptions
+from progen import GenParams, generate
+
+
+ENGINES = {"ply": pascal_analex.lexer, "fast": fastlex.lexer}
+
+
+def lex_all(lexer_base, src: str) -> int:
+    lex = lexer_base.clone()
+    lex.lineno = 1
+    lex.input(src)
+    n = 0
+    token = lex.token
+    while token() is not None:
+        n += 1
+    return n
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark dos lexers (PLY vs fastlex).")
+    ap.add_argument("--statements", type=int, nargs="+", default=[2000, 8000, 32000])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    warmup()
+
+    print(f"{'statements':>10} {'MB':>6} {'tokens':>8} {'motor':>5} {'lex (s)':>8} {'Mtok/s':>7} "
+          f"{'MB/s':>6} {'compile (s)':>11}")
+    for n in args.statements:
+        src = generate(GenParams(statements=n))
+        mb = len(src.encode("utf-8")) / (1024 * 1024)
+        for name, base in ENGINES.items():
+            n_tokens = lex_all(base, src)
+            t_lex = best_of(lambda: lex_all(base, src), args.repeat)
+            options = CompilerOptions(lexer=name)
+            t_comp = best_of(lambda: compile_source(src, options), max(1, args.repeat - 1))
+            print(f"{n:>10} {mb:>6.2f} {n_tokens:>8} {name:>5} {t_lex:>8.3f} {n_tokens / t_lex / 1e6:>7.2f} "
+                  f"{mb / t_lex:>6.2f} {t_comp:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Módulo: bench_scaling.py
+Descrição: Benchmark de escalabilidade do compilador.
+Gera programas Pascal sintéticos com N statements e mede o tempo de
+compile_source para cada tamanho. Com o código representado como lista de
+instruções (IR), o tempo por statement deve manter-se aproximadamente constante
+(crescimento linear), ao contrário da concatenação de strings (quadrática).
+
+Uso: python bench/bench_scaling.py [N1 N2 ...]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.compiler import compile_source
+
+
+DEFAULT_SIZES = [12500, 25000, 50000, 100000]
+
+
+def make_program(n: int) -> str:
+    """
+    Gera um programa com n statements simples (atribuições, IFs e WHILEs curtos),
+    que exercitam as principais regras de geração de código.
+    """
+    lines = [
+        "program Bench;",
+        "var a, b, i: integer; v: array[1..10] of integer;",
+        "begin",
+        "  a := 0; b := 1; i := 0;",
+    ]
+    for k in range(n):
+        m = k % 4
+        if m == 0:
+            lines.append(f"  a := a + {k % 97} * b;")
+        elif m == 1:
+            lines.append(f"  if a > {k % 13} then b := b - 1 else b := b + 1;")
+        elif m == 2:
+            lines.append(f"  v[{k % 10 + 1}] := a mod 7;")
+        else:
+            lines.append("  while i < 0 do i := i + 1;")
+    lines.append("  writeln(a, b)")
+    lines.append("end.")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or DEFAULT_SIZES
+
+    # aquece (construção das tabelas LALR) para não contaminar a 1ª medição
+    compile_source(make_program(10))
+
+    print(f"{'statements':>12} {'tempo (s)':>10} {'us/stmt':>9}")
+    for n in sizes:
+        src = make_program(n)
+        t0 = time.perf_counter()
+        compile_source(src)
+        dt = time.perf_counter() - t0
+        print(f"{n:>12} {dt:>10.3f} {dt / n * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Módulo: bench_server.py
+Descrição: Benchmark do modo servidor (main.py --serve) contra um processo por compilação.
+Compila os mesmos N programas (casos OK dos testes, repetidos) de duas formas:
+- "processo por ficheiro": python main.py ficheiro.pas, uma vez por programa;
+- "servidor": todos os pedidos em linhas JSON para um único main.py --serve.
+Imprime o tempo total, o débito (compilações/s) e as latências por pedido
+reportadas pelo próprio servidor (pedido {"op": "stats"}).
+
+Uso: python bench/bench_server.py [-n N] [-j WORKERS]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+MAIN = str(ROOT / "main.py")
+OK_DIR = ROOT / "tests" / "cases" / "ok"
+
+
+def per_process(files) -> float:
+    t0 = time.perf_counter()
+    for f in files:
+        subprocess.run([sys.executable, MAIN, str(f)], stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - t0
+
+
+def via_server(files, workers: int):
+    requests = "".join(
+        json.dumps({"id": k, "source": f.read_text(encoding="utf-8")}) + "\n" for k, f in enumerate(files)
+    )
+    # o pedido de estatísticas só é lido depois de todas as compilações terem sido despachadas
+    stats_req = json.dumps({"id": "stats", "op": "stats"}) + "\n"
+    t0 = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, MAIN, "--serve", "-j", str(workers)], stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding="utf-8")
+    proc.stdin.write(requests)
+    proc.stdin.flush()
+    responses = [json.loads(proc.stdout.readline()) for _ in files]
+    elapsed = time.perf_counter() - t0
+    proc.stdin.write(stats_req)
+    proc.stdin.close()
+    stats = json.loads(proc.stdout.readline())["stats"]
+    proc.wait()
+    if not all(r["ok"] for r in responses):
+        raise SystemExit("O servidor devolveu erros para casos que deviam compilar.")
+    return elapsed, stats
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Servidor de compilação vs um processo por ficheiro.")
+    ap.add_argument("-n", type=int, default=64, help="nº de compilações (por omissão, 64)")
+    ap.add_argument("-j", "--jobs", type=int, default=1, help="workers do servidor (por omissão, 1)")
+    args = ap.parse_args()
+
+    cases = sorted(OK_DIR.glob("*.pas"))
+    files = [cases[k % len(cases)] for k in range(args.n)]
+
+    t_proc = per_process(files)
+    t_srv, stats = via_server(files, args.jobs)
+    print(f"{'modo':<24} {'total (s)':>10} {'compilações/s':>14}")
+    print(f"{'processo por ficheiro':<24} {t_proc:>10.3f} {args.n / t_proc:>14.1f}")
+    print(f"{'servidor (-j ' + str(args.jobs) + ')':<24} {t_srv:>10.3f} {args.n / t_srv:>14.1f}")
+    print(f"\nLatência por pedido no servidor: média {stats['mean_ms']:.2f} ms, p50 {stats['p50_ms']:.2f}, "
+          f"p90 {stats['p90_ms']:.2f}, p99 {stats['p99_ms']:.2f}, máx {stats['max_ms']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
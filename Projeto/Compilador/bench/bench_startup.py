@@ -0,0 +1,90 @@
+"""
+Módulo: bench_startup.py
+Descrição: Benchmark de arranque a frio do compilador (um processo por compilação).
+Mede o tempo de parede de várias execuções de cada cenário, num processo novo:
+- "python vazio": custo do próprio interpretador (referência);
+- "yacc + PLY lex": o arranque antigo (yacc.yacc() com reflexão da gramática,
+  import do parsetab.py e construção do master regex do lexer do PLY);
+- "main.py (congelado)": o arranque atual, com as tabelas congeladas e os
+  imports preguiçosos;
+- "main.py (referência)": com --baseline-dir, o main.py de outra cópia do
+  compilador (p.ex. extraída com 'git archive <commit>'), para comparação direta.
+A compilação em si é de um ficheiro pequeno, pelo que o tempo é quase todo de arranque.
+Os .pyc são escritos na primeira execução (aquecimento), como numa instalação normal,
+e as execuções dos vários cenários são intercaladas para repartir o ruído da máquina.
+
+Uso: python bench/bench_startup.py [--runs N] [--baseline-dir DIR] [ficheiro.pas]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_FILE = ROOT / "tests" / "cases" / "ok" / "HelloWorld.pas"
+
+LEGACY = """
+import sys
+sys.path.insert(0, {root!r})
+import ply.yacc as yacc
+from src import parser, pascal_analex, compiler
+from src.context import CompilerOptions
+parser._parser = yacc.yacc(module=parser, start="programa", debug=False, write_tables=False)
+pascal_analex.lexer
+with open({file!r}, encoding="utf-8") as f:
+    print(compiler.compile_source(f.read(), CompilerOptions(lexer="ply")))
+"""
+
+
+def scenarios(pas_file: Path, baseline_dir=None):
+    """Lista de (nome, comando, diretoria de trabalho)."""
+    cases = [
+        ("python vazio", [sys.executable, "-c", "pass"], ROOT),
+        ("yacc + PLY lex", [sys.executable, "-c", LEGACY.format(root=str(ROOT), file=str(pas_file))], ROOT),
+        ("main.py (congelado)", [sys.executable, str(ROOT / "main.py"), str(pas_file)], ROOT),
+    ]
+    if baseline_dir:
+        base = Path(baseline_dir).resolve()
+        cases.append(("main.py (referência)", [sys.executable, str(base / "main.py"), str(pas_file)], base))
+    return cases
+
+
+def run_once(cmd, cwd, env) -> float:
+    t0 = time.perf_counter()
+    subprocess.run(cmd, cwd=cwd, env=env, stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - t0
+
+
+def time_runs(cases, runs: int, env) -> dict:
+    """Tempos (s) de cada cenário; as execuções são intercaladas entre cenários."""
+    for _name, cmd, cwd in cases:
+        run_once(cmd, cwd, env)  # aquecimento (.pyc)
+    times = {name: [] for name, _cmd, _cwd in cases}
+    for _ in range(runs):
+        for name, cmd, cwd in cases:
+            times[name].append(run_once(cmd, cwd, env))
+    return times
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark de arranque a frio.")
+    ap.add_argument("file", nargs="?", default=str(DEFAULT_FILE), help="programa .pas compilado em cada execução")
+    ap.add_argument("--runs", type=int, default=10)
+    ap.add_argument("--baseline-dir", help="outra cópia do compilador (com main.py), para comparação")
+    args = ap.parse_args()
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    print(f"{'cenário':<22} {'mín (ms)':>9} {'mediana (ms)':>13}")
+    results = time_runs(scenarios(Path(args.file).resolve(), args.baseline_dir), args.runs, env)
+    for name, times in results.items():
+        print(f"{name:<22} {min(times) * 1000:>9.1f} {statistics.median(times) * 1000:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Módulo: progen.py
+Descrição: Gerador de programas Pascal sintéticos e escaláveis para benchmarks.
+O tamanho e a forma do programa são controlados por GenParams:
+- statements: nº de statements do programa principal;
+- expr_depth: profundidade das expressões aritméticas/booleanas;
+- subprograms: nº de funções (cada uma chama a anterior, sem recursão);
+- array_size: tamanho do array global;
+- nesting: profundidade dos FOR aninhados.
+
+Os programas são determinísticos (seed), semanticamente válidos e terminam
+sempre (ciclos com limites constantes e valores reduzidos com 'mod'), pelo
+que também podem ser executados na VM local.
+
+Uso: python bench/progen.py [--statements N] [...] > programa.pas
+"""
+
+import argparse
+import random
+from dataclasses import dataclass
+
+
+@dataclass
+class GenParams:
+    statements: int = 1000
+    expr_depth: int = 3
+    subprograms: int = 4
+    array_size: int = 16
+    nesting: int = 2
+    seed: int = 1
+
+
+N_GLOBALS = 6       # variáveis globais inteiras g0..g5
+LOOP_TRIPS = 3      # iterações de cada FOR gerado
+
+
+class ProgramGenerator:
+    """Gera o texto de um programa a partir de GenParams."""
+
+    def __init__(self, params: GenParams):
+        self.p = params
+        self.rnd = random.Random(params.seed)
+
+    # --- expressões ---
+
+    def int_expr(self, depth: int, names) -> str:
+        """Expressão inteira com a profundidade dada sobre as variáveis 'names'."""
+        r = self.rnd
+        if depth <= 0:
+            return r.choice(names) if r.random() < 0.6 else str(r.randint(0, 99))
+        a = self.int_expr(depth - 1, names)
+        b = self.int_expr(depth - 1, names)
+        op = r.choice(("+", "-", "*", "div", "mod"))
+        if op in ("div", "mod"):
+            return f"({a} {op} {r.randint(2, 9)})"
+        return f"({a} {op} {b})"
+
+    def bool_expr(self, depth: int, names) -> str:
+        r = self.rnd
+        cmp = f"{self.int_expr(max(0, depth - 1), names)} {r.choice(('<', '<=', '>', '>=', '=', '<>'))} {r.randint(0, 50)}"
+        if depth <= 1 or r.random() < 0.5:
+            return cmp
+        other = self.bool_expr(depth - 1, names)
+        return f"({cmp}) {r.choice(('and', 'or'))} ({other})"
+
+    # --- statements ---
+
+    def assign(self, names, indent) -> str:
+        g = self.rnd.randrange(N_GLOBALS)
+        return f"{indent}g{g} := {self.int_expr(self.p.expr_depth, names)} mod 1000;"
+
+    def array_store(self, names, indent, index=None) -> str:
+        idx = index or str(self.rnd.randint(1, self.p.array_size))
+        return f"{indent}arr[{idx}] := {self.int_expr(self.p.expr_depth, names)} mod 1000;"
+
+    def call(self, names, indent) -> str:
+        if not self.p.subprograms:
+            return self.assign(names, indent)
+        f = self.rnd.randrange(self.p.subprograms)
+        a = self.int_expr(1, names)
+        b = self.int_expr(1, names)
+        return f"{indent}g{self.rnd.randrange(N_GLOBALS)} := f{f}({a}, {b}) mod 1000;"
+
+    def if_stmt(self, names, indent) -> str:
+        cond = self.bool_expr(self.p.expr_depth, names)
+        return (f"{indent}if {cond} then\n{self.assign(names, indent + '  ')[:-1]}\n"
+                f"{indent}else\n{self.assign(names, indent + '  ')}")
+
+    def while_stmt(self, names, indent) -> str:
+        return (f"{indent}w := 0;\n"
+                f"{indent}while w < {LOOP_TRIPS} do\n"
+                f"{indent}begin\n"
+                f"{self.assign(names, indent + '  ')}\n"
+                f"{indent}  w := w + 1\n"
+                f"{indent}end;")
+
+    def for_nest(self, names, indent, level=1) -> str:
+        """FOR aninhados até 'nesting' níveis; o corpo mais interno usa os índices."""
+        i = f"i{level}"
+        inner_names = names + [i]
+        if level >= self.p.nesting:
+            body = (f"{self.array_store(inner_names, indent + '    ', index=f'(({i} - 1) mod {self.p.array_size}) + 1')}\n"
+                    f"{self.assign(inner_names, indent + '    ')}")
+        else:
+            body = self.for_nest(inner_names, indent + "    ", level + 1)
+        return (f"{indent}for {i} := 1 to {LOOP_TRIPS} do\n"
+                f"{indent}begin\n{body}\n{indent}end;")
+
+    def statement(self, k, names, indent="  ") -> str:
+        kind = k % 6
+        if kind == 0:
+            return self.assign(names, indent)
+        if kind == 1:
+            return self.if_stmt(names, indent)
+        if kind == 2:
+            return self.array_store(names, indent)
+        if kind == 3:
+            return self.call(names, indent)
+        if kind == 4 and self.p.nesting > 0:
+            return self.for_nest(names, indent)
+        return self.while_stmt(names, indent)
+
+    # --- programa ---
+
+    def function(self, k) -> str:
+        names = ["x", "y", "t"]
+        body = [f"  t := {self.int_expr(self.p.expr_depth, ['x', 'y'])} mod 1000;"]
+        if k > 0:
+            body.append(f"  t := t + f{k - 1}(y, t) mod 1000;")
+        body.append(f"  if {self.bool_expr(2, names)} then t := t - x mod 7;")
+        body.append(f"  f{k} := t")
+        return (f"function f{k}(x, y: integer): integer;\n"
+                f"var t: integer;\nbegin\n" + "\n".join(body) + "\nend;\n")
+
+    def generate(self) -> str:
+        p = self.p
+        globals_ = ", ".join(f"g{k}" for k in range(N_GLOBALS))
+        loops = "".join(f", i{k}" for k in range(1, p.nesting + 1))
+        out = [
+            "program Gen;",
+            f"var {globals_}, w{loops}: integer;",
+            f"    arr: array[1..{p.array_size}] of integer;",
+        ]
+        out += [self.function(k) for k in range(p.subprograms)]
+        out.append("begin")
+        out += [f"  g{k} := {k + 1};" for k in range(N_GLOBALS)]
+        names = [f"g{k}" for k in range(N_GLOBALS)]
+        out += [self.statement(k, names) for k in range(p.statements)]
+        out.append(f"  writeln({', '.join(names)}, arr[1])")
+        out.append("end.")
+        return "\n".join(out) + "\n"
+
+
+def generate(params: GenParams = None, **kw) -> str:
+    """Atalho: generate(statements=5000, nesting=3) -> texto do programa."""
+    return ProgramGenerator(params or GenParams(**kw)).generate()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Gera um programa Pascal sintético.")
+    defaults = GenParams()
+    for name, value in vars(defaults).items():
+        ap.add_argument(f"--{name.replace('_', '-')}", type=int, default=value)
+    args = ap.parse_args()
+    print(generate(GenParams(**vars(args))), end="")
+
+
+if __name__ == "__main__":
+    main()
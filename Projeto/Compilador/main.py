@@ -3,38 +3,275 @@ Módulo: main.py
 Descrição: Ponto de entrada principal do Compilador Pascal.
 Este script permite ao utilizador compilar um ficheiro .pas via linha de comandos,
 exibindo o código assembly gerado para a Máquina Virtual (VM) no terminal.
+
+Modo batch: com vários ficheiros e/ou diretorias (ou com -o), os programas são
+compilados em paralelo num pool de processos (um por core, por omissão), em que
+cada worker constrói o parser uma única vez. No fim é impresso um resumo com o
+tempo de cada ficheiro e as falhas.
+
+Modo servidor (--serve): um processo de longa duração, com as tabelas já
+carregadas, atende pedidos de compilação em linhas JSON (stdin/stdout ou um
+socket Unix com --socket); ver src/server.py.
+
+Com --stats, são impressas (no stderr) as estatísticas por fase da compilação:
+tokens, reduções por regra, tempo de lexing vs ações, pico de memória, etc.
+
+Para um arranque rápido, os módulos só necessários em alguns modos (pool de
+processos, cache, estatísticas, pathlib no modo batch) são importados apenas
+quando são usados. Com um único ficheiro e sem opções, nem o argparse é importado.
 """
 
+import os
 import sys
-from src.compiler import compile_source
+import time
 
-def main():
+from src.compiler import compile_source, warmup
+from src.context import CompilerOptions, BUILTIN_MODES, EVAL_FUEL, UNROLL_BUDGET, UNROLL_FACTOR
+
+
+def build_arg_parser():
+    """Define os argumentos aceites pela linha de comandos."""
+    import argparse
+    ap = argparse.ArgumentParser(
+        prog="main.py",
+        description="Compilador Pascal -> VM. Com um único ficheiro (sem -o), imprime o código VM no terminal.",
+    )
+    ap.add_argument("inputs", nargs="*", help="ficheiros .pas e/ou diretorias (procuradas recursivamente)")
+    ap.add_argument("-o", "--out-dir", help="diretoria onde são escritos os ficheiros .vm (modo batch)")
+    ap.add_argument("-j", "--jobs", type=int,
+                    help="nº de processos do pool (por omissão, nº de cores; com --serve, 1 no próprio processo)")
+    ap.add_argument("--no-peephole", action="store_true", help="desativa o otimizador peephole")
+    ap.add_argument("--no-check-elim", action="store_true",
+                    help="mantém o CHECK em todos os acessos a arrays (sem eliminação de bounds checks)")
+    ap.add_argument("--no-prune", action="store_true",
+                    help="mantém os subprogramas nunca chamados e as variáveis não usadas")
+    ap.add_argument("--eval-fuel", type=int, default=EVAL_FUEL, metavar="N",
+                    help=f"avalia em compilação as chamadas a funções puras com argumentos constantes, "
+                         f"com até N nós avaliados por chamada (por omissão, {EVAL_FUEL}; 0 desativa)")
+    ap.add_argument("--no-tailrec", action="store_true",
+                    help="mantém as chamadas recursivas finais (sem transformação em ciclos)")
+    ap.add_argument("--inline-budget", type=int, default=16, metavar="N",
+                    help="expande inline os subprogramas folha com até N nós (por omissão, 16; 0 desativa)")
+    ap.add_argument("--inline-report", action="store_true",
+                    help="mostra as decisões de inlining (no stderr)")
+    ap.add_argument("--unroll-budget", type=int, default=UNROLL_BUDGET, metavar="N",
+                    help=f"desenrola os FOR com limites constantes até N nós de código desenrolado "
+                         f"(por omissão, {UNROLL_BUDGET}; 0 desativa)")
+    ap.add_argument("--unroll-factor", type=int, default=UNROLL_FACTOR, metavar="N",
+                    help=f"fator do desenrolamento parcial dos FOR demasiado grandes para o total "
+                         f"(por omissão, {UNROLL_FACTOR}; menos de 2 desativa)")
+    ap.add_argument("--memoize", action="store_true",
+                    help="memoriza as funções recursivas puras de parâmetros integer numa tabela na heap")
+    ap.add_argument("--builtins", choices=BUILTIN_MODES, default="auto",
+                    help="round/abs: expansão inline, chamada a uma rotina partilhada ou escolha por tamanho (auto)")
+    ap.add_argument("--cache-dir", help="diretoria da cache de compilação (desativada por omissão)")
+    ap.add_argument("--cache-size", type=int, default=64, help="tamanho máximo da cache em MB (por omissão, 64)")
+    ap.add_argument("--stats", action="store_true",
+                    help="mostra estatísticas por fase da compilação (no stderr)")
+    ap.add_argument("--no-tracemalloc", action="store_true",
+                    help="com --stats, não mede o pico de memória (tempos mais fiéis)")
+    ap.add_argument("--serve", action="store_true",
+                    help="modo servidor: pedidos de compilação em linhas JSON no stdin/stdout (ver src/server.py)")
+    ap.add_argument("--socket", help="com --serve, escuta num socket Unix em vez do stdin/stdout")
+    return ap
+
+
+def open_cache(cache_dir, cache_size_mb):
+    """Cria a cache de compilação, se tiver sido pedida."""
+    if not cache_dir:
+        return None
+    from src.cache import CompileCache
+    return CompileCache(cache_dir, max_bytes=cache_size_mb * 1024 * 1024)
+
+
+def collect_sources(inputs):
     """
-    Função principal que gere o fluxo de execução via terminal.
-    
-    Fluxo:
-    1. Valida os argumentos da linha de comandos.
-    2. Lê o ficheiro de origem (.pas).
-    3. Chama o pipeline de compilação.
-    4. Imprime o resultado final (código VM).
+    Expande a lista de entradas em pares (ficheiro .pas, caminho relativo de saída).
+    As diretorias são percorridas recursivamente e mantêm a sua estrutura na saída.
     """
+    from pathlib import Path
+    jobs = []
+    for raw in inputs:
+        path = Path(raw)
+        if path.is_dir():
+            for f in sorted(path.rglob("*.pas")):
+                jobs.append((f, f.relative_to(path).with_suffix(".vm")))
+        elif path.is_file():
+            jobs.append((path, Path(path.name).with_suffix(".vm")))
+        else:
+            raise SystemExit(f"Entrada inexistente: {raw}")
+    return jobs
 
-    # Verifica se o utilizador passou o caminho do ficheiro como argumento
-    # Exemplo esperado: python main.py testes/meu_programa.pas
-    if len(sys.argv) != 2:
-        print("Uso: python main.py <ficheiro.pas>")
-        raise SystemExit(1)
 
-    # Recupera o caminho do ficheiro do primeiro argumento da lista sys.argv
-    path = sys.argv[1]
+# Opções, cache e modo de estatísticas de cada worker (definidos por _init_worker)
+_worker_options = None
+_worker_cache = None
+_worker_track_memory = None  # None: sem estatísticas; True/False: com/sem tracemalloc
+
+
+def _init_worker(options, cache_dir=None, cache_size_mb=64, track_memory=None):
+    """Inicializa um worker: guarda as opções, abre a cache e constrói o parser uma única vez."""
+    global _worker_options, _worker_cache, _worker_track_memory
+    _worker_options = options
+    _worker_cache = open_cache(cache_dir, cache_size_mb)
+    _worker_track_memory = track_memory
+    warmup()
+
+
+def new_stats(track_memory):
+    """CompileStats para uma compilação, ou None se não foram pedidas estatísticas."""
+    if track_memory is None:
+        return None
+    from src.stats import CompileStats
+    return CompileStats(track_memory=track_memory)
+
+
+def compile_file(src_path: str, out_path: str):
+    """
+    Compila um ficheiro e escreve o resultado (executado dentro de um worker).
+    :return: (caminho, sucesso, tempo em segundos, mensagem de erro ou None,
+              CompileStats ou None)
+    """
+    t0 = time.perf_counter()
+    stats = new_stats(_worker_track_memory)
+    try:
+        with open(src_path, "r", encoding="utf-8") as f:
+            source = f.read()
+        vm_code = compile_source(source, _worker_options, cache=_worker_cache, stats=stats)
+        out_parent = os.path.dirname(out_path)
+        if out_parent:
+            os.makedirs(out_parent, exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as f:
+            f.write(vm_code)
+        return src_path, True, time.perf_counter() - t0, None, stats
+    except Exception as e:
+        return src_path, False, time.perf_counter() - t0, f"{type(e).__name__}: {e}", None
+
+
+def run_batch(jobs, out_dir, n_workers, options, cache_dir=None, cache_size_mb=64, track_memory=None):
+    """
+    Compila todos os ficheiros em paralelo e imprime o resumo final.
+    Antes de começar, termina com erro se duas entradas forem escritas no mesmo
+    ficheiro de saída (ex: a/x.pas e b/x.pas com -o, ou uma diretoria e um
+    ficheiro dentro dela), em vez de dois workers escreverem no mesmo .vm.
+    :return: nº de ficheiros que falharam.
+    """
+    from pathlib import Path
+    tasks = []
+    sources_by_out = {}
+    for src, rel in jobs:
+        out = Path(out_dir) / rel if out_dir else src.with_suffix(".vm")
+        key = os.path.normcase(os.path.abspath(out))
+        if key in sources_by_out:
+            raise SystemExit(f"Saída repetida: {sources_by_out[key]} e {src} seriam escritos em {out}")
+        sources_by_out[key] = src
+        tasks.append((str(src), str(out)))
+
+    n_workers = max(1, min(n_workers, len(tasks)))
+    t0 = time.perf_counter()
+    init_args = (options, cache_dir, cache_size_mb, track_memory)
+    if n_workers == 1:
+        _init_worker(*init_args)
+        results = [compile_file(s, o) for s, o in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=init_args) as pool:
+            results = list(pool.map(compile_file, *zip(*tasks)))
+    wall = time.perf_counter() - t0
+
+    failed = [r for r in results if not r[1]]
+    print(f"{'estado':<6} {'tempo (s)':>9}  ficheiro")
+    for path, ok, dt, err, _stats in results:
+        print(f"{'OK' if ok else 'FAIL':<6} {dt:>9.3f}  {path}")
+    if failed:
+        print("\nFalhas:")
+        for path, _ok, _dt, err, _stats in failed:
+            print(f"  {path}: {err}")
+    if track_memory is not None:
+        total = new_stats(track_memory)
+        for r in results:
+            if r[4] is not None:
+                total.merge(r[4])
+        print("\nEstatísticas agregadas (ficheiros compilados com sucesso):", file=sys.stderr)
+        print(total.format(), file=sys.stderr)
+    print(
+        f"\nResumo: {len(results)} ficheiros, {len(results) - len(failed)} OK, {len(failed)} falharam "
+        f"| {wall:.2f}s de parede com {n_workers} processo(s)"
+    )
+    return len(failed)
+
+
+def compile_single(path, options, cache=None, track_memory=None, inline_report=False):
+    """
+    Compila um único ficheiro e imprime o código VM no terminal (e as
+    estatísticas e as decisões de inlining, se pedidas, no stderr).
+    """
     # Abre o ficheiro Pascal para leitura com codificação UTF-8
     with open(path, "r", encoding="utf-8") as f:
         source = f.read()
 
     # Invoca o compilador (compiler.py) para processar o código fonte
     # Esta função coordena o Lexer, Parser, Semântico e CodeGen
-    vm_code = compile_source(source)
+    stats = new_stats(track_memory)
+    report = {}
+    vm_code = compile_source(source, options, report=report, cache=cache, stats=stats)
     print(vm_code)
+    if stats is not None:
+        print(stats.format(), file=sys.stderr)
+    if inline_report:
+        from src.inline import format_decisions
+        print(format_decisions(report.get("inline", [])), file=sys.stderr)
+
+
+def main():
+    """
+    Função principal que gere o fluxo de execução via terminal.
+
+    Fluxo:
+    1. Valida os argumentos da linha de comandos.
+    2. Lê o(s) ficheiro(s) de origem (.pas).
+    3. Chama o pipeline de compilação.
+    4. Imprime o resultado final (código VM) ou, em modo batch, o resumo.
+    """
+
+    # Exemplo esperado: python main.py testes/meu_programa.pas
+    #                   python main.py testes/ outro.pas -o build/ -j 8 --cache-dir .plc_cache
+    #                   python main.py --serve [--socket /tmp/plc.sock] [-j 4]
+    argv = sys.argv[1:]
+    if len(argv) == 1 and not argv[0].startswith("-") and os.path.isfile(argv[0]):
+        # Caso mais comum (um ficheiro, sem opções): dispensa o argparse no arranque
+        compile_single(argv[0], CompilerOptions())
+        return
+
+    ap = build_arg_parser()
+    args = ap.parse_args(argv)
+    if args.serve:
+        # Sem -j, um único worker no próprio processo (menor latência)
+        from src.server import serve
+        stats = serve(args.jobs or 1, args.socket)
+        print(f"Servidor terminado: {stats.format()}", file=sys.stderr)
+        return
+    if not args.inputs:
+        ap.error("indique pelo menos um ficheiro .pas ou diretoria (ou use --serve)")
+    options = CompilerOptions(peephole=not args.no_peephole, check_elim=not args.no_check_elim,
+                              builtins=args.builtins, prune=not args.no_prune, tailrec=not args.no_tailrec,
+                              inline_budget=max(0, args.inline_budget), eval_fuel=max(0, args.eval_fuel),
+                              unroll_budget=max(0, args.unroll_budget), unroll_factor=max(0, args.unroll_factor),
+                              memoize=args.memoize)
+    track_memory = (not args.no_tracemalloc) if args.stats else None
+
+    single = len(args.inputs) == 1 and os.path.isfile(args.inputs[0]) and not args.out_dir
+    if single:
+        compile_single(args.inputs[0], options, open_cache(args.cache_dir, args.cache_size), track_memory,
+                       args.inline_report)
+        return
+
+    jobs = collect_sources(args.inputs)
+    if not jobs:
+        print("Nenhum ficheiro .pas encontrado.")
+        raise SystemExit(1)
+    if run_batch(jobs, args.out_dir, args.jobs or os.cpu_count() or 1, options, args.cache_dir, args.cache_size, track_memory):
+        raise SystemExit(1)
 
 if __name__ == "__main__":
     main()
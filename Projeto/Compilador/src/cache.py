@@ -0,0 +1,135 @@
+"""
+Módulo: cache.py
+Descrição: Cache em disco dos resultados de compilação, endereçada por conteúdo.
+A chave de cada entrada é um hash SHA-256 do código fonte, das opções de
+compilação e de uma "impressão digital" do compilador (assinatura LALR da
+gramática, versão do compilador e hash dos módulos em src/).
+Assim, qualquer alteração ao compilador invalida automaticamente as entradas antigas.
+
+Cada entrada guarda o código VM gerado (ou o erro de compilação) num ficheiro
+JSON. O tamanho total é limitado: quando é excedido, as entradas usadas há mais
+tempo (mtime, atualizado em cada acesso) são removidas (LRU).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+
+from . import parser as grammar
+from .tables import grammar_signature
+
+
+SRC_DIR = Path(__file__).resolve().parent
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_fingerprints = {}
+
+
+def compiler_fingerprint(version: str) -> str:
+    """
+    Impressão digital do compilador: assinatura da gramática LALR + versão +
+    hash do código dos módulos do compilador. Calculada uma vez por processo.
+    """
+    fp = _fingerprints.get(version)
+    if fp is None:
+        h = hashlib.sha256()
+        h.update(grammar_signature(grammar).encode("utf-8"))
+        h.update(version.encode("utf-8"))
+        for f in sorted(SRC_DIR.glob("*.py")):
+            h.update(f.name.encode("utf-8"))
+            h.update(f.read_bytes())
+        fp = h.hexdigest()
+        _fingerprints[version] = fp
+    return fp
+
+
+class CompileCache:
+    """
+    Cache LRU em disco, limitada em bytes.
+    Pode ser partilhada por vários processos: as escritas são atómicas
+    (ficheiro temporário + os.replace) e as remoções toleram corridas.
+    """
+
+    def __init__(self, directory, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.dir = Path(directory)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size = None  # tamanho total conhecido (calculado quando necessário)
+
+    def key(self, source: str, options, version: str) -> str:
+        """Chave da entrada: hash do fonte + opções + impressão digital do compilador."""
+        h = hashlib.sha256()
+        h.update(compiler_fingerprint(version).encode("utf-8"))
+        h.update(json.dumps(asdict(options), sort_keys=True).encode("utf-8"))
+        h.update(b"\0")
+        h.update(source.encode("utf-8"))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.dir / f"{key}.json"
+
+    def get(self, key: str):
+        """Devolve a entrada (dict) associada a 'key', ou None se não existir."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # marca como usada recentemente (LRU)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: dict) -> None:
+        """Guarda uma entrada e aplica a política de evicção se o limite for excedido."""
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        fd, tmp = tempfile.mkstemp(dir=self.dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, self._path(key))
+
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        out = []
+        for p in self.dir.glob("*.json"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            out.append((st.st_mtime, st.st_size, p))
+        return out
+
+    def _scan_size(self) -> int:
+        return sum(size for _mtime, size, _p in self._entries())
+
+    def evict(self) -> None:
+        """
+        Remove as entradas menos usadas recentemente até ficar abaixo do limite.
+        A entrada mais recente nunca é removida, mesmo que sozinha exceda o limite.
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _mtime, size, _p in entries)
+        for _mtime, size, p in entries[:-1]:
+            if total <= self.max_bytes:
+                break
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._size = total
@@ -3,8 +3,73 @@ Módulo: codegen.py
 Descrição: Este módulo é responsável pela geração de instruções Assembly para a Máquina Virtual.
 Faz a ponte entre a análise semântica e o ficheiro executável final (.vm), gerindo a 
 pilha, endereçamento de variáveis e controlo de fluxo (labels).
+
+O código é representado internamente por uma lista de instruções (IR) do tipo `Instr`
+(opcode + operandos). O texto .vm só é produzido uma vez, no fim, por `serialize`,
+o que evita concatenações repetidas de strings e permite que passes posteriores
+inspecionem as instruções sem voltar a fazer parsing do texto.
 """
 
+from .nodes import While, For, Repeat, Call
+from .tailrec import ACCUMULATORS
+from .prune import emitted
+
+# Pseudo-opcode usado para representar a definição de um label (ex: 'L1:')
+LABEL = "LABEL"
+
+
+class Instr:
+    """
+    Registo compacto de uma instrução da VM.
+    - op: opcode (ex: 'PUSHI', 'JZ') ou LABEL para definições de labels.
+    - args: tuplo de operandos (inteiros, floats, strings ou nomes de labels).
+    """
+    __slots__ = ("op", "args")
+
+    def __init__(self, op: str, args: tuple = ()):
+        self.op = op
+        self.args = args
+
+    def __eq__(self, other):
+        return isinstance(other, Instr) and self.op == other.op and self.args == other.args
+
+    def __hash__(self):
+        return hash((self.op, self.args))
+
+    def __repr__(self):
+        return f"Instr({format_instr(self)!r})"
+
+
+def ins(op: str, *args) -> Instr:
+    """Cria uma instrução (ex: ins('PUSHI', 1) -> 'PUSHI 1')."""
+    return Instr(op, args)
+
+
+def label(name: str) -> Instr:
+    """Cria a definição de um label (ex: label('L1') -> 'L1:')."""
+    return Instr(LABEL, (name,))
+
+
+def format_instr(i: Instr) -> str:
+    """Converte uma instrução para a sua representação textual na VM."""
+    if i.op == LABEL:
+        return f"{i.args[0]}:"
+    if not i.args:
+        return i.op
+    if i.op in ("PUSHS", "ERR"):
+        lit = i.args[0].replace('"', '\\"')
+        return f'{i.op} "{lit}"'
+    return f"{i.op} " + ", ".join(str(a) for a in i.args)
+
+
+def serialize(instrs) -> str:
+    """
+    Serializa uma sequência de instruções para texto .vm (uma instrução por linha).
+    É chamada uma única vez no fim da compilação.
+    """
+    return "\n".join(map(format_instr, instrs)) + "\n"
+
+
 class CodeGen:
     """
     Classe principal de acumulação e gestão de código assembly.
@@ -12,14 +77,20 @@ class CodeGen:
     nunca colidam entre diferentes estruturas de controlo (como IFs e WHILEs).
     """
     def __init__(self):
-        self.lines = [] # Lista que armazena sequencialmente as instruções geradas
+        self.instrs = [] # Lista que armazena sequencialmente as instruções (Instr) geradas
         self.lbl = 0 # Contador para garantir a unicidade de labels
 
-    def emit(self, s: str):
+    def emit(self, op: str, *args):
         """
-        Adiciona uma instrução ou um bloco de código bruto à lista de saída.
+        Adiciona uma instrução à lista de saída.
         """
-        self.lines.append(s)
+        self.instrs.append(Instr(op, args))
+
+    def extend(self, code):
+        """
+        Adiciona um bloco de instruções (lista de Instr) à lista de saída.
+        """
+        self.instrs.extend(code)
 
     def new_label(self, prefix="L"):
         """
@@ -39,15 +110,15 @@ class CodeGen:
         Escreve a definição de um label no código (ex: 'L1:').
         Utilizado como destino de instruções JUMP ou JZ.
         """
-        self.emit(f"{lab}:")
+        self.instrs.append(label(lab))
 
     def get(self) -> str:
         """
-        Compila todas as linhas armazenadas numa única string formatada,
+        Compila todas as instruções armazenadas numa única string formatada,
         pronta para ser escrita num ficheiro .vm.
         """
-        return "\n".join(self.lines) + "\n"
-    
+        return serialize(self.instrs)
+
 
 def gen_load_var(info):
     """
@@ -56,9 +127,9 @@ def gen_load_var(info):
     :param info: Dicionário contendo 'level' (escopo) e 'addr' (endereço na stack).
     """
     if info["level"] == "global":
-        return f"PUSHG {info['addr']}\n"
+        return [ins("PUSHG", info["addr"])]
     else:
-        return f"PUSHL {info['addr']}\n"
+        return [ins("PUSHL", info["addr"])]
 
 def gen_store_var(info):
     """
@@ -67,9 +138,9 @@ def gen_store_var(info):
     :param info: Dicionário contendo 'level' e 'addr'.
     """
     if info["level"] == "global":
-        return f"STOREG {info['addr']}\n"
+        return [ins("STOREG", info["addr"])]
     else:
-        return f"STOREL {info['addr']}\n"
+        return [ins("STOREL", info["addr"])]
 
 def push_default_for_type(t):
     """
@@ -81,11 +152,751 @@ def push_default_for_type(t):
     - boolean/int/char: 0
     """
     if t == "real":
-        return "PUSHF 0.0\n"
+        return [ins("PUSHF", 0.0)]
     if t == "string":
-        return 'PUSHS ""\n'
+        return [ins("PUSHS", "")]
     if t == "char":
-        return "PUSHI 0\n"
+        return [ins("PUSHI", 0)]
+    if t == "boolean":
+        return [ins("PUSHI", 0)]
+    return [ins("PUSHI", 0)]
+
+
+def push_const(t, c):
+    """
+    Gera a instrução que empilha diretamente um valor constante conhecido
+    em tempo de compilação (resultado de constant folding).
+    - real: PUSHF | string: PUSHS | integer/char/boolean: PUSHI
+    """
+    if t == "real":
+        return [ins("PUSHF", float(c))]
+    if t == "string":
+        return [ins("PUSHS", c)]
     if t == "boolean":
-        return "PUSHI 0\n"
-    return "PUSHI 0\n"
\ No newline at end of file
+        return [ins("PUSHI", 1 if c else 0)]
+    return [ins("PUSHI", int(c))]
+
+
+"""
+GERAÇÃO DE CÓDIGO (PASSE SOBRE A AST ANOTADA)
+"""
+
+# Instruções dos operadores relacionais (inteiros, reais)
+REL_INSTRS = {
+    "<": ("INF", "FINF"),
+    "<=": ("INFEQ", "FINFEQ"),
+    ">": ("SUP", "FSUP"),
+    ">=": ("SUPEQ", "FSUPEQ"),
+}
+
+# Negação de cada comparação de ordem: not (a < b) == (a >= b)
+NEGATED_REL = {"<": ">=", "<=": ">", ">": "<=", ">=": "<"}
+
+# Tipos representados por um inteiro na VM (a - b é 0 sse a = b)
+INT_LIKE = ("integer", "char", "boolean")
+
+# Builtins com expansão inline longa (saltos e labels próprios) que podem ser
+# ligados como rotinas de suporte (runtime) partilhadas: chave -> prefixo do label.
+# A rotina recebe o argumento em fp[-1] e deixa o resultado no mesmo slot, pelo
+# que a chamada é só 'PUSHA rotina; CALL' (sem POP).
+RUNTIME_ROUTINES = {"round": "RTROUND", "abs_i": "RTABSI", "abs_f": "RTABSF"}
+
+
+def runtime_key(call):
+    """Chave (em RUNTIME_ROUTINES) de uma chamada a round/abs."""
+    if call.name == "round":
+        return "round"
+    return "abs_i" if call.args[0].type == "integer" else "abs_f"
+
+
+def builtin_inline(key, La, Lb):
+    """
+    Expansão de round/abs sobre o valor no topo da pilha, com os labels La/Lb.
+    - round(x) = FTOI(x + 0.5) se x >= 0, senão FTOI(x - 0.5)
+    - abs(x) = 0 - x se x < 0
+    """
+    if key == "round":
+        return [
+            ins("DUP", 1), ins("PUSHF", 0.0), ins("FINF"), ins("JZ", La),  # x<0.0 ?
+            ins("PUSHF", 0.5), ins("FSUB"), ins("FTOI"), ins("JUMP", Lb),
+            label(La), ins("PUSHF", 0.5), ins("FADD"), ins("FTOI"),
+            label(Lb),
+        ]
+    if key == "abs_i":
+        zero, less, sub = ins("PUSHI", 0), ins("INF"), ins("SUB")
+    else:
+        zero, less, sub = ins("PUSHF", 0.0), ins("FINF"), ins("FSUB")
+    return [
+        ins("DUP", 1), zero, less, ins("JZ", La),
+        zero, ins("SWAP"), sub, ins("JUMP", Lb),
+        label(La), label(Lb),
+    ]
+
+# Instruções dos operadores aritméticos (inteiros, reais)
+ARITH_INSTRS = {
+    "+": ("ADD", "FADD"),
+    "-": ("SUB", "FSUB"),
+    "*": ("MUL", "FMUL"),
+}
+
+
+class Emitter:
+    """
+    Passe de geração de código sobre a AST já anotada por sem.Analyzer.
+    Cada método devolve a lista de instruções (Instr) do seu nó; o código dos
+    subprogramas é acumulado em ctx.subprog_code (os aninhados primeiro) e o
+    programa final em ctx.cg.
+
+    As expressões com valor constante conhecido (anotação 'const') são
+    substituídas por um único PUSHI/PUSHF/PUSHS (constant folding efetivo).
+    Os labels de cada estrutura só são pedidos depois de gerado o código dos
+    seus filhos.
+
+    Com check_elim, os acessos a arrays marcados como seguros pela análise
+    (VarRef.safe) não levam CHECK; ctx.checks_removed/checks_kept contam-nos.
+
+    'builtins' escolhe como são gerados round/abs (ver RUNTIME_ROUTINES):
+    'inline' expande-os em cada chamada, 'call' chama sempre a rotina partilhada
+    e 'auto' decide por tamanho (ver plan_runtime). Só as rotinas efetivamente
+    chamadas são ligadas ao programa (ctx.runtime_linked).
+    """
+
+    def __init__(self, ctx, check_elim: bool = True, builtins: str = "auto"):
+        self.ctx = ctx
+        self.cg = ctx.cg
+        self.check_elim = check_elim
+        self.builtins = builtins
+        self.routine_calls = set()  # id() das chamadas geradas como CALL da rotina
+        self.routine_labels = {}  # chave da rotina -> label (só as usadas)
+        self.tail_labels = {}  # id(TailLoop) -> label do início do corpo (ver tailrec.py)
+        self._visitors = {}
+
+    def gen(self, node):
+        cls = type(node)
+        fn = self._visitors.get(cls)
+        if fn is None:
+            fn = self._visitors[cls] = getattr(self, "gen_" + cls.__name__)
+        return fn(node)
+
+    def expr(self, e):
+        """Código de uma expressão: constante dobrada ou o código do nó."""
+        if e.const is not None:
+            return push_const(e.type, e.const)
+        return self.gen(e)
+
+    # PROGRAMA E DECLARAÇÕES
+
+    def gen_Program(self, prog):
+        ctx = self.ctx
+        self.plan_runtime(prog)
+        for d in prog.decls:
+            self.gen(d)
+        body = self.gen(prog.body)
+
+        # O programa final é acumulado no CodeGen; a serialização para texto
+        # acontece uma única vez no fim (ver compile_source).
+        cg = self.cg
+        cg.emit("JUMP", "MAIN")
+        cg.extend(ctx.subprog_code)
+        for key, lab in self.routine_labels.items():
+            cg.extend(self.runtime_routine(key, lab))
+        ctx.runtime_linked = list(self.routine_labels)
+        cg.emit_label("MAIN")
+        cg.emit("PUSHN", prog.nglobals)      # aloca globais primeiro
+        cg.extend(ctx.global_init_code)      # aloca arrays e guarda o endereço em gp[addr]
+        cg.emit("START")                     # fp fica “depois” das globais
+        cg.extend(body)
+        cg.emit("STOP")
+        return cg.instrs
+
+    def gen_VarDecl(self, decl):
+        """Alocação dos arrays declarados: PUSHI tamanho; ALLOCN; STOREG/STOREL addr."""
+        code = []
+        for info in decl.symbols:
+            t = info["type"]
+            if isinstance(t, tuple) and t[0] == "array":
+                (lo, hi) = t[1]
+                code += [ins("PUSHI", hi - lo + 1), ins("ALLOCN")] + gen_store_var(info)
+        if decl.symbols and decl.symbols[0]["level"] == "global":
+            self.ctx.global_init_code += code
+            return []
+        return code
+
+    def gen_Subprogram(self, sub):
+        # Convenção:
+        # Caller empilha: [ret_slot][args...], CALL
+        # Callee no fim guarda fp[0] em fp[-(k+1)] (slot do caller) e RETURN
+        if not sub.live:
+            return []  # nunca é chamado (ver prune.py)
+        local_init = []
+        for d in sub.decls:
+            local_init += self.gen(d)
+        loop = sub.loop
+        if loop is not None:
+            self.tail_labels[id(loop)] = self.cg.new_label("TAIL")
+        body = self.gen(sub.body)
+
+        code = self.ctx.subprog_code
+        code.append(label(sub.name))
+        code.append(ins("PUSHN", sub.nlocals))
+        code += local_init
+        if sub.memo is not None:
+            Lmiss = self.cg.new_label("MEMOMISS")
+            Lret = self.cg.new_label("MEMORET")
+            code += self.memo_lookup(sub, Lmiss, Lret)
+        if loop is not None:
+            # as chamadas recursivas finais saltam para aqui (o acumulador só é iniciado uma vez)
+            if loop.op is not None:
+                code += [ins("PUSHI", ACCUMULATORS[loop.op])] + gen_store_var(loop.acc)
+            code.append(label(self.tail_labels[id(loop)]))
+        code += body
+        if loop is not None and loop.op is not None:
+            # retorno = acc op f
+            code += gen_load_var(loop.acc) + [ins("PUSHL", 0), ins(ARITH_INSTRS[loop.op][0]), ins("STOREL", 0)]
+        if sub.memo is not None:
+            code += self.memo_store(sub, Lret)
+        if sub.kind == "func":
+            code.append(ins("PUSHL", 0))
+            code.append(ins("STOREL", -(len(sub.params) + 1)))
+        code.append(ins("RETURN"))
+        return []
+
+    def memo_lookup(self, sub, Lmiss, Lret):
+        """
+        Prólogo de uma função memorizada (ver memo.py): calcula a posição da
+        entrada dos argumentos (-1 fora do domínio) e, se a entrada já estiver
+        preenchida, devolve o valor guardado sem executar o corpo.
+        """
+        m = sub.memo
+        k = len(sub.params)
+        self.ctx.global_init_code += [ins("PUSHI", 2 * m.entries), ins("ALLOCN")] + gen_store_var(m.table)
+        code = [ins("PUSHI", -1)] + gen_store_var(m.index)
+        for p in range(-k, 0):  # 0 <= p < domain
+            code += [ins("PUSHL", p), ins("PUSHI", 0), ins("SUPEQ"), ins("JZ", Lmiss)]
+            code += [ins("PUSHL", p), ins("PUSHI", m.domain), ins("INF"), ins("JZ", Lmiss)]
+        code.append(ins("PUSHL", -k))
+        for p in range(-k + 1, 0):
+            code += [ins("PUSHI", m.domain), ins("MUL"), ins("PUSHL", p), ins("ADD")]
+        code += [ins("PUSHI", 2), ins("MUL")] + gen_store_var(m.index)
+        code += gen_load_var(m.table) + gen_load_var(m.index) + [ins("LOADN"), ins("JZ", Lmiss)]
+        code += gen_load_var(m.table) + gen_load_var(m.index) + [ins("PUSHI", 1), ins("ADD"), ins("LOADN")]
+        code += [ins("STOREL", 0), ins("JUMP", Lret), label(Lmiss)]
+        return code
+
+    def memo_store(self, sub, Lret):
+        """Epílogo de uma função memorizada: guarda o resultado (fp[0]) na entrada, se houver."""
+        m = sub.memo
+        code = gen_load_var(m.index) + [ins("PUSHI", 0), ins("SUPEQ"), ins("JZ", Lret)]
+        code += gen_load_var(m.table) + gen_load_var(m.index) + [ins("PUSHI", 1), ins("STOREN")]
+        code += gen_load_var(m.table) + gen_load_var(m.index) + [ins("PUSHI", 1), ins("ADD"), ins("PUSHL", 0), ins("STOREN")]
+        code.append(label(Lret))
+        return code
+
+    # STATEMENTS
+
+    def gen_Compound(self, node):
+        code = []
+        for s in node.stmts:
+            code += self.gen(s)
+        return code
+
+    def element(self, ref):
+        """
+        Endereço de um elemento de array 'v[i]': base, índice, CHECK lo,hi (só
+        se o acesso não for provadamente seguro) e conversão para offset 0-based.
+        """
+        info = ref.symbol
+        idx = ref.index
+        (lo, hi) = info["type"][1]
+        code = gen_load_var(info)  # base address
+        if self.check_elim and ref.safe:
+            self.ctx.checks_removed += 1
+            if idx.const is not None:
+                return code + [ins("PUSHI", idx.const - lo)]
+            code += self.expr(idx)
+        else:
+            self.ctx.checks_kept += 1
+            code += self.expr(idx)
+            code.append(ins("CHECK", lo, hi))  # bounds check dinâmico
+        if lo != 0:
+            code += [ins("PUSHI", lo), ins("SUB")]
+        return code
+
+    def gen_Assign(self, node):
+        info = node.symbol
+        target = node.target
+        if node.tail is not None:
+            return self.tail_call(node.tail)
+
+        # x := expr
+        if target.index is None:
+            return self.expr(node.expr) + gen_store_var(info)
+
+        # v[i] := expr  (só arrays; a indexação de strings é read-only)
+        code = self.element(target)
+        code += self.expr(node.expr)  # rhs
+        code.append(ins("STOREN"))
+        return code
+
+    def gen_If(self, node):
+        then = self.gen(node.then)
+        els = self.gen(node.els) if node.els is not None else None
+
+        # condição constante: só sobrevive o ramo que é executado
+        c = node.cond.const
+        if c is not None:
+            return then if c else (els or [])
+
+        # a condição salta diretamente para o else (ou para o fim) quando é falsa
+        if els is None:
+            Lend = self.cg.new_label("IFEND")
+            return self.branch(node.cond, Lend, False) + then + [label(Lend)]
+
+        Lelse = self.cg.new_label("IFELSE")
+        Lend = self.cg.new_label("IFEND")
+        return (
+            self.branch(node.cond, Lelse, False) +
+            then + [ins("JUMP", Lend)] +
+            [label(Lelse)] + els +
+            [label(Lend)]
+        )
+
+    def gen_While(self, node):
+        # condição constante: 'while false' desaparece; 'while true' dispensa o teste
+        c = node.cond.const
+        if c is not None and not c:
+            return []
+        body = self.gen(node.body)
+        if c is not None:
+            Lstart = self.cg.new_label("WSTART")
+            return [label(Lstart)] + body + [ins("JUMP", Lstart)]
+
+        # Rotação do ciclo (do-while guardado): a condição é testada uma vez à
+        # entrada (salta para o fim se for falsa) e depois no fim do corpo, que
+        # salta para trás enquanto for verdadeira. O código da condição é
+        # gerado duas vezes, cada uma com os seus labels.
+        Lbody = self.cg.new_label("WBODY")
+        Lend = self.cg.new_label("WEND")
+        return (
+            self.branch(node.cond, Lend, False) +
+            [label(Lbody)] + body +
+            self.branch(node.cond, Lbody, True) +
+            [label(Lend)]
+        )
+
+    def gen_For(self, node):
+        if node.unroll is not None:
+            return self.unrolled_for(node)
+        info = node.symbol
+        start = self.expr(node.start)
+        end = self.expr(node.end)
+        body = self.gen(node.body)
+        up = (node.direction == "TO")
+
+        # início e fim são avaliados uma vez, antes do ciclo; um fim não constante
+        # fica no slot escondido node.limit
+        if node.limit is not None:
+            code = start + end + gen_store_var(node.limit) + gen_store_var(info)
+            end = gen_load_var(node.limit)
+        else:
+            code = start + gen_store_var(info)
+
+        # Limites constantes: o teste de entrada é decidido já aqui
+        first, last = node.start.const, node.end.const
+        enters = None
+        if first is not None and last is not None:
+            enters = (first <= last) if up else (first >= last)
+            if not enters:
+                return code  # o corpo nunca é executado
+
+        # Ciclo rodado (do-while guardado): teste à entrada ('i <= fim' com TO,
+        # 'i >= fim' com DOWNTO) e, no fim do corpo, um único salto condicional
+        # para trás enquanto o limite não foi ultrapassado.
+        Lbody = self.cg.new_label("FORBODY")
+        Lend = self.cg.new_label("FOREND")
+        if not enters:
+            code += gen_load_var(info) + end
+            code.append(ins("INFEQ") if up else ins("SUPEQ"))
+            code.append(ins("JZ", Lend))
+
+        code.append(label(Lbody))
+        code += body
+
+        code += gen_load_var(info)
+        code.append(ins("PUSHI", 1))
+        code.append(ins("ADD") if up else ins("SUB"))
+        code += gen_store_var(info)
+
+        code += gen_load_var(info) + end
+        code.append(ins("SUP") if up else ins("INF"))  # i > fim ? / i < fim ?
+        code.append(ins("JZ", Lbody))
+        code.append(label(Lend))
+        return code
+
+    def unrolled_for(self, node):
+        """
+        FOR desenrolado (ver unroll.py): no parcial, um ciclo rodado sobre blocos
+        de 'factor' cópias do corpo (sem teste à entrada, há sempre dois blocos
+        ou mais); depois, as cópias das restantes iterações e o valor final da
+        variável de controlo.
+        """
+        u, info = node.unroll, node.symbol
+        up = (node.direction == "TO")
+        code = []
+        if u.factor is not None:
+            Lbody = self.cg.new_label("FORBODY")
+            code += self.expr(node.start) + gen_store_var(info)
+            code.append(label(Lbody))
+            for b in u.block:
+                code += self.gen(b)
+            code += gen_load_var(info) + [ins("PUSHI", u.factor), ins("ADD") if up else ins("SUB")]
+            code += gen_store_var(info)
+            code += gen_load_var(info) + [ins("PUSHI", u.last), ins("SUP") if up else ins("INF"), ins("JZ", Lbody)]
+        for b in u.rest:
+            code += self.gen(b)
+        if u.factor is None or u.rest:
+            code += [ins("PUSHI", u.final)] + gen_store_var(info)
+        return code
+
+    def gen_Repeat(self, node):
+        body = self.gen(node.body)
+
+        # condição constante: 'until true' executa o corpo uma vez; 'until false' nunca testa
+        c = node.cond.const
+        if c is not None and c:
+            return body
+
+        Lstart = self.cg.new_label("RSTART")
+        return [label(Lstart)] + body + self.branch(node.cond, Lstart, False)
+
+    def call_args(self, args, params):
+        """Argumentos pela ordem dos parâmetros, com conversão integer->real quando necessário."""
+        code = []
+        for e, (_pname, param_t, _pline) in zip(args, params):
+            code += self.expr(e)
+            if param_t == "real" and e.type == "integer":
+                code.append(ins("ITOF"))
+        return code
+
+    def gen_ProcCall(self, node):
+        info = node.symbol
+        if node.tail is not None:
+            return self.tail_call(node.tail)
+        if node.inline is not None:
+            return self.inline_call(node)
+        if node.args is None:
+            return [ins("PUSHA", info.get("label", node.name)), ins("CALL")]
+        code = self.call_args(node.args, info["params"])
+        code += [ins("PUSHA", info.get("label", node.name)), ins("CALL")]
+        code.append(ins("POP", len(node.args)))  # limpar args
+        return code
+
+    def tail_call(self, tail):
+        """
+        Chamada recursiva final (ver tailrec.py): acumula a parcela, avalia os
+        argumentos, guarda-os nos slots dos parâmetros, repõe a 0 os locais que
+        o exigem e salta para o início do corpo.
+        """
+        loop = tail.loop
+        params = loop.symbol["params"]
+        code = []
+        if tail.extra is not None:
+            code += gen_load_var(loop.acc) + self.expr(tail.extra)
+            code += [ins(ARITH_INSTRS[loop.op][0])] + gen_store_var(loop.acc)
+        code += self.call_args(tail.call.args or [], params)
+        k = len(params)
+        for i in reversed(range(k)):
+            code.append(ins("STOREL", i - k))
+        for slot in loop.reset:
+            code += [ins("PUSHI", 0)] + gen_store_var(slot)
+        code.append(ins("JUMP", self.tail_labels[id(loop)]))
+        return code
+
+    def inline_call(self, node):
+        """
+        Chamada expandida inline (ver inline.py): os argumentos são avaliados
+        pela ordem da chamada e guardados nos slots dos parâmetros, segue-se o
+        corpo copiado e, nas funções, o valor do slot de retorno.
+        """
+        exp = node.inline
+        code = self.call_args(node.args or [], node.symbol["params"])
+        for slot in reversed(exp.params):
+            code += gen_store_var(slot)
+        for slot in exp.init:
+            code += [ins("PUSHI", 0)] + gen_store_var(slot)
+        code += self.gen(exp.body)
+        if exp.result is not None:
+            code += gen_load_var(exp.result)
+        return code
+
+    def gen_Writeln(self, node):
+        code = []
+        for e in node.args:
+            t = e.type
+            code += self.expr(e)
+            if t == "integer" or t == "boolean":
+                code.append(ins("WRITEI"))
+            elif t == "real":
+                code.append(ins("WRITEF"))
+            elif t == "string":
+                code.append(ins("WRITES"))
+            elif t == "char":
+                code.append(ins("WRITECHR"))
+        code.append(ins("WRITELN"))
+        return code
+
+    def gen_Readln(self, node):
+        code = []
+        for lv in node.targets:
+            info = lv.symbol
+            t = lv.type
+            if lv.index is None:
+                code.append(ins("READ"))
+                if t == "integer":
+                    code.append(ins("ATOI"))
+                elif t == "real":
+                    code.append(ins("ATOF"))
+                code += gen_store_var(info)
+                continue
+
+            code += self.element(lv)
+            code.append(ins("READ"))
+            if t == "integer":
+                code.append(ins("ATOI"))
+            elif t == "real":
+                code.append(ins("ATOF"))
+            code.append(ins("STOREN"))
+        return code
+
+    # CONDIÇÕES
+
+    def branch(self, e, target, when):
+        """
+        Código de uma condição usada num salto: salta para 'target' quando o
+        valor de 'e' é 'when' (True/False) e segue para a instrução seguinte no
+        caso contrário. not/and/or e as comparações saltam diretamente para os
+        destinos, sem materializar o 0/1 na pilha; as restantes expressões
+        booleanas (variáveis, chamadas, ...) são calculadas e testadas com JZ.
+        """
+        if e.const is not None:
+            return [ins("JUMP", target)] if bool(e.const) == when else []
+
+        op = getattr(e, "op", None)
+        if op == "not":
+            return self.branch(e.operand, target, not when)
+
+        if op in ("and", "or"):
+            # 'and' falso / 'or' verdadeiro: qualquer operando decide o salto
+            if when == (op == "or"):
+                return self.branch(e.left, target, when) + self.branch(e.right, target, when)
+            # caso contrário, o 1º operando pode decidir o resultado oposto e
+            # salta por cima do teste do 2º
+            right = self.branch(e.right, target, when)
+            Lskip = self.cg.new_label("OR_SKIP" if op == "or" else "AND_SKIP")
+            return self.branch(e.left, Lskip, not when) + right + [label(Lskip)]
+
+        if op in ("=", "<>"):
+            left, right = e.left, e.right
+            on_equal = (op == "=") == when
+            if left.type in INT_LIKE and right.type in INT_LIKE:
+                # comparação com 0: o JZ testa diretamente o outro operando
+                if left.const == 0:
+                    left, right = right, left
+                if right.const == 0:
+                    return self.expr(left) + ([] if on_equal else [ins("NOT")]) + [ins("JZ", target)]
+                if not on_equal:
+                    return self.expr(left) + self.expr(right) + [ins("EQUAL"), ins("JZ", target)]
+                # salta na igualdade: 'a - b' é 0
+                return self.expr(left) + self.expr(right) + [ins("SUB"), ins("JZ", target)]
+            code = self.gen(e)  # EQUAL (com promoção int->real) e NOT em '<>'
+            if op == "<>":
+                code.pop()
+            return code + ([ins("NOT")] if on_equal else []) + [ins("JZ", target)]
+
+        if op in REL_INSTRS:
+            # o JZ salta quando a comparação dá 0: para saltar quando é
+            # verdadeira, testa-se a comparação negada
+            if when:
+                op = NEGATED_REL[op]
+            use_float = (e.left.type == "real" or e.right.type == "real")
+            code = self.promoted(e.left, use_float) + self.promoted(e.right, use_float)
+            return code + [ins(REL_INSTRS[op][1 if use_float else 0]), ins("JZ", target)]
+
+        code = self.expr(e)
+        if when:
+            code.append(ins("NOT"))
+        code.append(ins("JZ", target))
+        return code
+
+    # EXPRESSÕES
+
+    def gen_Literal(self, node):
+        return push_const(node.type, node.const)
+
+    def gen_VarRef(self, node):
+        info = node.symbol
+        if node.index is None:
+            return gen_load_var(info)
+
+        if node.string_indexed:
+            return gen_load_var(info) + self.expr(node.index) + [ins("PUSHI", 1), ins("SUB"), ins("CHARAT")]
+        return self.element(node) + [ins("LOADN")]
+
+    def gen_UnOp(self, node):
+        x = self.expr(node.operand)
+        if node.op == "not":
+            return x + [ins("NOT")]
+        if node.type == "integer":
+            return [ins("PUSHI", 0)] + x + [ins("SUB")]
+        return [ins("PUSHF", 0.0)] + x + [ins("FSUB")]
+
+    def promoted(self, e, to_real):
+        """Código de um operando, convertido para real (ITOF) se for integer e to_real."""
+        code = self.expr(e)
+        if to_real and e.type == "integer":
+            code.append(ins("ITOF"))
+        return code
+
+    def gen_BinOp(self, node):
+        op = node.op
+        left, right = node.left, node.right
+
+        if op == "or":
+            l, r = self.expr(left), self.expr(right)
+            Ltrue = self.cg.new_label("OR_TRUE")
+            Lend = self.cg.new_label("OR_END")
+            # lhs != 0 -> resultado true sem avaliar rhs
+            return (l + [ins("JZ", Ltrue), ins("PUSHI", 1), ins("JUMP", Lend), label(Ltrue)] +
+                    r + [label(Lend)])
+
+        if op == "and":
+            l, r = self.expr(left), self.expr(right)
+            Lfalse = self.cg.new_label("AND_FALSE")
+            Lend = self.cg.new_label("AND_END")
+            # lhs == 0 -> false sem avaliar rhs
+            return (l + [ins("JZ", Lfalse)] + r +
+                    [ins("JUMP", Lend), label(Lfalse), ins("PUSHI", 0), label(Lend)])
+
+        t1, t2 = left.type, right.type
+        numeric = (t1 in ("integer", "real") and t2 in ("integer", "real"))
+
+        if op in ("=", "<>"):
+            # promoção int->real quando os tipos numéricos diferem
+            mixed = numeric and t1 != t2
+            code = self.promoted(left, mixed) + self.promoted(right, mixed)
+            code.append(ins("EQUAL"))
+            if op == "<>":
+                code.append(ins("NOT"))
+            return code
+
+        if op in REL_INSTRS:
+            use_float = (t1 == "real" or t2 == "real")
+            code = self.promoted(left, use_float) + self.promoted(right, use_float)
+            code.append(ins(REL_INSTRS[op][1 if use_float else 0]))
+            return code
+
+        if op in ARITH_INSTRS:
+            to_real = (node.type == "real")
+            code = self.promoted(left, to_real) + self.promoted(right, to_real)
+            code.append(ins(ARITH_INSTRS[op][1 if to_real else 0]))
+            return code
+
+        if op == "/":
+            return self.promoted(left, True) + self.promoted(right, True) + [ins("FDIV")]
+
+        # div / mod
+        return self.expr(left) + self.expr(right) + [ins("DIV" if op == "div" else "MOD")]
+
+    def gen_Call(self, node):
+        info = node.symbol
+        if info["kind"] == "builtin_func":
+            return self.builtin_call(node)
+
+        if node.inline is not None:
+            return self.inline_call(node)
+
+        # slot de retorno tipado + args + CALL ; POP args ; o retorno fica no topo
+        code = push_default_for_type(info["ret"])
+        code += self.call_args(node.args, info["params"])
+        code += [ins("PUSHA", info.get("label", node.name)), ins("CALL")]
+        code.append(ins("POP", len(node.args)))
+        return code
+
+    def builtin_call(self, node):
+        name = node.name
+        args = node.args
+        x = self.expr(args[0])
+        t0 = args[0].type
+
+        if name == "length":
+            return x + [ins("STRLEN")]  # strings (o de um array é constante)
+        if name == "concat":
+            return x + self.expr(args[1]) + [ins("CONCAT")]
+        if name == "ord":
+            return x  # char já é um inteiro ASCII: no-op
+        if name == "chr":
+            return x + [ins("CHECK", 0, 255)]  # no-op, com CHECK 0..255 por robustez
+        if name == "odd":
+            # odd(x) := (x mod 2) <> 0
+            return x + [ins("PUSHI", 2), ins("MOD"), ins("PUSHI", 0), ins("EQUAL"), ins("NOT")]
+        if name == "trunc":
+            return x + [ins("FTOI")]
+
+        # round / abs: rotina partilhada ou expansão inline
+        key = runtime_key(node)
+        if id(node) in self.routine_calls:
+            return x + [ins("PUSHA", self.routine_label(key)), ins("CALL")]
+        if key == "round":
+            labels = (self.cg.new_label("ROUND_POS"), self.cg.new_label("ROUND_END"))
+        elif key == "abs_i":
+            labels = (self.cg.new_label("ABS_I_OK"), self.cg.new_label("ABS_I_END"))
+        else:
+            labels = (self.cg.new_label("ABS_F_OK"), self.cg.new_label("ABS_F_END"))
+        return x + builtin_inline(key, *labels)
+
+    # ROTINAS DE SUPORTE (RUNTIME)
+
+    def plan_runtime(self, prog):
+        """
+        Escolhe as chamadas a round/abs geradas como CALL da rotina partilhada.
+        Em modo 'auto', as chamadas dentro de ciclos são sempre expandidas
+        (evitam o custo de CALL/RETURN em cada iteração); as restantes usam a
+        rotina quando, para esse builtin, a rotina mais as chamadas ocupam menos
+        instruções do que as expansões inline: (S + 3) + 2N < S * N. As chamadas
+        são as do código gerado (prune.emitted), incluindo as das expansões
+        inline e das cópias dos FOR desenrolados; o bloco de um FOR desenrolado
+        parcialmente (ver unroll.py) também é um ciclo.
+        """
+        if self.builtins == "inline":
+            return
+        sites = {}  # chave -> chamadas candidatas
+        in_loops = set()
+        for n in emitted(prog):
+            if isinstance(n, (While, Repeat)):
+                in_loops.update(id(c) for c in emitted(n) if isinstance(c, Call))
+            elif isinstance(n, For):
+                loop = n.unroll.block if n.unroll is not None else [n.body]
+                in_loops.update(id(c) for b in loop for c in emitted(b) if isinstance(c, Call))
+            elif isinstance(n, Call) and n.const is None and n.name in ("round", "abs") \
+                    and n.symbol["kind"] == "builtin_func":
+                sites.setdefault(runtime_key(n), []).append(n)
+        for key, calls in sites.items():
+            if self.builtins == "auto":
+                calls = [c for c in calls if id(c) not in in_loops]
+                size = sum(1 for i in builtin_inline(key, "_", "_") if i.op != LABEL)
+                if (size + 3) + 2 * len(calls) >= size * len(calls):
+                    continue
+            self.routine_calls.update(id(c) for c in calls)
+
+    def routine_label(self, key):
+        """Label da rotina 'key', que passa a ser ligada ao programa."""
+        lab = self.routine_labels.get(key)
+        if lab is None:
+            lab = self.routine_labels[key] = self.cg.new_label(RUNTIME_ROUTINES[key])
+        return lab
+
+    def runtime_routine(self, key, lab):
+        """Código da rotina: o mesmo da expansão inline, sobre o argumento em fp[-1]."""
+        labels = (self.cg.new_label(RUNTIME_ROUTINES[key] + "A"), self.cg.new_label(RUNTIME_ROUTINES[key] + "B"))
+        return ([label(lab), ins("PUSHL", -1)] + builtin_inline(key, *labels) +
+                [ins("STOREL", -1), ins("RETURN")])
@@ -2,14 +2,41 @@
 Módulo: compiler.py
 Descrição: Atua como o ponto de entrada principal para a lógica de compilação.
 Este ficheiro configura o contexto, inicializa as funções pré-definidas (built-ins)
-e coordena a interação entre o Lexer e o Parser.
+e coordena o pipeline: parse (AST, ver nodes.py) -> análise semântica
+(sem.Analyzer, que também desenrola os FOR, ver unroll.py) -> recursividade final (tailrec.py) -> expansão inline (inline.py)
+-> eliminação de código não usado (prune.py) -> memoização (memo.py, opcional)
+-> geração de código (codegen.Emitter) -> peephole -> serialização.
+
+Cada compilação é independente (contexto, tabela de símbolos, CodeGen e clone do
+lexer próprios); apenas as tabelas LALR são partilhadas, em modo só de leitura.
+Por isso, a mesma instância de Compiler (ou compile_source) pode ser usada em
+simultâneo por várias threads.
+
+Opcionalmente, um CompileStats (ver stats.py) recolhe tempos por fase, contagens
+de tokens/reduções, pico de memória e nº de instruções geradas.
 """
 
-from .context import CompilerContext
-from .sem import SymbolTable, BUILTIN_FUNCS
-from .codegen import CodeGen
-from .parser import build_parser
-from .pascal_analex import lexer
+import sys
+import time
+
+from .context import CompilerContext, CompilerOptions, EVAL_FUEL, UNROLL_BUDGET, UNROLL_FACTOR
+from .sem import SymbolTable, SemanticError, BUILTIN_FUNCS, Analyzer
+from .codegen import CodeGen, Emitter, serialize
+from . import peephole
+from .tailrec import tail_calls
+from .inline import inline_calls
+from .prune import prune
+from .memo import candidates, memoize
+from .parser import build_parser, parse_program, load_tables, SyntaxParseError
+
+# Versão do compilador (faz parte da chave da cache de compilação, ver cache.py)
+COMPILER_VERSION = "1.3"
+
+# Erros de compilação (diagnósticos) que podem ser guardados e repetidos pela cache
+DIAGNOSTIC_ERRORS = {
+    "SemanticError": SemanticError,
+    "SyntaxParseError": SyntaxParseError,
+}
 
 
 def init_builtins(ctx: CompilerContext):
@@ -21,34 +48,213 @@ def init_builtins(ctx: CompilerContext):
     for name in BUILTIN_FUNCS:
         ctx.symtab.declare(name, {"kind": "builtin_func"}, lineno=0, declaring_builtin=True)
 
-def compile_source(source: str) -> str:
+def warmup():
     """
-    Coordena o pipeline de compilação para transformar o código fonte em Assembly VM.
-    
-    1. Instancia a Tabela de Símbolos (st) e o Gerador de Código (gen).
-    2. Cria o Contexto do Compilador (_ctx) que partilha estes objetos entre as fases.
-    3. Inicializa os built-ins e configura o Parser e o Lexer.
-    4. Executa o parse, que despoleta a geração de código via regras da gramática.
-    
-    :param source: String contendo o código Pascal.
-    :return: String com o código assembly final gerado.
+    Prepara o processo atual para compilar (constrói as tabelas LALR partilhadas).
+    Útil em workers de um pool, para que o custo seja pago uma vez por processo.
     """
+    load_tables()
 
-    # Inicialização das estruturas base
-    st = SymbolTable()
-    gen = CodeGen()
-    _ctx = CompilerContext(symtab=st, cg=gen)
 
-    # Garante que o estado do contexto está limpo (ex: contadores de endereços)
+def new_context() -> CompilerContext:
+    """Contexto novo (tabela de símbolos com os built-ins e CodeGen vazio) para uma compilação."""
+    _ctx = CompilerContext(symtab=SymbolTable(), cg=CodeGen())
     _ctx.reset()
     init_builtins(_ctx)
+    return _ctx
+
+
+def analyze(prog, ctx: CompilerContext = None, eval_fuel: int = EVAL_FUEL,
+            unroll_budget: int = UNROLL_BUDGET, unroll_factor: int = UNROLL_FACTOR) -> CompilerContext:
+    """
+    Análise semântica de uma AST (ver sem.Analyzer), num contexto novo se não for dado;
+    'eval_fuel' limita a avaliação das chamadas a funções puras (0 desativa) e
+    'unroll_budget'/'unroll_factor' o desenrolamento dos FOR (ver unroll.py).
+    Pode ser repetida sobre a mesma árvore: as anotações são sempre reescritas.
+    :return: o contexto, pronto para a geração de código.
+    """
+    ctx = ctx or new_context()
+    Analyzer(ctx, eval_fuel, unroll_budget, unroll_factor).visit(prog)
+    return ctx
+
+
+def generate(prog, ctx: CompilerContext, options: CompilerOptions = None) -> list:
+    """
+    Geração de código de uma AST já analisada em 'ctx' (lista de Instr, antes do peephole),
+    depois da transformação das chamadas recursivas finais em ciclos (se options.tailrec),
+    da expansão inline dos subprogramas pequenos (se options.inline_budget > 0)
+    da eliminação de subprogramas e variáveis não usados (se options.prune)
+    e da memoização das funções recursivas puras (se options.memoize).
+    """
+    options = options or CompilerOptions()
+    memo = candidates(prog) if options.memoize else []
+    if options.tailrec:
+        tail_calls(prog, ctx, skip=memo)
+    inline_calls(prog, ctx, options.inline_budget)
+    if options.prune:
+        ctx.pruned = prune(prog, ctx)
+    if options.memoize:
+        memoize(prog, ctx, memo)
+    return Emitter(ctx, check_elim=options.check_elim, builtins=options.builtins).gen(prog)
+
+
+class Compiler:
+    """
+    Interface orientada a objetos do compilador.
+    Guarda apenas as opções de compilação (e a cache opcional); todo o estado de
+    uma compilação é criado de novo em cada chamada a compile(), o que a torna reentrante.
+    """
 
-    # Constrói o parser injetando o contexto para que as ações semânticas 
-    # tenham acesso à tabela de símbolos e ao gerador de código.
-    parser, _lexer = build_parser(_ctx)
+    def __init__(self, options: CompilerOptions = None, cache=None):
+        self.options = options or CompilerOptions()
+        self.cache = cache  # CompileCache opcional (ver cache.py)
 
-    # Reinicia a contagem de linhas para mensagens de erro precisas
-    _lexer.lineno = 1
+    def compile(self, source: str, report: dict = None, stats: "CompileStats" = None,
+                messages: list = None) -> str:
+        """
+        Compila 'source', consultando primeiro a cache (se existir).
+        Numa entrada em cache, devolve o código guardado ou volta a lançar o
+        mesmo erro de compilação; caso contrário compila e guarda o resultado.
+        Os avisos da compilação (ex: caracteres ilegais, ver fastlex.py) são
+        recolhidos numa lista própria desta compilação, guardados na entrada e
+        repetidos em cada hit; são acrescentados a 'messages', se for dada, ou
+        impressos no stdout no fim da compilação.
+        Se forem pedidas estatísticas (stats), a cache é ignorada, já que uma
+        entrada em cache não tem fases para medir.
+        """
+        warnings = []
+        try:
+            return self._compile_cached(source, report, stats, warnings)
+        finally:
+            if messages is not None:
+                messages.extend(warnings)
+            else:
+                sys.stdout.write("".join(m + "\n" for m in warnings))
 
-    # O parser.parse retorna a string final acumulada pelo CodeGen
-    return parser.parse(source, lexer=_lexer)
+    def _compile_cached(self, source: str, report: dict, stats: "CompileStats", warnings: list) -> str:
+        """Corpo de compile(): os avisos são acrescentados a 'warnings'."""
+        if stats is not None:
+            from .stats import MemoryTracker  # só importado quando pedido (arranque rápido)
+            t0 = time.perf_counter()
+            try:
+                with MemoryTracker(stats):
+                    return self._compile(source, report, stats, warnings)
+            finally:
+                stats.total_time = time.perf_counter() - t0
+
+        if self.cache is None:
+            return self._compile(source, report, messages=warnings)
+
+        key = self.cache.key(source, self.options, COMPILER_VERSION)
+        entry = self.cache.get(key)
+        if entry is not None:
+            warnings.extend(entry.get("messages", []))
+            if report is not None:
+                report.update(entry.get("report") or {})
+                report["cache"] = "hit"
+            if entry["ok"]:
+                return entry["code"]
+            raise DIAGNOSTIC_ERRORS[entry["error_type"]](entry["message"])
+
+        local_report = {}
+        try:
+            code = self._compile(source, local_report, messages=warnings)
+        except tuple(DIAGNOSTIC_ERRORS.values()) as e:
+            self.cache.put(key, {"ok": False, "error_type": type(e).__name__, "message": str(e),
+                                 "messages": list(warnings)})
+            raise
+        self.cache.put(key, {"ok": True, "code": code, "report": local_report, "messages": list(warnings)})
+        if report is not None:
+            report.update(local_report)
+            report["cache"] = "miss"
+        return code
+
+    def _compile(self, source: str, report: dict = None, stats: "CompileStats" = None,
+                 messages: list = None) -> str:
+        """
+        Coordena o pipeline de compilação para transformar o código fonte em Assembly VM.
+
+        1. Obtém um parser e um lexer próprios desta compilação e constrói a AST.
+        2. Cria o Contexto do Compilador (_ctx), com a Tabela de Símbolos e os built-ins.
+        3. Análise semântica: declara os símbolos e anota tipos/constantes na AST.
+        4. Geração de código: percorre a AST anotada e produz as instruções (IR).
+        5. Aplica o otimizador peephole (se ativo) sobre as instruções geradas.
+
+        :param source: String contendo o código Pascal.
+        :param report: Dicionário opcional onde são registadas estatísticas das otimizações
+                       (ex: report["peephole"]["removed"] = nº de instruções removidas).
+        :param stats: CompileStats opcional, preenchido com as medições de cada fase.
+        :param messages: Lista opcional onde o lexer acrescenta os seus avisos (sem ela, impressos).
+        :return: String com o código assembly final gerado.
+        """
+        options = self.options
+
+        # Parser (cópia leve sobre as tabelas partilhadas) e lexer (clone)
+        # exclusivos desta compilação.
+        parser, _lexer = build_parser(options.lexer)
+        _lexer.messages = messages
+
+        # Instrumentação (só quando são pedidas estatísticas)
+        tokenfunc = None
+        if stats is not None:
+            from .stats import timed_tokenfunc, instrument_productions
+            stats.lines = source.count("\n") + 1
+            stats.source_bytes = len(source.encode("utf-8"))
+            instrument_productions(parser, stats)
+            tokenfunc = timed_tokenfunc(_lexer, stats)
+        clock = time.perf_counter
+
+        # As ações da gramática apenas constroem a AST
+        t0 = clock()
+        prog = parse_program(source, tokenfunc=tokenfunc, parser=parser, lexer=_lexer)
+        t_parse = clock()
+        _ctx = analyze(prog, eval_fuel=options.eval_fuel, unroll_budget=options.unroll_budget,
+                       unroll_factor=options.unroll_factor)
+        t_sem = clock()
+        code = generate(prog, _ctx, options)
+        t1 = clock()
+        if report is not None:
+            report["bounds"] = {"removed": _ctx.checks_removed, "kept": _ctx.checks_kept}
+            report["evaluated"] = _ctx.calls_evaluated
+            report["runtime"] = list(_ctx.runtime_linked)
+            report["pruned"] = dict(_ctx.pruned)
+            report["tailrec"] = list(_ctx.tailrec)
+            report["inline"] = [dict(e) for e in _ctx.inline_log]
+            report["memoized"] = list(_ctx.memoized)
+
+        # Otimização peephole entre o parse e a serialização
+        if options.peephole:
+            code, peep = peephole.optimize(code)
+            if report is not None:
+                report["peephole"] = peep
+        t2 = clock()
+
+        # A serialização para texto .vm é feita uma única vez, no fim.
+        text = serialize(code)
+
+        if stats is not None:
+            stats.parse_time = t_parse - t0
+            stats.sem_time = t_sem - t_parse
+            stats.codegen_time = t1 - t_sem
+            stats.peephole_time = t2 - t1
+            stats.serialize_time = clock() - t2
+            stats.instructions = peephole.count_instrs(code)
+            stats.checks_removed = _ctx.checks_removed
+            stats.checks_kept = _ctx.checks_kept
+        return text
+
+
+def compile_source(source: str, options: CompilerOptions = None, report: dict = None, cache=None,
+                   stats: "CompileStats" = None, messages: list = None) -> str:
+    """
+    Atalho funcional: compila 'source' com as opções dadas (ver Compiler.compile).
+
+    :param source: String contendo o código Pascal.
+    :param options: Opções de compilação (CompilerOptions); por omissão, todas ativas.
+    :param report: Dicionário opcional para estatísticas das otimizações.
+    :param cache: CompileCache opcional; evita recompilar fontes já compiladas.
+    :param stats: CompileStats opcional com as medições por fase (ver stats.py).
+    :param messages: Lista opcional para os avisos da compilação; sem ela, são impressos.
+    :return: String com o código assembly final gerado.
+    """
+    return Compiler(options, cache).compile(source, report=report, stats=stats, messages=messages)
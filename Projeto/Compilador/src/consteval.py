@@ -0,0 +1,221 @@
+"""
+Módulo: consteval.py
+Descrição: Avaliação em tempo de compilação de chamadas a funções puras.
+Usado pela análise semântica (sem.Analyzer): uma chamada a uma função do
+utilizador pura, com todos os argumentos constantes, é avaliada por um pequeno
+interpretador da AST anotada e passa a ter o resultado como constante
+(anotação 'const'), gerado como um único PUSHI/PUSHF/PUSHS.
+
+Um subprograma é puro quando o seu resultado só depende dos argumentos e a
+chamada não tem efeitos visíveis:
+- não usa writeln/readln;
+- não lê nem escreve variáveis globais;
+- não recebe arrays (passados por referência);
+- só chama builtins, a si próprio e outros subprogramas puros.
+
+O interpretador segue a semântica do código gerado (div/mod de Pascal, chars
+como códigos ASCII, locais a 0 como no PUSHN, 'for' com o fim avaliado uma vez)
+e desiste (EvalError), deixando a chamada para a execução, quando a avaliação
+falharia na VM (divisão por zero, índice fora dos limites, chr fora de 0..255)
+ou quando esgota o combustível ('fuel': nº máximo de nós avaliados), o que
+impede que um ciclo infinito bloqueie a compilação.
+"""
+
+from .nodes import (Compound, Assign, If, While, For, Repeat, ProcCall, Writeln, Readln,
+                    Literal, VarRef, Call, BinOp, UnOp, walk)
+from .sem import int_div, int_mod, fold_builtin, is_array_type, SemanticError
+from .context import EVAL_FUEL
+
+
+class EvalError(Exception):
+    """A chamada não pode ser avaliada em tempo de compilação (fica para a execução)."""
+    pass
+
+
+def is_pure(sub) -> bool:
+    """'sub' é puro (ver a descrição do módulo); os subprogramas chamados já foram analisados."""
+    if any(is_array_type(t) for (_n, t, _l) in sub.symbol["params"]):
+        return False
+    for n in walk(sub.body):
+        if isinstance(n, (Writeln, Readln)):
+            return False
+        if isinstance(n, (VarRef, For)) and n.symbol["level"] == "global":
+            return False
+        if isinstance(n, (Call, ProcCall)) and n.symbol is not sub.symbol:
+            if n.symbol["kind"] != "builtin_func" and not n.symbol.get("pure"):
+                return False
+    return True
+
+
+class Evaluator:
+    """
+    Interpretador da AST anotada para chamadas a subprogramas puros.
+    'subprograms' associa id(info) de cada subprograma do utilizador a
+    (nó Subprogram, infos dos parâmetros, info do retorno ou None).
+    """
+
+    def __init__(self, subprograms: dict, fuel: int = EVAL_FUEL):
+        self.subprograms = subprograms
+        self.fuel = fuel
+
+    def tick(self):
+        self.fuel -= 1
+        if self.fuel < 0:
+            raise EvalError("combustível esgotado")
+
+    def call(self, info, args: list):
+        """Resultado de chamar o subprograma 'info' com os valores 'args'."""
+        sub, params, ret = self.subprograms[id(info)]
+        env = {}
+        for pinfo, v in zip(params, args):
+            env[id(pinfo)] = float(v) if pinfo["type"] == "real" else v
+        self.exec(sub.body, env)
+        if ret is None:
+            return None
+        result = env.get(id(ret), 0)
+        return float(result) if ret["type"] == "real" else result
+
+    # STATEMENTS
+
+    def exec(self, node, env):
+        self.tick()
+        if isinstance(node, Compound):
+            for s in node.stmts:
+                self.exec(s, env)
+        elif isinstance(node, Assign):
+            value = self.eval(node.expr, env)
+            if node.target.index is None:
+                env[id(node.symbol)] = float(value) if node.symbol["type"] == "real" else value
+            else:
+                array, pos = self.element(node.target, env)
+                array[pos] = value
+        elif isinstance(node, If):
+            taken = node.then if self.eval(node.cond, env) else node.els
+            if taken is not None:
+                self.exec(taken, env)
+        elif isinstance(node, While):
+            while self.eval(node.cond, env):
+                self.exec(node.body, env)
+        elif isinstance(node, Repeat):
+            while True:
+                self.exec(node.body, env)
+                if self.eval(node.cond, env):
+                    break
+        elif isinstance(node, For):
+            self.exec_for(node, env)
+        elif isinstance(node, ProcCall):
+            self.call(node.symbol, [self.eval(a, env) for a in node.args or []])
+        else:
+            raise EvalError(f"statement não suportado: {type(node).__name__}")
+
+    def exec_for(self, node, env):
+        key = id(node.symbol)
+        up = (node.direction == "TO")
+        env[key] = self.eval(node.start, env)
+        end = self.eval(node.end, env)
+        if not (env[key] <= end if up else env[key] >= end):
+            return
+        while True:
+            self.exec(node.body, env)
+            env[key] += 1 if up else -1
+            if env[key] > end if up else env[key] < end:
+                return
+
+    # EXPRESSÕES
+
+    def element(self, ref, env):
+        """(lista, posição 0-based) do elemento 'v[i]' de um array local."""
+        info = ref.symbol
+        (lo, hi) = info["type"][1]
+        i = self.eval(ref.index, env)
+        if not lo <= i <= hi:
+            raise EvalError(f"índice {i} fora de {lo}..{hi}")
+        array = env.get(id(info))
+        if array is None:
+            array = env[id(info)] = [0] * (hi - lo + 1)  # ALLOCN
+        return array, i - lo
+
+    def eval(self, e, env):
+        self.tick()
+        if e.const is not None:
+            return e.const
+        if isinstance(e, VarRef):
+            if e.string_indexed:
+                s, i = env.get(id(e.symbol)), self.eval(e.index, env)
+                if not isinstance(s, str) or not 1 <= i <= len(s):
+                    raise EvalError("indexação de string inválida")
+                return ord(s[i - 1])
+            if e.index is not None:
+                array, pos = self.element(e, env)
+                return array[pos]
+            value = env.get(id(e.symbol), 0)  # PUSHN inicia os locais a 0
+            if e.symbol["type"] == "string" and not isinstance(value, str):
+                raise EvalError("string local sem valor")
+            return value
+        if isinstance(e, UnOp):
+            x = self.eval(e.operand, env)
+            return (not x) if e.op == "not" else -x
+        if isinstance(e, BinOp):
+            return self.eval_binop(e, env)
+        if isinstance(e, Call):
+            args = [self.eval(a, env) for a in e.args]
+            if e.symbol["kind"] == "builtin_func":
+                try:
+                    value = fold_builtin(e.name, args, e.line)
+                except SemanticError as err:
+                    raise EvalError(str(err)) from None
+                if value is None:
+                    raise EvalError(f"builtin não suportado: {e.name}")
+                return value
+            return self.call(e.symbol, args)
+        if isinstance(e, Literal):
+            return e.const
+        raise EvalError(f"expressão não suportada: {type(e).__name__}")
+
+    def eval_binop(self, e, env):
+        op = e.op
+        a = self.eval(e.left, env)
+        if op == "and":
+            return bool(a) and bool(self.eval(e.right, env))
+        if op == "or":
+            return bool(a) or bool(self.eval(e.right, env))
+        b = self.eval(e.right, env)
+        if op == "+":
+            return a + b
+        if op == "-":
+            return a - b
+        if op == "*":
+            return a * b
+        if op in ("/", "div", "mod") and b == 0:
+            raise EvalError("divisão por zero")
+        if op == "/":
+            return a / b
+        if op == "div":
+            return int_div(a, b)
+        if op == "mod":
+            return int_mod(a, b)
+        if op == "=":
+            return a == b
+        if op == "<>":
+            return a != b
+        if op == "<":
+            return a < b
+        if op == "<=":
+            return a <= b
+        if op == ">":
+            return a > b
+        return a >= b
+
+
+def evaluate_call(subprograms: dict, info, args: list, fuel: int = EVAL_FUEL):
+    """
+    Valor de uma chamada a uma função pura com argumentos constantes, ou None
+    se não puder ser avaliada em tempo de compilação (ver Evaluator).
+    """
+    try:
+        value = Evaluator(subprograms, fuel).call(info, args)
+    except (EvalError, RecursionError):
+        return None
+    if info["ret"] == "string" and not isinstance(value, str):
+        return None
+    return value
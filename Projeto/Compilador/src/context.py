@@ -2,61 +2,124 @@
 Módulo: context.py
 Descrição: Gere o estado e o contexto de compilação.
 Este módulo utiliza Dataclasses para manter o rasto de endereços, blocos de código
-pendentes e estados de subprogramas (funções/procedimentos), permitindo o suporte
+acumulados e estados de subprogramas (funções/procedimentos), permitindo o suporte
 a âmbitos aninhados e verificação de retorno de funções.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Optional
+
+# Modos de geração de round/abs (CompilerOptions.builtins, ver codegen.Emitter)
+BUILTIN_MODES = ("auto", "inline", "call")
+
+# Combustível por omissão da avaliação de funções puras (nós da AST avaliados, ver consteval.py)
+EVAL_FUEL = 50_000
+
+# Desenrolamento de FOR com limites constantes por omissão (ver unroll.py): tamanho
+# máximo (nós da AST) do código desenrolado e fator do desenrolamento parcial
+UNROLL_BUDGET = 64
+UNROLL_FACTOR = 4
+
+@dataclass
+class CompilerOptions:
+    """
+    Opções de compilação (ativação de passes de otimização).
+    """
+    peephole: bool = True # Aplica o otimizador peephole (peephole.py) ao código final
+    lexer: str = "fast" # Motor léxico: 'fast' (fastlex.py) ou 'ply' (pascal_analex.py)
+    check_elim: bool = True # Omite o CHECK dos acessos a arrays com índice provadamente dentro dos limites
+    builtins: str = "auto" # round/abs: 'inline', 'call' (rotina de suporte partilhada) ou 'auto' (por tamanho)
+    prune: bool = True # Elimina subprogramas nunca chamados e variáveis não usadas (prune.py)
+    eval_fuel: int = EVAL_FUEL # Avalia em compilação as chamadas a funções puras com argumentos constantes; 0 desativa (consteval.py)
+    tailrec: bool = True # Transforma as chamadas recursivas finais em saltos (tailrec.py)
+    inline_budget: int = 16 # Tamanho máximo (nós da AST) de um subprograma expandido inline; 0 desativa (inline.py)
+    unroll_budget: int = UNROLL_BUDGET # Tamanho máximo (nós da AST) de um FOR de limites constantes desenrolado; 0 desativa (unroll.py)
+    unroll_factor: int = UNROLL_FACTOR # Fator do desenrolamento parcial dos FOR demasiado grandes para o total; < 2 desativa
+    memoize: bool = False # Memoriza as funções recursivas puras de parâmetros integer numa tabela na heap (memo.py)
+
 
 @dataclass
 class CompilerContext:
     """
     Objeto central que armazena o estado do compilador durante a análise.
-    Funciona como uma 'memória partilhada' entre o Parser, o Semântico e o Gerador de Código.
+    Funciona como uma 'memória partilhada' entre os passes sobre a AST: o Semântico
+    (sem.Analyzer) e o Gerador de Código (codegen.Emitter).
     """
 
     # Objetos Core
-    symtab: Any # Referência para a Tabela de Símbolos (SymbolTable)
-    cg: Any # Referência para o Gerador de Código (CodeGen)
-
-    # Parser "Pendentes"
-    # Guardam cabeçalhos de subprogramas enquanto o corpo ainda não foi processado
-    pending_func_header: Optional[Any] = None
-    pending_proc_header: Optional[Any] = None
+    symtab: object # Referência para a Tabela de Símbolos (SymbolTable)
+    cg: object # Referência para o Gerador de Código (CodeGen)
 
     # Alocação de Globais / Locais
     next_global_addr: int = 0
     # Pilhas para suportar funções dentro de funções (âmbitos aninhados)
     next_local_addr_stack: list[int] = field(default_factory=list)
-    local_init_code_stack: list[str] = field(default_factory=list)
 
-    # Acumulação de Código
-    global_init_code: str = "" # Código de inicialização para o bloco principal
-    subprog_code: str = "" # Código gerado para funções e procedimentos
+    # Acumulação de Código (listas de instruções Instr, ver codegen.py)
+    global_init_code: list = field(default_factory=list) # Código de inicialização para o bloco principal
+    subprog_code: list = field(default_factory=list) # Código gerado para funções e procedimentos
 
     # Rastreio de Subprogramas
-    current_subprog: list[Any] = field(default_factory=list) # Pilha de subprogramas ativos
+    current_subprog: list = field(default_factory=list) # Pilha de subprogramas ativos
     func_return_assigned: list[bool] = field(default_factory=list) # Garante que funções retornam valor
 
     # Rastreador de strings e constantes (read-only)
     readonly_counts: dict = field(default_factory=dict)
 
+    # Bounds checks (CHECK) dos acessos a arrays: omitidos por serem seguros / mantidos
+    checks_removed: int = 0
+    checks_kept: int = 0
+
+    # Chamadas a funções puras avaliadas em tempo de compilação (ver consteval.py)
+    calls_evaluated: int = 0
+
+    # Rotinas de suporte dos builtins ligadas ao programa (ver codegen.RUNTIME_ROUTINES)
+    runtime_linked: list = field(default_factory=list)
+
+    # Subprogramas e variáveis eliminados por não serem usados (ver prune.py)
+    pruned: dict = field(default_factory=dict)
+
+    # Subprogramas com chamadas recursivas finais transformadas em ciclos (ver tailrec.py)
+    tailrec: list = field(default_factory=list)
+
+    # Decisões de inlining, uma por subprograma (ver inline.py)
+    inline_log: list = field(default_factory=list)
+
+    # Funções memorizadas numa tabela na heap (ver memo.py)
+    memoized: list = field(default_factory=list)
+
+    def new_temp(self, t: str = "integer") -> dict:
+        """
+        Reserva um slot escondido (sem nome na tabela de símbolos) para um temporário:
+        local ao subprograma em análise (fp[addr]) ou, no programa principal, global (gp[addr]).
+        Devolve uma info no formato das variáveis, usável com gen_load_var/gen_store_var.
+        """
+        if self.next_local_addr_stack:
+            addr = self.next_local_addr_stack[-1]
+            self.next_local_addr_stack[-1] += 1
+            return {"kind": "var", "type": t, "level": "local", "addr": addr}
+        addr = self.next_global_addr
+        self.next_global_addr += 1
+        return {"kind": "var", "type": t, "level": "global", "addr": addr}
+
     def reset(self):
         """
         Limpa todo o estado de compilação, exceto as referências core (symtab/cg).
         Essencial para reiniciar o compilador entre diferentes ficheiros de teste.
         """
-        self.pending_func_header = None
-        self.pending_proc_header = None
-
         self.next_global_addr = 0
         self.next_local_addr_stack.clear()
-        self.local_init_code_stack.clear()
 
-        self.global_init_code = ""
-        self.subprog_code = ""
+        self.global_init_code = []
+        self.subprog_code = []
 
         self.current_subprog.clear()
         self.func_return_assigned.clear()
         self.readonly_counts.clear()
+        self.checks_removed = 0
+        self.checks_kept = 0
+        self.calls_evaluated = 0
+        self.runtime_linked = []
+        self.pruned = {}
+        self.tailrec = []
+        self.inline_log = []
+        self.memoized = []
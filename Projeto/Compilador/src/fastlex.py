@@ -0,0 +1,153 @@
+"""
+Módulo: fastlex.py
+Descrição: Lexer rápido, alternativo ao PLY lex (pascal_analex.py).
+Produz exatamente a mesma sequência de tokens (tipo, valor, linha e posição),
+mas evita o custo por token do PLY:
+- um único scanner compilado com grupos nomeados, em que os espaços e tabs
+  que precedem o token são consumidos no próprio match;
+- despacho direto pelo nome do grupo (m.lastgroup) e tabelas pré-calculadas
+  para palavras reservadas e operadores, sem funções de regra por token;
+- contagem de linhas "preguiçosa": o scanner nunca conta mudanças de linha;
+  a linha de um token só é calculada quando é pedida (tok.lineno), por
+  pesquisa binária nas posições dos '\\n', calculadas uma vez por input.
+
+Expõe a mesma interface que o parser usa do lexer do PLY: input(), token(),
+clone() e o atributo lineno (linha inicial do input).
+"""
+
+import re
+from bisect import bisect_left
+
+from .pascal_analex import reserved, lex_warning
+
+
+# Operadores e pontuação -> tipo do token
+OPERATORS = {
+    "+": "PLUS", "-": "MINUS", "*": "TIMES", "/": "DIVIDE",
+    "<=": "LESSEQUAL", ">=": "GREATEREQUAL", "<>": "NOTEQUAL", ":=": "ASSIGN", "..": "RANGE",
+    "<": "LESS", ">": "GREATER", "=": "EQUAL", ":": "COLON", ".": "DOT",
+    "(": "LPAREN", ")": "RPAREN", "[": "LBRACKET", "]": "RBRACKET",
+    ";": "SEMICOLON", ",": "COMMA",
+}
+
+# As alternativas estão ordenadas pela frequência (identificadores, mudanças de
+# linha/comentários, operadores), respeitando as precedências do master regex do
+# PLY onde as regras se sobrepõem: comentários '(*' antes de '(', reais antes de
+# inteiros, e os operadores de 2 caracteres antes dos de 1 ('<=' antes de '<').
+# O ID usa classes ASCII explícitas (\w aceitaria letras acentuadas).
+_SCANNER = re.compile(r"""[ \t]*(?:
+    (?P<ID>[a-zA-Z_][a-zA-Z0-9_]*)
+  | (?P<SKIP>\n+|\{[^}]*\}|\(\*[\s\S]*?\*\))
+  | (?P<OP>[-+*/=;,)\[\]]|<[=>]?|>=?|:=?|\.\.?|\()
+  | (?P<REAL>\d+(?:\.\d+(?:[eE][+-]?\d+)?|[eE][+-]?\d+))
+  | (?P<INT>\d+)
+  | (?P<STR>'(?:[^'\n]|'')*')
+)""", re.VERBOSE)
+
+_NEWLINE = re.compile(r"\n")
+
+
+class Token:
+    """Token compatível com o LexToken do PLY (type, value, lineno, lexpos)."""
+    __slots__ = ("type", "value", "lexpos", "lexer")
+
+    def __init__(self, type_, value, lexpos, lexer):
+        self.type = type_
+        self.value = value
+        self.lexpos = lexpos
+        self.lexer = lexer
+
+    @property
+    def lineno(self) -> int:
+        return self.lexer.line_of(self.lexpos)
+
+    def __str__(self):
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+    __repr__ = __str__
+
+
+class FastLexer:
+    """Lexer de Pascal baseado num único scanner; ver a descrição do módulo."""
+
+    def __init__(self):
+        self.lineno = 1
+        self.lexdata = ""
+        self.lexpos = 0
+        self._newlines = None
+        self._tokens = iter(())
+        self.messages = None  # avisos desta compilação (ver pascal_analex.lex_warning)
+
+    def clone(self):
+        """Novo lexer independente (o estado de um input não é partilhado)."""
+        c = FastLexer()
+        c.lineno = self.lineno
+        return c
+
+    def input(self, data: str) -> None:
+        self.lexdata = data
+        self.lexpos = 0
+        self._newlines = None
+        self._tokens = self._scan(data)
+
+    def token(self):
+        """Devolve o próximo token, ou None no fim do input."""
+        return next(self._tokens, None)
+
+    def __iter__(self):
+        return iter(self.token, None)
+
+    def line_of(self, pos: int) -> int:
+        """Linha da posição 'pos' (as posições dos '\\n' são calculadas no 1º pedido)."""
+        nl = self._newlines
+        if nl is None:
+            nl = self._newlines = [m.start() for m in _NEWLINE.finditer(self.lexdata)]
+        return self.lineno + bisect_left(nl, pos)
+
+    def _scan(self, data: str):
+        match = _SCANNER.match
+        kw = reserved
+        ops = OPERATORS
+        id_types = {}  # identificador (texto original) -> tipo, para cada input
+        n = len(data)
+        pos = 0
+        while True:
+            m = match(data, pos)
+            if m is None:
+                # só espaços até ao fim, ou um carácter que nenhuma regra aceita
+                while pos < n and data[pos] in " \t":
+                    pos += 1
+                if pos >= n:
+                    self.lexpos = pos
+                    return
+                lex_warning(self, f"Caractere ilegal '{data[pos]}' na linha {self.line_of(pos)}")
+                pos += 1
+                continue
+
+            # o token termina no fim do match: lexpos = pos - len(texto)
+            kind = m.lastgroup
+            pos = m.end()
+            if kind == "ID":
+                value = m.group(kind)
+                t = id_types.get(value)
+                if t is None:
+                    t = id_types[value] = kw.get(value.lower(), "ID")
+                yield Token(t, value, pos - len(value), self)
+            elif kind == "OP":
+                value = m.group(kind)
+                yield Token(ops[value], value, pos - len(value), self)
+            elif kind == "SKIP":
+                continue
+            elif kind == "INT":
+                value = m.group(kind)
+                yield Token("NUMBER_INT", int(value), pos - len(value), self)
+            elif kind == "REAL":
+                value = m.group(kind)
+                yield Token("NUMBER_REAL", float(value), pos - len(value), self)
+            else:
+                value = m.group(kind)
+                yield Token("STRING_LITERAL", value[1:-1].replace("''", "'"), pos - len(value), self)
+
+
+# Instância base (clonada por compilação, como o lexer do PLY)
+lexer = FastLexer()
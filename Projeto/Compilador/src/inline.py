@@ -0,0 +1,172 @@
+"""
+Módulo: inline.py
+Descrição: Expansão inline de pequenos subprogramas folha.
+Passe entre a análise semântica e a eliminação de código não usado (prune.py):
+cada chamada a um subprograma elegível recebe a anotação 'inline' (nodes.Inline)
+e o gerador de código emite o corpo no lugar da chamada, poupando o slot de
+retorno, PUSHA/CALL, o PUSHN/STOREL/RETURN do subprograma e o POP dos argumentos.
+
+Um subprograma é elegível quando:
+- não faz parte de um ciclo no grafo de chamadas (recursividade, direta ou não);
+- é uma folha (não chama outros subprogramas do utilizador);
+- não declara arrays locais (que exigiriam um ALLOCN por chamada);
+- o corpo tem no máximo 'budget' nós da AST (contando só o código gerado, ver
+  prune.emitted: um FOR desenrolado conta como as suas cópias).
+
+Os parâmetros, as variáveis locais e o retorno do subprograma passam a ser
+slots temporários do chamador (globais no programa principal, locais num
+subprograma), partilhados por todas as chamadas ao mesmo subprograma nesse
+chamador: como o subprograma é folha, duas expansões nunca estão ativas ao mesmo
+tempo. As decisões (expandido ou não, e porquê) ficam em ctx.inline_log.
+"""
+
+from .nodes import (Subprogram, Program, Compound, Assign, For, VarRef, VarDecl, Call, ProcCall, Inline,
+                    walk, clone)
+
+
+def var_refs(body):
+    """Infos das variáveis locais referidas em 'body' (sem repetições)."""
+    seen = {}
+    for n in walk(body):
+        if isinstance(n, VarRef) or isinstance(n, For):
+            if n.symbol["level"] == "local":
+                seen[id(n.symbol)] = n.symbol
+        if isinstance(n, For) and n.limit is not None and n.limit["level"] == "local":
+            seen[id(n.limit)] = n.limit
+    return list(seen.values())
+
+
+def reads(node, info) -> bool:
+    return any(isinstance(n, VarRef) and n.symbol is info for n in walk(node))
+
+
+def assigned_first(body, info) -> bool:
+    """
+    True se, nos statements de topo de 'body', o primeiro que refere 'info' lhe
+    atribui um valor sem o ler antes (o slot dispensa a inicialização a 0).
+    """
+    stmts = body.stmts if isinstance(body, Compound) else [body]
+    for s in stmts:
+        if isinstance(s, Assign) and s.target.index is None and s.symbol is info:
+            return not reads(s.expr, info)
+        if isinstance(s, For) and (s.limit is info or s.symbol is info):
+            return not (reads(s.start, info) or reads(s.end, info))
+        if reads(s, info) or any(isinstance(n, (Assign, For)) and n.symbol is info for n in walk(s)):
+            return False
+    return True
+
+
+class Inliner:
+    """Decide que subprogramas são expandidos e anota as chamadas (ver a descrição do módulo)."""
+
+    def __init__(self, prog, budget: int):
+        self.prog = prog
+        self.budget = budget
+        self.subs = {id(n.symbol): n for n in walk(prog) if isinstance(n, Subprogram)}
+        self.slots = {}  # (id(chamador), id(subprograma)) -> (remap, params, result)
+
+    def callees(self, sub) -> list:
+        """Subprogramas do utilizador chamados no corpo de 'sub' (sem repetições)."""
+        seen = {}
+        for n in walk(sub.body):
+            if isinstance(n, (Call, ProcCall)) and id(n.symbol) in self.subs:
+                seen[id(n.symbol)] = self.subs[id(n.symbol)]
+        return list(seen.values())
+
+    def recursive(self, sub) -> bool:
+        """'sub' alcança-se a si próprio no grafo de chamadas."""
+        stack, seen = self.callees(sub), set()
+        while stack:
+            s = stack.pop()
+            if s is sub:
+                return True
+            if id(s) not in seen:
+                seen.add(id(s))
+                stack.extend(self.callees(s))
+        return False
+
+    def reject_reason(self, sub, size):
+        """Motivo pelo qual 'sub' não é expandido, ou None se for elegível."""
+        if self.recursive(sub):
+            return "recursivo (ciclo no grafo de chamadas)"
+        called = self.callees(sub)
+        if called:
+            return f"não é folha (chama {', '.join(s.name for s in called)})"
+        for d in sub.decls:
+            if isinstance(d, VarDecl) and isinstance(d.tspec.type, tuple):
+                return "declara arrays locais"
+        if size > self.budget:
+            return f"tamanho {size} > orçamento {self.budget}"
+        return None
+
+    def new_slot(self, frame, t) -> dict:
+        """Slot temporário no frame do chamador (global no programa principal)."""
+        if isinstance(frame, Program):
+            frame.nglobals += 1
+            return {"kind": "var", "type": t, "level": "global", "addr": frame.nglobals - 1}
+        frame.nlocals += 1
+        return {"kind": "var", "type": t, "level": "local", "addr": frame.nlocals - 1}
+
+    def expansion(self, frame, sub) -> Inline:
+        """Expansão de uma chamada a 'sub' feita a partir de 'frame'."""
+        key = (id(frame), id(sub))
+        if key not in self.slots:
+            info = sub.symbol
+            params = [self.new_slot(frame, t) for (_n, t, _l) in info["params"]]
+            k = len(params)
+            result = self.new_slot(frame, info["ret"]) if sub.kind == "func" else None
+            remap = {}
+            for v in var_refs(sub.body):
+                if v["addr"] < 0:
+                    remap[id(v)] = params[v["addr"] + k]
+                elif v["addr"] == 0 and result is not None:
+                    remap[id(v)] = result
+                else:
+                    remap[id(v)] = self.new_slot(frame, v["type"])
+            body = clone(sub.body, remap)
+            init = [slot for v, slot in ((v, remap[id(v)]) for v in var_refs(sub.body))
+                    if v["addr"] >= 0 and not assigned_first(sub.body, v)]
+            self.slots[key] = (params, init, body, result)
+        params, init, body, result = self.slots[key]
+        return Inline(params, init, body, result)
+
+    def run(self) -> list:
+        """Anota as chamadas expandidas (só as que são geradas) e devolve as decisões, por subprograma."""
+        from .prune import emitted  # prune.py importa tailrec.py, que importa este módulo
+        eligible, log = {}, []
+        for sub in self.subs.values():
+            size = sum(1 for _ in emitted(sub.body))
+            reason = self.reject_reason(sub, size)
+            entry = {"name": sub.name, "line": sub.line, "size": size, "inlined": reason is None,
+                     "reason": reason, "sites": 0}
+            log.append(entry)
+            if reason is None:
+                eligible[id(sub.symbol)] = (sub, entry)
+
+        frames = [self.prog] + list(self.subs.values())
+        for frame in frames:
+            for n in list(emitted(frame.body)):
+                if isinstance(n, Call) and n.const is not None:
+                    continue  # avaliada em tempo de compilação (ver consteval.py)
+                if isinstance(n, (Call, ProcCall)) and id(n.symbol) in eligible:
+                    sub, entry = eligible[id(n.symbol)]
+                    n.inline = self.expansion(frame, sub)
+                    entry["sites"] += 1
+        return log
+
+
+def inline_calls(prog, ctx, budget: int) -> list:
+    """Expande inline as chamadas elegíveis de 'prog' (ver Inliner); devolve e guarda as decisões."""
+    ctx.inline_log = Inliner(prog, budget).run() if budget > 0 else []
+    return ctx.inline_log
+
+
+def format_decisions(log: list) -> str:
+    """Texto das decisões de inlining (uma linha por subprograma)."""
+    lines = []
+    for e in sorted(log, key=lambda e: e["line"] or 0):
+        if e["inlined"]:
+            lines.append(f"inline    {e['name']} (linha {e['line']}): tamanho {e['size']}, {e['sites']} chamada(s) expandida(s)")
+        else:
+            lines.append(f"não inline {e['name']} (linha {e['line']}): {e['reason']}")
+    return "\n".join(lines)
@@ -0,0 +1,78 @@
+"""
+Módulo: memo.py
+Descrição: Memoização de funções recursivas puras com parâmetros inteiros.
+Passe opcional (CompilerOptions.memoize, --memoize): as funções a memorizar são
+escolhidas antes da transformação da recursividade final (tailrec.py), que as
+deixa de fora, e as tabelas são alocadas depois da eliminação de código não
+usado (prune.py), só para as que estão vivas. Uma função é memorizada quando:
+- é pura (info["pure"] na tabela de símbolos, ver consteval.py);
+- devolve integer e todos os parâmetros são integer;
+- chama-se a si própria (recursividade direta, ex: fib ou comb ingénuos) e
+  nem todas essas chamadas são transformáveis num ciclo por tailrec.py (a
+  recursividade linear fica para o ciclo, mais barato).
+
+Numa função memorizada, nenhuma chamada é transformada num salto: as iterações
+de um ciclo não passariam pelo prólogo, pelo que não consultariam nem
+preencheriam a tabela.
+
+Cada função memorizada tem uma tabela na heap, alocada com ALLOCN no arranque
+do programa e guardada num slot global. O domínio coberto é 0..D-1 em cada um
+dos k parâmetros, com D ** k <= MEMO_ENTRIES. No prólogo, uma chamada com os
+argumentos dentro do domínio consulta a tabela e, se a entrada já estiver
+preenchida, devolve logo o valor guardado; senão, o corpo é executado e o
+resultado guardado antes do RETURN. Fora do domínio, a função comporta-se como
+antes (sem consulta nem registo).
+"""
+
+from .nodes import Subprogram, Call, Memo, walk
+from .tailrec import tail_matches
+
+# Nº máximo de entradas de cada tabela (cada entrada ocupa 2 posições na heap)
+MEMO_ENTRIES = 4096
+
+
+def domain(k: int) -> int:
+    """Maior D com D ** k <= MEMO_ENTRIES (nº de valores de cada um dos k parâmetros)."""
+    d = int(round(MEMO_ENTRIES ** (1 / k)))
+    while d ** k > MEMO_ENTRIES:
+        d -= 1
+    return d
+
+
+def reject_reason(sub):
+    """Motivo pelo qual a função 'sub' não é memorizada, ou None se for elegível."""
+    info = sub.symbol
+    if not info.get("pure"):
+        return "impura"
+    if info["ret"] != "integer" or not info["params"] or any(t != "integer" for (_n, t, _l) in info["params"]):
+        return "não é uma função integer de parâmetros integer"
+    calls = {id(n) for n in walk(sub.body) if isinstance(n, Call) and n.symbol is info and n.const is None}
+    if not calls:
+        return "não recursiva"
+    if calls <= {id(call) for _s, (call, _extra, _op) in tail_matches(sub)[0]}:
+        return "recursividade final (transformável num ciclo)"
+    if domain(len(info["params"])) < 2:
+        return "demasiados parâmetros"
+    return None
+
+
+def candidates(prog) -> list:
+    """Funções de 'prog' a memorizar (escolhidas antes de tailrec.py, ver a descrição do módulo)."""
+    return [sub for sub in walk(prog)
+            if isinstance(sub, Subprogram) and sub.kind == "func" and reject_reason(sub) is None]
+
+
+def memoize(prog, ctx, subs: list) -> list:
+    """Anota as funções vivas de 'subs' (ver candidates) com a sua tabela (Subprogram.memo); devolve e guarda os nomes."""
+    ctx.memoized = []
+    for sub in subs:
+        if not sub.live:
+            continue
+        d = domain(len(sub.params))
+        table = {"kind": "var", "type": "integer", "level": "global", "addr": prog.nglobals}
+        prog.nglobals += 1
+        index = {"kind": "var", "type": "integer", "level": "local", "addr": sub.nlocals}
+        sub.nlocals += 1
+        sub.memo = Memo(table, index, d, d ** len(sub.params), sub.line)
+        ctx.memoized.append(sub.name)
+    return ctx.memoized
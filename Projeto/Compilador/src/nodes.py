@@ -0,0 +1,439 @@
+"""
+Módulo: nodes.py
+Descrição: Árvore sintática abstrata (AST) tipada do compilador.
+As ações da gramática (parser.py) apenas constroem estes nós; a análise
+semântica (sem.Analyzer) percorre a árvore, resolve os identificadores e anota
+cada nó (tipo, constante conhecida, símbolo), e a geração de código
+(codegen.Emitter) percorre a árvore anotada e produz as instruções da VM.
+
+Os nós usam __slots__ (compactos e rápidos a criar). Os campos sintáticos são
+preenchidos pelo parser; os campos de anotação começam a None e são sempre
+reescritos pela análise, pelo que a mesma árvore pode ser analisada de novo
+(ex: uma AST guardada entre compilações).
+
+Os tipos são representados como no resto do compilador: 'integer', 'real',
+'boolean', 'char', 'string' ou ('array', (lo, hi), tipo_base).
+"""
+
+
+class Node:
+    """Base de todos os nós: 'line' é a linha usada nas mensagens de erro."""
+    __slots__ = ("line",)
+
+    def __repr__(self):
+        fields = ", ".join(f"{s}={getattr(self, s)!r}" for s in self.__slots__ if s != "line")
+        return f"{type(self).__name__}({fields})"
+
+
+# TIPOS E DECLARAÇÕES
+
+class TypeSpec(Node):
+    """
+    Tipo escrito numa declaração. 'ranges' guarda (lo, hi, linha) de cada
+    'array[lo..hi]' (do mais exterior para o mais interior), validados pela análise.
+    """
+    __slots__ = ("type", "ranges")
+
+    def __init__(self, type_, ranges=(), line=None):
+        self.type = type_
+        self.ranges = list(ranges)
+        self.line = line
+
+
+class VarDecl(Node):
+    """'var a, b: tipo;' -> names = [(nome, linha), ...]. Anotação: symbols (infos declaradas)."""
+    __slots__ = ("names", "tspec", "symbols")
+
+    def __init__(self, names, tspec):
+        self.names = names
+        self.tspec = tspec
+        self.symbols = None
+        self.line = names[0][1] if names else None
+
+
+class Param(Node):
+    """Parâmetro formal (nome, tipo); os parâmetros de um mesmo grupo partilham o TypeSpec."""
+    __slots__ = ("name", "tspec")
+
+    def __init__(self, name, tspec, line):
+        self.name = name
+        self.tspec = tspec
+        self.line = line
+
+
+class Subprogram(Node):
+    """
+    Função (kind='func', com 'ret') ou procedimento (kind='proc').
+    Anotações: symbol (info na tabela de símbolos), nlocals (slots locais, incluindo
+    o retorno em fp[0] nas funções), live (False se nunca é chamado a partir do
+    programa principal, ver prune.py), loop (TailLoop se as chamadas recursivas
+    finais foram transformadas num ciclo, ver tailrec.py) e memo (Memo se os
+    resultados são memorizados, ver memo.py).
+    """
+    __slots__ = ("kind", "name", "params", "ret", "decls", "body", "symbol", "nlocals", "live", "loop", "memo")
+
+    def __init__(self, kind, name, params, ret, decls, body, line):
+        self.kind = kind
+        self.name = name
+        self.params = params
+        self.ret = ret
+        self.decls = decls
+        self.body = body
+        self.line = line
+        self.symbol = None
+        self.nlocals = None
+        self.live = True
+        self.loop = None
+        self.memo = None
+
+
+class Program(Node):
+    """Programa completo. Anotação: nglobals (nº de slots globais)."""
+    __slots__ = ("name", "decls", "body", "nglobals")
+
+    def __init__(self, name, decls, body, line):
+        self.name = name
+        self.decls = decls
+        self.body = body
+        self.line = line
+        self.nglobals = None
+
+
+# STATEMENTS
+
+class Compound(Node):
+    """'begin ... end' (ou a lista de statements de um 'repeat')."""
+    __slots__ = ("stmts",)
+
+    def __init__(self, stmts, line=None):
+        self.stmts = stmts
+        self.line = line
+
+
+class Assign(Node):
+    """
+    'target := expr' ('line' é a do ':='). Anotações: symbol (info do alvo) e
+    tail (TailCall se é uma chamada recursiva final, ver tailrec.py, ou None).
+    """
+    __slots__ = ("target", "expr", "symbol", "tail")
+
+    def __init__(self, target, expr, line):
+        self.target = target
+        self.expr = expr
+        self.line = line
+        self.symbol = None
+        self.tail = None
+
+
+class If(Node):
+    __slots__ = ("cond", "then", "els")
+
+    def __init__(self, cond, then, els, line):
+        self.cond = cond
+        self.then = then
+        self.els = els
+        self.line = line
+
+
+class While(Node):
+    __slots__ = ("cond", "body")
+
+    def __init__(self, cond, body, line):
+        self.cond = cond
+        self.body = body
+        self.line = line
+
+
+class For(Node):
+    """
+    'for var := start to|downto end do body'. Anotações: symbol (info da variável
+    de controlo), limit (slot escondido onde o fim é guardado, se não for constante)
+    e unroll (Unroll se o ciclo é desenrolado, ver unroll.py, ou None).
+    """
+    __slots__ = ("var", "start", "direction", "end", "body", "symbol", "limit", "unroll")
+
+    def __init__(self, var, start, direction, end, body, line):
+        self.var = var
+        self.start = start
+        self.direction = direction  # "TO" ou "DOWNTO"
+        self.end = end
+        self.body = body
+        self.line = line
+        self.symbol = None
+        self.limit = None
+        self.unroll = None
+
+
+class Repeat(Node):
+    """'repeat body until cond' ('line' é a do UNTIL)."""
+    __slots__ = ("body", "cond")
+
+    def __init__(self, body, cond, line):
+        self.body = body
+        self.cond = cond
+        self.line = line
+
+
+class ProcCall(Node):
+    """
+    Chamada de procedimento; args=None quando é escrita sem parênteses.
+    Anotações: symbol, inline (expansão Inline, ver inline.py, ou None) e tail
+    (TailCall se é uma chamada recursiva final, ver tailrec.py, ou None).
+    """
+    __slots__ = ("name", "args", "symbol", "inline", "tail")
+
+    def __init__(self, name, args, line):
+        self.name = name
+        self.args = args
+        self.line = line
+        self.symbol = None
+        self.inline = None
+        self.tail = None
+
+
+class Writeln(Node):
+    __slots__ = ("args",)
+
+    def __init__(self, args, line):
+        self.args = args
+        self.line = line
+
+
+class Readln(Node):
+    """'readln(v1, v2[i], ...)': targets são VarRef em modo escrita."""
+    __slots__ = ("targets",)
+
+    def __init__(self, targets, line):
+        self.targets = targets
+        self.line = line
+
+
+# EXPRESSÕES
+# Anotações comuns: type (tipo do resultado) e const (valor conhecido em tempo
+# de compilação, ou None).
+
+class Expr(Node):
+    __slots__ = ("type", "const")
+
+
+class Literal(Expr):
+    """Constante literal (o tipo é conhecido logo no parse)."""
+    __slots__ = ()
+
+    def __init__(self, type_, value, line):
+        self.type = type_
+        self.const = value
+        self.line = line
+
+
+class VarRef(Expr):
+    """
+    Acesso a uma variável ('x') ou a um elemento ('v[i]', 's[i]').
+    lvalue=True quando é o alvo de uma atribuição ou de um readln.
+    Anotações: symbol (info da variável), string_indexed e safe (o índice de
+    um array está provadamente dentro dos limites, dispensando o CHECK).
+    """
+    __slots__ = ("name", "index", "lvalue", "symbol", "string_indexed", "safe")
+
+    def __init__(self, name, index, line, lvalue=False):
+        self.name = name
+        self.index = index
+        self.lvalue = lvalue
+        self.line = line
+        self.type = None
+        self.const = None
+        self.symbol = None
+        self.string_indexed = False
+        self.safe = False
+
+
+class Call(Expr):
+    """
+    Chamada de função (builtin ou do utilizador) numa expressão.
+    Anotações: symbol e inline (expansão Inline, ver inline.py, ou None).
+    """
+    __slots__ = ("name", "args", "symbol", "inline")
+
+    def __init__(self, name, args, line):
+        self.name = name
+        self.args = args
+        self.line = line
+        self.type = None
+        self.const = None
+        self.symbol = None
+        self.inline = None
+
+
+class BinOp(Expr):
+    """
+    Operação binária: aritmética ('+', '-', '*', '/', 'div', 'mod'), lógica
+    ('and', 'or') ou relacional ('=', '<>', '<', '<=', '>', '>=').
+    """
+    __slots__ = ("op", "left", "right")
+
+    def __init__(self, op, left, right, line):
+        self.op = op
+        self.left = left
+        self.right = right
+        self.line = line
+        self.type = None
+        self.const = None
+
+
+class UnOp(Expr):
+    """Operação unária: '-' ou 'not'."""
+    __slots__ = ("op", "operand")
+
+    def __init__(self, op, operand, line):
+        self.op = op
+        self.operand = operand
+        self.line = line
+        self.type = None
+        self.const = None
+
+
+class Inline(Node):
+    """
+    Expansão inline de uma chamada a um subprograma folha (ver inline.py):
+    os argumentos são guardados nos slots 'params' do chamador, os slots em
+    'init' começam a 0 (como no PUSHN do subprograma), 'body' é uma cópia do
+    corpo com as variáveis do subprograma substituídas por slots do chamador e
+    'result' é o slot do valor de retorno (None nos procedimentos).
+    """
+    __slots__ = ("params", "init", "body", "result")
+
+    def __init__(self, params, init, body, result):
+        self.params = params
+        self.init = init
+        self.body = body
+        self.result = result
+        self.line = body.line
+
+
+class TailLoop(Node):
+    """
+    Subprograma cujas chamadas recursivas finais saltam para o início do corpo
+    (ver tailrec.py). Nas funções com acumulador ('f := e op f(...)'), 'op' é
+    '+' ou '*' e 'acc' o slot local do acumulador; 'reset' são os slots locais
+    que voltam a 0 em cada iteração (como no PUSHN de uma nova chamada).
+    """
+    __slots__ = ("symbol", "op", "acc", "reset")
+
+    def __init__(self, symbol, op, acc, reset, line):
+        self.symbol = symbol
+        self.op = op
+        self.acc = acc
+        self.reset = reset
+        self.line = line
+
+
+class TailCall(Node):
+    """
+    Chamada recursiva final transformada num salto (ver tailrec.py): 'call' é a
+    chamada (Call ou ProcCall) e 'extra' a parcela acumulada ('e' em
+    'f := e op f(...)'), ou None.
+    """
+    __slots__ = ("loop", "call", "extra")
+
+    def __init__(self, loop, call, extra):
+        self.loop = loop
+        self.call = call
+        self.extra = extra
+        self.line = call.line
+
+
+class Memo(Node):
+    """
+    Tabela de memoização de uma função (ver memo.py): 'table' é o slot global com
+    o endereço da tabela (2 posições por entrada: preenchida, valor), 'index' o
+    slot local com a posição da entrada dos argumentos (-1 fora do domínio) e
+    'domain' o nº de valores (0..domain-1) de cada parâmetro; 'entries' = domain ** k.
+    """
+    __slots__ = ("table", "index", "domain", "entries")
+
+    def __init__(self, table, index, domain, entries, line):
+        self.table = table
+        self.index = index
+        self.domain = domain
+        self.entries = entries
+        self.line = line
+
+
+class Unroll(Node):
+    """
+    FOR com limites constantes desenrolado (ver unroll.py). No desenrolamento
+    parcial, 'block' são 'factor' cópias do corpo, com a variável de controlo
+    substituída por 'var', 'var + 1', ... ('var - 1', ... com DOWNTO), repetidas
+    enquanto a variável não passa de 'last' (o valor no início do último bloco);
+    no total, 'block' é vazio e factor None. 'rest' são as cópias das restantes
+    iterações, com a variável substituída pelo seu valor constante, e 'final' o
+    valor da variável no fim do ciclo.
+    """
+    __slots__ = ("block", "factor", "last", "rest", "final")
+
+    def __init__(self, block, factor, last, rest, final, line):
+        self.block = block
+        self.factor = factor
+        self.last = last
+        self.rest = rest
+        self.final = final
+        self.line = line
+
+
+ARITH_OPS = ("+", "-", "*", "/", "div", "mod")
+LOGIC_OPS = ("and", "or")
+REL_OPS = ("=", "<>", "<", "<=", ">", ">=")
+
+
+_CHILD_SLOTS = {}
+
+
+def _child_slots(cls):
+    slots = _CHILD_SLOTS.get(cls)
+    if slots is None:
+        slots = tuple(s for c in reversed(cls.__mro__) for s in getattr(c, "__slots__", ())
+                      if s not in ("line", "type", "const", "symbol", "symbols", "tspec", "ret", "inline",
+                                   "tail", "loop", "memo"))
+        _CHILD_SLOTS[cls] = slots
+    return slots
+
+
+def children(node):
+    """Nós filhos diretos de 'node', pela ordem dos campos."""
+    out = []
+    for s in _child_slots(type(node)):
+        v = getattr(node, s)
+        if isinstance(v, Node):
+            out.append(v)
+        elif isinstance(v, list):
+            out.extend(x for x in v if isinstance(x, Node))
+    return out
+
+
+def walk(node):
+    """Percorre 'node' e todos os nós descendentes (pré-ordem)."""
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        yield n
+        stack.extend(reversed(children(n)))
+
+
+def clone(node, remap):
+    """
+    Cópia de 'node' e dos seus descendentes (com as anotações), em que cada info
+    de variável presente em 'remap' (id(info) -> nova info) é substituída.
+    """
+    cls = type(node)
+    new = cls.__new__(cls)
+    for c in cls.__mro__:
+        for s in getattr(c, "__slots__", ()):
+            v = getattr(node, s, None)
+            if isinstance(v, Node):
+                v = clone(v, remap)
+            elif isinstance(v, list):
+                v = [clone(x, remap) if isinstance(x, Node) else x for x in v]
+            elif isinstance(v, dict):
+                v = remap.get(id(v), v)
+            setattr(new, s, v)
+    return new
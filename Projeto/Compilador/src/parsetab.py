@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'programanonassocIFXnonassocELSEAND ARRAY ASSIGN BEGIN BOOLEAN CHAR COLON COMMA DIV DIVIDE DO DOT DOWNTO ELSE END EQUAL FALSE FOR FUNCTION GREATER GREATEREQUAL ID IF INTEGER LBRACKET LESS LESSEQUAL LPAREN MINUS MOD NOT NOTEQUAL NUMBER_INT NUMBER_REAL OF OR PLUS PROCEDURE PROGRAM RANGE RBRACKET READLN REAL REPEAT RPAREN SEMICOLON STRING STRING_LITERAL THEN TIMES TO TRUE UNTIL VAR WHILE WRITELNprograma : PROGRAM ID SEMICOLON bloco DOTbloco : decls compound_stmtdecls : decl declsdecls :decl : var_sectiondecl : subprog_declvar_section : VAR var_decl_listvar_decl_list : var_decl var_decl_list_tailvar_decl_list_tail : var_decl var_decl_list_tailvar_decl_list_tail :var_decl : id_list COLON tipo SEMICOLONid_list : ID id_list_tailid_list_tail : COMMA ID id_list_tailid_list_tail :tipo : INTEGERtipo : REALtipo : BOOLEANtipo : CHARtipo : STRINGtipo : array_typearray_type : ARRAY LBRACKET range RBRACKET OF tiporange : NUMBER_INT RANGE NUMBER_INTsubprog_decl : function_declsubprog_decl : procedure_declfunction_header : FUNCTION ID LPAREN param_list_opt RPAREN COLON tipo SEMICOLONfunc_enter :function_decl : function_header func_enter bloco SEMICOLONprocedure_header : PROCEDURE ID LPAREN param_list_opt RPAREN SEMICOLONproc_enter :procedure_decl : procedure_header proc_enter bloco SEMICOLONparam_list_opt : param_listparam_list_opt :param_list : param param_list_tailparam_list_tail : SEMICOLON param param_list_tailparam_list_tail :param : id_list COLON tipocompound_stmt : BEGIN stmt_list_opt ENDstmt_list_opt : stmt_liststmt_list_opt :stmt_list : stmt stmt_list_tailstmt_list_tail : SEMICOLON stmt stmt_list_tailstmt_list_tail : SEMICOLONstmt_list_tail :stmt : assign_stmtstmt : if_stmtstmt : while_stmtstmt : for_stmtstmt : repeat_stmtstmt : compound_stmtstmt : proc_callassign_stmt : lvalue ASSIGN exprvar_ref : IDvar_ref : ID LBRACKET expr RBRACKETlvalue : IDlvalue : ID LBRACKET expr RBRACKETif_stmt : IF expr THEN stmt %prec IFXif_stmt : IF expr THEN stmt ELSE stmtwhile_stmt : WHILE expr DO stmtfor_dir : TOfor_dir : DOWNTOfor_stmt : FOR ID ASSIGN expr for_dir expr DO for_enter stmt for_exitfor_enter :for_exit :repeat_stmt : REPEAT stmt_list_opt UNTIL exprproc_call : IDproc_call : ID LPAREN arg_list_opt RPARENproc_call : WRITELN args_optproc_call : READLN read_args_optread_args_opt : LPAREN read_var_list RPARENread_args_opt :read_var_list : lvalueread_var_list : lvalue COMMA read_var_listargs_opt : LPAREN arg_list_opt RPARENargs_opt :arg_list_opt : arg_listarg_list_opt :arg_list : expr arg_list_tailarg_list_tail : COMMA expr arg_list_tailarg_list_tail :expr : or_expror_expr : and_expror_expr : or_expr OR and_exprand_expr : rel_exprand_expr : and_expr AND rel_exprrel_expr : add_expr rel_optrel_opt : relop add_exprrel_opt :relop : EQUALrelop : NOTEQUALrelop : LESSrelop : LESSEQUALrelop : GREATERrelop : GREATEREQUALadd_expr : mul_expradd_expr : add_expr PLUS mul_expradd_expr : add_expr MINUS mul_exprmul_expr : unary_exprmul_expr : mul_expr TIMES unary_exprmul_expr : mul_expr DIVIDE unary_exprmul_expr : mul_expr DIV unary_exprmul_expr : mul_expr MOD unary_exprunary_expr : MINUS unary_exprunary_expr : NOT unary_exprunary_expr : primaryprimary : NUMBER_REALprimary : NUMBER_INTprimary : STRING_LITERALprimary : TRUEprimary : FALSEprimary : var_refprimary : ID LPAREN arg_list_opt RPARENprimary : LPAREN expr RPAREN'
+_lr_signature = 'programanonassocIFXnonassocELSEAND ARRAY ASSIGN BEGIN BOOLEAN CHAR COLON COMMA DIV DIVIDE DO DOT DOWNTO ELSE END EQUAL FALSE FOR FUNCTION GREATER GREATEREQUAL ID IF INTEGER LBRACKET LESS LESSEQUAL LPAREN MINUS MOD NOT NOTEQUAL NUMBER_INT NUMBER_REAL OF OR PLUS PROCEDURE PROGRAM RANGE RBRACKET READLN REAL REPEAT RPAREN SEMICOLON STRING STRING_LITERAL THEN TIMES TO TRUE UNTIL VAR WHILE WRITELNprograma : PROGRAM ID SEMICOLON bloco DOTbloco : decls compound_stmtdecls : decl declsdecls :decl : var_sectiondecl : subprog_declvar_section : VAR var_decl_listvar_decl_list : var_decl var_decl_list_tailvar_decl_list_tail : var_decl var_decl_list_tailvar_decl_list_tail :var_decl : id_list COLON tipo SEMICOLONid_list : ID id_list_tailid_list_tail : COMMA ID id_list_tailid_list_tail :tipo : INTEGERtipo : REALtipo : BOOLEANtipo : CHARtipo : STRINGtipo : array_typearray_type : ARRAY LBRACKET range RBRACKET OF tiporange : NUMBER_INT RANGE NUMBER_INTsubprog_decl : function_declsubprog_decl : procedure_declfunction_header : FUNCTION ID LPAREN param_list_opt RPAREN COLON tipo SEMICOLONfunction_decl : function_header bloco SEMICOLONprocedure_header : PROCEDURE ID LPAREN param_list_opt RPAREN SEMICOLONprocedure_decl : procedure_header bloco SEMICOLONparam_list_opt : param_listparam_list_opt :param_list : param param_list_tailparam_list_tail : SEMICOLON param param_list_tailparam_list_tail :param : id_list COLON tipocompound_stmt : BEGIN stmt_list_opt ENDstmt_list_opt : stmt_liststmt_list_opt : stmt_list SEMICOLONstmt_list_opt :stmt_list : stmtstmt_list : stmt_list SEMICOLON stmtstmt : assign_stmtstmt : if_stmtstmt : while_stmtstmt : for_stmtstmt : repeat_stmtstmt : compound_stmtstmt : proc_callassign_stmt : lvalue ASSIGN exprvar_ref : IDvar_ref : ID LBRACKET expr RBRACKETlvalue : IDlvalue : ID LBRACKET expr RBRACKETif_stmt : IF expr THEN stmt %prec IFXif_stmt : IF expr THEN stmt ELSE stmtwhile_stmt : WHILE expr DO stmtfor_dir : TOfor_dir : DOWNTOfor_stmt : FOR ID ASSIGN expr for_dir expr DO stmtrepeat_stmt : REPEAT stmt_list_opt UNTIL exprproc_call : IDproc_call : ID LPAREN arg_list_opt RPARENproc_call : WRITELN args_optproc_call : READLN read_args_optread_args_opt : LPAREN read_var_list RPARENread_args_opt :read_var_list : lvalueread_var_list : lvalue COMMA read_var_listargs_opt : LPAREN arg_list_opt RPARENargs_opt :arg_list_opt : arg_listarg_list_opt :arg_list : expr arg_list_tailarg_list_tail : COMMA expr arg_list_tailarg_list_tail :expr : or_expror_expr : and_expror_expr : or_expr OR and_exprand_expr : rel_exprand_expr : and_expr AND rel_exprrel_expr : add_expr rel_optrel_opt : relop add_exprrel_opt :relop : EQUALrelop : NOTEQUALrelop : LESSrelop : LESSEQUALrelop : GREATERrelop : GREATEREQUALadd_expr : mul_expradd_expr : add_expr PLUS mul_expradd_expr : add_expr MINUS mul_exprmul_expr : unary_exprmul_expr : mul_expr TIMES unary_exprmul_expr : mul_expr DIVIDE unary_exprmul_expr : mul_expr DIV unary_exprmul_expr : mul_expr MOD unary_exprunary_expr : MINUS unary_exprunary_expr : NOT unary_exprunary_expr : primaryprimary : NUMBER_REALprimary : NUMBER_INTprimary : STRING_LITERALprimary : TRUEprimary : FALSEprimary : var_refprimary : ID LPAREN arg_list_opt RPARENprimary : LPAREN expr RPAREN'
     
-_lr_action_items = {'PROGRAM':([0,],[2,]),'$end':([1,17,],[0,-1,]),'ID':([2,10,15,16,19,22,40,41,42,44,47,51,54,55,58,59,66,68,77,80,81,84,86,106,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,134,139,144,165,170,177,180,181,182,195,197,],[3,24,27,28,43,24,76,76,79,43,24,96,24,24,43,76,76,76,76,76,76,76,138,43,76,76,76,76,76,-88,-89,-90,-91,-92,-93,76,76,76,76,76,76,43,76,76,-11,24,76,138,43,76,-59,-60,-62,43,]),'SEMICOLON':([3,18,31,32,33,34,35,36,37,38,43,45,46,52,53,56,61,62,63,64,65,67,69,70,71,72,73,74,75,76,83,85,88,89,90,91,92,93,94,101,104,105,109,123,124,146,148,149,150,151,152,153,154,155,156,157,160,161,163,167,168,169,174,175,178,179,187,189,196,198,199,],[4,-2,58,-44,-45,-46,-47,-48,-49,-50,-65,-74,-70,97,98,-37,-80,-81,-83,-87,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-67,-68,139,-15,-16,-17,-18,-19,-20,144,58,-51,-85,-102,-103,176,-56,-82,-84,-95,-96,-86,-98,-99,-100,-101,-112,-58,-66,-64,-73,-69,144,-36,-111,-53,194,-57,-21,-63,-61,]),'BEGIN':([4,6,7,8,9,11,12,13,14,19,20,21,22,25,26,44,47,48,58,87,97,98,106,128,139,176,177,194,195,197,],[-4,19,-4,-5,-6,-23,-24,-26,-29,19,-3,-7,-10,-4,-4,19,-10,-8,19,-9,-27,-30,19,19,-11,-28,19,-25,-62,19,]),'VAR':([4,7,8,9,11,12,13,14,21,22,25,26,47,48,87,97,98,139,176,194,],[10,10,-5,-6,-23,-24,-26,-29,-7,-10,10,10,-10,-8,-9,-27,-30,-11,-28,-25,]),'FUNCTION':([4,7,8,9,11,12,13,14,21,22,25,26,47,48,87,97,98,139,176,194,],[15,15,-5,-6,-23,-24,-26,-29,-7,-10,15,15,-10,-8,-9,-27,-30,-11,-28,-25,]),'PROCEDURE':([4,7,8,9,11,12,13,14,21,22,25,26,47,48,87,97,98,139,176,194,],[16,16,-5,-6,-23,-24,-26,-29,-7,-10,16,16,-10,-8,-9,-27,-30,-11,-28,-25,]),'DOT':([5,18,56,],[17,-2,-37,]),'END':([19,29,30,31,32,33,34,35,36,37,38,43,45,46,56,57,58,61,62,63,64,65,67,69,70,71,72,73,74,75,76,83,85,104,105,109,123,124,147,148,149,150,151,152,153,154,155,156,157,160,161,163,167,168,169,178,179,189,198,199,],[-39,56,-38,-43,-44,-45,-46,-47,-48,-49,-50,-65,-74,-70,-37,-40,-42,-80,-81,-83,-87,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-67,-68,-43,-51,-85,-102,-103,-41,-56,-82,-84,-95,-96,-86,-98,-99,-100,-101,-112,-58,-66,-64,-73,-69,-111,-53,-57,-63,-61,]),'IF':([19,44,58,106,128,177,195,197,],[40,40,40,40,40,40,-62,40,]),'WHILE':([19,44,58,106,128,177,195,197,],[41,41,41,41,41,41,-62,41,]),'FOR':([19,44,58,106,128,177,195,197,],[42,42,42,42,42,42,-62,42,]),'REPEAT':([19,44,58,106,128,177,195,197,],[44,44,44,44,44,44,-62,44,]),'WRITELN':([19,44,58,106,128,177,195,197,],[45,45,45,45,45,45,-62,45,]),'READLN':([19,44,58,106,128,177,195,197,],[46,46,46,46,46,46,-62,46,]),'COLON':([23,24,50,96,102,141,142,],[49,-14,-12,-14,145,-13,173,]),'COMMA':([24,61,62,63,64,65,67,69,70,71,72,73,74,75,76,96,109,123,124,132,137,138,149,150,151,152,153,154,155,156,157,160,166,178,179,183,],[51,-80,-81,-83,-87,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,51,-85,-102,-103,165,170,-54,-82,-84,-95,-96,-86,-98,-99,-100,-101,-112,-55,-111,-53,165,]),'LPAREN':([27,28,40,41,43,45,46,59,66,68,76,77,80,81,84,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,129,134,165,180,181,182,],[54,55,77,77,80,84,86,77,77,77,125,77,77,77,77,77,77,77,77,77,-88,-89,-90,-91,-92,-93,77,77,77,77,77,77,77,77,77,77,-59,-60,]),'UNTIL':([30,31,32,33,34,35,36,37,38,43,44,45,46,56,57,58,61,62,63,64,65,67,69,70,71,72,73,74,75,76,82,83,85,104,105,109,123,124,147,148,149,150,151,152,153,154,155,156,157,160,161,163,167,168,169,178,179,189,198,199,],[-38,-43,-44,-45,-46,-47,-48,-49,-50,-65,-39,-74,-70,-37,-40,-42,-80,-81,-83,-87,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,134,-67,-68,-43,-51,-85,-102,-103,-41,-56,-82,-84,-95,-96,-86,-98,-99,-100,-101,-112,-58,-66,-64,-73,-69,-111,-53,-57,-63,-61,]),'ELSE':([32,33,34,35,36,37,38,43,45,46,56,61,62,63,64,65,67,69,70,71,72,73,74,75,76,83,85,105,109,123,124,148,149,150,151,152,153,154,155,156,157,160,161,163,167,168,169,178,179,189,198,199,],[-44,-45,-46,-47,-48,-49,-50,-65,-74,-70,-37,-80,-81,-83,-87,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-67,-68,-51,-85,-102,-103,177,-82,-84,-95,-96,-86,-98,-99,-100,-101,-112,-58,-66,-64,-73,-69,-111,-53,-57,-63,-61,]),'ASSIGN':([39,43,79,166,],[59,-54,129,-55,]),'MINUS':([40,41,59,64,65,66,67,68,69,70,71,72,73,74,75,76,77,80,81,84,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,129,134,151,152,153,154,155,156,157,160,165,178,179,180,181,182,],[66,66,66,111,-94,66,-97,66,-104,-105,-106,-107,-108,-109,-110,-52,66,66,66,66,66,66,66,66,66,-88,-89,-90,-91,-92,-93,66,66,66,66,-102,-103,66,66,66,66,-95,-96,111,-98,-99,-100,-101,-112,66,-111,-53,66,-59,-60,]),'NOT':([40,41,59,66,68,77,80,81,84,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,129,134,165,180,181,182,],[68,68,68,68,68,68,68,68,68,68,68,68,68,68,-88,-89,-90,-91,-92,-93,68,68,68,68,68,68,68,68,68,68,-59,-60,]),'NUMBER_REAL':([40,41,59,66,68,77,80,81,84,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,129,134,165,180,181,182,],[70,70,70,70,70,70,70,70,70,70,70,70,70,70,-88,-89,-90,-91,-92,-93,70,70,70,70,70,70,70,70,70,70,-59,-60,]),'NUMBER_INT':([40,41,59,66,68,77,80,81,84,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,129,134,140,165,180,181,182,186,],[71,71,71,71,71,71,71,71,71,71,71,71,71,71,-88,-89,-90,-91,-92,-93,71,71,71,71,71,71,71,71,172,71,71,-59,-60,193,]),'STRING_LITERAL':([40,41,59,66,68,77,80,81,84,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,129,134,165,180,181,182,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,-88,-89,-90,-91,-92,-93,72,72,72,72,72,72,72,72,72,72,-59,-60,]),'TRUE':([40,41,59,66,68,77,80,81,84,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,129,134,165,180,181,182,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,-88,-89,-90,-91,-92,-93,73,73,73,73,73,73,73,73,73,73,-59,-60,]),'FALSE':([40,41,59,66,68,77,80,81,84,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,129,134,165,180,181,182,],[74,74,74,74,74,74,74,74,74,74,74,74,74,74,-88,-89,-90,-91,-92,-93,74,74,74,74,74,74,74,74,74,74,-59,-60,]),'LBRACKET':([43,76,95,138,],[81,126,140,81,]),'INTEGER':([49,145,173,192,],[89,89,89,89,]),'REAL':([49,145,173,192,],[90,90,90,90,]),'BOOLEAN':([49,145,173,192,],[91,91,91,91,]),'CHAR':([49,145,173,192,],[92,92,92,92,]),'STRING':([49,145,173,192,],[93,93,93,93,]),'ARRAY':([49,145,173,192,],[95,95,95,95,]),'RPAREN':([54,55,61,62,63,64,65,67,69,70,71,72,73,74,75,76,80,84,89,90,91,92,93,94,99,100,101,103,109,123,124,125,127,130,131,132,135,136,137,138,143,149,150,151,152,153,154,155,156,157,158,160,164,166,174,175,178,179,183,184,188,191,196,],[-32,-32,-80,-81,-83,-87,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-76,-76,-15,-16,-17,-18,-19,-20,142,-31,-35,146,-85,-102,-103,-76,160,163,-75,-79,168,169,-71,-54,-33,-82,-84,-95,-96,-86,-98,-99,-100,-101,178,-112,-77,-55,-35,-36,-111,-53,-79,-72,-34,-78,-21,]),'THEN':([60,61,62,63,64,65,67,69,70,71,72,73,74,75,76,109,123,124,149,150,151,152,153,154,155,156,157,160,178,179,],[106,-80,-81,-83,-87,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-85,-102,-103,-82,-84,-95,-96,-86,-98,-99,-100,-101,-112,-111,-53,]),'DO':([61,62,63,64,65,67,69,70,71,72,73,74,75,76,78,109,123,124,149,150,151,152,153,154,155,156,157,160,178,179,190,],[-80,-81,-83,-87,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,128,-85,-102,-103,-82,-84,-95,-96,-86,-98,-99,-100,-101,-112,-111,-53,195,]),'RBRACKET':([61,62,63,64,65,67,69,70,71,72,73,74,75,76,109,123,124,133,149,150,151,152,153,154,155,156,157,159,160,171,178,179,193,],[-80,-81,-83,-87,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-85,-102,-103,166,-82,-84,-95,-96,-86,-98,-99,-100,-101,179,-112,185,-111,-53,-22,]),'TO':([61,62,63,64,65,67,69,70,71,72,73,74,75,76,109,123,124,149,150,151,152,153,154,155,156,157,160,162,178,179,],[-80,-81,-83,-87,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-85,-102,-103,-82,-84,-95,-96,-86,-98,-99,-100,-101,-112,181,-111,-53,]),'DOWNTO':([61,62,63,64,65,67,69,70,71,72,73,74,75,76,109,123,124,149,150,151,152,153,154,155,156,157,160,162,178,179,],[-80,-81,-83,-87,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-85,-102,-103,-82,-84,-95,-96,-86,-98,-99,-100,-101,-112,182,-111,-53,]),'OR':([61,62,63,64,65,67,69,70,71,72,73,74,75,76,109,123,124,149,150,151,152,153,154,155,156,157,160,178,179,],[107,-81,-83,-87,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-85,-102,-103,-82,-84,-95,-96,-86,-98,-99,-100,-101,-112,-111,-53,]),'AND':([62,63,64,65,67,69,70,71,72,73,74,75,76,109,123,124,149,150,151,152,153,154,155,156,157,160,178,179,],[108,-83,-87,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-85,-102,-103,108,-84,-95,-96,-86,-98,-99,-100,-101,-112,-111,-53,]),'PLUS':([64,65,67,69,70,71,72,73,74,75,76,123,124,151,152,153,154,155,156,157,160,178,179,],[110,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-102,-103,-95,-96,110,-98,-99,-100,-101,-112,-111,-53,]),'EQUAL':([64,65,67,69,70,71,72,73,74,75,76,123,124,151,152,154,155,156,157,160,178,179,],[113,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-102,-103,-95,-96,-98,-99,-100,-101,-112,-111,-53,]),'NOTEQUAL':([64,65,67,69,70,71,72,73,74,75,76,123,124,151,152,154,155,156,157,160,178,179,],[114,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-102,-103,-95,-96,-98,-99,-100,-101,-112,-111,-53,]),'LESS':([64,65,67,69,70,71,72,73,74,75,76,123,124,151,152,154,155,156,157,160,178,179,],[115,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-102,-103,-95,-96,-98,-99,-100,-101,-112,-111,-53,]),'LESSEQUAL':([64,65,67,69,70,71,72,73,74,75,76,123,124,151,152,154,155,156,157,160,178,179,],[116,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-102,-103,-95,-96,-98,-99,-100,-101,-112,-111,-53,]),'GREATER':([64,65,67,69,70,71,72,73,74,75,76,123,124,151,152,154,155,156,157,160,178,179,],[117,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-102,-103,-95,-96,-98,-99,-100,-101,-112,-111,-53,]),'GREATEREQUAL':([64,65,67,69,70,71,72,73,74,75,76,123,124,151,152,154,155,156,157,160,178,179,],[118,-94,-97,-104,-105,-106,-107,-108,-109,-110,-52,-102,-103,-95,-96,-98,-99,-100,-101,-112,-111,-53,]),'TIMES':([65,67,69,70,71,72,73,74,75,76,123,124,151,152,154,155,156,157,160,178,179,],[119,-97,-104,-105,-106,-107,-108,-109,-110,-52,-102,-103,119,119,-98,-99,-100,-101,-112,-111,-53,]),'DIVIDE':([65,67,69,70,71,72,73,74,75,76,123,124,151,152,154,155,156,157,160,178,179,],[120,-97,-104,-105,-106,-107,-108,-109,-110,-52,-102,-103,120,120,-98,-99,-100,-101,-112,-111,-53,]),'DIV':([65,67,69,70,71,72,73,74,75,76,123,124,151,152,154,155,156,157,160,178,179,],[121,-97,-104,-105,-106,-107,-108,-109,-110,-52,-102,-103,121,121,-98,-99,-100,-101,-112,-111,-53,]),'MOD':([65,67,69,70,71,72,73,74,75,76,123,124,151,152,154,155,156,157,160,178,179,],[122,-97,-104,-105,-106,-107,-108,-109,-110,-52,-102,-103,122,122,-98,-99,-100,-101,-112,-111,-53,]),'RANGE':([172,],[186,]),'OF':([185,],[192,]),}
+_lr_action_items = {'PROGRAM':([0,],[2,]),'$end':([1,17,],[0,-1,]),'ID':([2,10,15,16,19,22,40,41,42,44,47,51,54,55,57,58,65,67,76,79,80,83,85,103,104,105,107,108,109,110,111,112,113,114,115,116,117,118,119,122,123,125,126,131,136,141,161,166,173,176,177,178,191,],[3,24,27,28,43,24,75,75,78,43,24,95,24,24,43,75,75,75,75,75,75,75,135,43,75,75,75,75,75,-83,-84,-85,-86,-87,-88,75,75,75,75,75,75,43,75,75,-11,24,75,135,43,75,-56,-57,43,]),'SEMICOLON':([3,18,25,26,30,31,32,33,34,35,36,37,38,43,45,46,56,60,61,62,63,64,66,68,69,70,71,72,73,74,75,82,84,87,88,89,90,91,92,93,98,101,102,106,120,121,143,144,145,146,147,148,149,150,151,152,153,156,157,159,163,164,165,170,171,174,175,183,185,192,193,],[4,-2,52,53,57,-39,-41,-42,-43,-44,-45,-46,-47,-60,-69,-65,-35,-75,-76,-78,-82,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-62,-63,136,-15,-16,-17,-18,-19,-20,141,-40,-48,-80,-97,-98,172,-53,-77,-79,-90,-91,-81,-93,-94,-95,-96,-107,-55,-61,-59,-68,-64,141,-34,-106,-50,190,-54,-21,-58,]),'BEGIN':([4,6,7,8,9,11,12,13,14,19,20,21,22,44,47,48,52,53,57,86,103,125,136,172,173,190,191,],[-4,19,-4,-5,-6,-23,-24,-4,-4,19,-3,-7,-10,19,-10,-8,-26,-28,19,-9,19,19,-11,-27,19,-25,19,]),'VAR':([4,7,8,9,11,12,13,14,21,22,47,48,52,53,86,136,172,190,],[10,10,-5,-6,-23,-24,10,10,-7,-10,-10,-8,-26,-28,-9,-11,-27,-25,]),'FUNCTION':([4,7,8,9,11,12,13,14,21,22,47,48,52,53,86,136,172,190,],[15,15,-5,-6,-23,-24,15,15,-7,-10,-10,-8,-26,-28,-9,-11,-27,-25,]),'PROCEDURE':([4,7,8,9,11,12,13,14,21,22,47,48,52,53,86,136,172,190,],[16,16,-5,-6,-23,-24,16,16,-7,-10,-10,-8,-26,-28,-9,-11,-27,-25,]),'DOT':([5,18,56,],[17,-2,-35,]),'END':([19,29,30,31,32,33,34,35,36,37,38,43,45,46,56,57,60,61,62,63,64,66,68,69,70,71,72,73,74,75,82,84,101,102,106,120,121,144,145,146,147,148,149,150,151,152,153,156,157,159,163,164,165,174,175,185,193,],[-38,56,-36,-39,-41,-42,-43,-44,-45,-46,-47,-60,-69,-65,-35,-37,-75,-76,-78,-82,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-62,-63,-40,-48,-80,-97,-98,-53,-77,-79,-90,-91,-81,-93,-94,-95,-96,-107,-55,-61,-59,-68,-64,-106,-50,-54,-58,]),'IF':([19,44,57,103,125,173,191,],[40,40,40,40,40,40,40,]),'WHILE':([19,44,57,103,125,173,191,],[41,41,41,41,41,41,41,]),'FOR':([19,44,57,103,125,173,191,],[42,42,42,42,42,42,42,]),'REPEAT':([19,44,57,103,125,173,191,],[44,44,44,44,44,44,44,]),'WRITELN':([19,44,57,103,125,173,191,],[45,45,45,45,45,45,45,]),'READLN':([19,44,57,103,125,173,191,],[46,46,46,46,46,46,46,]),'COLON':([23,24,50,95,99,138,139,],[49,-14,-12,-14,142,-13,169,]),'COMMA':([24,60,61,62,63,64,66,68,69,70,71,72,73,74,75,95,106,120,121,129,134,135,145,146,147,148,149,150,151,152,153,156,162,174,175,179,],[51,-75,-76,-78,-82,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,51,-80,-97,-98,161,166,-51,-77,-79,-90,-91,-81,-93,-94,-95,-96,-107,-52,-106,-50,161,]),'LPAREN':([27,28,40,41,43,45,46,58,65,67,75,76,79,80,83,104,105,107,108,109,110,111,112,113,114,115,116,117,118,119,122,123,126,131,161,176,177,178,],[54,55,76,76,79,83,85,76,76,76,122,76,76,76,76,76,76,76,76,76,-83,-84,-85,-86,-87,-88,76,76,76,76,76,76,76,76,76,76,-56,-57,]),'UNTIL':([30,31,32,33,34,35,36,37,38,43,44,45,46,56,57,60,61,62,63,64,66,68,69,70,71,72,73,74,75,81,82,84,101,102,106,120,121,144,145,146,147,148,149,150,151,152,153,156,157,159,163,164,165,174,175,185,193,],[-36,-39,-41,-42,-43,-44,-45,-46,-47,-60,-38,-69,-65,-35,-37,-75,-76,-78,-82,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,131,-62,-63,-40,-48,-80,-97,-98,-53,-77,-79,-90,-91,-81,-93,-94,-95,-96,-107,-55,-61,-59,-68,-64,-106,-50,-54,-58,]),'ELSE':([32,33,34,35,36,37,38,43,45,46,56,60,61,62,63,64,66,68,69,70,71,72,73,74,75,82,84,102,106,120,121,144,145,146,147,148,149,150,151,152,153,156,157,159,163,164,165,174,175,185,193,],[-41,-42,-43,-44,-45,-46,-47,-60,-69,-65,-35,-75,-76,-78,-82,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-62,-63,-48,-80,-97,-98,173,-77,-79,-90,-91,-81,-93,-94,-95,-96,-107,-55,-61,-59,-68,-64,-106,-50,-54,-58,]),'ASSIGN':([39,43,78,162,],[58,-51,126,-52,]),'MINUS':([40,41,58,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,83,104,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,126,131,147,148,149,150,151,152,153,156,161,174,175,176,177,178,],[65,65,65,108,-89,65,-92,65,-99,-100,-101,-102,-103,-104,-105,-49,65,65,65,65,65,65,65,65,65,-83,-84,-85,-86,-87,-88,65,65,65,65,-97,-98,65,65,65,65,-90,-91,108,-93,-94,-95,-96,-107,65,-106,-50,65,-56,-57,]),'NOT':([40,41,58,65,67,76,79,80,83,104,105,107,108,109,110,111,112,113,114,115,116,117,118,119,122,123,126,131,161,176,177,178,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,-83,-84,-85,-86,-87,-88,67,67,67,67,67,67,67,67,67,67,-56,-57,]),'NUMBER_REAL':([40,41,58,65,67,76,79,80,83,104,105,107,108,109,110,111,112,113,114,115,116,117,118,119,122,123,126,131,161,176,177,178,],[69,69,69,69,69,69,69,69,69,69,69,69,69,69,-83,-84,-85,-86,-87,-88,69,69,69,69,69,69,69,69,69,69,-56,-57,]),'NUMBER_INT':([40,41,58,65,67,76,79,80,83,104,105,107,108,109,110,111,112,113,114,115,116,117,118,119,122,123,126,131,137,161,176,177,178,182,],[70,70,70,70,70,70,70,70,70,70,70,70,70,70,-83,-84,-85,-86,-87,-88,70,70,70,70,70,70,70,70,168,70,70,-56,-57,189,]),'STRING_LITERAL':([40,41,58,65,67,76,79,80,83,104,105,107,108,109,110,111,112,113,114,115,116,117,118,119,122,123,126,131,161,176,177,178,],[71,71,71,71,71,71,71,71,71,71,71,71,71,71,-83,-84,-85,-86,-87,-88,71,71,71,71,71,71,71,71,71,71,-56,-57,]),'TRUE':([40,41,58,65,67,76,79,80,83,104,105,107,108,109,110,111,112,113,114,115,116,117,118,119,122,123,126,131,161,176,177,178,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,-83,-84,-85,-86,-87,-88,72,72,72,72,72,72,72,72,72,72,-56,-57,]),'FALSE':([40,41,58,65,67,76,79,80,83,104,105,107,108,109,110,111,112,113,114,115,116,117,118,119,122,123,126,131,161,176,177,178,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,-83,-84,-85,-86,-87,-88,73,73,73,73,73,73,73,73,73,73,-56,-57,]),'LBRACKET':([43,75,94,135,],[80,123,137,80,]),'INTEGER':([49,142,169,188,],[88,88,88,88,]),'REAL':([49,142,169,188,],[89,89,89,89,]),'BOOLEAN':([49,142,169,188,],[90,90,90,90,]),'CHAR':([49,142,169,188,],[91,91,91,91,]),'STRING':([49,142,169,188,],[92,92,92,92,]),'ARRAY':([49,142,169,188,],[94,94,94,94,]),'RPAREN':([54,55,60,61,62,63,64,66,68,69,70,71,72,73,74,75,79,83,88,89,90,91,92,93,96,97,98,100,106,120,121,122,124,127,128,129,132,133,134,135,140,145,146,147,148,149,150,151,152,153,154,156,160,162,170,171,174,175,179,180,184,187,192,],[-30,-30,-75,-76,-78,-82,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-71,-71,-15,-16,-17,-18,-19,-20,139,-29,-33,143,-80,-97,-98,-71,156,159,-70,-74,164,165,-66,-51,-31,-77,-79,-90,-91,-81,-93,-94,-95,-96,174,-107,-72,-52,-33,-34,-106,-50,-74,-67,-32,-73,-21,]),'THEN':([59,60,61,62,63,64,66,68,69,70,71,72,73,74,75,106,120,121,145,146,147,148,149,150,151,152,153,156,174,175,],[103,-75,-76,-78,-82,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-80,-97,-98,-77,-79,-90,-91,-81,-93,-94,-95,-96,-107,-106,-50,]),'DO':([60,61,62,63,64,66,68,69,70,71,72,73,74,75,77,106,120,121,145,146,147,148,149,150,151,152,153,156,174,175,186,],[-75,-76,-78,-82,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,125,-80,-97,-98,-77,-79,-90,-91,-81,-93,-94,-95,-96,-107,-106,-50,191,]),'RBRACKET':([60,61,62,63,64,66,68,69,70,71,72,73,74,75,106,120,121,130,145,146,147,148,149,150,151,152,153,155,156,167,174,175,189,],[-75,-76,-78,-82,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-80,-97,-98,162,-77,-79,-90,-91,-81,-93,-94,-95,-96,175,-107,181,-106,-50,-22,]),'TO':([60,61,62,63,64,66,68,69,70,71,72,73,74,75,106,120,121,145,146,147,148,149,150,151,152,153,156,158,174,175,],[-75,-76,-78,-82,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-80,-97,-98,-77,-79,-90,-91,-81,-93,-94,-95,-96,-107,177,-106,-50,]),'DOWNTO':([60,61,62,63,64,66,68,69,70,71,72,73,74,75,106,120,121,145,146,147,148,149,150,151,152,153,156,158,174,175,],[-75,-76,-78,-82,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-80,-97,-98,-77,-79,-90,-91,-81,-93,-94,-95,-96,-107,178,-106,-50,]),'OR':([60,61,62,63,64,66,68,69,70,71,72,73,74,75,106,120,121,145,146,147,148,149,150,151,152,153,156,174,175,],[104,-76,-78,-82,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-80,-97,-98,-77,-79,-90,-91,-81,-93,-94,-95,-96,-107,-106,-50,]),'AND':([61,62,63,64,66,68,69,70,71,72,73,74,75,106,120,121,145,146,147,148,149,150,151,152,153,156,174,175,],[105,-78,-82,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-80,-97,-98,105,-79,-90,-91,-81,-93,-94,-95,-96,-107,-106,-50,]),'PLUS':([63,64,66,68,69,70,71,72,73,74,75,120,121,147,148,149,150,151,152,153,156,174,175,],[107,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-97,-98,-90,-91,107,-93,-94,-95,-96,-107,-106,-50,]),'EQUAL':([63,64,66,68,69,70,71,72,73,74,75,120,121,147,148,150,151,152,153,156,174,175,],[110,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-97,-98,-90,-91,-93,-94,-95,-96,-107,-106,-50,]),'NOTEQUAL':([63,64,66,68,69,70,71,72,73,74,75,120,121,147,148,150,151,152,153,156,174,175,],[111,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-97,-98,-90,-91,-93,-94,-95,-96,-107,-106,-50,]),'LESS':([63,64,66,68,69,70,71,72,73,74,75,120,121,147,148,150,151,152,153,156,174,175,],[112,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-97,-98,-90,-91,-93,-94,-95,-96,-107,-106,-50,]),'LESSEQUAL':([63,64,66,68,69,70,71,72,73,74,75,120,121,147,148,150,151,152,153,156,174,175,],[113,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-97,-98,-90,-91,-93,-94,-95,-96,-107,-106,-50,]),'GREATER':([63,64,66,68,69,70,71,72,73,74,75,120,121,147,148,150,151,152,153,156,174,175,],[114,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-97,-98,-90,-91,-93,-94,-95,-96,-107,-106,-50,]),'GREATEREQUAL':([63,64,66,68,69,70,71,72,73,74,75,120,121,147,148,150,151,152,153,156,174,175,],[115,-89,-92,-99,-100,-101,-102,-103,-104,-105,-49,-97,-98,-90,-91,-93,-94,-95,-96,-107,-106,-50,]),'TIMES':([64,66,68,69,70,71,72,73,74,75,120,121,147,148,150,151,152,153,156,174,175,],[116,-92,-99,-100,-101,-102,-103,-104,-105,-49,-97,-98,116,116,-93,-94,-95,-96,-107,-106,-50,]),'DIVIDE':([64,66,68,69,70,71,72,73,74,75,120,121,147,148,150,151,152,153,156,174,175,],[117,-92,-99,-100,-101,-102,-103,-104,-105,-49,-97,-98,117,117,-93,-94,-95,-96,-107,-106,-50,]),'DIV':([64,66,68,69,70,71,72,73,74,75,120,121,147,148,150,151,152,153,156,174,175,],[118,-92,-99,-100,-101,-102,-103,-104,-105,-49,-97,-98,118,118,-93,-94,-95,-96,-107,-106,-50,]),'MOD':([64,66,68,69,70,71,72,73,74,75,120,121,147,148,150,151,152,153,156,174,175,],[119,-92,-99,-100,-101,-102,-103,-104,-105,-49,-97,-98,119,119,-93,-94,-95,-96,-107,-106,-50,]),'RANGE':([168,],[182,]),'OF':([181,],[188,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'programa':([0,],[1,]),'bloco':([4,25,26,],[5,52,53,]),'decls':([4,7,25,26,],[6,20,6,6,]),'decl':([4,7,25,26,],[7,7,7,7,]),'var_section':([4,7,25,26,],[8,8,8,8,]),'subprog_decl':([4,7,25,26,],[9,9,9,9,]),'function_decl':([4,7,25,26,],[11,11,11,11,]),'procedure_decl':([4,7,25,26,],[12,12,12,12,]),'function_header':([4,7,25,26,],[13,13,13,13,]),'procedure_header':([4,7,25,26,],[14,14,14,14,]),'compound_stmt':([6,19,44,58,106,128,177,197,],[18,37,37,37,37,37,37,37,]),'var_decl_list':([10,],[21,]),'var_decl':([10,22,47,],[22,47,47,]),'id_list':([10,22,47,54,55,144,],[23,23,23,102,102,102,]),'func_enter':([13,],[25,]),'proc_enter':([14,],[26,]),'stmt_list_opt':([19,44,],[29,82,]),'stmt_list':([19,44,],[30,30,]),'stmt':([19,44,58,106,128,177,197,],[31,31,104,148,161,189,198,]),'assign_stmt':([19,44,58,106,128,177,197,],[32,32,32,32,32,32,32,]),'if_stmt':([19,44,58,106,128,177,197,],[33,33,33,33,33,33,33,]),'while_stmt':([19,44,58,106,128,177,197,],[34,34,34,34,34,34,34,]),'for_stmt':([19,44,58,106,128,177,197,],[35,35,35,35,35,35,35,]),'repeat_stmt':([19,44,58,106,128,177,197,],[36,36,36,36,36,36,36,]),'proc_call':([19,44,58,106,128,177,197,],[38,38,38,38,38,38,38,]),'lvalue':([19,44,58,86,106,128,170,177,197,],[39,39,39,137,39,39,137,39,39,]),'var_decl_list_tail':([22,47,],[48,87,]),'id_list_tail':([24,96,],[50,141,]),'stmt_list_tail':([31,104,],[57,147,]),'expr':([40,41,59,77,80,81,84,125,126,129,134,165,180,],[60,78,105,127,132,133,132,132,159,162,167,183,190,]),'or_expr':([40,41,59,77,80,81,84,125,126,129,134,165,180,],[61,61,61,61,61,61,61,61,61,61,61,61,61,]),'and_expr':([40,41,59,77,80,81,84,107,125,126,129,134,165,180,],[62,62,62,62,62,62,62,149,62,62,62,62,62,62,]),'rel_expr':([40,41,59,77,80,81,84,107,108,125,126,129,134,165,180,],[63,63,63,63,63,63,63,63,150,63,63,63,63,63,63,]),'add_expr':([40,41,59,77,80,81,84,107,108,112,125,126,129,134,165,180,],[64,64,64,64,64,64,64,64,64,153,64,64,64,64,64,64,]),'mul_expr':([40,41,59,77,80,81,84,107,108,110,111,112,125,126,129,134,165,180,],[65,65,65,65,65,65,65,65,65,151,152,65,65,65,65,65,65,65,]),'unary_expr':([40,41,59,66,68,77,80,81,84,107,108,110,111,112,119,120,121,122,125,126,129,134,165,180,],[67,67,67,123,124,67,67,67,67,67,67,67,67,67,154,155,156,157,67,67,67,67,67,67,]),'primary':([40,41,59,66,68,77,80,81,84,107,108,110,111,112,119,120,121,122,125,126,129,134,165,180,],[69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,]),'var_ref':([40,41,59,66,68,77,80,81,84,107,108,110,111,112,119,120,121,122,125,126,129,134,165,180,],[75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'args_opt':([45,],[83,]),'read_args_opt':([46,],[85,]),'tipo':([49,145,173,192,],[88,175,187,196,]),'array_type':([49,145,173,192,],[94,94,94,94,]),'param_list_opt':([54,55,],[99,103,]),'param_list':([54,55,],[100,100,]),'param':([54,55,144,],[101,101,174,]),'rel_opt':([64,],[109,]),'relop':([64,],[112,]),'arg_list_opt':([80,84,125,],[130,135,158,]),'arg_list':([80,84,125,],[131,131,131,]),'read_var_list':([86,170,],[136,184,]),'param_list_tail':([101,174,],[143,188,]),'arg_list_tail':([132,183,],[164,191,]),'range':([140,],[171,]),'for_dir':([162,],[180,]),'for_enter':([195,],[197,]),'for_exit':([198,],[199,]),}
+_lr_goto_items = {'programa':([0,],[1,]),'bloco':([4,13,14,],[5,25,26,]),'decls':([4,7,13,14,],[6,20,6,6,]),'decl':([4,7,13,14,],[7,7,7,7,]),'var_section':([4,7,13,14,],[8,8,8,8,]),'subprog_decl':([4,7,13,14,],[9,9,9,9,]),'function_decl':([4,7,13,14,],[11,11,11,11,]),'procedure_decl':([4,7,13,14,],[12,12,12,12,]),'function_header':([4,7,13,14,],[13,13,13,13,]),'procedure_header':([4,7,13,14,],[14,14,14,14,]),'compound_stmt':([6,19,44,57,103,125,173,191,],[18,37,37,37,37,37,37,37,]),'var_decl_list':([10,],[21,]),'var_decl':([10,22,47,],[22,47,47,]),'id_list':([10,22,47,54,55,141,],[23,23,23,99,99,99,]),'stmt_list_opt':([19,44,],[29,81,]),'stmt_list':([19,44,],[30,30,]),'stmt':([19,44,57,103,125,173,191,],[31,31,101,144,157,185,193,]),'assign_stmt':([19,44,57,103,125,173,191,],[32,32,32,32,32,32,32,]),'if_stmt':([19,44,57,103,125,173,191,],[33,33,33,33,33,33,33,]),'while_stmt':([19,44,57,103,125,173,191,],[34,34,34,34,34,34,34,]),'for_stmt':([19,44,57,103,125,173,191,],[35,35,35,35,35,35,35,]),'repeat_stmt':([19,44,57,103,125,173,191,],[36,36,36,36,36,36,36,]),'proc_call':([19,44,57,103,125,173,191,],[38,38,38,38,38,38,38,]),'lvalue':([19,44,57,85,103,125,166,173,191,],[39,39,39,134,39,39,134,39,39,]),'var_decl_list_tail':([22,47,],[48,86,]),'id_list_tail':([24,95,],[50,138,]),'expr':([40,41,58,76,79,80,83,122,123,126,131,161,176,],[59,77,102,124,129,130,129,129,155,158,163,179,186,]),'or_expr':([40,41,58,76,79,80,83,122,123,126,131,161,176,],[60,60,60,60,60,60,60,60,60,60,60,60,60,]),'and_expr':([40,41,58,76,79,80,83,104,122,123,126,131,161,176,],[61,61,61,61,61,61,61,145,61,61,61,61,61,61,]),'rel_expr':([40,41,58,76,79,80,83,104,105,122,123,126,131,161,176,],[62,62,62,62,62,62,62,62,146,62,62,62,62,62,62,]),'add_expr':([40,41,58,76,79,80,83,104,105,109,122,123,126,131,161,176,],[63,63,63,63,63,63,63,63,63,149,63,63,63,63,63,63,]),'mul_expr':([40,41,58,76,79,80,83,104,105,107,108,109,122,123,126,131,161,176,],[64,64,64,64,64,64,64,64,64,147,148,64,64,64,64,64,64,64,]),'unary_expr':([40,41,58,65,67,76,79,80,83,104,105,107,108,109,116,117,118,119,122,123,126,131,161,176,],[66,66,66,120,121,66,66,66,66,66,66,66,66,66,150,151,152,153,66,66,66,66,66,66,]),'primary':([40,41,58,65,67,76,79,80,83,104,105,107,108,109,116,117,118,119,122,123,126,131,161,176,],[68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'var_ref':([40,41,58,65,67,76,79,80,83,104,105,107,108,109,116,117,118,119,122,123,126,131,161,176,],[74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'args_opt':([45,],[82,]),'read_args_opt':([46,],[84,]),'tipo':([49,142,169,188,],[87,171,183,192,]),'array_type':([49,142,169,188,],[93,93,93,93,]),'param_list_opt':([54,55,],[96,100,]),'param_list':([54,55,],[97,97,]),'param':([54,55,141,],[98,98,170,]),'rel_opt':([63,],[106,]),'relop':([63,],[109,]),'arg_list_opt':([79,83,122,],[127,132,154,]),'arg_list':([79,83,122,],[128,128,128,]),'read_var_list':([85,166,],[133,180,]),'param_list_tail':([98,170,],[140,184,]),'arg_list_tail':([129,179,],[160,187,]),'range':([137,],[167,]),'for_dir':([158,],[176,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,116 +27,111 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> programa","S'",1,None,None,None),
-  ('programa -> PROGRAM ID SEMICOLON bloco DOT','programa',5,'p_programa','parser.py',106),
-  ('bloco -> decls compound_stmt','bloco',2,'p_bloco','parser.py',129),
-  ('decls -> decl decls','decls',2,'p_decls_multi','parser.py',138),
-  ('decls -> <empty>','decls',0,'p_decls_empty','parser.py',141),
-  ('decl -> var_section','decl',1,'p_decl_single1','parser.py',144),
-  ('decl -> subprog_decl','decl',1,'p_decl_single2','parser.py',147),
-  ('var_section -> VAR var_decl_list','var_section',2,'p_var_section','parser.py',155),
-  ('var_decl_list -> var_decl var_decl_list_tail','var_decl_list',2,'p_var_decl_list','parser.py',158),
-  ('var_decl_list_tail -> var_decl var_decl_list_tail','var_decl_list_tail',2,'p_var_decl_list_tail_multi','parser.py',161),
-  ('var_decl_list_tail -> <empty>','var_decl_list_tail',0,'p_var_decl_list_tail_single_empty','parser.py',164),
-  ('var_decl -> id_list COLON tipo SEMICOLON','var_decl',4,'p_var_decl','parser.py',167),
-  ('id_list -> ID id_list_tail','id_list',2,'p_id_list','parser.py',205),
-  ('id_list_tail -> COMMA ID id_list_tail','id_list_tail',3,'p_id_list_tail_multi','parser.py',209),
-  ('id_list_tail -> <empty>','id_list_tail',0,'p_id_list_tail_empty','parser.py',213),
-  ('tipo -> INTEGER','tipo',1,'p_tipo_integer','parser.py',222),
-  ('tipo -> REAL','tipo',1,'p_tipo_real','parser.py',226),
-  ('tipo -> BOOLEAN','tipo',1,'p_tipo_boolean','parser.py',230),
-  ('tipo -> CHAR','tipo',1,'p_tipo_char','parser.py',234),
-  ('tipo -> STRING','tipo',1,'p_tipo_string','parser.py',238),
-  ('tipo -> array_type','tipo',1,'p_tipo_array_type','parser.py',242),
-  ('array_type -> ARRAY LBRACKET range RBRACKET OF tipo','array_type',6,'p_array_type','parser.py',246),
-  ('range -> NUMBER_INT RANGE NUMBER_INT','range',3,'p_range','parser.py',250),
-  ('subprog_decl -> function_decl','subprog_decl',1,'p_subprog_decl_single1','parser.py',262),
-  ('subprog_decl -> procedure_decl','subprog_decl',1,'p_subprog_decl_single2','parser.py',265),
-  ('function_header -> FUNCTION ID LPAREN param_list_opt RPAREN COLON tipo SEMICOLON','function_header',8,'p_function_header','parser.py',273),
-  ('func_enter -> <empty>','func_enter',0,'p_func_enter','parser.py',282),
-  ('function_decl -> function_header func_enter bloco SEMICOLON','function_decl',4,'p_function_decl','parser.py',326),
-  ('procedure_header -> PROCEDURE ID LPAREN param_list_opt RPAREN SEMICOLON','procedure_header',6,'p_procedure_header','parser.py',361),
-  ('proc_enter -> <empty>','proc_enter',0,'p_proc_enter','parser.py',369),
-  ('procedure_decl -> procedure_header proc_enter bloco SEMICOLON','procedure_decl',4,'p_procedure_decl','parser.py',398),
-  ('param_list_opt -> param_list','param_list_opt',1,'p_param_list_opt_single','parser.py',422),
-  ('param_list_opt -> <empty>','param_list_opt',0,'p_param_list_opt_empty','parser.py',426),
-  ('param_list -> param param_list_tail','param_list',2,'p_param_list','parser.py',430),
-  ('param_list_tail -> SEMICOLON param param_list_tail','param_list_tail',3,'p_param_list_tail_multi','parser.py',434),
-  ('param_list_tail -> <empty>','param_list_tail',0,'p_param_list_tail_empty','parser.py',438),
-  ('param -> id_list COLON tipo','param',3,'p_param','parser.py',442),
-  ('compound_stmt -> BEGIN stmt_list_opt END','compound_stmt',3,'p_compound_stmt','parser.py',452),
-  ('stmt_list_opt -> stmt_list','stmt_list_opt',1,'p_stmt_list_opt_single','parser.py',456),
-  ('stmt_list_opt -> <empty>','stmt_list_opt',0,'p_stmt_list_opt_empty','parser.py',460),
-  ('stmt_list -> stmt stmt_list_tail','stmt_list',2,'p_stmt_list','parser.py',464),
-  ('stmt_list_tail -> SEMICOLON stmt stmt_list_tail','stmt_list_tail',3,'p_stmt_list_tail_multi','parser.py',468),
-  ('stmt_list_tail -> SEMICOLON','stmt_list_tail',1,'p_stmt_list_tail_single','parser.py',472),
-  ('stmt_list_tail -> <empty>','stmt_list_tail',0,'p_stmt_list_tail_empty','parser.py',476),
-  ('stmt -> assign_stmt','stmt',1,'p_stmt_single1','parser.py',485),
-  ('stmt -> if_stmt','stmt',1,'p_stmt_single2','parser.py',489),
-  ('stmt -> while_stmt','stmt',1,'p_stmt_single3','parser.py',493),
-  ('stmt -> for_stmt','stmt',1,'p_stmt_single4','parser.py',497),
-  ('stmt -> repeat_stmt','stmt',1,'p_stmt_single5','parser.py',501),
-  ('stmt -> compound_stmt','stmt',1,'p_stmt_single6','parser.py',505),
-  ('stmt -> proc_call','stmt',1,'p_stmt_single7','parser.py',509),
-  ('assign_stmt -> lvalue ASSIGN expr','assign_stmt',3,'p_assign_stmt','parser.py',518),
-  ('var_ref -> ID','var_ref',1,'p_var_ref_single','parser.py',585),
-  ('var_ref -> ID LBRACKET expr RBRACKET','var_ref',4,'p_var_ref_multi','parser.py',589),
-  ('lvalue -> ID','lvalue',1,'p_lvalue_single','parser.py',593),
-  ('lvalue -> ID LBRACKET expr RBRACKET','lvalue',4,'p_lvalue_indexed','parser.py',597),
-  ('if_stmt -> IF expr THEN stmt','if_stmt',4,'p_if_stmt_no_else','parser.py',606),
-  ('if_stmt -> IF expr THEN stmt ELSE stmt','if_stmt',6,'p_if_stmt_with_else','parser.py',617),
-  ('while_stmt -> WHILE expr DO stmt','while_stmt',4,'p_while_stmt','parser.py',634),
-  ('for_dir -> TO','for_dir',1,'p_for_dir_single1','parser.py',652),
-  ('for_dir -> DOWNTO','for_dir',1,'p_for_dir_single2','parser.py',656),
-  ('for_stmt -> FOR ID ASSIGN expr for_dir expr DO for_enter stmt for_exit','for_stmt',10,'p_for_stmt','parser.py',660),
-  ('for_enter -> <empty>','for_enter',0,'p_for_enter','parser.py',712),
-  ('for_exit -> <empty>','for_exit',0,'p_for_exit','parser.py',719),
-  ('repeat_stmt -> REPEAT stmt_list_opt UNTIL expr','repeat_stmt',4,'p_repeat_stmt','parser.py',727),
-  ('proc_call -> ID','proc_call',1,'p_proc_call_single','parser.py',747),
-  ('proc_call -> ID LPAREN arg_list_opt RPAREN','proc_call',4,'p_proc_call_multi1','parser.py',776),
-  ('proc_call -> WRITELN args_opt','proc_call',2,'p_proc_call_multi2','parser.py',824),
-  ('proc_call -> READLN read_args_opt','proc_call',2,'p_proc_call_multi3','parser.py',847),
-  ('read_args_opt -> LPAREN read_var_list RPAREN','read_args_opt',3,'p_read_args_opt_multi','parser.py',899),
-  ('read_args_opt -> <empty>','read_args_opt',0,'p_read_args_opt_empty','parser.py',903),
-  ('read_var_list -> lvalue','read_var_list',1,'p_read_var_list_single','parser.py',907),
-  ('read_var_list -> lvalue COMMA read_var_list','read_var_list',3,'p_read_var_list_multi','parser.py',911),
-  ('args_opt -> LPAREN arg_list_opt RPAREN','args_opt',3,'p_args_opt_multi','parser.py',916),
-  ('args_opt -> <empty>','args_opt',0,'p_args_opt_empty','parser.py',920),
-  ('arg_list_opt -> arg_list','arg_list_opt',1,'p_arg_list_opt_single','parser.py',924),
-  ('arg_list_opt -> <empty>','arg_list_opt',0,'p_arg_list_opt_empty','parser.py',928),
-  ('arg_list -> expr arg_list_tail','arg_list',2,'p_arg_list','parser.py',932),
-  ('arg_list_tail -> COMMA expr arg_list_tail','arg_list_tail',3,'p_arg_list_tail_multi','parser.py',936),
-  ('arg_list_tail -> <empty>','arg_list_tail',0,'p_arg_list_tail_empty','parser.py',940),
-  ('expr -> or_expr','expr',1,'p_expr','parser.py',961),
-  ('or_expr -> and_expr','or_expr',1,'p_or_expr_single','parser.py',965),
-  ('or_expr -> or_expr OR and_expr','or_expr',3,'p_or_expr_multi','parser.py',969),
-  ('and_expr -> rel_expr','and_expr',1,'p_and_expr_single','parser.py',993),
-  ('and_expr -> and_expr AND rel_expr','and_expr',3,'p_and_expr_multi','parser.py',997),
-  ('rel_expr -> add_expr rel_opt','rel_expr',2,'p_rel_expr','parser.py',1020),
-  ('rel_opt -> relop add_expr','rel_opt',2,'p_rel_opt_multi','parser.py',1109),
-  ('rel_opt -> <empty>','rel_opt',0,'p_rel_opt_empty','parser.py',1114),
-  ('relop -> EQUAL','relop',1,'p_relop_single1','parser.py',1118),
-  ('relop -> NOTEQUAL','relop',1,'p_relop_single2','parser.py',1122),
-  ('relop -> LESS','relop',1,'p_relop_single3','parser.py',1126),
-  ('relop -> LESSEQUAL','relop',1,'p_relop_single4','parser.py',1130),
-  ('relop -> GREATER','relop',1,'p_relop_single5','parser.py',1134),
-  ('relop -> GREATEREQUAL','relop',1,'p_relop_single6','parser.py',1138),
-  ('add_expr -> mul_expr','add_expr',1,'p_add_expr_single','parser.py',1142),
-  ('add_expr -> add_expr PLUS mul_expr','add_expr',3,'p_add_expr_multi1','parser.py',1146),
-  ('add_expr -> add_expr MINUS mul_expr','add_expr',3,'p_add_expr_multi2','parser.py',1156),
-  ('mul_expr -> unary_expr','mul_expr',1,'p_mul_expr_single','parser.py',1166),
-  ('mul_expr -> mul_expr TIMES unary_expr','mul_expr',3,'p_mul_expr_multi1','parser.py',1170),
-  ('mul_expr -> mul_expr DIVIDE unary_expr','mul_expr',3,'p_mul_expr_multi2','parser.py',1180),
-  ('mul_expr -> mul_expr DIV unary_expr','mul_expr',3,'p_mul_expr_multi3','parser.py',1200),
-  ('mul_expr -> mul_expr MOD unary_expr','mul_expr',3,'p_mul_expr_multi4','parser.py',1214),
-  ('unary_expr -> MINUS unary_expr','unary_expr',2,'p_unary_expr_multi1','parser.py',1228),
-  ('unary_expr -> NOT unary_expr','unary_expr',2,'p_unary_expr_multi2','parser.py',1241),
-  ('unary_expr -> primary','unary_expr',1,'p_unary_expr_single','parser.py',1250),
-  ('primary -> NUMBER_REAL','primary',1,'p_primary_single1','parser.py',1259),
-  ('primary -> NUMBER_INT','primary',1,'p_primary_single2','parser.py',1263),
-  ('primary -> STRING_LITERAL','primary',1,'p_primary_single3','parser.py',1267),
-  ('primary -> TRUE','primary',1,'p_primary_single4','parser.py',1279),
-  ('primary -> FALSE','primary',1,'p_primary_single5','parser.py',1283),
-  ('primary -> var_ref','primary',1,'p_primary_single6','parser.py',1287),
-  ('primary -> ID LPAREN arg_list_opt RPAREN','primary',4,'p_primary_single7','parser.py',1326),
-  ('primary -> LPAREN expr RPAREN','primary',3,'p_primary_single8','parser.py',1556),
+  ('programa -> PROGRAM ID SEMICOLON bloco DOT','programa',5,'p_programa','parser.py',34),
+  ('bloco -> decls compound_stmt','bloco',2,'p_bloco','parser.py',39),
+  ('decls -> decl decls','decls',2,'p_decls_multi','parser.py',46),
+  ('decls -> <empty>','decls',0,'p_decls_empty','parser.py',50),
+  ('decl -> var_section','decl',1,'p_decl_single1','parser.py',54),
+  ('decl -> subprog_decl','decl',1,'p_decl_single2','parser.py',58),
+  ('var_section -> VAR var_decl_list','var_section',2,'p_var_section','parser.py',65),
+  ('var_decl_list -> var_decl var_decl_list_tail','var_decl_list',2,'p_var_decl_list','parser.py',69),
+  ('var_decl_list_tail -> var_decl var_decl_list_tail','var_decl_list_tail',2,'p_var_decl_list_tail_multi','parser.py',73),
+  ('var_decl_list_tail -> <empty>','var_decl_list_tail',0,'p_var_decl_list_tail_single_empty','parser.py',77),
+  ('var_decl -> id_list COLON tipo SEMICOLON','var_decl',4,'p_var_decl','parser.py',81),
+  ('id_list -> ID id_list_tail','id_list',2,'p_id_list','parser.py',87),
+  ('id_list_tail -> COMMA ID id_list_tail','id_list_tail',3,'p_id_list_tail_multi','parser.py',91),
+  ('id_list_tail -> <empty>','id_list_tail',0,'p_id_list_tail_empty','parser.py',95),
+  ('tipo -> INTEGER','tipo',1,'p_tipo_integer','parser.py',102),
+  ('tipo -> REAL','tipo',1,'p_tipo_real','parser.py',106),
+  ('tipo -> BOOLEAN','tipo',1,'p_tipo_boolean','parser.py',110),
+  ('tipo -> CHAR','tipo',1,'p_tipo_char','parser.py',114),
+  ('tipo -> STRING','tipo',1,'p_tipo_string','parser.py',118),
+  ('tipo -> array_type','tipo',1,'p_tipo_array_type','parser.py',122),
+  ('array_type -> ARRAY LBRACKET range RBRACKET OF tipo','array_type',6,'p_array_type','parser.py',126),
+  ('range -> NUMBER_INT RANGE NUMBER_INT','range',3,'p_range','parser.py',132),
+  ('subprog_decl -> function_decl','subprog_decl',1,'p_subprog_decl_single1','parser.py',140),
+  ('subprog_decl -> procedure_decl','subprog_decl',1,'p_subprog_decl_single2','parser.py',144),
+  ('function_header -> FUNCTION ID LPAREN param_list_opt RPAREN COLON tipo SEMICOLON','function_header',8,'p_function_header','parser.py',151),
+  ('function_decl -> function_header bloco SEMICOLON','function_decl',3,'p_function_decl','parser.py',155),
+  ('procedure_header -> PROCEDURE ID LPAREN param_list_opt RPAREN SEMICOLON','procedure_header',6,'p_procedure_header','parser.py',164),
+  ('procedure_decl -> procedure_header bloco SEMICOLON','procedure_decl',3,'p_procedure_decl','parser.py',168),
+  ('param_list_opt -> param_list','param_list_opt',1,'p_param_list_opt_single','parser.py',177),
+  ('param_list_opt -> <empty>','param_list_opt',0,'p_param_list_opt_empty','parser.py',181),
+  ('param_list -> param param_list_tail','param_list',2,'p_param_list','parser.py',185),
+  ('param_list_tail -> SEMICOLON param param_list_tail','param_list_tail',3,'p_param_list_tail_multi','parser.py',189),
+  ('param_list_tail -> <empty>','param_list_tail',0,'p_param_list_tail_empty','parser.py',193),
+  ('param -> id_list COLON tipo','param',3,'p_param','parser.py',197),
+  ('compound_stmt -> BEGIN stmt_list_opt END','compound_stmt',3,'p_compound_stmt','parser.py',205),
+  ('stmt_list_opt -> stmt_list','stmt_list_opt',1,'p_stmt_list_opt_single','parser.py',209),
+  ('stmt_list_opt -> stmt_list SEMICOLON','stmt_list_opt',2,'p_stmt_list_opt_trailing','parser.py',213),
+  ('stmt_list_opt -> <empty>','stmt_list_opt',0,'p_stmt_list_opt_empty','parser.py',217),
+  ('stmt_list -> stmt','stmt_list',1,'p_stmt_list_single','parser.py',223),
+  ('stmt_list -> stmt_list SEMICOLON stmt','stmt_list',3,'p_stmt_list_multi','parser.py',227),
+  ('stmt -> assign_stmt','stmt',1,'p_stmt_single1','parser.py',235),
+  ('stmt -> if_stmt','stmt',1,'p_stmt_single2','parser.py',239),
+  ('stmt -> while_stmt','stmt',1,'p_stmt_single3','parser.py',243),
+  ('stmt -> for_stmt','stmt',1,'p_stmt_single4','parser.py',247),
+  ('stmt -> repeat_stmt','stmt',1,'p_stmt_single5','parser.py',251),
+  ('stmt -> compound_stmt','stmt',1,'p_stmt_single6','parser.py',255),
+  ('stmt -> proc_call','stmt',1,'p_stmt_single7','parser.py',259),
+  ('assign_stmt -> lvalue ASSIGN expr','assign_stmt',3,'p_assign_stmt','parser.py',266),
+  ('var_ref -> ID','var_ref',1,'p_var_ref_single','parser.py',273),
+  ('var_ref -> ID LBRACKET expr RBRACKET','var_ref',4,'p_var_ref_multi','parser.py',277),
+  ('lvalue -> ID','lvalue',1,'p_lvalue_single','parser.py',281),
+  ('lvalue -> ID LBRACKET expr RBRACKET','lvalue',4,'p_lvalue_indexed','parser.py',285),
+  ('if_stmt -> IF expr THEN stmt','if_stmt',4,'p_if_stmt_no_else','parser.py',292),
+  ('if_stmt -> IF expr THEN stmt ELSE stmt','if_stmt',6,'p_if_stmt_with_else','parser.py',296),
+  ('while_stmt -> WHILE expr DO stmt','while_stmt',4,'p_while_stmt','parser.py',300),
+  ('for_dir -> TO','for_dir',1,'p_for_dir_single1','parser.py',304),
+  ('for_dir -> DOWNTO','for_dir',1,'p_for_dir_single2','parser.py',308),
+  ('for_stmt -> FOR ID ASSIGN expr for_dir expr DO stmt','for_stmt',8,'p_for_stmt','parser.py',312),
+  ('repeat_stmt -> REPEAT stmt_list_opt UNTIL expr','repeat_stmt',4,'p_repeat_stmt','parser.py',317),
+  ('proc_call -> ID','proc_call',1,'p_proc_call_single','parser.py',323),
+  ('proc_call -> ID LPAREN arg_list_opt RPAREN','proc_call',4,'p_proc_call_multi1','parser.py',328),
+  ('proc_call -> WRITELN args_opt','proc_call',2,'p_proc_call_multi2','parser.py',333),
+  ('proc_call -> READLN read_args_opt','proc_call',2,'p_proc_call_multi3','parser.py',338),
+  ('read_args_opt -> LPAREN read_var_list RPAREN','read_args_opt',3,'p_read_args_opt_multi','parser.py',343),
+  ('read_args_opt -> <empty>','read_args_opt',0,'p_read_args_opt_empty','parser.py',347),
+  ('read_var_list -> lvalue','read_var_list',1,'p_read_var_list_single','parser.py',351),
+  ('read_var_list -> lvalue COMMA read_var_list','read_var_list',3,'p_read_var_list_multi','parser.py',355),
+  ('args_opt -> LPAREN arg_list_opt RPAREN','args_opt',3,'p_args_opt_multi','parser.py',360),
+  ('args_opt -> <empty>','args_opt',0,'p_args_opt_empty','parser.py',364),
+  ('arg_list_opt -> arg_list','arg_list_opt',1,'p_arg_list_opt_single','parser.py',368),
+  ('arg_list_opt -> <empty>','arg_list_opt',0,'p_arg_list_opt_empty','parser.py',372),
+  ('arg_list -> expr arg_list_tail','arg_list',2,'p_arg_list','parser.py',376),
+  ('arg_list_tail -> COMMA expr arg_list_tail','arg_list_tail',3,'p_arg_list_tail_multi','parser.py',380),
+  ('arg_list_tail -> <empty>','arg_list_tail',0,'p_arg_list_tail_empty','parser.py',384),
+  ('expr -> or_expr','expr',1,'p_expr','parser.py',391),
+  ('or_expr -> and_expr','or_expr',1,'p_or_expr_single','parser.py',395),
+  ('or_expr -> or_expr OR and_expr','or_expr',3,'p_or_expr_multi','parser.py',399),
+  ('and_expr -> rel_expr','and_expr',1,'p_and_expr_single','parser.py',404),
+  ('and_expr -> and_expr AND rel_expr','and_expr',3,'p_and_expr_multi','parser.py',408),
+  ('rel_expr -> add_expr rel_opt','rel_expr',2,'p_rel_expr','parser.py',413),
+  ('rel_opt -> relop add_expr','rel_opt',2,'p_rel_opt_multi','parser.py',421),
+  ('rel_opt -> <empty>','rel_opt',0,'p_rel_opt_empty','parser.py',426),
+  ('relop -> EQUAL','relop',1,'p_relop_single1','parser.py',430),
+  ('relop -> NOTEQUAL','relop',1,'p_relop_single2','parser.py',434),
+  ('relop -> LESS','relop',1,'p_relop_single3','parser.py',438),
+  ('relop -> LESSEQUAL','relop',1,'p_relop_single4','parser.py',442),
+  ('relop -> GREATER','relop',1,'p_relop_single5','parser.py',446),
+  ('relop -> GREATEREQUAL','relop',1,'p_relop_single6','parser.py',450),
+  ('add_expr -> mul_expr','add_expr',1,'p_add_expr_single','parser.py',454),
+  ('add_expr -> add_expr PLUS mul_expr','add_expr',3,'p_add_expr_multi1','parser.py',458),
+  ('add_expr -> add_expr MINUS mul_expr','add_expr',3,'p_add_expr_multi2','parser.py',462),
+  ('mul_expr -> unary_expr','mul_expr',1,'p_mul_expr_single','parser.py',466),
+  ('mul_expr -> mul_expr TIMES unary_expr','mul_expr',3,'p_mul_expr_multi1','parser.py',470),
+  ('mul_expr -> mul_expr DIVIDE unary_expr','mul_expr',3,'p_mul_expr_multi2','parser.py',474),
+  ('mul_expr -> mul_expr DIV unary_expr','mul_expr',3,'p_mul_expr_multi3','parser.py',478),
+  ('mul_expr -> mul_expr MOD unary_expr','mul_expr',3,'p_mul_expr_multi4','parser.py',482),
+  ('unary_expr -> MINUS unary_expr','unary_expr',2,'p_unary_expr_multi1','parser.py',486),
+  ('unary_expr -> NOT unary_expr','unary_expr',2,'p_unary_expr_multi2','parser.py',490),
+  ('unary_expr -> primary','unary_expr',1,'p_unary_expr_single','parser.py',494),
+  ('primary -> NUMBER_REAL','primary',1,'p_primary_single1','parser.py',501),
+  ('primary -> NUMBER_INT','primary',1,'p_primary_single2','parser.py',505),
+  ('primary -> STRING_LITERAL','primary',1,'p_primary_single3','parser.py',509),
+  ('primary -> TRUE','primary',1,'p_primary_single4','parser.py',518),
+  ('primary -> FALSE','primary',1,'p_primary_single5','parser.py',522),
+  ('primary -> var_ref','primary',1,'p_primary_single6','parser.py',526),
+  ('primary -> ID LPAREN arg_list_opt RPAREN','primary',4,'p_primary_single7','parser.py',530),
+  ('primary -> LPAREN expr RPAREN','primary',3,'p_primary_single8','parser.py',534),
 ]
@@ -0,0 +1,8 @@
+# parsetab_frozen.py
+# Tabelas LALR congeladas, geradas por 'python -m src.tables'. Não editar.
+tabversion = '3.10'
+method = 'LALR'
+signature = 'programanonassocIFXnonassocELSEAND ARRAY ASSIGN BEGIN BOOLEAN CHAR COLON COMMA DIV DIVIDE DO DOT DOWNTO ELSE END EQUAL FALSE FOR FUNCTION GREATER GREATEREQUAL ID IF INTEGER LBRACKET LESS LESSEQUAL LPAREN MINUS MOD NOT NOTEQUAL NUMBER_INT NUMBER_REAL OF OR PLUS PROCEDURE PROGRAM RANGE RBRACKET READLN REAL REPEAT RPAREN SEMICOLON STRING STRING_LITERAL THEN TIMES TO TRUE UNTIL VAR WHILE WRITELNprograma : PROGRAM ID SEMICOLON bloco DOTbloco : decls compound_stmtdecls : decl declsdecls :decl : var_sectiondecl : subprog_declvar_section : VAR var_decl_listvar_decl_list : var_decl var_decl_list_tailvar_decl_list_tail : var_decl var_decl_list_tailvar_decl_list_tail :var_decl : id_list COLON tipo SEMICOLONid_list : ID id_list_tailid_list_tail : COMMA ID id_list_tailid_list_tail :tipo : INTEGERtipo : REALtipo : BOOLEANtipo : CHARtipo : STRINGtipo : array_typearray_type : ARRAY LBRACKET range RBRACKET OF tiporange : NUMBER_INT RANGE NUMBER_INTsubprog_decl : function_declsubprog_decl : procedure_declfunction_header : FUNCTION ID LPAREN param_list_opt RPAREN COLON tipo SEMICOLONfunction_decl : function_header bloco SEMICOLONprocedure_header : PROCEDURE ID LPAREN param_list_opt RPAREN SEMICOLONprocedure_decl : procedure_header bloco SEMICOLONparam_list_opt : param_listparam_list_opt :param_list : param param_list_tailparam_list_tail : SEMICOLON param param_list_tailparam_list_tail :param : id_list COLON tipocompound_stmt : BEGIN stmt_list_opt ENDstmt_list_opt : stmt_liststmt_list_opt : stmt_list SEMICOLONstmt_list_opt :stmt_list : stmtstmt_list : stmt_list SEMICOLON stmtstmt : assign_stmtstmt : if_stmtstmt : while_stmtstmt : for_stmtstmt : repeat_stmtstmt : compound_stmtstmt : proc_callassign_stmt : lvalue ASSIGN exprvar_ref : IDvar_ref : ID LBRACKET expr RBRACKETlvalue : IDlvalue : ID LBRACKET expr RBRACKETif_stmt : IF expr THEN stmt %prec IFXif_stmt : IF expr THEN stmt ELSE stmtwhile_stmt : WHILE expr DO stmtfor_dir : TOfor_dir : DOWNTOfor_stmt : FOR ID ASSIGN expr for_dir expr DO stmtrepeat_stmt : REPEAT stmt_list_opt UNTIL exprproc_call : IDproc_call : ID LPAREN arg_list_opt RPARENproc_call : WRITELN args_optproc_call : READLN read_args_optread_args_opt : LPAREN read_var_list RPARENread_args_opt :read_var_list : lvalueread_var_list : lvalue COMMA read_var_listargs_opt : LPAREN arg_list_opt RPARENargs_opt :arg_list_opt : arg_listarg_list_opt :arg_list : expr arg_list_tailarg_list_tail : COMMA expr arg_list_tailarg_list_tail :expr : or_expror_expr : and_expror_expr : or_expr OR and_exprand_expr : rel_exprand_expr : and_expr AND rel_exprrel_expr : add_expr rel_optrel_opt : relop add_exprrel_opt :relop : EQUALrelop : NOTEQUALrelop : LESSrelop : LESSEQUALrelop : GREATERrelop : GREATEREQUALadd_expr : mul_expradd_expr : add_expr PLUS mul_expradd_expr : add_expr MINUS mul_exprmul_expr : unary_exprmul_expr : mul_expr TIMES unary_exprmul_expr : mul_expr DIVIDE unary_exprmul_expr : mul_expr DIV unary_exprmul_expr : mul_expr MOD unary_exprunary_expr : MINUS unary_exprunary_expr : NOT unary_exprunary_expr : primaryprimary : NUMBER_REALprimary : NUMBER_INTprimary : STRING_LITERALprimary : TRUEprimary : FALSEprimary : var_refprimary : ID LPAREN arg_list_opt RPARENprimary : LPAREN expr RPAREN'
+action = {0: {'PROGRAM': 2}, 1: {'$end': 0}, 17: {'$end': -1}, 2: {'ID': 3}, 10: {'ID': 24}, 15: {'ID': 27}, 16: {'ID': 28}, 19: {'ID': 43, 'BEGIN': 19, 'END': -38, 'IF': 40, 'WHILE': 41, 'FOR': 42, 'REPEAT': 44, 'WRITELN': 45, 'READLN': 46}, 22: {'ID': 24, 'BEGIN': -10, 'VAR': -10, 'FUNCTION': -10, 'PROCEDURE': -10}, 40: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 41: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 42: {'ID': 78}, 44: {'ID': 43, 'BEGIN': 19, 'IF': 40, 'WHILE': 41, 'FOR': 42, 'REPEAT': 44, 'WRITELN': 45, 'READLN': 46, 'UNTIL': -38}, 47: {'ID': 24, 'BEGIN': -10, 'VAR': -10, 'FUNCTION': -10, 'PROCEDURE': -10}, 51: {'ID': 95}, 54: {'ID': 24, 'RPAREN': -30}, 55: {'ID': 24, 'RPAREN': -30}, 57: {'ID': 43, 'BEGIN': 19, 'END': -37, 'IF': 40, 'WHILE': 41, 'FOR': 42, 'REPEAT': 44, 'WRITELN': 45, 'READLN': 46, 'UNTIL': -37}, 58: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 65: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 67: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 76: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 79: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73, 'RPAREN': -71}, 80: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 83: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73, 'RPAREN': -71}, 85: {'ID': 135}, 103: {'ID': 43, 'BEGIN': 19, 'IF': 40, 'WHILE': 41, 'FOR': 42, 'REPEAT': 44, 'WRITELN': 45, 'READLN': 46}, 104: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 105: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 107: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 108: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 109: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 110: {'ID': -83, 'LPAREN': -83, 'MINUS': -83, 'NOT': -83, 'NUMBER_REAL': -83, 'NUMBER_INT': -83, 'STRING_LITERAL': -83, 'TRUE': -83, 'FALSE': -83}, 111: {'ID': -84, 'LPAREN': -84, 'MINUS': -84, 'NOT': -84, 'NUMBER_REAL': -84, 'NUMBER_INT': -84, 'STRING_LITERAL': -84, 'TRUE': -84, 'FALSE': -84}, 112: {'ID': -85, 'LPAREN': -85, 'MINUS': -85, 'NOT': -85, 'NUMBER_REAL': -85, 'NUMBER_INT': -85, 'STRING_LITERAL': -85, 'TRUE': -85, 'FALSE': -85}, 113: {'ID': -86, 'LPAREN': -86, 'MINUS': -86, 'NOT': -86, 'NUMBER_REAL': -86, 'NUMBER_INT': -86, 'STRING_LITERAL': -86, 'TRUE': -86, 'FALSE': -86}, 114: {'ID': -87, 'LPAREN': -87, 'MINUS': -87, 'NOT': -87, 'NUMBER_REAL': -87, 'NUMBER_INT': -87, 'STRING_LITERAL': -87, 'TRUE': -87, 'FALSE': -87}, 115: {'ID': -88, 'LPAREN': -88, 'MINUS': -88, 'NOT': -88, 'NUMBER_REAL': -88, 'NUMBER_INT': -88, 'STRING_LITERAL': -88, 'TRUE': -88, 'FALSE': -88}, 116: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 117: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 118: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 119: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 122: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73, 'RPAREN': -71}, 123: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 125: {'ID': 43, 'BEGIN': 19, 'IF': 40, 'WHILE': 41, 'FOR': 42, 'REPEAT': 44, 'WRITELN': 45, 'READLN': 46}, 126: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 131: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 136: {'ID': -11, 'BEGIN': -11, 'VAR': -11, 'FUNCTION': -11, 'PROCEDURE': -11}, 141: {'ID': 24}, 161: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 166: {'ID': 135}, 173: {'ID': 43, 'BEGIN': 19, 'IF': 40, 'WHILE': 41, 'FOR': 42, 'REPEAT': 44, 'WRITELN': 45, 'READLN': 46}, 176: {'ID': 75, 'LPAREN': 76, 'MINUS': 65, 'NOT': 67, 'NUMBER_REAL': 69, 'NUMBER_INT': 70, 'STRING_LITERAL': 71, 'TRUE': 72, 'FALSE': 73}, 177: {'ID': -56, 'LPAREN': -56, 'MINUS': -56, 'NOT': -56, 'NUMBER_REAL': -56, 'NUMBER_INT': -56, 'STRING_LITERAL': -56, 'TRUE': -56, 'FALSE': -56}, 178: {'ID': -57, 'LPAREN': -57, 'MINUS': -57, 'NOT': -57, 'NUMBER_REAL': -57, 'NUMBER_INT': -57, 'STRING_LITERAL': -57, 'TRUE': -57, 'FALSE': -57}, 191: {'ID': 43, 'BEGIN': 19, 'IF': 40, 'WHILE': 41, 'FOR': 42, 'REPEAT': 44, 'WRITELN': 45, 'READLN': 46}, 3: {'SEMICOLON': 4}, 18: {'SEMICOLON': -2, 'DOT': -2}, 25: {'SEMICOLON': 52}, 26: {'SEMICOLON': 53}, 30: {'SEMICOLON': 57, 'END': -36, 'UNTIL': -36}, 31: {'SEMICOLON': -39, 'END': -39, 'UNTIL': -39}, 32: {'SEMICOLON': -41, 'END': -41, 'UNTIL': -41, 'ELSE': -41}, 33: {'SEMICOLON': -42, 'END': -42, 'UNTIL': -42, 'ELSE': -42}, 34: {'SEMICOLON': -43, 'END': -43, 'UNTIL': -43, 'ELSE': -43}, 35: {'SEMICOLON': -44, 'END': -44, 'UNTIL': -44, 'ELSE': -44}, 36: {'SEMICOLON': -45, 'END': -45, 'UNTIL': -45, 'ELSE': -45}, 37: {'SEMICOLON': -46, 'END': -46, 'UNTIL': -46, 'ELSE': -46}, 38: {'SEMICOLON': -47, 'END': -47, 'UNTIL': -47, 'ELSE': -47}, 43: {'SEMICOLON': -60, 'END': -60, 'LPAREN': 79, 'UNTIL': -60, 'ELSE': -60, 'ASSIGN': -51, 'LBRACKET': 80}, 45: {'SEMICOLON': -69, 'END': -69, 'LPAREN': 83, 'UNTIL': -69, 'ELSE': -69}, 46: {'SEMICOLON': -65, 'END': -65, 'LPAREN': 85, 'UNTIL': -65, 'ELSE': -65}, 56: {'SEMICOLON': -35, 'DOT': -35, 'END': -35, 'UNTIL': -35, 'ELSE': -35}, 60: {'SEMICOLON': -75, 'END': -75, 'COMMA': -75, 'UNTIL': -75, 'ELSE': -75, 'RPAREN': -75, 'THEN': -75, 'DO': -75, 'RBRACKET': -75, 'TO': -75, 'DOWNTO': -75, 'OR': 104}, 61: {'SEMICOLON': -76, 'END': -76, 'COMMA': -76, 'UNTIL': -76, 'ELSE': -76, 'RPAREN': -76, 'THEN': -76, 'DO': -76, 'RBRACKET': -76, 'TO': -76, 'DOWNTO': -76, 'OR': -76, 'AND': 105}, 62: {'SEMICOLON': -78, 'END': -78, 'COMMA': -78, 'UNTIL': -78, 'ELSE': -78, 'RPAREN': -78, 'THEN': -78, 'DO': -78, 'RBRACKET': -78, 'TO': -78, 'DOWNTO': -78, 'OR': -78, 'AND': -78}, 63: {'SEMICOLON': -82, 'END': -82, 'COMMA': -82, 'UNTIL': -82, 'ELSE': -82, 'MINUS': 108, 'RPAREN': -82, 'THEN': -82, 'DO': -82, 'RBRACKET': -82, 'TO': -82, 'DOWNTO': -82, 'OR': -82, 'AND': -82, 'PLUS': 107, 'EQUAL': 110, 'NOTEQUAL': 111, 'LESS': 112, 'LESSEQUAL': 113, 'GREATER': 114, 'GREATEREQUAL': 115}, 64: {'SEMICOLON': -89, 'END': -89, 'COMMA': -89, 'UNTIL': -89, 'ELSE': -89, 'MINUS': -89, 'RPAREN': -89, 'THEN': -89, 'DO': -89, 'RBRACKET': -89, 'TO': -89, 'DOWNTO': -89, 'OR': -89, 'AND': -89, 'PLUS': -89, 'EQUAL': -89, 'NOTEQUAL': -89, 'LESS': -89, 'LESSEQUAL': -89, 'GREATER': -89, 'GREATEREQUAL': -89, 'TIMES': 116, 'DIVIDE': 117, 'DIV': 118, 'MOD': 119}, 66: {'SEMICOLON': -92, 'END': -92, 'COMMA': -92, 'UNTIL': -92, 'ELSE': -92, 'MINUS': -92, 'RPAREN': -92, 'THEN': -92, 'DO': -92, 'RBRACKET': -92, 'TO': -92, 'DOWNTO': -92, 'OR': -92, 'AND': -92, 'PLUS': -92, 'EQUAL': -92, 'NOTEQUAL': -92, 'LESS': -92, 'LESSEQUAL': -92, 'GREATER': -92, 'GREATEREQUAL': -92, 'TIMES': -92, 'DIVIDE': -92, 'DIV': -92, 'MOD': -92}, 68: {'SEMICOLON': -99, 'END': -99, 'COMMA': -99, 'UNTIL': -99, 'ELSE': -99, 'MINUS': -99, 'RPAREN': -99, 'THEN': -99, 'DO': -99, 'RBRACKET': -99, 'TO': -99, 'DOWNTO': -99, 'OR': -99, 'AND': -99, 'PLUS': -99, 'EQUAL': -99, 'NOTEQUAL': -99, 'LESS': -99, 'LESSEQUAL': -99, 'GREATER': -99, 'GREATEREQUAL': -99, 'TIMES': -99, 'DIVIDE': -99, 'DIV': -99, 'MOD': -99}, 69: {'SEMICOLON': -100, 'END': -100, 'COMMA': -100, 'UNTIL': -100, 'ELSE': -100, 'MINUS': -100, 'RPAREN': -100, 'THEN': -100, 'DO': -100, 'RBRACKET': -100, 'TO': -100, 'DOWNTO': -100, 'OR': -100, 'AND': -100, 'PLUS': -100, 'EQUAL': -100, 'NOTEQUAL': -100, 'LESS': -100, 'LESSEQUAL': -100, 'GREATER': -100, 'GREATEREQUAL': -100, 'TIMES': -100, 'DIVIDE': -100, 'DIV': -100, 'MOD': -100}, 70: {'SEMICOLON': -101, 'END': -101, 'COMMA': -101, 'UNTIL': -101, 'ELSE': -101, 'MINUS': -101, 'RPAREN': -101, 'THEN': -101, 'DO': -101, 'RBRACKET': -101, 'TO': -101, 'DOWNTO': -101, 'OR': -101, 'AND': -101, 'PLUS': -101, 'EQUAL': -101, 'NOTEQUAL': -101, 'LESS': -101, 'LESSEQUAL': -101, 'GREATER': -101, 'GREATEREQUAL': -101, 'TIMES': -101, 'DIVIDE': -101, 'DIV': -101, 'MOD': -101}, 71: {'SEMICOLON': -102, 'END': -102, 'COMMA': -102, 'UNTIL': -102, 'ELSE': -102, 'MINUS': -102, 'RPAREN': -102, 'THEN': -102, 'DO': -102, 'RBRACKET': -102, 'TO': -102, 'DOWNTO': -102, 'OR': -102, 'AND': -102, 'PLUS': -102, 'EQUAL': -102, 'NOTEQUAL': -102, 'LESS': -102, 'LESSEQUAL': -102, 'GREATER': -102, 'GREATEREQUAL': -102, 'TIMES': -102, 'DIVIDE': -102, 'DIV': -102, 'MOD': -102}, 72: {'SEMICOLON': -103, 'END': -103, 'COMMA': -103, 'UNTIL': -103, 'ELSE': -103, 'MINUS': -103, 'RPAREN': -103, 'THEN': -103, 'DO': -103, 'RBRACKET': -103, 'TO': -103, 'DOWNTO': -103, 'OR': -103, 'AND': -103, 'PLUS': -103, 'EQUAL': -103, 'NOTEQUAL': -103, 'LESS': -103, 'LESSEQUAL': -103, 'GREATER': -103, 'GREATEREQUAL': -103, 'TIMES': -103, 'DIVIDE': -103, 'DIV': -103, 'MOD': -103}, 73: {'SEMICOLON': -104, 'END': -104, 'COMMA': -104, 'UNTIL': -104, 'ELSE': -104, 'MINUS': -104, 'RPAREN': -104, 'THEN': -104, 'DO': -104, 'RBRACKET': -104, 'TO': -104, 'DOWNTO': -104, 'OR': -104, 'AND': -104, 'PLUS': -104, 'EQUAL': -104, 'NOTEQUAL': -104, 'LESS': -104, 'LESSEQUAL': -104, 'GREATER': -104, 'GREATEREQUAL': -104, 'TIMES': -104, 'DIVIDE': -104, 'DIV': -104, 'MOD': -104}, 74: {'SEMICOLON': -105, 'END': -105, 'COMMA': -105, 'UNTIL': -105, 'ELSE': -105, 'MINUS': -105, 'RPAREN': -105, 'THEN': -105, 'DO': -105, 'RBRACKET': -105, 'TO': -105, 'DOWNTO': -105, 'OR': -105, 'AND': -105, 'PLUS': -105, 'EQUAL': -105, 'NOTEQUAL': -105, 'LESS': -105, 'LESSEQUAL': -105, 'GREATER': -105, 'GREATEREQUAL': -105, 'TIMES': -105, 'DIVIDE': -105, 'DIV': -105, 'MOD': -105}, 75: {'SEMICOLON': -49, 'END': -49, 'COMMA': -49, 'LPAREN': 122, 'UNTIL': -49, 'ELSE': -49, 'MINUS': -49, 'LBRACKET': 123, 'RPAREN': -49, 'THEN': -49, 'DO': -49, 'RBRACKET': -49, 'TO': -49, 'DOWNTO': -49, 'OR': -49, 'AND': -49, 'PLUS': -49, 'EQUAL': -49, 'NOTEQUAL': -49, 'LESS': -49, 'LESSEQUAL': -49, 'GREATER': -49, 'GREATEREQUAL': -49, 'TIMES': -49, 'DIVIDE': -49, 'DIV': -49, 'MOD': -49}, 82: {'SEMICOLON': -62, 'END': -62, 'UNTIL': -62, 'ELSE': -62}, 84: {'SEMICOLON': -63, 'END': -63, 'UNTIL': -63, 'ELSE': -63}, 87: {'SEMICOLON': 136}, 88: {'SEMICOLON': -15, 'RPAREN': -15}, 89: {'SEMICOLON': -16, 'RPAREN': -16}, 90: {'SEMICOLON': -17, 'RPAREN': -17}, 91: {'SEMICOLON': -18, 'RPAREN': -18}, 92: {'SEMICOLON': -19, 'RPAREN': -19}, 93: {'SEMICOLON': -20, 'RPAREN': -20}, 98: {'SEMICOLON': 141, 'RPAREN': -33}, 101: {'SEMICOLON': -40, 'END': -40, 'UNTIL': -40}, 102: {'SEMICOLON': -48, 'END': -48, 'UNTIL': -48, 'ELSE': -48}, 106: {'SEMICOLON': -80, 'END': -80, 'COMMA': -80, 'UNTIL': -80, 'ELSE': -80, 'RPAREN': -80, 'THEN': -80, 'DO': -80, 'RBRACKET': -80, 'TO': -80, 'DOWNTO': -80, 'OR': -80, 'AND': -80}, 120: {'SEMICOLON': -97, 'END': -97, 'COMMA': -97, 'UNTIL': -97, 'ELSE': -97, 'MINUS': -97, 'RPAREN': -97, 'THEN': -97, 'DO': -97, 'RBRACKET': -97, 'TO': -97, 'DOWNTO': -97, 'OR': -97, 'AND': -97, 'PLUS': -97, 'EQUAL': -97, 'NOTEQUAL': -97, 'LESS': -97, 'LESSEQUAL': -97, 'GREATER': -97, 'GREATEREQUAL': -97, 'TIMES': -97, 'DIVIDE': -97, 'DIV': -97, 'MOD': -97}, 121: {'SEMICOLON': -98, 'END': -98, 'COMMA': -98, 'UNTIL': -98, 'ELSE': -98, 'MINUS': -98, 'RPAREN': -98, 'THEN': -98, 'DO': -98, 'RBRACKET': -98, 'TO': -98, 'DOWNTO': -98, 'OR': -98, 'AND': -98, 'PLUS': -98, 'EQUAL': -98, 'NOTEQUAL': -98, 'LESS': -98, 'LESSEQUAL': -98, 'GREATER': -98, 'GREATEREQUAL': -98, 'TIMES': -98, 'DIVIDE': -98, 'DIV': -98, 'MOD': -98}, 143: {'SEMICOLON': 172}, 144: {'SEMICOLON': -53, 'END': -53, 'UNTIL': -53, 'ELSE': 173}, 145: {'SEMICOLON': -77, 'END': -77, 'COMMA': -77, 'UNTIL': -77, 'ELSE': -77, 'RPAREN': -77, 'THEN': -77, 'DO': -77, 'RBRACKET': -77, 'TO': -77, 'DOWNTO': -77, 'OR': -77, 'AND': 105}, 146: {'SEMICOLON': -79, 'END': -79, 'COMMA': -79, 'UNTIL': -79, 'ELSE': -79, 'RPAREN': -79, 'THEN': -79, 'DO': -79, 'RBRACKET': -79, 'TO': -79, 'DOWNTO': -79, 'OR': -79, 'AND': -79}, 147: {'SEMICOLON': -90, 'END': -90, 'COMMA': -90, 'UNTIL': -90, 'ELSE': -90, 'MINUS': -90, 'RPAREN': -90, 'THEN': -90, 'DO': -90, 'RBRACKET': -90, 'TO': -90, 'DOWNTO': -90, 'OR': -90, 'AND': -90, 'PLUS': -90, 'EQUAL': -90, 'NOTEQUAL': -90, 'LESS': -90, 'LESSEQUAL': -90, 'GREATER': -90, 'GREATEREQUAL': -90, 'TIMES': 116, 'DIVIDE': 117, 'DIV': 118, 'MOD': 119}, 148: {'SEMICOLON': -91, 'END': -91, 'COMMA': -91, 'UNTIL': -91, 'ELSE': -91, 'MINUS': -91, 'RPAREN': -91, 'THEN': -91, 'DO': -91, 'RBRACKET': -91, 'TO': -91, 'DOWNTO': -91, 'OR': -91, 'AND': -91, 'PLUS': -91, 'EQUAL': -91, 'NOTEQUAL': -91, 'LESS': -91, 'LESSEQUAL': -91, 'GREATER': -91, 'GREATEREQUAL': -91, 'TIMES': 116, 'DIVIDE': 117, 'DIV': 118, 'MOD': 119}, 149: {'SEMICOLON': -81, 'END': -81, 'COMMA': -81, 'UNTIL': -81, 'ELSE': -81, 'MINUS': 108, 'RPAREN': -81, 'THEN': -81, 'DO': -81, 'RBRACKET': -81, 'TO': -81, 'DOWNTO': -81, 'OR': -81, 'AND': -81, 'PLUS': 107}, 150: {'SEMICOLON': -93, 'END': -93, 'COMMA': -93, 'UNTIL': -93, 'ELSE': -93, 'MINUS': -93, 'RPAREN': -93, 'THEN': -93, 'DO': -93, 'RBRACKET': -93, 'TO': -93, 'DOWNTO': -93, 'OR': -93, 'AND': -93, 'PLUS': -93, 'EQUAL': -93, 'NOTEQUAL': -93, 'LESS': -93, 'LESSEQUAL': -93, 'GREATER': -93, 'GREATEREQUAL': -93, 'TIMES': -93, 'DIVIDE': -93, 'DIV': -93, 'MOD': -93}, 151: {'SEMICOLON': -94, 'END': -94, 'COMMA': -94, 'UNTIL': -94, 'ELSE': -94, 'MINUS': -94, 'RPAREN': -94, 'THEN': -94, 'DO': -94, 'RBRACKET': -94, 'TO': -94, 'DOWNTO': -94, 'OR': -94, 'AND': -94, 'PLUS': -94, 'EQUAL': -94, 'NOTEQUAL': -94, 'LESS': -94, 'LESSEQUAL': -94, 'GREATER': -94, 'GREATEREQUAL': -94, 'TIMES': -94, 'DIVIDE': -94, 'DIV': -94, 'MOD': -94}, 152: {'SEMICOLON': -95, 'END': -95, 'COMMA': -95, 'UNTIL': -95, 'ELSE': -95, 'MINUS': -95, 'RPAREN': -95, 'THEN': -95, 'DO': -95, 'RBRACKET': -95, 'TO': -95, 'DOWNTO': -95, 'OR': -95, 'AND': -95, 'PLUS': -95, 'EQUAL': -95, 'NOTEQUAL': -95, 'LESS': -95, 'LESSEQUAL': -95, 'GREATER': -95, 'GREATEREQUAL': -95, 'TIMES': -95, 'DIVIDE': -95, 'DIV': -95, 'MOD': -95}, 153: {'SEMICOLON': -96, 'END': -96, 'COMMA': -96, 'UNTIL': -96, 'ELSE': -96, 'MINUS': -96, 'RPAREN': -96, 'THEN': -96, 'DO': -96, 'RBRACKET': -96, 'TO': -96, 'DOWNTO': -96, 'OR': -96, 'AND': -96, 'PLUS': -96, 'EQUAL': -96, 'NOTEQUAL': -96, 'LESS': -96, 'LESSEQUAL': -96, 'GREATER': -96, 'GREATEREQUAL': -96, 'TIMES': -96, 'DIVIDE': -96, 'DIV': -96, 'MOD': -96}, 156: {'SEMICOLON': -107, 'END': -107, 'COMMA': -107, 'UNTIL': -107, 'ELSE': -107, 'MINUS': -107, 'RPAREN': -107, 'THEN': -107, 'DO': -107, 'RBRACKET': -107, 'TO': -107, 'DOWNTO': -107, 'OR': -107, 'AND': -107, 'PLUS': -107, 'EQUAL': -107, 'NOTEQUAL': -107, 'LESS': -107, 'LESSEQUAL': -107, 'GREATER': -107, 'GREATEREQUAL': -107, 'TIMES': -107, 'DIVIDE': -107, 'DIV': -107, 'MOD': -107}, 157: {'SEMICOLON': -55, 'END': -55, 'UNTIL': -55, 'ELSE': -55}, 159: {'SEMICOLON': -61, 'END': -61, 'UNTIL': -61, 'ELSE': -61}, 163: {'SEMICOLON': -59, 'END': -59, 'UNTIL': -59, 'ELSE': -59}, 164: {'SEMICOLON': -68, 'END': -68, 'UNTIL': -68, 'ELSE': -68}, 165: {'SEMICOLON': -64, 'END': -64, 'UNTIL': -64, 'ELSE': -64}, 170: {'SEMICOLON': 141, 'RPAREN': -33}, 171: {'SEMICOLON': -34, 'RPAREN': -34}, 174: {'SEMICOLON': -106, 'END': -106, 'COMMA': -106, 'UNTIL': -106, 'ELSE': -106, 'MINUS': -106, 'RPAREN': -106, 'THEN': -106, 'DO': -106, 'RBRACKET': -106, 'TO': -106, 'DOWNTO': -106, 'OR': -106, 'AND': -106, 'PLUS': -106, 'EQUAL': -106, 'NOTEQUAL': -106, 'LESS': -106, 'LESSEQUAL': -106, 'GREATER': -106, 'GREATEREQUAL': -106, 'TIMES': -106, 'DIVIDE': -106, 'DIV': -106, 'MOD': -106}, 175: {'SEMICOLON': -50, 'END': -50, 'COMMA': -50, 'UNTIL': -50, 'ELSE': -50, 'MINUS': -50, 'RPAREN': -50, 'THEN': -50, 'DO': -50, 'RBRACKET': -50, 'TO': -50, 'DOWNTO': -50, 'OR': -50, 'AND': -50, 'PLUS': -50, 'EQUAL': -50, 'NOTEQUAL': -50, 'LESS': -50, 'LESSEQUAL': -50, 'GREATER': -50, 'GREATEREQUAL': -50, 'TIMES': -50, 'DIVIDE': -50, 'DIV': -50, 'MOD': -50}, 183: {'SEMICOLON': 190}, 185: {'SEMICOLON': -54, 'END': -54, 'UNTIL': -54, 'ELSE': -54}, 192: {'SEMICOLON': -21, 'RPAREN': -21}, 193: {'SEMICOLON': -58, 'END': -58, 'UNTIL': -58, 'ELSE': -58}, 4: {'BEGIN': -4, 'VAR': 10, 'FUNCTION': 15, 'PROCEDURE': 16}, 6: {'BEGIN': 19}, 7: {'BEGIN': -4, 'VAR': 10, 'FUNCTION': 15, 'PROCEDURE': 16}, 8: {'BEGIN': -5, 'VAR': -5, 'FUNCTION': -5, 'PROCEDURE': -5}, 9: {'BEGIN': -6, 'VAR': -6, 'FUNCTION': -6, 'PROCEDURE': -6}, 11: {'BEGIN': -23, 'VAR': -23, 'FUNCTION': -23, 'PROCEDURE': -23}, 12: {'BEGIN': -24, 'VAR': -24, 'FUNCTION': -24, 'PROCEDURE': -24}, 13: {'BEGIN': -4, 'VAR': 10, 'FUNCTION': 15, 'PROCEDURE': 16}, 14: {'BEGIN': -4, 'VAR': 10, 'FUNCTION': 15, 'PROCEDURE': 16}, 20: {'BEGIN': -3}, 21: {'BEGIN': -7, 'VAR': -7, 'FUNCTION': -7, 'PROCEDURE': -7}, 48: {'BEGIN': -8, 'VAR': -8, 'FUNCTION': -8, 'PROCEDURE': -8}, 52: {'BEGIN': -26, 'VAR': -26, 'FUNCTION': -26, 'PROCEDURE': -26}, 53: {'BEGIN': -28, 'VAR': -28, 'FUNCTION': -28, 'PROCEDURE': -28}, 86: {'BEGIN': -9, 'VAR': -9, 'FUNCTION': -9, 'PROCEDURE': -9}, 172: {'BEGIN': -27, 'VAR': -27, 'FUNCTION': -27, 'PROCEDURE': -27}, 190: {'BEGIN': -25, 'VAR': -25, 'FUNCTION': -25, 'PROCEDURE': -25}, 5: {'DOT': 17}, 29: {'END': 56}, 23: {'COLON': 49}, 24: {'COLON': -14, 'COMMA': 51}, 50: {'COLON': -12}, 95: {'COLON': -14, 'COMMA': 51}, 99: {'COLON': 142}, 138: {'COLON': -13}, 139: {'COLON': 169}, 129: {'COMMA': 161, 'RPAREN': -74}, 134: {'COMMA': 166, 'RPAREN': -66}, 135: {'COMMA': -51, 'LBRACKET': 80, 'RPAREN': -51}, 162: {'COMMA': -52, 'ASSIGN': -52, 'RPAREN': -52}, 179: {'COMMA': 161, 'RPAREN': -74}, 27: {'LPAREN': 54}, 28: {'LPAREN': 55}, 81: {'UNTIL': 131}, 39: {'ASSIGN': 58}, 78: {'ASSIGN': 126}, 137: {'NUMBER_INT': 168}, 182: {'NUMBER_INT': 189}, 94: {'LBRACKET': 137}, 49: {'INTEGER': 88, 'REAL': 89, 'BOOLEAN': 90, 'CHAR': 91, 'STRING': 92, 'ARRAY': 94}, 142: {'INTEGER': 88, 'REAL': 89, 'BOOLEAN': 90, 'CHAR': 91, 'STRING': 92, 'ARRAY': 94}, 169: {'INTEGER': 88, 'REAL': 89, 'BOOLEAN': 90, 'CHAR': 91, 'STRING': 92, 'ARRAY': 94}, 188: {'INTEGER': 88, 'REAL': 89, 'BOOLEAN': 90, 'CHAR': 91, 'STRING': 92, 'ARRAY': 94}, 96: {'RPAREN': 139}, 97: {'RPAREN': -29}, 100: {'RPAREN': 143}, 124: {'RPAREN': 156}, 127: {'RPAREN': 159}, 128: {'RPAREN': -70}, 132: {'RPAREN': 164}, 133: {'RPAREN': 165}, 140: {'RPAREN': -31}, 154: {'RPAREN': 174}, 160: {'RPAREN': -72}, 180: {'RPAREN': -67}, 184: {'RPAREN': -32}, 187: {'RPAREN': -73}, 59: {'THEN': 103}, 77: {'DO': 125}, 186: {'DO': 191}, 130: {'RBRACKET': 162}, 155: {'RBRACKET': 175}, 167: {'RBRACKET': 181}, 189: {'RBRACKET': -22}, 158: {'TO': 177, 'DOWNTO': 178}, 168: {'RANGE': 182}, 181: {'OF': 188}}
+goto = {0: {'programa': 1}, 4: {'bloco': 5, 'decls': 6, 'decl': 7, 'var_section': 8, 'subprog_decl': 9, 'function_decl': 11, 'procedure_decl': 12, 'function_header': 13, 'procedure_header': 14}, 13: {'bloco': 25, 'decls': 6, 'decl': 7, 'var_section': 8, 'subprog_decl': 9, 'function_decl': 11, 'procedure_decl': 12, 'function_header': 13, 'procedure_header': 14}, 14: {'bloco': 26, 'decls': 6, 'decl': 7, 'var_section': 8, 'subprog_decl': 9, 'function_decl': 11, 'procedure_decl': 12, 'function_header': 13, 'procedure_header': 14}, 7: {'decls': 20, 'decl': 7, 'var_section': 8, 'subprog_decl': 9, 'function_decl': 11, 'procedure_decl': 12, 'function_header': 13, 'procedure_header': 14}, 6: {'compound_stmt': 18}, 19: {'compound_stmt': 37, 'stmt_list_opt': 29, 'stmt_list': 30, 'stmt': 31, 'assign_stmt': 32, 'if_stmt': 33, 'while_stmt': 34, 'for_stmt': 35, 'repeat_stmt': 36, 'proc_call': 38, 'lvalue': 39}, 44: {'compound_stmt': 37, 'stmt_list_opt': 81, 'stmt_list': 30, 'stmt': 31, 'assign_stmt': 32, 'if_stmt': 33, 'while_stmt': 34, 'for_stmt': 35, 'repeat_stmt': 36, 'proc_call': 38, 'lvalue': 39}, 57: {'compound_stmt': 37, 'stmt': 101, 'assign_stmt': 32, 'if_stmt': 33, 'while_stmt': 34, 'for_stmt': 35, 'repeat_stmt': 36, 'proc_call': 38, 'lvalue': 39}, 103: {'compound_stmt': 37, 'stmt': 144, 'assign_stmt': 32, 'if_stmt': 33, 'while_stmt': 34, 'for_stmt': 35, 'repeat_stmt': 36, 'proc_call': 38, 'lvalue': 39}, 125: {'compound_stmt': 37, 'stmt': 157, 'assign_stmt': 32, 'if_stmt': 33, 'while_stmt': 34, 'for_stmt': 35, 'repeat_stmt': 36, 'proc_call': 38, 'lvalue': 39}, 173: {'compound_stmt': 37, 'stmt': 185, 'assign_stmt': 32, 'if_stmt': 33, 'while_stmt': 34, 'for_stmt': 35, 'repeat_stmt': 36, 'proc_call': 38, 'lvalue': 39}, 191: {'compound_stmt': 37, 'stmt': 193, 'assign_stmt': 32, 'if_stmt': 33, 'while_stmt': 34, 'for_stmt': 35, 'repeat_stmt': 36, 'proc_call': 38, 'lvalue': 39}, 10: {'var_decl_list': 21, 'var_decl': 22, 'id_list': 23}, 22: {'var_decl': 47, 'id_list': 23, 'var_decl_list_tail': 48}, 47: {'var_decl': 47, 'id_list': 23, 'var_decl_list_tail': 86}, 54: {'id_list': 99, 'param_list_opt': 96, 'param_list': 97, 'param': 98}, 55: {'id_list': 99, 'param_list_opt': 100, 'param_list': 97, 'param': 98}, 141: {'id_list': 99, 'param': 170}, 85: {'lvalue': 134, 'read_var_list': 133}, 166: {'lvalue': 134, 'read_var_list': 180}, 24: {'id_list_tail': 50}, 95: {'id_list_tail': 138}, 40: {'expr': 59, 'or_expr': 60, 'and_expr': 61, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 41: {'expr': 77, 'or_expr': 60, 'and_expr': 61, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 58: {'expr': 102, 'or_expr': 60, 'and_expr': 61, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 76: {'expr': 124, 'or_expr': 60, 'and_expr': 61, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 79: {'expr': 129, 'or_expr': 60, 'and_expr': 61, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74, 'arg_list_opt': 127, 'arg_list': 128}, 80: {'expr': 130, 'or_expr': 60, 'and_expr': 61, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 83: {'expr': 129, 'or_expr': 60, 'and_expr': 61, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74, 'arg_list_opt': 132, 'arg_list': 128}, 122: {'expr': 129, 'or_expr': 60, 'and_expr': 61, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74, 'arg_list_opt': 154, 'arg_list': 128}, 123: {'expr': 155, 'or_expr': 60, 'and_expr': 61, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 126: {'expr': 158, 'or_expr': 60, 'and_expr': 61, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 131: {'expr': 163, 'or_expr': 60, 'and_expr': 61, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 161: {'expr': 179, 'or_expr': 60, 'and_expr': 61, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 176: {'expr': 186, 'or_expr': 60, 'and_expr': 61, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 104: {'and_expr': 145, 'rel_expr': 62, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 105: {'rel_expr': 146, 'add_expr': 63, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 109: {'add_expr': 149, 'mul_expr': 64, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 107: {'mul_expr': 147, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 108: {'mul_expr': 148, 'unary_expr': 66, 'primary': 68, 'var_ref': 74}, 65: {'unary_expr': 120, 'primary': 68, 'var_ref': 74}, 67: {'unary_expr': 121, 'primary': 68, 'var_ref': 74}, 116: {'unary_expr': 150, 'primary': 68, 'var_ref': 74}, 117: {'unary_expr': 151, 'primary': 68, 'var_ref': 74}, 118: {'unary_expr': 152, 'primary': 68, 'var_ref': 74}, 119: {'unary_expr': 153, 'primary': 68, 'var_ref': 74}, 45: {'args_opt': 82}, 46: {'read_args_opt': 84}, 49: {'tipo': 87, 'array_type': 93}, 142: {'tipo': 171, 'array_type': 93}, 169: {'tipo': 183, 'array_type': 93}, 188: {'tipo': 192, 'array_type': 93}, 63: {'rel_opt': 106, 'relop': 109}, 98: {'param_list_tail': 140}, 170: {'param_list_tail': 184}, 129: {'arg_list_tail': 160}, 179: {'arg_list_tail': 187}, 137: {'range': 167}, 158: {'for_dir': 176}}
+productions = [("S' -> programa", "S'", 1, None, None, None), ('programa -> PROGRAM ID SEMICOLON bloco DOT', 'programa', 5, 'p_programa', 'parser.py', 34), ('bloco -> decls compound_stmt', 'bloco', 2, 'p_bloco', 'parser.py', 39), ('decls -> decl decls', 'decls', 2, 'p_decls_multi', 'parser.py', 46), ('decls -> <empty>', 'decls', 0, 'p_decls_empty', 'parser.py', 50), ('decl -> var_section', 'decl', 1, 'p_decl_single1', 'parser.py', 54), ('decl -> subprog_decl', 'decl', 1, 'p_decl_single2', 'parser.py', 58), ('var_section -> VAR var_decl_list', 'var_section', 2, 'p_var_section', 'parser.py', 65), ('var_decl_list -> var_decl var_decl_list_tail', 'var_decl_list', 2, 'p_var_decl_list', 'parser.py', 69), ('var_decl_list_tail -> var_decl var_decl_list_tail', 'var_decl_list_tail', 2, 'p_var_decl_list_tail_multi', 'parser.py', 73), ('var_decl_list_tail -> <empty>', 'var_decl_list_tail', 0, 'p_var_decl_list_tail_single_empty', 'parser.py', 77), ('var_decl -> id_list COLON tipo SEMICOLON', 'var_decl', 4, 'p_var_decl', 'parser.py', 81), ('id_list -> ID id_list_tail', 'id_list', 2, 'p_id_list', 'parser.py', 87), ('id_list_tail -> COMMA ID id_list_tail', 'id_list_tail', 3, 'p_id_list_tail_multi', 'parser.py', 91), ('id_list_tail -> <empty>', 'id_list_tail', 0, 'p_id_list_tail_empty', 'parser.py', 95), ('tipo -> INTEGER', 'tipo', 1, 'p_tipo_integer', 'parser.py', 102), ('tipo -> REAL', 'tipo', 1, 'p_tipo_real', 'parser.py', 106), ('tipo -> BOOLEAN', 'tipo', 1, 'p_tipo_boolean', 'parser.py', 110), ('tipo -> CHAR', 'tipo', 1, 'p_tipo_char', 'parser.py', 114), ('tipo -> STRING', 'tipo', 1, 'p_tipo_string', 'parser.py', 118), ('tipo -> array_type', 'tipo', 1, 'p_tipo_array_type', 'parser.py', 122), ('array_type -> ARRAY LBRACKET range RBRACKET OF tipo', 'array_type', 6, 'p_array_type', 'parser.py', 126), ('range -> NUMBER_INT RANGE NUMBER_INT', 'range', 3, 'p_range', 'parser.py', 132), ('subprog_decl -> function_decl', 'subprog_decl', 1, 'p_subprog_decl_single1', 'parser.py', 140), ('subprog_decl -> procedure_decl', 'subprog_decl', 1, 'p_subprog_decl_single2', 'parser.py', 144), ('function_header -> FUNCTION ID LPAREN param_list_opt RPAREN COLON tipo SEMICOLON', 'function_header', 8, 'p_function_header', 'parser.py', 151), ('function_decl -> function_header bloco SEMICOLON', 'function_decl', 3, 'p_function_decl', 'parser.py', 155), ('procedure_header -> PROCEDURE ID LPAREN param_list_opt RPAREN SEMICOLON', 'procedure_header', 6, 'p_procedure_header', 'parser.py', 164), ('procedure_decl -> procedure_header bloco SEMICOLON', 'procedure_decl', 3, 'p_procedure_decl', 'parser.py', 168), ('param_list_opt -> param_list', 'param_list_opt', 1, 'p_param_list_opt_single', 'parser.py', 177), ('param_list_opt -> <empty>', 'param_list_opt', 0, 'p_param_list_opt_empty', 'parser.py', 181), ('param_list -> param param_list_tail', 'param_list', 2, 'p_param_list', 'parser.py', 185), ('param_list_tail -> SEMICOLON param param_list_tail', 'param_list_tail', 3, 'p_param_list_tail_multi', 'parser.py', 189), ('param_list_tail -> <empty>', 'param_list_tail', 0, 'p_param_list_tail_empty', 'parser.py', 193), ('param -> id_list COLON tipo', 'param', 3, 'p_param', 'parser.py', 197), ('compound_stmt -> BEGIN stmt_list_opt END', 'compound_stmt', 3, 'p_compound_stmt', 'parser.py', 205), ('stmt_list_opt -> stmt_list', 'stmt_list_opt', 1, 'p_stmt_list_opt_single', 'parser.py', 209), ('stmt_list_opt -> stmt_list SEMICOLON', 'stmt_list_opt', 2, 'p_stmt_list_opt_trailing', 'parser.py', 213), ('stmt_list_opt -> <empty>', 'stmt_list_opt', 0, 'p_stmt_list_opt_empty', 'parser.py', 217), ('stmt_list -> stmt', 'stmt_list', 1, 'p_stmt_list_single', 'parser.py', 223), ('stmt_list -> stmt_list SEMICOLON stmt', 'stmt_list', 3, 'p_stmt_list_multi', 'parser.py', 227), ('stmt -> assign_stmt', 'stmt', 1, 'p_stmt_single1', 'parser.py', 235), ('stmt -> if_stmt', 'stmt', 1, 'p_stmt_single2', 'parser.py', 239), ('stmt -> while_stmt', 'stmt', 1, 'p_stmt_single3', 'parser.py', 243), ('stmt -> for_stmt', 'stmt', 1, 'p_stmt_single4', 'parser.py', 247), ('stmt -> repeat_stmt', 'stmt', 1, 'p_stmt_single5', 'parser.py', 251), ('stmt -> compound_stmt', 'stmt', 1, 'p_stmt_single6', 'parser.py', 255), ('stmt -> proc_call', 'stmt', 1, 'p_stmt_single7', 'parser.py', 259), ('assign_stmt -> lvalue ASSIGN expr', 'assign_stmt', 3, 'p_assign_stmt', 'parser.py', 266), ('var_ref -> ID', 'var_ref', 1, 'p_var_ref_single', 'parser.py', 273), ('var_ref -> ID LBRACKET expr RBRACKET', 'var_ref', 4, 'p_var_ref_multi', 'parser.py', 277), ('lvalue -> ID', 'lvalue', 1, 'p_lvalue_single', 'parser.py', 281), ('lvalue -> ID LBRACKET expr RBRACKET', 'lvalue', 4, 'p_lvalue_indexed', 'parser.py', 285), ('if_stmt -> IF expr THEN stmt', 'if_stmt', 4, 'p_if_stmt_no_else', 'parser.py', 292), ('if_stmt -> IF expr THEN stmt ELSE stmt', 'if_stmt', 6, 'p_if_stmt_with_else', 'parser.py', 296), ('while_stmt -> WHILE expr DO stmt', 'while_stmt', 4, 'p_while_stmt', 'parser.py', 300), ('for_dir -> TO', 'for_dir', 1, 'p_for_dir_single1', 'parser.py', 304), ('for_dir -> DOWNTO', 'for_dir', 1, 'p_for_dir_single2', 'parser.py', 308), ('for_stmt -> FOR ID ASSIGN expr for_dir expr DO stmt', 'for_stmt', 8, 'p_for_stmt', 'parser.py', 312), ('repeat_stmt -> REPEAT stmt_list_opt UNTIL expr', 'repeat_stmt', 4, 'p_repeat_stmt', 'parser.py', 317), ('proc_call -> ID', 'proc_call', 1, 'p_proc_call_single', 'parser.py', 323), ('proc_call -> ID LPAREN arg_list_opt RPAREN', 'proc_call', 4, 'p_proc_call_multi1', 'parser.py', 328), ('proc_call -> WRITELN args_opt', 'proc_call', 2, 'p_proc_call_multi2', 'parser.py', 333), ('proc_call -> READLN read_args_opt', 'proc_call', 2, 'p_proc_call_multi3', 'parser.py', 338), ('read_args_opt -> LPAREN read_var_list RPAREN', 'read_args_opt', 3, 'p_read_args_opt_multi', 'parser.py', 343), ('read_args_opt -> <empty>', 'read_args_opt', 0, 'p_read_args_opt_empty', 'parser.py', 347), ('read_var_list -> lvalue', 'read_var_list', 1, 'p_read_var_list_single', 'parser.py', 351), ('read_var_list -> lvalue COMMA read_var_list', 'read_var_list', 3, 'p_read_var_list_multi', 'parser.py', 355), ('args_opt -> LPAREN arg_list_opt RPAREN', 'args_opt', 3, 'p_args_opt_multi', 'parser.py', 360), ('args_opt -> <empty>', 'args_opt', 0, 'p_args_opt_empty', 'parser.py', 364), ('arg_list_opt -> arg_list', 'arg_list_opt', 1, 'p_arg_list_opt_single', 'parser.py', 368), ('arg_list_opt -> <empty>', 'arg_list_opt', 0, 'p_arg_list_opt_empty', 'parser.py', 372), ('arg_list -> expr arg_list_tail', 'arg_list', 2, 'p_arg_list', 'parser.py', 376), ('arg_list_tail -> COMMA expr arg_list_tail', 'arg_list_tail', 3, 'p_arg_list_tail_multi', 'parser.py', 380), ('arg_list_tail -> <empty>', 'arg_list_tail', 0, 'p_arg_list_tail_empty', 'parser.py', 384), ('expr -> or_expr', 'expr', 1, 'p_expr', 'parser.py', 391), ('or_expr -> and_expr', 'or_expr', 1, 'p_or_expr_single', 'parser.py', 395), ('or_expr -> or_expr OR and_expr', 'or_expr', 3, 'p_or_expr_multi', 'parser.py', 399), ('and_expr -> rel_expr', 'and_expr', 1, 'p_and_expr_single', 'parser.py', 404), ('and_expr -> and_expr AND rel_expr', 'and_expr', 3, 'p_and_expr_multi', 'parser.py', 408), ('rel_expr -> add_expr rel_opt', 'rel_expr', 2, 'p_rel_expr', 'parser.py', 413), ('rel_opt -> relop add_expr', 'rel_opt', 2, 'p_rel_opt_multi', 'parser.py', 421), ('rel_opt -> <empty>', 'rel_opt', 0, 'p_rel_opt_empty', 'parser.py', 426), ('relop -> EQUAL', 'relop', 1, 'p_relop_single1', 'parser.py', 430), ('relop -> NOTEQUAL', 'relop', 1, 'p_relop_single2', 'parser.py', 434), ('relop -> LESS', 'relop', 1, 'p_relop_single3', 'parser.py', 438), ('relop -> LESSEQUAL', 'relop', 1, 'p_relop_single4', 'parser.py', 442), ('relop -> GREATER', 'relop', 1, 'p_relop_single5', 'parser.py', 446), ('relop -> GREATEREQUAL', 'relop', 1, 'p_relop_single6', 'parser.py', 450), ('add_expr -> mul_expr', 'add_expr', 1, 'p_add_expr_single', 'parser.py', 454), ('add_expr -> add_expr PLUS mul_expr', 'add_expr', 3, 'p_add_expr_multi1', 'parser.py', 458), ('add_expr -> add_expr MINUS mul_expr', 'add_expr', 3, 'p_add_expr_multi2', 'parser.py', 462), ('mul_expr -> unary_expr', 'mul_expr', 1, 'p_mul_expr_single', 'parser.py', 466), ('mul_expr -> mul_expr TIMES unary_expr', 'mul_expr', 3, 'p_mul_expr_multi1', 'parser.py', 470), ('mul_expr -> mul_expr DIVIDE unary_expr', 'mul_expr', 3, 'p_mul_expr_multi2', 'parser.py', 474), ('mul_expr -> mul_expr DIV unary_expr', 'mul_expr', 3, 'p_mul_expr_multi3', 'parser.py', 478), ('mul_expr -> mul_expr MOD unary_expr', 'mul_expr', 3, 'p_mul_expr_multi4', 'parser.py', 482), ('unary_expr -> MINUS unary_expr', 'unary_expr', 2, 'p_unary_expr_multi1', 'parser.py', 486), ('unary_expr -> NOT unary_expr', 'unary_expr', 2, 'p_unary_expr_multi2', 'parser.py', 490), ('unary_expr -> primary', 'unary_expr', 1, 'p_unary_expr_single', 'parser.py', 494), ('primary -> NUMBER_REAL', 'primary', 1, 'p_primary_single1', 'parser.py', 501), ('primary -> NUMBER_INT', 'primary', 1, 'p_primary_single2', 'parser.py', 505), ('primary -> STRING_LITERAL', 'primary', 1, 'p_primary_single3', 'parser.py', 509), ('primary -> TRUE', 'primary', 1, 'p_primary_single4', 'parser.py', 518), ('primary -> FALSE', 'primary', 1, 'p_primary_single5', 'parser.py', 522), ('primary -> var_ref', 'primary', 1, 'p_primary_single6', 'parser.py', 526), ('primary -> ID LPAREN arg_list_opt RPAREN', 'primary', 4, 'p_primary_single7', 'parser.py', 530), ('primary -> LPAREN expr RPAREN', 'primary', 3, 'p_primary_single8', 'parser.py', 534)]
@@ -1,3 +1,5 @@
+import sys
+
 import ply.lex as lex
 
 reserved = {
@@ -117,8 +119,35 @@ def t_newline(t):
     r'\n+'
     t.lexer.lineno += len(t.value)
 
+def lex_warning(lexer, msg: str) -> None:
+    """
+    Aviso do lexer (ex: caractere ilegal): acrescentado à lista 'messages' do
+    lexer, se existir (uma por compilação, ver compiler.py), ou impresso no stdout.
+    """
+    sink = getattr(lexer, "messages", None)
+    if sink is None:
+        print(msg)
+    else:
+        sink.append(msg)
+
 def t_error(t):
-    print(f"Caractere ilegal '{t.value[0]}' na linha {t.lexer.lineno}")
+    lex_warning(t.lexer, f"Caractere ilegal '{t.value[0]}' na linha {t.lexer.lineno}")
     t.lexer.skip(1)
 
-lexer = lex.lex()
+_lexer = None
+
+
+def build_lexer():
+    """Constrói o lexer do PLY (master regex) a partir das regras t_* deste módulo."""
+    return lex.lex(module=sys.modules[__name__])
+
+
+def __getattr__(name):
+    # O lexer só é construído no primeiro acesso a 'pascal_analex.lexer', para que
+    # quem só precisa da lista de tokens (ex: o parser) não pague o seu custo.
+    global _lexer
+    if name == "lexer":
+        if _lexer is None:
+            _lexer = build_lexer()
+        return _lexer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
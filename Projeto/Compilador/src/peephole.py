@@ -0,0 +1,355 @@
+"""
+Módulo: peephole.py
+Descrição: Otimizador "peephole" sobre o código (IR) gerado para a VM.
+Percorre a lista de instruções produzida pelo parser e aplica pequenas regras
+de reescrita locais (janelas de 2-3 instruções) até atingir um ponto fixo:
+- inversão de comparações seguidas de NOT e de 'JZ La; JUMP Lb; La:';
+- folding de operações entre constantes (ex: 'PUSHI 0; PUSHI 3; SUB');
+- saltos condicionais com condição constante;
+- saltos para a instrução seguinte e encadeamento de saltos (jump threading);
+- fusão de labels consecutivos e remoção de labels não referenciados;
+- remoção de código inalcançável (após JUMP, RETURN ou STOP).
+
+As regras são funções registadas em PASSES (ver @rule), pelo que novas regras
+podem ser adicionadas sem alterar o motor.
+"""
+
+from .codegen import LABEL, ins, label
+
+
+# Saltos cujo operando é um label
+BRANCHES = ("JUMP", "JZ")
+# Instruções que referenciam labels (saltos e endereços de subprogramas)
+LABEL_REFS = ("JUMP", "JZ", "PUSHA")
+# Instruções após as quais o fluxo nunca continua para a instrução seguinte
+TERMINATORS = ("JUMP", "RETURN", "STOP")
+
+# Comparação inversa: 'cmp; NOT' == 'inv(cmp)'
+INVERSE_CMP = {
+    "INF": "SUPEQ", "SUPEQ": "INF",
+    "SUP": "INFEQ", "INFEQ": "SUP",
+    "FINF": "FSUPEQ", "FSUPEQ": "FINF",
+    "FSUP": "FINFEQ", "FINFEQ": "FSUP",
+}
+
+# Operações entre constantes que podem ser avaliadas em tempo de compilação
+INT_FOLD = {
+    "ADD": lambda a, b: a + b,
+    "SUB": lambda a, b: a - b,
+    "MUL": lambda a, b: a * b,
+    "EQUAL": lambda a, b: int(a == b),
+    "INF": lambda a, b: int(a < b),
+    "INFEQ": lambda a, b: int(a <= b),
+    "SUP": lambda a, b: int(a > b),
+    "SUPEQ": lambda a, b: int(a >= b),
+}
+FLOAT_FOLD = {
+    "FADD": lambda a, b: a + b,
+    "FSUB": lambda a, b: a - b,
+    "FMUL": lambda a, b: a * b,
+}
+
+# Labels que nunca são removidos (ponto de entrada do programa principal)
+KEEP_LABELS = {"MAIN"}
+
+# Registo das regras: lista de (nome, função). Cada regra recebe a lista de
+# instruções e devolve (nova_lista, nº de reescritas aplicadas).
+PASSES = []
+
+
+def rule(name):
+    """Decorador que regista uma regra peephole em PASSES."""
+    def deco(fn):
+        PASSES.append((name, fn))
+        return fn
+    return deco
+
+
+def count_instrs(code) -> int:
+    """Conta as instruções reais (ignora definições de labels)."""
+    return sum(1 for i in code if i.op != LABEL)
+
+
+def _label_targets(code):
+    """Mapeia cada label para o índice da primeira instrução real que o segue."""
+    targets = {}
+    pending = []
+    for idx, i in enumerate(code):
+        if i.op == LABEL:
+            pending.append(i.args[0])
+            continue
+        for name in pending:
+            targets[name] = idx
+        pending.clear()
+    for name in pending:
+        targets[name] = len(code)
+    return targets
+
+
+def _referenced_labels(code):
+    return {i.args[0] for i in code if i.op in LABEL_REFS}
+
+
+@rule("fold_consts")
+def fold_consts(code):
+    """PUSHI a; PUSHI b; op -> PUSHI (a op b)  |  PUSHI a; ITOF -> PUSHF a  |  PUSHI c; NOT."""
+    out = []
+    n = 0
+    for i in code:
+        out.append(i)
+        if len(out) >= 2:
+            a, b = out[-2], out[-1]
+            if a.op == "PUSHI" and b.op == "ITOF":
+                out[-2:] = [ins("PUSHF", float(a.args[0]))]
+                n += 1
+                continue
+            if a.op == "PUSHI" and b.op == "NOT":
+                out[-2:] = [ins("PUSHI", int(a.args[0] == 0))]
+                n += 1
+                continue
+        if len(out) >= 3:
+            a, b, op = out[-3], out[-2], out[-1]
+            if a.op == "PUSHI" and b.op == "PUSHI" and op.op in INT_FOLD:
+                out[-3:] = [ins("PUSHI", INT_FOLD[op.op](a.args[0], b.args[0]))]
+                n += 1
+            elif a.op == "PUSHF" and b.op == "PUSHF" and op.op in FLOAT_FOLD:
+                out[-3:] = [ins("PUSHF", FLOAT_FOLD[op.op](a.args[0], b.args[0]))]
+                n += 1
+    return out, n
+
+
+@rule("const_branch")
+def const_branch(code):
+    """PUSHI 0; JZ L -> JUMP L  |  PUSHI c (c != 0); JZ L -> (nada)."""
+    out = []
+    n = 0
+    for i in code:
+        if i.op == "JZ" and out and out[-1].op == "PUSHI":
+            c = out.pop().args[0]
+            if c == 0:
+                out.append(ins("JUMP", i.args[0]))
+            n += 1
+            continue
+        out.append(i)
+    return out, n
+
+
+@rule("invert_branch")
+def invert_branch(code):
+    """
+    cmp; JZ La; JUMP Lb; La:  ->  cmp; NOT; JZ Lb; La:
+    (o NOT é depois absorvido por 'invert_cmp' ou 'double_not'). Só se aplica
+    quando a condição é uma comparação invertível ou um NOT, para nunca piorar.
+    """
+    out = []
+    n = 0
+    k = 0
+    while k < len(code):
+        i = code[k]
+        if (
+            i.op == "JZ" and k + 2 < len(code)
+            and code[k + 1].op == "JUMP"
+            and code[k + 2].op == LABEL and code[k + 2].args[0] == i.args[0]
+            and out and (out[-1].op in INVERSE_CMP or out[-1].op == "NOT")
+        ):
+            out.append(ins("NOT"))
+            out.append(ins("JZ", code[k + 1].args[0]))
+            n += 1
+            k += 2
+            continue
+        out.append(i)
+        k += 1
+    return out, n
+
+
+@rule("invert_cmp")
+def invert_cmp(code):
+    """INF; NOT -> SUPEQ (e restantes comparações, inteiras e reais)."""
+    out = []
+    n = 0
+    for i in code:
+        if i.op == "NOT" and out and out[-1].op in INVERSE_CMP:
+            out[-1] = ins(INVERSE_CMP[out[-1].op])
+            n += 1
+            continue
+        out.append(i)
+    return out, n
+
+
+@rule("double_not")
+def double_not(code):
+    """NOT; NOT; JZ L -> JZ L (a dupla negação não altera o teste de zero)."""
+    out = []
+    n = 0
+    for i in code:
+        if i.op == "JZ" and len(out) >= 2 and out[-1].op == "NOT" and out[-2].op == "NOT":
+            del out[-2:]
+            n += 1
+        out.append(i)
+    return out, n
+
+
+@rule("merge_labels")
+def merge_labels(code):
+    """Labels consecutivos são fundidos num só; as referências são renomeadas."""
+    rename = {}
+    k = 0
+    while k < len(code):
+        if code[k].op != LABEL:
+            k += 1
+            continue
+        j = k
+        while j < len(code) and code[j].op == LABEL:
+            j += 1
+        group = [code[x].args[0] for x in range(k, j)]
+        if len(group) > 1:
+            keep = next((g for g in group if g in KEEP_LABELS), group[0])
+            for g in group:
+                if g != keep:
+                    rename[g] = keep
+        k = j
+    if not rename:
+        return code, 0
+
+    out = []
+    seen = set()
+    for i in code:
+        if i.op == LABEL:
+            name = rename.get(i.args[0], i.args[0])
+            if name in seen:
+                continue
+            seen.add(name)
+            out.append(label(name))
+        elif i.op in LABEL_REFS and i.args[0] in rename:
+            out.append(ins(i.op, rename[i.args[0]]))
+        else:
+            out.append(i)
+    return out, len(rename)
+
+
+@rule("thread_jumps")
+def thread_jumps(code):
+    """
+    JUMP/JZ L, onde L: JUMP M  ->  JUMP/JZ M.
+    JUMP/JZ L, onde L: PUSHI 0; JZ M  ->  JUMP/JZ M (o salto em M é certo).
+    JUMP L, onde L: RETURN/STOP ->  RETURN/STOP.
+    """
+    targets = _label_targets(code)
+
+    def next_jump(t):
+        # Destino certo a partir da instrução t (ou None se depender da pilha)
+        if t is None or t >= len(code):
+            return None
+        if code[t].op == "JUMP":
+            return code[t].args[0]
+        if code[t].op == "PUSHI" and code[t].args[0] == 0:
+            u = t + 1
+            while u < len(code) and code[u].op == LABEL:
+                u += 1
+            if u < len(code) and code[u].op == "JZ":
+                return code[u].args[0]
+        return None
+
+    def final_target(name):
+        seen = set()
+        while name not in seen:
+            seen.add(name)
+            nxt = next_jump(targets.get(name))
+            if nxt is None:
+                break
+            name = nxt
+        return name
+
+    out = []
+    n = 0
+    for i in code:
+        if i.op in BRANCHES:
+            dst = final_target(i.args[0])
+            if dst != i.args[0]:
+                i = ins(i.op, dst)
+                n += 1
+            t = targets.get(dst)
+            if i.op == "JUMP" and t is not None and t < len(code) and code[t].op in ("RETURN", "STOP"):
+                i = code[t]
+                n += 1
+        out.append(i)
+    return out, n
+
+
+@rule("jump_to_next")
+def jump_to_next(code):
+    """JUMP L imediatamente seguido (só por labels) de L: -> removido."""
+    out = []
+    n = 0
+    for k, i in enumerate(code):
+        if i.op == "JUMP":
+            j = k + 1
+            hit = False
+            while j < len(code) and code[j].op == LABEL:
+                if code[j].args[0] == i.args[0]:
+                    hit = True
+                    break
+                j += 1
+            if hit:
+                n += 1
+                continue
+        out.append(i)
+    return out, n
+
+
+@rule("drop_labels")
+def drop_labels(code):
+    """Remove labels que não são alvo de nenhum salto nem PUSHA."""
+    refs = _referenced_labels(code) | KEEP_LABELS
+    out = [i for i in code if i.op != LABEL or i.args[0] in refs]
+    return out, len(code) - len(out)
+
+
+@rule("unreachable")
+def unreachable(code):
+    """Remove instruções após JUMP/RETURN/STOP até ao próximo label."""
+    out = []
+    n = 0
+    dead = False
+    for i in code:
+        if i.op == LABEL:
+            dead = False
+        elif dead:
+            n += 1
+            continue
+        out.append(i)
+        if i.op in TERMINATORS:
+            dead = True
+    return out, n
+
+
+def optimize(code, passes=None, max_rounds=50):
+    """
+    Aplica as regras até não haver alterações (ou até max_rounds iterações).
+    :param code: Lista de instruções (Instr).
+    :param passes: Lista de (nome, função); por omissão, todas as regras registadas.
+    :return: (código otimizado, relatório) em que o relatório indica o nº de
+             instruções antes/depois, removidas e as aplicações por regra.
+    """
+    passes = PASSES if passes is None else passes
+    before = count_instrs(code)
+    applied = {name: 0 for name, _ in passes}
+
+    for _ in range(max_rounds):
+        changed = False
+        for name, fn in passes:
+            code, n = fn(code)
+            if n:
+                applied[name] += n
+                changed = True
+        if not changed:
+            break
+
+    after = count_instrs(code)
+    report = {
+        "before": before,
+        "after": after,
+        "removed": before - after,
+        "rules": {k: v for k, v in applied.items() if v},
+    }
+    return code, report
@@ -0,0 +1,131 @@
+"""
+Módulo: prune.py
+Descrição: Eliminação de subprogramas e variáveis não usados.
+Passe entre a análise semântica e a geração de código, sobre a AST anotada:
+- constrói o grafo de chamadas a partir do corpo principal (MAIN) e marca como
+  mortos (Subprogram.live = False) os subprogramas que nunca são alcançados;
+- recolhe as variáveis (globais e locais, incluindo os slots escondidos dos
+  'for') referidas pelo código que é de facto gerado e renumera os seus
+  endereços de forma compacta, pelo que as não usadas deixam de ocupar um slot
+  no PUSHN e, nos arrays, de ter um ALLOCN.
+
+Só é considerado o código que o gerador emite: expressões com valor constante
+(um único PUSH) e ramos de if/while/for com condição constante que nunca são
+executados não contam como usos, uma chamada avaliada em tempo de compilação
+(consteval.py) não é uma chamada, uma chamada expandida inline (inline.py)
+conta como o código da expansão e um FOR desenrolado (unroll.py) conta como as
+cópias do corpo. Os erros semânticos já foram todos reportados
+pela análise, mesmo em código morto.
+
+As alterações são apenas anotações (live, VarDecl.symbols, endereços das infos,
+nglobals/nlocals), reescritas por uma nova análise da mesma AST.
+"""
+
+from .tailrec import loop_slots
+from .nodes import Expr, If, While, For, VarRef, Call, ProcCall, Inline, Subprogram, VarDecl, children, walk
+
+
+def emitted(node):
+    """
+    Nós de 'node' cujo código é gerado (pré-ordem, ver a descrição do módulo);
+    uma chamada expandida inline é seguida da sua expansão (Inline).
+    """
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        yield n
+        if isinstance(n, Expr) and n.const is not None:
+            continue
+        if isinstance(n, (Call, ProcCall)) and n.inline is not None:
+            stack.append(n.inline)
+        if isinstance(n, If) and n.cond.const is not None:
+            taken = n.then if n.cond.const else n.els
+            if taken is not None:
+                stack.append(taken)
+            continue
+        if isinstance(n, While) and n.cond.const is not None and not n.cond.const:
+            continue
+        if isinstance(n, For) and n.start.const is not None and n.end.const is not None:
+            up = (n.direction == "TO")
+            if not (n.start.const <= n.end.const if up else n.start.const >= n.end.const):
+                stack.extend((n.end, n.start))  # só a inicialização da variável de controlo
+                continue
+        if isinstance(n, For) and n.unroll is not None:
+            stack.append(n.unroll)  # só as cópias do corpo (ver unroll.py)
+            continue
+        stack.extend(reversed(children(n)))
+
+
+def used_vars(body, extra=()) -> list:
+    """Infos das variáveis referidas pelo código gerado de 'body', mais 'extra' (sem repetições)."""
+    seen = {id(info): info for info in extra}
+    for n in emitted(body):
+        if isinstance(n, VarRef):
+            seen[id(n.symbol)] = n.symbol
+        elif isinstance(n, Inline):
+            for info in n.params + n.init + ([n.result] if n.result is not None else []):
+                seen[id(info)] = info
+        elif isinstance(n, For):
+            seen[id(n.symbol)] = n.symbol
+            if n.limit is not None:
+                seen[id(n.limit)] = n.limit
+    return list(seen.values())
+
+
+def renumber(infos: list, first: int) -> int:
+    """Atribui endereços consecutivos a partir de 'first' (pela ordem original); devolve o seguinte."""
+    for addr, info in enumerate(sorted(infos, key=lambda i: i["addr"]), start=first):
+        info["addr"] = addr
+    return first + len(infos)
+
+
+def prune(prog, ctx) -> dict:
+    """
+    Elimina os subprogramas não alcançáveis e as variáveis não usadas de 'prog'.
+    :return: {"subprograms": nº de subprogramas removidos, "variables": nº de variáveis removidas}
+    """
+    subs = {id(n.symbol): n for n in walk(prog) if isinstance(n, Subprogram)}
+
+    # 1) grafo de chamadas a partir do MAIN
+    live = []
+    pending = [prog.body]
+    reached = set()
+    while pending:
+        for n in emitted(pending.pop()):
+            if isinstance(n, Call) and n.const is not None:
+                continue  # avaliada em tempo de compilação (ver consteval.py)
+            if isinstance(n, (Call, ProcCall)) and n.inline is None:
+                sub = subs.get(id(n.symbol))
+                if sub is not None and id(sub) not in reached:
+                    reached.add(id(sub))
+                    live.append(sub)
+                    pending.append(sub.body)
+    for sub in subs.values():
+        sub.live = id(sub) in reached
+
+    # 2) variáveis usadas: globais (em qualquer corpo vivo) e locais de cada subprograma
+    used = {}
+    global_vars = {}
+    for body, owner in [(prog.body, None)] + [(s.body, s) for s in live]:
+        local_vars = []
+        loop = owner.loop if owner is not None else None
+        for info in used_vars(body, loop_slots(loop) if loop is not None else ()):
+            used[id(info)] = info
+            if info["level"] == "global":
+                global_vars[id(info)] = info
+            elif owner is not None and info["addr"] >= (1 if owner.kind == "func" else 0):
+                local_vars.append(info)  # parâmetros (fp[-k..-1]) e retorno (fp[0]) ficam
+        if owner is not None:
+            owner.nlocals = renumber(local_vars, 1 if owner.kind == "func" else 0)
+    prog.nglobals = renumber(list(global_vars.values()), 0)
+
+    removed_vars = 0
+    scopes = [prog.decls] + [s.decls for s in live]
+    for decls in scopes:
+        for d in decls:
+            if isinstance(d, VarDecl):
+                kept = [i for i in d.symbols if id(i) in used]
+                removed_vars += len(d.symbols) - len(kept)
+                d.symbols = kept
+
+    return {"subprograms": len(subs) - len(live), "variables": removed_vars}
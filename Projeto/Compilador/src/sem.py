@@ -8,6 +8,10 @@ a compatibilidade entre tipos de dados.
 
 from __future__ import annotations
 
+from .nodes import For, Call, ProcCall, VarRef, UnOp, BinOp, Unroll, walk
+from .context import EVAL_FUEL, UNROLL_BUDGET, UNROLL_FACTOR
+from .unroll import plan, constant_copy, offset_copy
+
 
 class SemanticError(Exception):
     """Exceção para erros lógicos detetados durante a análise (ex: tipos incompatíveis)."""
@@ -156,6 +160,45 @@ def is_numeric(t):
     """
     return t in NUMERIC
 
+def int_div(a, b):
+    """
+    Divisão inteira com a semântica de Pascal ('div'): trunca em direção a zero
+    (ao contrário do operador // do Python, que arredonda para baixo).
+    """
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b >= 0) else -q
+
+def int_mod(a, b):
+    """Resto com a semântica de Pascal ('mod'): a - b * (a div b)."""
+    return a - b * int_div(a, b)
+
+def fold_builtin(name, values, lineno):
+    """
+    Avalia em tempo de compilação uma função builtin com argumentos constantes,
+    com a mesma semântica do código gerado (ver codegen.Emitter.builtin_call).
+    Os chars são representados pelo seu código ASCII, como na VM.
+    """
+    x = values[0]
+    if name == "length":
+        return len(x)  # só strings: o length de um array já é sempre constante
+    if name == "concat":
+        return x + values[1]
+    if name == "ord":
+        return x
+    if name == "chr":
+        if not 0 <= x <= 255:
+            semerr(f"chr({x}) fora do intervalo 0..255 em expressão constante", lineno)
+        return x
+    if name == "odd":
+        return x % 2 != 0
+    if name == "abs":
+        return abs(x)
+    if name == "trunc":
+        return int(x)  # FTOI trunca em direção a zero
+    if name == "round":
+        return int(x + 0.5) if x >= 0 else int(x - 0.5)
+    return None
+
 def numeric_result(t1, t2):
     """
     Implementa a regra de promoção de tipos (Type Promotion).
@@ -195,4 +238,743 @@ def fmt_sig_args(args):
     Formata uma lista de tipos de argumentos para mensagens de erro de funções.
     Ex: [integer, real, string]
     """
-    return "[" + ", ".join(fmt_type(a) for a in args) + "]"
\ No newline at end of file
+    return "[" + ", ".join(fmt_type(a) for a in args) + "]"
+
+
+"""
+ANÁLISE SEMÂNTICA (PASSE SOBRE A AST)
+"""
+
+def semerr(msg, lineno=None):
+    """Centraliza o lançamento de erros semânticos com indicação de linha."""
+    if lineno is not None:
+        raise SemanticError(f"{msg} (linha {lineno})")
+    raise SemanticError(msg)
+
+
+def readonly_enter(ctx, name: str, reason: str = "readonly"):
+    """
+    Bloqueia uma variável para escrita.
+    Usado principalmente para proteger a variável de controlo do ciclo FOR.
+    """
+    c, _r = ctx.readonly_counts.get(name, (0, reason))
+    ctx.readonly_counts[name] = (c + 1, reason)
+
+
+def readonly_exit(ctx, name: str):
+    """Liberta uma variável do estado read-only."""
+    v = ctx.readonly_counts.get(name)
+    if not v:
+        return
+    c, r = v
+    if c <= 1:
+        ctx.readonly_counts.pop(name, None)
+    else:
+        ctx.readonly_counts[name] = (c - 1, r)
+
+
+def is_readonly(ctx, name: str) -> bool:
+    """Verifica se uma variável está atualmente protegida contra escrita."""
+    v = ctx.readonly_counts.get(name)
+    if not v:
+        return False
+    c, _ = v
+    return c > 0
+
+
+def semerr_if_readonly(ctx, name: str, lineno: int, *, what="alterar"):
+    """Lança erro se houver tentativa de modificar uma variável protegida."""
+    v = ctx.readonly_counts.get(name)
+    if not v:
+        return
+    c, reason = v
+    if c > 0:
+        if reason == "for_control":
+            raise SemanticError(f"Não é permitido atribuir à variável de controlo do FOR '{name}' (linha {lineno}).")
+        raise SemanticError(f"Não é permitido {what} '{name}' (linha {lineno}).")
+
+
+class Analyzer:
+    """
+    Passe semântico sobre a AST (ver nodes.py).
+    Declara os símbolos (endereços de globais, locais e parâmetros), verifica os
+    tipos e anota cada nó: tipo e constante conhecida das expressões (constant
+    folding) e a info da tabela de símbolos de cada referência.
+
+    A árvore é percorrida em pós-ordem, pela mesma ordem em que o parser reduz
+    as regras, pelo que o primeiro erro reportado é o que uma análise feita
+    durante o parse reportaria.
+
+    Faz também uma análise de intervalos dos índices de arrays: constantes e
+    variáveis de controlo de FOR (read-only no corpo) com limites conhecidos.
+    Um acesso cujo índice está provadamente dentro dos limites é marcado como
+    seguro (VarRef.safe) e o gerador de código dispensa o CHECK.
+
+    Cada subprograma é classificado como puro ou não (info["pure"], ver
+    consteval.py); uma chamada a uma função pura com argumentos constantes é
+    avaliada em tempo de compilação, com no máximo 'eval_fuel' nós avaliados
+    (0 desativa a avaliação).
+
+    Os FOR com limites constantes são desenrolados (ver unroll.py), com
+    'unroll_budget' e 'unroll_factor' (orçamento 0 desativa).
+    """
+
+    def __init__(self, ctx, eval_fuel: int = EVAL_FUEL, unroll_budget: int = UNROLL_BUDGET,
+                 unroll_factor: int = UNROLL_FACTOR):
+        self.ctx = ctx
+        self.symtab = ctx.symtab
+        self._visitors = {}
+        self.for_ranges = {}  # id(info da variável de controlo) -> (lo, hi) no corpo do FOR
+        self.eval_fuel = eval_fuel
+        self.subprograms = {}  # id(info) -> (Subprogram, infos dos parâmetros, info do retorno)
+        self.evaluated = {}  # (id(info), argumentos) -> resultado da avaliação (ou None)
+        self.unroll_budget = unroll_budget
+        self.unroll_factor = unroll_factor
+
+    def visit(self, node):
+        cls = type(node)
+        fn = self._visitors.get(cls)
+        if fn is None:
+            fn = self._visitors[cls] = getattr(self, "visit_" + cls.__name__)
+        return fn(node)
+
+    # PROGRAMA E DECLARAÇÕES
+
+    def visit_Program(self, prog):
+        ctx = self.ctx
+        for d in prog.decls:
+            self.visit(d)
+        self.visit(prog.body)
+
+        info = self.symtab.scopes[0].get(prog.name)
+        if info is not None and info.get("kind") == "builtin_func":
+            semerr(f"Nome do programa '{prog.name}' é reservado (builtin) e não pode ser usado", prog.line)
+        prog.nglobals = ctx.next_global_addr
+
+    def check_type(self, tspec):
+        """Valida os ranges de 'array[lo..hi]' de um tipo declarado."""
+        for lo, hi, line in tspec.ranges:
+            if lo > hi:
+                semerr(f"Range inválido: {lo}..{hi} (limite inferior maior que superior)", line)
+
+    def visit_VarDecl(self, decl):
+        ctx = self.ctx
+        self.check_type(decl.tspec)
+        t = decl.tspec.type
+
+        # Dentro de um subprograma (depth > 0) as variáveis são locais (fp[addr]);
+        # no escopo global ocupam o próximo slot do Global Pointer (gp[addr]).
+        in_subprog = (self.symtab.depth() > 0)
+        symbols = []
+        for (name, line) in decl.names:
+            if not in_subprog:
+                addr = ctx.next_global_addr
+                ctx.next_global_addr += 1
+                info = {"kind": "var", "type": t, "level": "global", "addr": addr}
+            else:
+                addr = ctx.next_local_addr_stack[-1]
+                ctx.next_local_addr_stack[-1] += 1
+                info = {"kind": "var", "type": t, "level": "local", "addr": addr}
+            self.symtab.declare(name, info, lineno=line)
+            symbols.append(info)
+        decl.symbols = symbols
+
+    def visit_Subprogram(self, sub):
+        ctx = self.ctx
+        st = self.symtab
+
+        # tipos do cabeçalho (parâmetros, por grupo, e depois o retorno)
+        seen = []
+        for prm in sub.params:
+            if not any(prm.tspec is s for s in seen):
+                seen.append(prm.tspec)
+                self.check_type(prm.tspec)
+        if sub.ret is not None:
+            self.check_type(sub.ret)
+
+        name, line = sub.name, sub.line
+        params = [(prm.name, prm.tspec.type, prm.line) for prm in sub.params]
+        k = len(params)
+        is_func = (sub.kind == "func")
+
+        # declara o subprograma no scope atual e entra no scope do corpo
+        if is_func:
+            info = {"kind": "func", "params": params, "ret": sub.ret.type, "label": name}
+        else:
+            info = {"kind": "proc", "params": params, "label": name}
+        st.declare(name, info, lineno=line)
+        st.push()
+
+        ret_info = None
+        if is_func:
+            # função reserva fp[0] para o retorno (variável implícita com o nome da função)
+            ctx.next_local_addr_stack.append(1)
+            ret_info = {"kind": "var", "type": sub.ret.type, "level": "local", "addr": 0}
+            st.declare(name, ret_info, lineno=line)
+
+            # regra forte: nenhum parâmetro pode ter o mesmo nome da função
+            for (varname, t, vline) in params:
+                if varname == name:
+                    semerr(
+                        f"Parâmetro '{varname}' não pode ter o mesmo nome da função '{name}' (colide com a variável de retorno)",
+                        vline
+                    )
+        else:
+            ctx.next_local_addr_stack.append(0)
+
+        # params: offsets negativos fp[-k .. -1]
+        param_infos = []
+        for i, (varname, t, vline) in enumerate(params):
+            param_infos.append({"kind": "var", "type": t, "level": "local", "addr": i - k})
+            st.declare(varname, param_infos[-1], lineno=vline)
+
+        ctx.current_subprog.append((sub.kind, name, line, k))
+        if is_func:
+            ctx.func_return_assigned.append(False)
+
+        for d in sub.decls:
+            self.visit(d)
+        self.visit(sub.body)
+
+        assigned = ctx.func_return_assigned.pop() if is_func else True
+        ctx.current_subprog.pop()
+        sub.nlocals = ctx.next_local_addr_stack.pop()
+        st.pop()
+        sub.symbol = info
+        sub.live = True
+        sub.loop = None
+        sub.memo = None
+
+        if not assigned:
+            semerr(f"Função '{name}' não atribui valor de retorno (ex: {name} := ...)", line)
+
+        # import local: consteval usa as funções de folding deste módulo
+        from .consteval import is_pure
+        info["pure"] = is_pure(sub)
+        self.subprograms[id(info)] = (sub, param_infos, ret_info)
+
+    # STATEMENTS
+
+    def visit_Compound(self, node):
+        for s in node.stmts:
+            self.visit(s)
+
+    def visit_Assign(self, node):
+        ctx = self.ctx
+        left = node.target
+        node.tail = None
+        self.visit(left)
+        self.visit(node.expr)
+
+        left_name = left.name
+        left_t = left.type
+        left_indexed = left.index is not None
+        line = node.line
+
+        # marcar retorno atribuído se for "fname := ..."
+        if ctx.current_subprog and ctx.current_subprog[-1][0] == "func":
+            fname = ctx.current_subprog[-1][1]
+            if (not left_indexed) and left_name == fname:
+                ctx.func_return_assigned[-1] = True
+
+        right_t = node.expr.type
+
+        if not left_indexed:
+            semerr_if_readonly(ctx, left_name, line, what="atribuir")
+
+        if is_array_type(left_t):
+            semerr("Não podes atribuir diretamente a um array inteiro (falta índice)", line)
+
+        if not (left_t == right_t or (left_t == "real" and right_t == "integer")):
+            semerr(f"Atribuição incompatível: {fmt_type(left_t)} := {fmt_type(right_t)}", line)
+
+        node.symbol = left.symbol
+
+    def visit_If(self, node):
+        self.visit(node.cond)
+        self.visit(node.then)
+        if node.els is not None:
+            self.visit(node.els)
+        if node.cond.type != "boolean":
+            semerr(f"IF exige condição boolean, recebi {fmt_type(node.cond.type)}", node.line)
+
+    def visit_While(self, node):
+        self.visit(node.cond)
+        self.visit(node.body)
+        if node.cond.type != "boolean":
+            semerr(f"WHILE exige condição boolean, recebi {fmt_type(node.cond.type)}", node.line)
+
+    def visit_For(self, node):
+        ctx = self.ctx
+        varname = node.var
+        self.visit(node.start)
+        self.visit(node.end)
+
+        # a variável de controlo é read-only durante o corpo
+        info = self.symtab.lookup(varname)
+        key = id(info)
+        outer = self.for_ranges.get(key)
+        rng = self.control_range(node, info)
+        if rng is not None:
+            self.for_ranges[key] = rng
+        readonly_enter(ctx, varname, reason="for_control")
+        self.visit(node.body)
+        readonly_exit(ctx, varname)
+        if rng is not None:
+            if outer is None:
+                del self.for_ranges[key]
+            else:
+                self.for_ranges[key] = outer
+
+        id_line = node.line
+        if info is None:
+            semerr(f"Variável '{varname}' usada no FOR sem ter sido declarada", id_line)
+        if info["kind"] != "var":
+            semerr(f"'{varname}' no FOR não é uma variável", id_line)
+        if info["type"] != "integer":
+            semerr(f"Variável de controlo do FOR tem de ser integer (recebi {fmt_type(info['type'])})", id_line)
+
+        if node.start.type != "integer":
+            semerr(f"Início do FOR tem de ser integer (recebi {fmt_type(node.start.type)})", id_line)
+        if node.end.type != "integer":
+            semerr(f"Fim do FOR tem de ser integer (recebi {fmt_type(node.end.type)})", id_line)
+        node.symbol = info
+        # o fim é avaliado uma única vez, antes do ciclo: se não for constante,
+        # fica guardado num slot escondido
+        node.limit = ctx.new_temp() if node.end.const is None else None
+        node.unroll = self.unroll_for(node, info)
+
+    def unroll_for(self, node, info):
+        """
+        Desenrola o FOR 'node' já analisado (ver unroll.py), analisando cada cópia
+        do corpo; devolve o Unroll, ou None se o FOR não é desenrolado.
+        """
+        p = plan(node, info, self.unroll_budget, self.unroll_factor)
+        if p is None:
+            return None
+        factor, trips = p
+        first, step = node.start.const, (1 if node.direction == "TO" else -1)
+        done = trips - trips % factor if factor is not None else 0  # iterações feitas pelos blocos
+        last = first + step * (done - factor) if factor is not None else None
+        key = id(info)
+        outer, evaluated = self.for_ranges.get(key), self.ctx.calls_evaluated
+        readonly_enter(self.ctx, node.var, reason="for_control")
+        try:
+            block = []
+            if factor is not None:
+                self.for_ranges[key] = (first, last) if step > 0 else (last, first)
+                block = [offset_copy(node.body, node.var, step * j) for j in range(factor)]
+                for b in block:
+                    self.visit(b)
+                self.for_ranges.pop(key)
+            rest = [constant_copy(node.body, node.var, first + step * j) for j in range(done, trips)]
+            for b in rest:
+                self.visit(b)
+        except SemanticError:
+            self.ctx.calls_evaluated = evaluated  # as cópias não são geradas
+            return None
+        finally:
+            readonly_exit(self.ctx, node.var)
+            if outer is not None:
+                self.for_ranges[key] = outer
+            else:
+                self.for_ranges.pop(key, None)
+        return Unroll(block, factor, last, rest, first + step * trips, node.line)
+
+    def control_range(self, node, info):
+        """
+        Intervalo da variável de controlo de um FOR durante o corpo: [início, fim]
+        (ou [fim, início] com DOWNTO), a partir dos intervalos dos limites.
+        Só é válido se nada no corpo pode alterar a variável: nenhum FOR aninhado
+        sobre ela e, se for global, nenhuma chamada a subprogramas do utilizador.
+        """
+        if info is None or info.get("kind") != "var" or info["type"] != "integer":
+            return None
+        first, last = self.int_range(node.start), self.int_range(node.end)
+        if first is None or last is None:
+            return None
+        for n in walk(node.body):
+            if isinstance(n, For) and n.var == node.var:
+                return None
+            if info["level"] == "global" and isinstance(n, (Call, ProcCall)):
+                callee = self.symtab.lookup(n.name)
+                if callee is not None and callee["kind"] in ("func", "proc"):
+                    return None
+        if node.direction == "TO":
+            return (first[0], last[1])
+        return (last[0], first[1])
+
+    def int_range(self, e):
+        """
+        Intervalo (lo, hi) dos valores de uma expressão integer já analisada, ou
+        None se não for conhecido: constantes, variáveis de controlo de FOR e
+        '+', '-', '*', unário '-', 'div'/'mod' por constantes positivas.
+        """
+        if e.type != "integer":
+            return None
+        if e.const is not None:
+            return (e.const, e.const)
+        if isinstance(e, VarRef):
+            if e.index is None:
+                return self.for_ranges.get(id(e.symbol))
+            return None
+        if isinstance(e, UnOp):
+            r = self.int_range(e.operand)
+            return (-r[1], -r[0]) if r is not None else None
+        if not isinstance(e, BinOp):
+            return None
+        a = self.int_range(e.left)
+        if a is None:
+            return None
+        if e.op in ("div", "mod"):
+            k = e.right.const
+            if k is None or k <= 0:
+                return None
+            if e.op == "div":
+                return (int_div(a[0], k), int_div(a[1], k))
+            if a[0] < 0:
+                return None
+            return a if a[1] < k else (0, k - 1)
+        b = self.int_range(e.right)
+        if b is None:
+            return None
+        if e.op == "+":
+            return (a[0] + b[0], a[1] + b[1])
+        if e.op == "-":
+            return (a[0] - b[1], a[1] - b[0])
+        if e.op == "*":
+            prods = (a[0] * b[0], a[0] * b[1], a[1] * b[0], a[1] * b[1])
+            return (min(prods), max(prods))
+        return None
+
+    def visit_Repeat(self, node):
+        self.visit(node.body)
+        self.visit(node.cond)
+        if node.cond.type != "boolean":
+            semerr(f"UNTIL exige condição boolean, recebi {fmt_type(node.cond.type)}", node.line)
+
+    def visit_ProcCall(self, node):
+        name, line = node.name, node.line
+        if node.args is None:
+            info = self.symtab.lookup(name)
+            if info is None:
+                semerr(f"'{name}' chamado sem ter sido declarado", line)
+            if info["kind"] == "var":
+                semerr(f"'{name}' é uma variável e não pode ser chamada como procedure", line)
+            if info["kind"] == "func":
+                semerr(f"Função '{name}' não pode ser chamada como statement; usa o valor numa expressão", line)
+            if info["kind"] == "builtin_func":
+                semerr(f"Função builtin '{name}' não pode ser chamada como statement; usa o valor numa expressão", line)
+            if info["kind"] != "proc":
+                semerr(f"'{name}' não é procedure", line)
+            params = info["params"]
+            if len(params) != 0:
+                semerr(f"Procedure '{name}' exige {len(params)} args; usa '{name}(...)'", line)
+            node.symbol = info
+            node.inline = None
+            node.tail = None
+            return
+
+        for a in node.args:
+            self.visit(a)
+        args_t = [a.type for a in node.args]
+
+        info = self.symtab.lookup(name)
+        if info is None:
+            semerr(f"'{name}' chamado sem ter sido declarado", line)
+        if info["kind"] == "var":
+            semerr(f"'{name}' é uma variável e não pode ser chamada como procedure", line)
+        if info["kind"] == "builtin_func":
+            semerr(f"Função builtin '{name}' não pode ser chamada como statement; usa o valor numa expressão", line)
+        if info["kind"] == "func":
+            semerr(f"Função '{name}' não pode ser chamada como statement; usa o valor numa expressão", line)
+        if info["kind"] != "proc":
+            semerr(f"'{name}' não é procedure", line)
+        self.check_args(name, info["params"], args_t, line)
+        node.symbol = info
+        node.inline = None
+        node.tail = None
+
+    def is_return_var(self, name, info) -> bool:
+        """'info' é a variável de retorno (fp[0]) da função em análise, chamada 'name'."""
+        cur = self.ctx.current_subprog
+        return (bool(cur) and cur[-1][0] == "func" and cur[-1][1] == name
+                and info["level"] == "local" and info["addr"] == 0)
+
+    def check_args(self, name, params, args_t, line):
+        """Verifica o nº e os tipos dos argumentos de uma chamada a um subprograma do utilizador."""
+        if len(args_t) != len(params):
+            semerr(f"'{name}' espera {len(params)} args, recebi {len(args_t)}: {fmt_sig_args(args_t)}", line)
+        for i, (got_t, param) in enumerate(zip(args_t, params), start=1):
+            _param_name, param_t, _pline = param
+            if not type_eq(param_t, got_t):
+                semerr(f"Arg {i} de '{name}' incompatível: espera {fmt_type(param_t)}, recebi {fmt_type(got_t)}", line)
+
+    def visit_Writeln(self, node):
+        for e in node.args:
+            self.visit(e)
+        for e in node.args:
+            if is_array_type(e.type):
+                semerr("WRITELN não aceita arrays", node.line)
+
+    def visit_Readln(self, node):
+        for lv in node.targets:
+            self.visit(lv)
+        for lv in node.targets:
+            if is_array_type(lv.type) and lv.index is None:
+                semerr("READLN não pode ler para um array inteiro", node.line)
+            if lv.index is None:
+                # PROIBIR mexer no contador do FOR dentro do corpo
+                semerr_if_readonly(self.ctx, lv.name, node.line, what="ler (READLN)")
+
+    # EXPRESSÕES
+
+    def visit_Literal(self, node):
+        pass
+
+    def visit_VarRef(self, node):
+        """Resolve uma variável simples ou um elemento de array/string (leitura ou escrita)."""
+        name, line = node.name, node.line
+        idx = node.index
+        if idx is not None:
+            self.visit(idx)
+
+        info = self.symtab.lookup(name)
+        if info is None:
+            semerr(f"Variável '{name}' usada sem ter sido declarada", line)
+        if info["kind"] != "var":
+            semerr(f"'{name}' não é uma variável", line)
+        node.symbol = info
+        node.const = None
+        node.string_indexed = False
+        node.safe = False
+
+        base_t = info["type"]
+        if idx is None:
+            node.type = base_t
+            return
+
+        if idx.type != "integer":
+            semerr(f"Índice de '{name}[...]' tem de ser integer (recebi {fmt_type(idx.type)})", line)
+        idx_c = idx.const
+
+        # Subcaso: Indexação de STRING (Pascal strings são frequentemente tratadas como read-only)
+        if base_t == "string":
+            if node.lvalue:
+                semerr(
+                    f"Não é permitido atribuir para '{name}[...]' porque '{name}' é string "
+                    f"(strings são read-only para indexação)",
+                    line
+                )
+            if idx_c is not None and idx_c < 1:
+                semerr(f"Índice inválido em string: '{name}[{idx_c}]' (strings usam índices >= 1)", line)
+            node.type = "char"
+            node.string_indexed = True
+            return
+
+        # Subcaso: Indexação de ARRAY
+        if not is_array_type(base_t):
+            semerr(f"'{name}' não é array nem string, não pode ser indexado com [ ] (tipo: {fmt_type(base_t)})", line)
+
+        # Verificação de limites se o índice for uma constante conhecida em tempo de compilação
+        (lo, hi) = base_t[1]
+        if idx_c is not None and (idx_c < lo or idx_c > hi):
+            semerr(f"Índice fora do range: '{name}[{idx_c}]' mas o array é {fmt_type(base_t)}", line)
+        node.type = base_t[2]
+        r = self.int_range(idx)
+        node.safe = r is not None and lo <= r[0] and r[1] <= hi
+
+    def visit_UnOp(self, node):
+        self.visit(node.operand)
+        t = node.operand.type
+        c = node.operand.const
+        if node.op == "-":
+            if t not in ("integer", "real"):
+                semerr("Operador unário '-' exige integer ou real", node.line)
+            node.type = t
+            node.const = (-c) if c is not None else None
+        else:
+            if t != "boolean":
+                semerr(f"NOT exige boolean, recebi {fmt_type(t)}", node.line)
+            node.type = "boolean"
+            node.const = (not c) if c is not None else None
+
+    def visit_BinOp(self, node):
+        self.visit(node.left)
+        self.visit(node.right)
+        op, line = node.op, node.line
+        t1, t2 = node.left.type, node.right.type
+        c1, c2 = node.left.const, node.right.const
+        both = c1 is not None and c2 is not None
+
+        if op in ("or", "and"):
+            word = op.upper()
+            if t1 != "boolean" or t2 != "boolean":
+                semerr(f"{word} exige boolean, recebi {fmt_type(t1)} {word} {fmt_type(t2)}", line)
+            if op == "or":
+                const = (c1 or c2) if both else None
+                if c1 is not None and c1:
+                    const = True   # curto-circuito: o rhs nunca é avaliado
+            else:
+                const = (c1 and c2) if both else None
+                if c1 is not None and not c1:
+                    const = False  # curto-circuito: o rhs nunca é avaliado
+            node.type, node.const = "boolean", const
+            return
+
+        if op in ("=", "<>"):
+            if is_array_type(t1) or is_array_type(t2):
+                semerr(f"Comparação inválida: não é permitido comparar array com '{op}'", line)
+            if not (t1 == t2 or (is_numeric(t1) and is_numeric(t2))):
+                semerr(f"Comparação inválida: {fmt_type(t1)} {op} {fmt_type(t2)}", line)
+            const = None
+            if both:
+                const = (c1 == c2) if op == "=" else (c1 != c2)
+            node.type, node.const = "boolean", const
+            return
+
+        if op in ("<", "<=", ">", ">="):
+            if not (is_numeric(t1) and is_numeric(t2)):
+                semerr(f"Comparação '{op}' exige números, recebi {fmt_type(t1)} {op} {fmt_type(t2)}", line)
+            const = None
+            if both:
+                if op == "<":
+                    const = (c1 < c2)
+                elif op == "<=":
+                    const = (c1 <= c2)
+                elif op == ">":
+                    const = (c1 > c2)
+                else:
+                    const = (c1 >= c2)
+            node.type, node.const = "boolean", const
+            return
+
+        if op in ("+", "-", "*"):
+            if not (is_numeric(t1) and is_numeric(t2)):
+                semerr(f"Operador '{op}' exige números", line)
+            const = None
+            if both:
+                const = c1 + c2 if op == "+" else c1 - c2 if op == "-" else c1 * c2
+            node.type, node.const = numeric_result(t1, t2), const
+            return
+
+        if op == "/":
+            if not (is_numeric(t1) and is_numeric(t2)):
+                semerr("Operador '/' exige números", line)
+            const = None
+            if both:
+                if c2 == 0:
+                    semerr("Divisão por zero em expressão constante", line)
+                const = c1 / c2
+            node.type, node.const = "real", const
+            return
+
+        # div / mod
+        if t1 != "integer" or t2 != "integer":
+            semerr(f"Operador '{op}' exige integer", line)
+        const = None
+        if both:
+            if c2 == 0:
+                semerr(f"Divisão por zero em expressão constante ({op})", line)
+            const = int_div(c1, c2) if op == "div" else int_mod(c1, c2)
+        node.type, node.const = "integer", const
+
+    def visit_Call(self, node):
+        name, line = node.name, node.line
+        args = node.args
+        for a in args:
+            self.visit(a)
+        args_t = [a.type for a in args]
+
+        info = self.symtab.lookup(name)
+        if info is None:
+            semerr(f"Função '{name}' chamada sem ter sido declarada", line)
+        if info["kind"] == "var" and self.is_return_var(name, info):
+            # chamada recursiva: com argumentos, o nome da função designa a própria função
+            info = self.symtab.scopes[-2][name]
+        if info["kind"] == "var":
+            semerr(f"'{name}' é uma variável e não pode ser chamada como função", line)
+        node.symbol = info
+        node.const = None
+        node.inline = None
+
+        if info["kind"] == "builtin_func":
+            self.builtin_call(node, args_t)
+            if node.const is None and all(a.const is not None for a in args):
+                node.const = fold_builtin(name, [a.const for a in args], line)
+            return
+
+        #  USER-DEFINED
+        if info["kind"] == "proc":
+            semerr(f"Procedure '{name}' não pode ser usada como expressão (não devolve valor)", line)
+        if info["kind"] != "func":
+            semerr(f"'{name}' não é function", line)
+        self.check_args(name, info["params"], args_t, line)
+        node.type = info["ret"]
+        if info.get("pure") and self.eval_fuel > 0 and all(a.const is not None for a in args):
+            node.const = self.evaluate(info, [a.const for a in args])
+
+    def evaluate(self, info, args):
+        """Resultado de uma chamada a uma função pura com argumentos constantes, ou None (ver consteval.py)."""
+        from .consteval import evaluate_call
+        key = (id(info), tuple(args))
+        if key not in self.evaluated:
+            self.evaluated[key] = evaluate_call(self.subprograms, info, args, self.eval_fuel)
+        value = self.evaluated[key]
+        if value is not None:
+            self.ctx.calls_evaluated += 1
+        return value
+
+    def builtin_call(self, node, args_t):
+        """Verifica (e tipa) uma chamada a uma função builtin (ver BUILTIN_FUNCS)."""
+        name, line, args = node.name, node.line, node.args
+        ret = resolve_builtin_func(name, args_t)
+        if ret is None:
+            semerr(
+                f"Chamada inválida a '{name}': argumentos {fmt_sig_args(args_t)} não correspondem a nenhuma assinatura",
+                line
+            )
+
+        if name == "length":
+            if len(args) != 1:
+                semerr("length(...) espera 1 argumento", line)
+            t0 = args_t[0]
+            if t0 == "string":
+                node.type = "integer"
+                return
+            if is_array_type(t0):
+                # o tamanho de um array é conhecido em tempo de compilação
+                (lo, hi) = t0[1]
+                node.type, node.const = "integer", hi - lo + 1
+                return
+            semerr(f"length(...) só aceita string ou array, recebi {fmt_type(t0)}", line)
+
+        if name == "concat":
+            if len(args) != 2:
+                semerr("concat(s1,s2) espera 2 argumentos", line)
+            if args_t[0] != "string" or args_t[1] != "string":
+                semerr(f"concat(...) espera (string,string), recebi {fmt_sig_args(args_t)}", line)
+            node.type = "string"
+            return
+
+        if name in ("ord", "chr", "odd", "trunc", "round"):
+            expected, result = {
+                "ord": ("char", "integer"), "chr": ("integer", "char"), "odd": ("integer", "boolean"),
+                "trunc": ("real", "integer"), "round": ("real", "integer"),
+            }[name]
+            if len(args) != 1:
+                semerr(f"{name}(...) espera 1 argumento", line)
+            if args_t[0] != expected:
+                semerr(f"{name}(...) espera {expected}, recebi {fmt_type(args_t[0])}", line)
+            node.type = result
+            return
+
+        if name == "abs":
+            if len(args) != 1:
+                semerr("abs(...) espera 1 argumento", line)
+            if args_t[0] not in ("integer", "real"):
+                semerr(f"abs(...) espera integer ou real, recebi {fmt_type(args_t[0])}", line)
+            node.type = args_t[0]
+            return
+
+        semerr(f"Builtin '{name}' não suportado (erro interno)", line)
@@ -0,0 +1,297 @@
+"""
+Módulo: server.py
+Descrição: Modo servidor (daemon) do compilador, com um protocolo de linhas JSON.
+Um processo de longa duração mantém as tabelas LALR carregadas e responde a
+pedidos de compilação, evitando o custo de arranque do interpretador e do
+parser em cada chamada (integrações com editores, CI).
+
+Transporte: stdin/stdout (uma linha JSON por pedido e por resposta) ou um
+socket Unix local (várias ligações em simultâneo, o mesmo formato por ligação).
+
+Pedido de compilação:
+    {"id": 1, "source": "program p; begin end.", "options": {"peephole": true, "lexer": "fast"}}
+Respostas:
+    {"id": 1, "ok": true, "vm": "...", "messages": [], "latency_ms": 1.9, "compile_ms": 1.2}
+    {"id": 2, "ok": false, "error": {"type": "SemanticError", "message": "..."}, ...}
+Outros pedidos: {"op": "stats"} devolve as estatísticas de latência e
+{"op": "shutdown"} termina o servidor (depois de responder aos pedidos pendentes).
+
+Os pedidos são lidos pelo ciclo asyncio e compilados num pool de workers
+(processos, ou uma thread no próprio processo com 1 worker), pelo que as
+respostas podem chegar fora de ordem: o "id" de cada pedido é devolvido na
+resposta. Os avisos da compilação (ex: caracteres ilegais) são devolvidos em
+"messages", em vez de impressos, para não corromperem o protocolo.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .compiler import compile_source, warmup, DIAGNOSTIC_ERRORS
+from .context import CompilerOptions, BUILTIN_MODES
+
+
+# Opções de compilação aceites no campo "options" de um pedido
+OPTION_FIELDS = ("peephole", "lexer", "check_elim", "builtins", "prune", "tailrec", "inline_budget", "eval_fuel",
+                 "memoize", "unroll_budget", "unroll_factor")
+
+
+class ProtocolError(Exception):
+    """Pedido mal formado (JSON inválido, campos em falta ou opções desconhecidas)."""
+    pass
+
+
+def compile_request(source: str, options: dict) -> dict:
+    """
+    Compila um pedido (executado num worker).
+    :return: resultado serializável: ok, vm ou error, messages e compile_ms.
+    """
+    messages = []
+    t0 = time.perf_counter()
+    try:
+        vm_code = compile_source(source, CompilerOptions(**options), messages=messages)
+        result = {"ok": True, "vm": vm_code}
+    except Exception as e:
+        result = {"ok": False, "error": {"type": type(e).__name__, "message": str(e)}}
+        if type(e).__name__ not in DIAGNOSTIC_ERRORS:
+            result["error"]["internal"] = True
+    result["messages"] = messages
+    result["compile_ms"] = (time.perf_counter() - t0) * 1000
+    return result
+
+
+def decode_request(line: str) -> dict:
+    """Descodifica uma linha do protocolo (um objeto JSON), ainda sem validar os campos."""
+    try:
+        req = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ProtocolError(f"JSON inválido: {e}") from None
+    if not isinstance(req, dict):
+        raise ProtocolError("o pedido tem de ser um objeto JSON")
+    return req
+
+
+def parse_request(line: str) -> dict:
+    """Valida uma linha do protocolo e devolve o pedido (dict)."""
+    return validate_request(decode_request(line))
+
+
+def validate_request(req: dict) -> dict:
+    """Valida os campos de um pedido já descodificado e devolve-o."""
+    op = req.get("op", "compile")
+    if op not in ("compile", "stats", "shutdown"):
+        raise ProtocolError(f"operação desconhecida: {op!r}")
+    if op == "compile":
+        if not isinstance(req.get("source"), str):
+            raise ProtocolError("falta o campo 'source' (texto do programa)")
+        options = req.get("options") or {}
+        if not isinstance(options, dict):
+            raise ProtocolError("'options' tem de ser um objeto JSON")
+        unknown = sorted(set(options) - set(OPTION_FIELDS))
+        if unknown:
+            raise ProtocolError(f"opções desconhecidas: {', '.join(unknown)}")
+        if options.get("lexer", "fast") not in ("fast", "ply"):
+            raise ProtocolError(f"lexer desconhecido: {options['lexer']!r}")
+        if options.get("builtins", "auto") not in BUILTIN_MODES:
+            raise ProtocolError(f"modo de builtins desconhecido: {options['builtins']!r}")
+        for field in ("inline_budget", "eval_fuel", "unroll_budget", "unroll_factor"):
+            value = options.get(field, 0)
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise ProtocolError(f"{field} tem de ser um inteiro >= 0: {value!r}")
+        for field in ("peephole", "check_elim", "prune", "tailrec", "memoize"):
+            value = options.get(field, True)
+            if not isinstance(value, bool):
+                raise ProtocolError(f"{field} tem de ser true ou false: {value!r}")
+    req["op"] = op
+    return req
+
+
+class LatencyStats:
+    """Latências (ms) de todos os pedidos de compilação atendidos pelo servidor."""
+
+    def __init__(self):
+        self.latencies = []  # do pedido lido à resposta escrita
+        self.compile_ms = []  # tempo de compilação dentro do worker
+        self.errors = 0  # pedidos com diagnóstico ou erro de protocolo
+
+    def record(self, latency_ms: float, compile_ms: float, ok: bool) -> None:
+        self.latencies.append(latency_ms)
+        self.compile_ms.append(compile_ms)
+        if not ok:
+            self.errors += 1
+
+    @staticmethod
+    def _percentile(ordered: list, q: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def to_dict(self) -> dict:
+        ordered = sorted(self.latencies)
+        n = len(ordered)
+        return {
+            "requests": n,
+            "errors": self.errors,
+            "mean_ms": sum(ordered) / n if n else 0.0,
+            "p50_ms": self._percentile(ordered, 0.50),
+            "p90_ms": self._percentile(ordered, 0.90),
+            "p99_ms": self._percentile(ordered, 0.99),
+            "max_ms": ordered[-1] if n else 0.0,
+            "mean_compile_ms": sum(self.compile_ms) / n if n else 0.0,
+        }
+
+    def format(self) -> str:
+        d = self.to_dict()
+        return (
+            f"{d['requests']} pedidos ({d['errors']} com erro) | latência média {d['mean_ms']:.2f} ms, "
+            f"p50 {d['p50_ms']:.2f}, p90 {d['p90_ms']:.2f}, p99 {d['p99_ms']:.2f}, máx {d['max_ms']:.2f} "
+            f"| compilação média {d['mean_compile_ms']:.2f} ms"
+        )
+
+
+class CompileServer:
+    """
+    Servidor de compilação: despacha os pedidos de cada fonte de linhas JSON
+    para o pool de workers e escreve as respostas à medida que ficam prontas.
+    """
+
+    def __init__(self, workers: int = 1):
+        self.workers = max(1, workers)
+        self.stats = LatencyStats()
+        self.pool = None
+        self._stopping = None  # asyncio.Event, criado dentro do ciclo
+
+    def _start_pool(self):
+        if self.workers == 1:
+            # No próprio processo: as tabelas são carregadas uma vez, aqui
+            warmup()
+            self.pool = ThreadPoolExecutor(max_workers=1)
+        else:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=warmup)
+
+    async def handle_line(self, line: str, write) -> None:
+        """Atende um pedido (uma linha) e escreve a resposta com write(dict)."""
+        t0 = time.perf_counter()
+        req_id = None
+        try:
+            req = decode_request(line)
+            req_id = req.get("id")  # ecoado também nas respostas de erro de protocolo
+            validate_request(req)
+            if req["op"] == "stats":
+                write({"id": req_id, "ok": True, "stats": self.stats.to_dict()})
+                return
+            if req["op"] == "shutdown":
+                self._stopping.set()
+                write({"id": req_id, "ok": True})
+                return
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self.pool, compile_request, req["source"], req.get("options") or {})
+        except ProtocolError as e:
+            result = {"ok": False, "error": {"type": "ProtocolError", "message": str(e)}, "messages": [], "compile_ms": 0.0}
+        except Exception as e:  # ex: worker terminado abruptamente
+            result = {"ok": False, "error": {"type": type(e).__name__, "message": str(e), "internal": True},
+                      "messages": [], "compile_ms": 0.0}
+
+        latency_ms = (time.perf_counter() - t0) * 1000
+        self.stats.record(latency_ms, result["compile_ms"], result["ok"])
+        write({"id": req_id, **result, "latency_ms": latency_ms})
+
+    async def serve_lines(self, readline, write) -> None:
+        """
+        Lê pedidos com 'readline' (corrotina; "" no fim) até ao fim do input ou
+        a um pedido de shutdown, atendendo-os em simultâneo.
+        """
+        pending = set()
+        stop = asyncio.create_task(self._stopping.wait())
+        while not self._stopping.is_set():
+            read = asyncio.create_task(readline())
+            await asyncio.wait((read, stop), return_when=asyncio.FIRST_COMPLETED)
+            if not read.done():
+                read.cancel()
+                break
+            line = read.result()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            task = asyncio.create_task(self.handle_line(line, write))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        stop.cancel()
+        if pending:
+            await asyncio.gather(*pending)
+
+    async def serve_stdio(self, stdin=None, stdout=None) -> None:
+        """Protocolo sobre stdin/stdout (o stdout fica reservado às respostas)."""
+        stdin = stdin or sys.stdin
+        stdout = stdout or sys.stdout
+
+        def write(obj):
+            stdout.write(json.dumps(obj, ensure_ascii=False) + "\n")
+            stdout.flush()
+
+        # A leitura bloqueante do stdin corre numa thread daemon, que entrega as
+        # linhas ao ciclo por uma fila (não impede a saída após um shutdown).
+        loop = asyncio.get_running_loop()
+        lines = asyncio.Queue()
+
+        def reader():
+            for line in iter(stdin.readline, ""):
+                loop.call_soon_threadsafe(lines.put_nowait, line)
+            loop.call_soon_threadsafe(lines.put_nowait, "")
+
+        threading.Thread(target=reader, daemon=True).start()
+        await self.serve_lines(lines.get, write)
+
+    async def serve_unix(self, path: str) -> None:
+        """Protocolo sobre um socket Unix em 'path' (até a um pedido de shutdown)."""
+        connections = set()  # tarefas das ligações ativas
+
+        async def on_connection(reader, writer):
+            connections.add(asyncio.current_task())
+            def write(obj):
+                writer.write((json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8"))
+
+            async def readline():
+                return (await reader.readline()).decode("utf-8")
+
+            try:
+                await self.serve_lines(readline, write)
+                await writer.drain()
+            finally:
+                connections.discard(asyncio.current_task())
+                writer.close()
+
+        if os.path.exists(path):
+            os.unlink(path)
+        server = await asyncio.start_unix_server(on_connection, path=path)
+        try:
+            async with server:
+                await self._stopping.wait()
+                # cada ligação termina depois de responder aos seus pedidos pendentes
+                await asyncio.gather(*connections, return_exceptions=True)
+        finally:
+            if os.path.exists(path):
+                os.unlink(path)
+
+    async def run(self, socket_path: str = None) -> None:
+        self._stopping = asyncio.Event()
+        self._start_pool()
+        try:
+            if socket_path:
+                await self.serve_unix(socket_path)
+            else:
+                await self.serve_stdio()
+        finally:
+            self.pool.shutdown(wait=True)
+
+
+def serve(workers: int = 1, socket_path: str = None) -> LatencyStats:
+    """Corre o servidor até ao fim do stdin (ou a um shutdown) e devolve as estatísticas."""
+    server = CompileServer(workers)
+    asyncio.run(server.run(socket_path))
+    return server.stats
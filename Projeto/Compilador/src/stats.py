@@ -0,0 +1,188 @@
+"""
+Módulo: stats.py
+Descrição: Instrumentação opcional das fases da compilação.
+A análise semântica e a geração de código são passes próprios sobre a AST e
+são medidas diretamente (ver Compiler._compile). A análise léxica e o parsing
+LALR acontecem juntos dentro de parser.parse, pelo que aí as medições são
+feitas "por dentro" do parser:
+- o lexer é envolvido numa função de tokens (tokenfunc) que conta os tokens
+  e mede o tempo passado a produzi-los;
+- as produções do parser desta compilação são substituídas por cópias cujas
+  ações contam as reduções por regra e medem o tempo gasto nas ações
+  (construção dos nós da AST).
+O tempo restante de parser.parse é o do próprio motor LALR.
+
+Sem estatísticas pedidas, nada disto é instalado e o custo é nulo.
+"""
+
+import copy
+import time
+import tracemalloc
+from dataclasses import dataclass, field, asdict
+
+
+@dataclass
+class CompileStats:
+    """
+    Estatísticas de uma compilação (tempos em segundos, memória em bytes).
+    O tracemalloc torna as alocações bastante mais lentas; com track_memory=False
+    o pico de memória não é medido, mas os tempos ficam mais fiéis.
+    """
+    track_memory: bool = True
+    lines: int = 0
+    source_bytes: int = 0
+    tokens: int = 0
+    reductions: dict = field(default_factory=dict)  # regra da gramática -> nº de reduções
+    lex_time: float = 0.0
+    action_time: float = 0.0
+    parse_time: float = 0.0      # total de parser.parse (inclui lexing e ações)
+    sem_time: float = 0.0        # análise semântica (sem.Analyzer)
+    codegen_time: float = 0.0    # geração de código (codegen.Emitter)
+    peephole_time: float = 0.0
+    serialize_time: float = 0.0
+    total_time: float = 0.0
+    peak_memory: int = 0         # pico de memória alocada (tracemalloc)
+    instructions: int = 0        # nº de instruções VM geradas (sem labels)
+    checks_removed: int = 0      # bounds checks (CHECK) omitidos em acessos seguros
+    checks_kept: int = 0         # bounds checks mantidos
+
+    @property
+    def driver_time(self) -> float:
+        """Tempo do motor LALR (parse sem lexing nem ações)."""
+        return max(0.0, self.parse_time - self.lex_time - self.action_time)
+
+    @property
+    def other_time(self) -> float:
+        """Tempo fora das fases medidas (preparação do contexto, parser, built-ins)."""
+        return max(0.0, self.total_time - self.parse_time - self.sem_time - self.codegen_time
+                   - self.peephole_time - self.serialize_time)
+
+    @property
+    def total_reductions(self) -> int:
+        return sum(self.reductions.values())
+
+    def merge(self, other: "CompileStats") -> None:
+        """Acumula as estatísticas de outra compilação (o pico de memória é o máximo)."""
+        for name in ("lines", "source_bytes", "tokens", "lex_time", "action_time", "parse_time",
+                     "sem_time", "codegen_time", "peephole_time", "serialize_time", "total_time", "instructions",
+                     "checks_removed", "checks_kept"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for rule, n in other.reductions.items():
+            self.reductions[rule] = self.reductions.get(rule, 0) + n
+        self.peak_memory = max(self.peak_memory, other.peak_memory)
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        d["driver_time"] = self.driver_time
+        d["other_time"] = self.other_time
+        d["total_reductions"] = self.total_reductions
+        return d
+
+    def format(self, top: int = 10) -> str:
+        """Relatório legível: tempos por fase, contagens e as regras mais reduzidas."""
+        total = self.total_time or 1e-12
+
+        def row(name, t):
+            return f"  {name:<22} {t * 1000:>10.2f} ms  {100 * t / total:>5.1f}%"
+
+        lines = [
+            f"Fonte      : {self.lines} linhas, {self.source_bytes} bytes, {self.tokens} tokens",
+            f"Reduções   : {self.total_reductions} ({len(self.reductions)} regras distintas)",
+            f"Instruções : {self.instructions}",
+            f"Bounds     : {self.checks_removed} CHECK omitidos, {self.checks_kept} mantidos",
+            (f"Memória    : pico de {self.peak_memory / (1024 * 1024):.2f} MB (tracemalloc)"
+             if self.track_memory else "Memória    : não medida"),
+            "Tempos:" + (" (com tracemalloc ativo)" if self.track_memory else ""),
+            row("lexing", self.lex_time),
+            row("ações (AST)", self.action_time),
+            row("motor LALR", self.driver_time),
+            row("análise semântica", self.sem_time),
+            row("geração de código", self.codegen_time),
+            row("peephole", self.peephole_time),
+            row("serialização", self.serialize_time),
+            row("preparação/outros", self.other_time),
+            row("total", self.total_time),
+        ]
+        if self.reductions and top:
+            lines.append(f"Regras mais reduzidas (top {top}):")
+            ranked = sorted(self.reductions.items(), key=lambda kv: (-kv[1], kv[0]))
+            for rule, n in ranked[:top]:
+                lines.append(f"  {n:>8}  {rule}")
+        return "\n".join(lines)
+
+
+def timed_tokenfunc(lexer, stats: CompileStats):
+    """Devolve uma função de tokens que conta os tokens e mede o tempo de lexing."""
+    token = lexer.token
+    clock = time.perf_counter
+
+    def get_token():
+        t0 = clock()
+        tok = token()
+        stats.lex_time += clock() - t0
+        if tok is not None:
+            stats.tokens += 1
+        return tok
+
+    return get_token
+
+
+def instrument_productions(parser, stats: CompileStats) -> None:
+    """
+    Substitui as produções deste parser (uma cópia leve, ver build_parser) por
+    cópias cujas ações contam reduções e medem o tempo. As tabelas partilhadas
+    por outras compilações não são alteradas.
+    """
+    clock = time.perf_counter
+    reductions = stats.reductions
+
+    def wrap(prod):
+        fn = prod.callable
+        rule = prod.str
+
+        def action(p):
+            reductions[rule] = reductions.get(rule, 0) + 1
+            t0 = clock()
+            try:
+                fn(p)
+            finally:
+                stats.action_time += clock() - t0
+
+        new = copy.copy(prod)
+        new.callable = action
+        return new
+
+    parser.productions = [wrap(p) if p.callable else p for p in parser.productions]
+
+
+class MemoryTracker:
+    """
+    Mede o pico de memória com tracemalloc durante um bloco 'with'.
+    Se o tracemalloc já estiver ativo, apenas reinicia o pico e não o desliga.
+    Nota: o tracemalloc é global ao processo; com várias compilações em
+    simultâneo, o pico inclui as alocações de todas.
+    """
+
+    def __init__(self, stats: CompileStats):
+        self.stats = stats
+        self.started = False
+
+    def __enter__(self):
+        if not self.stats.track_memory:
+            return self
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started = True
+        else:
+            tracemalloc.reset_peak()
+        self.base = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, *exc):
+        if not self.stats.track_memory:
+            return False
+        _current, peak = tracemalloc.get_traced_memory()
+        self.stats.peak_memory = max(0, peak - self.base)
+        if self.started:
+            tracemalloc.stop()
+        return False
@@ -0,0 +1,118 @@
+"""
+Módulo: tables.py
+Descrição: Tabelas LALR pré-construídas ("congeladas") para um arranque rápido.
+O yacc.yacc() do PLY, em cada processo, faz a reflexão completa do módulo da
+gramática, importa o parsetab.py (que reconstrói as tabelas em ciclos Python
+no import) e, se a gramática mudou, regenera o parsetab.py e reescreve o
+ficheiro de debug parser.out.
+
+Aqui, as tabelas finais (ação, goto e produções) são guardadas como literais em
+parsetab_frozen.py, carregado diretamente do .pyc. Antes de serem usadas são
+validadas contra a assinatura da gramática atual, calculada exatamente como o
+PLY a calcula (símbolo inicial + precedências + tokens + docstrings das regras),
+mas sem a reflexão completa. Se estiverem desatualizadas, o parser é construído
+em memória, sem escrever ficheiros.
+
+Para regenerar parsetab.py, parser.out e parsetab_frozen.py após alterar a gramática:
+    python -m src.tables
+"""
+
+import os
+import sys
+import types
+
+import ply.yacc as yacc
+
+
+START = "programa"
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+FROZEN_FILE = os.path.join(SRC_DIR, "parsetab_frozen.py")
+
+
+def grammar_signature(module) -> str:
+    """
+    Assinatura da gramática definida em 'module', igual à _lr_signature do PLY:
+    símbolo inicial, precedências, tokens (ordenados) e as docstrings das funções p_*
+    (ordenadas pela linha em que são definidas).
+    """
+    pfuncs = []
+    for name, item in vars(module).items():
+        if name.startswith("p_") and name != "p_error" and isinstance(item, types.FunctionType):
+            pfuncs.append((item.__code__.co_firstlineno, name, item.__doc__))
+    pfuncs.sort()
+
+    parts = [START]
+    prec = getattr(module, "precedence", None)
+    if prec:
+        parts.append("".join("".join(p) for p in prec))
+    parts.append(" ".join(sorted(module.tokens)))
+    parts += [doc for _line, _name, doc in pfuncs if doc]
+    return "".join(parts)
+
+
+def load_frozen(module):
+    """
+    Constrói o LRParser a partir de parsetab_frozen.py, sem passar pelo yacc().
+    :return: LRParser, ou None se as tabelas não existirem ou não corresponderem à gramática.
+    """
+    try:
+        from . import parsetab_frozen as frozen
+    except ImportError:
+        return None
+    if frozen.tabversion != yacc.__tabversion__ or frozen.signature != grammar_signature(module):
+        return None
+
+    lr = yacc.LRTable()
+    lr.lr_action = frozen.action
+    lr.lr_goto = frozen.goto
+    lr.lr_method = frozen.method
+    lr.lr_productions = [yacc.MiniProduction(*p) for p in frozen.productions]
+    lr.bind_callables(vars(module))
+    return yacc.LRParser(lr, module.p_error)
+
+
+def build(module, write_files: bool = False):
+    """
+    Constrói o parser com o yacc() do PLY (reflexão e validação completas).
+    Só com write_files=True é que parsetab.py e parser.out são (re)escritos.
+    """
+    return yacc.yacc(
+        module=module,
+        start=START,
+        debug=write_files,
+        write_tables=write_files,
+        outputdir=SRC_DIR,
+        tabmodule="parsetab",
+    )
+
+
+def freeze(module) -> str:
+    """Reconstrói as tabelas com o PLY e escreve parsetab_frozen.py (e parsetab.py/parser.out)."""
+    build(module, write_files=True)
+    # As tabelas são relidas do parsetab.py acabado de escrever, a forma que o
+    # yacc() carrega (os estados sem gotos não ficam guardados)
+    parser = build(module)
+    productions = [(p.str, p.name, p.len, p.func, p.file, p.line) for p in parser.productions]
+    text = (
+        "# parsetab_frozen.py\n"
+        "# Tabelas LALR congeladas, geradas por 'python -m src.tables'. Não editar.\n"
+        f"tabversion = {yacc.__tabversion__!r}\n"
+        "method = 'LALR'\n"
+        f"signature = {grammar_signature(module)!r}\n"
+        f"action = {parser.action!r}\n"
+        f"goto = {parser.goto!r}\n"
+        f"productions = {productions!r}\n"
+    )
+    with open(FROZEN_FILE, "w", encoding="utf-8") as f:
+        f.write(text)
+    return FROZEN_FILE
+
+
+def main():
+    from . import parser as grammar
+    path = freeze(grammar)
+    print(f"Tabelas escritas em {os.path.basename(path)}, parsetab.py e parser.out")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Módulo: tailrec.py
+Descrição: Transformação da recursividade final em ciclos.
+Passe entre a análise semântica e a expansão inline (inline.py), sobre a AST
+anotada. Uma chamada de um subprograma a si próprio em posição final (o último
+statement do corpo, ou de um ramo de um 'if' em posição final) deixa de criar um
+novo frame na VM: os argumentos são avaliados, guardados nos slots dos
+parâmetros (fp[-k..-1]) e o código salta para o início do corpo. Reconhece-se:
+- 'p(args)' num procedimento e 'f := f(args)' numa função (chamada final);
+- 'f := e op f(args)' e 'f := f(args) op e' numa função integer, com op '+' ou
+  '*' (associativos e comutativos): 'e' é acumulada num slot local, iniciado a
+  0 ou 1 em cada chamada, e o valor devolvido passa a ser 'acc op f'. Só nas
+  funções de recursividade linear (todas as chamadas recursivas são estas):
+  numa recursividade em árvore (ex: 'fib := fib(n - 1) + fib(n - 2)') o
+  acumulador custa mais do que o CALL/RETURN que poupa.
+
+Em 'e op f(args)', 'e' já era avaliada antes da chamada e a ordem dos efeitos
+mantém-se. Em 'f(args) op e', 'e' passa a ser avaliada antes da recursão, pelo
+que não pode chamar subprogramas do utilizador nem ler variáveis globais.
+
+As restantes chamadas recursivas mantêm-se. Os subprogramas com arrays
+locais não são transformados (cada chamada tem o seu ALLOCN). Antes de cada
+salto, as variáveis locais lidas antes de serem atribuídas voltam a 0, como no
+PUSHN de uma nova chamada.
+
+As alterações são apenas anotações (Subprogram.loop, Assign/ProcCall.tail),
+reescritas por uma nova análise da mesma AST.
+"""
+
+from .nodes import Compound, If, Assign, ProcCall, Call, BinOp, VarRef, VarDecl, Subprogram, TailLoop, TailCall, walk
+from .inline import var_refs, assigned_first
+
+# Operadores acumuláveis e o valor inicial do acumulador
+ACCUMULATORS = {"+": 0, "*": 1}
+
+
+def tail_stmts(stmt) -> list:
+    """Statements em posição final de 'stmt' (depois deles, o subprograma termina)."""
+    if isinstance(stmt, Compound):
+        return tail_stmts(stmt.stmts[-1]) if stmt.stmts else []
+    if isinstance(stmt, If):
+        return tail_stmts(stmt.then) + (tail_stmts(stmt.els) if stmt.els is not None else [])
+    return [stmt]
+
+
+def reorderable(e) -> bool:
+    """'e' pode ser avaliada antes da recursão: não chama subprogramas do utilizador nem lê globais."""
+    for n in walk(e):
+        if isinstance(n, Call) and n.symbol["kind"] != "builtin_func":
+            return False
+        if isinstance(n, VarRef) and n.symbol["level"] == "global":
+            return False
+    return True
+
+
+def match(stmt, sub):
+    """(chamada, parcela, op) se 'stmt' é uma chamada recursiva final de 'sub', senão None."""
+    info = sub.symbol
+    if sub.kind == "proc":
+        return (stmt, None, None) if isinstance(stmt, ProcCall) and stmt.symbol is info else None
+
+    # 'f := ...' com f a variável de retorno (fp[0])
+    if not (isinstance(stmt, Assign) and stmt.target.index is None
+            and stmt.symbol["level"] == "local" and stmt.symbol["addr"] == 0):
+        return None
+    e = stmt.expr
+    if isinstance(e, Call) and e.symbol is info:
+        return e, None, None
+    if isinstance(e, BinOp) and e.op in ACCUMULATORS and e.type == "integer":
+        if isinstance(e.right, Call) and e.right.symbol is info:
+            return e.right, e.left, e.op
+        if isinstance(e.left, Call) and e.left.symbol is info and reorderable(e.right):
+            return e.left, e.right, e.op
+    return None
+
+
+def is_read(body, info) -> bool:
+    return any(isinstance(n, VarRef) and n.symbol is info and not n.lvalue for n in walk(body))
+
+
+def tail_matches(sub):
+    """
+    Chamadas recursivas finais de 'sub' que são transformadas (ver a descrição do
+    módulo): ([(statement, (chamada, parcela, op)), ...], op do acumulador ou None).
+    """
+    if any(isinstance(d, VarDecl) and isinstance(d.tspec.type, tuple) for d in sub.decls):
+        return [], None
+    matches = [(s, m) for s in tail_stmts(sub.body) for m in (match(s, sub),) if m is not None]
+    ops = [op for _s, (_call, _extra, op) in matches if op is not None]
+    op = ops[0] if ops else None
+    matches = [(s, m) for s, m in matches if m[2] in (None, op)]  # um único operador por função
+    if op is not None:
+        tail = {id(call) for _s, (call, _extra, _op) in matches}
+        if any(isinstance(n, Call) and n.symbol is sub.symbol and id(n) not in tail for n in walk(sub.body)):
+            op = None  # recursividade em árvore: só as chamadas finais sem acumulador
+            matches = [(s, m) for s, m in matches if m[2] is None]
+    return matches, op
+
+
+def transform(sub):
+    """Anota as chamadas recursivas finais de 'sub' (ver a descrição do módulo); devolve o TailLoop ou None."""
+    matches, op = tail_matches(sub)
+    if not matches:
+        return None
+
+    acc = None
+    if op is not None:
+        acc = {"kind": "var", "type": "integer", "level": "local", "addr": sub.nlocals}
+        sub.nlocals += 1
+    reset = [v for v in var_refs(sub.body)
+             if v["addr"] >= 0 and is_read(sub.body, v) and not assigned_first(sub.body, v)]
+    loop = TailLoop(sub.symbol, op, acc, reset, sub.line)
+    for s, (call, extra, _op) in matches:
+        s.tail = TailCall(loop, call, extra)
+    sub.loop = loop
+    return loop
+
+
+def loop_slots(loop) -> list:
+    """Slots locais usados pelo ciclo de 'loop' (acumulador e slots reiniciados)."""
+    return ([loop.acc] if loop.acc is not None else []) + loop.reset
+
+
+def tail_calls(prog, ctx, skip=()) -> list:
+    """
+    Transforma as chamadas recursivas finais de todos os subprogramas, exceto os
+    de 'skip' (ex: as funções memorizadas, ver memo.py); devolve e guarda os nomes.
+    """
+    skipped = {id(sub) for sub in skip}
+    ctx.tailrec = [sub.name for sub in walk(prog)
+                   if isinstance(sub, Subprogram) and id(sub) not in skipped and transform(sub) is not None]
+    return ctx.tailrec
@@ -0,0 +1,87 @@
+"""
+Módulo: unroll.py
+Descrição: Desenrolamento de ciclos FOR com limites constantes.
+Usado pela análise semântica (sem.Analyzer), depois de um FOR ter sido
+analisado sem erros. Um FOR cujos limites são constantes é desenrolado:
+- totalmente, se o código desenrolado (nº de iterações x nós do corpo) cabe no
+  orçamento ('budget'): o corpo é copiado uma vez por iteração, com a variável
+  de controlo substituída pelo valor constante dessa iteração;
+- parcialmente, senão, por um fator 'factor' (se o bloco cabe no orçamento e
+  há pelo menos dois blocos): um ciclo executa blocos de 'factor' cópias do
+  corpo, com a variável substituída por 'var', 'var + 1', ..., e incrementa-a
+  de 'factor' em cada bloco; as iterações que sobram são copiadas com valores
+  constantes.
+
+Cada cópia é analisada como código novo, pelo que as expressões com a variável
+de controlo passam a ser dobradas: um índice como 'v[abs(i - 3) + 1]' passa a
+constante e dispensa o CHECK, e um 'if' que dependa de 'i' fica com um só ramo.
+Se a análise de alguma cópia falhar (ex: um índice constante fora dos limites
+num ramo que nunca é executado), o FOR fica como estava. No fim, a variável de
+controlo fica com o mesmo valor que no ciclo original.
+
+Não são desenrolados os FOR com outro FOR sobre a mesma variável no corpo nem,
+se a variável for global, os que chamam subprogramas do utilizador que não sejam
+puros (que a poderiam ler).
+"""
+
+from .nodes import Node, VarRef, Literal, BinOp, For, Call, ProcCall, walk
+
+
+def substitute(node, var, make):
+    """
+    Cópia de 'node' em que cada leitura da variável 'var' passa a ser make(linha).
+    As anotações são copiadas tal como estão e reescritas quando a cópia é analisada.
+    """
+    if isinstance(node, VarRef) and node.name == var and node.index is None:
+        return make(node.line)
+    cls = type(node)
+    new = cls.__new__(cls)
+    for c in cls.__mro__:
+        for s in getattr(c, "__slots__", ()):
+            v = getattr(node, s, None)
+            if isinstance(v, Node):
+                v = substitute(v, var, make)
+            elif isinstance(v, list):
+                v = [substitute(x, var, make) if isinstance(x, Node) else x for x in v]
+            setattr(new, s, v)
+    if isinstance(new, For):
+        new.unroll = None  # reescrito pela análise da cópia
+    return new
+
+
+def constant_copy(body, var, value):
+    """Cópia de 'body' com a variável de controlo 'var' substituída pela constante 'value'."""
+    return substitute(body, var, lambda line: Literal("integer", value, line))
+
+
+def offset_copy(body, var, offset):
+    """Cópia de 'body' com a variável de controlo 'var' substituída por 'var + offset'."""
+    if offset == 0:
+        return substitute(body, var, lambda line: VarRef(var, None, line))
+    op = "+" if offset > 0 else "-"
+    return substitute(body, var, lambda line: BinOp(op, VarRef(var, None, line), Literal("integer", abs(offset), line), line))
+
+
+def plan(node, info, budget: int, factor: int):
+    """
+    Desenrolamento do FOR 'node' já analisado (ver a descrição do módulo):
+    (fator, nº de iterações), com fator None no desenrolamento total, ou None.
+    """
+    first, last = node.start.const, node.end.const
+    if budget <= 0 or first is None or last is None:
+        return None
+    trips = (last - first + 1) if node.direction == "TO" else (first - last + 1)
+    if trips <= 0:
+        return None
+    for n in walk(node.body):
+        if isinstance(n, For) and n.symbol is info:
+            return None
+        if info["level"] == "global" and isinstance(n, (Call, ProcCall)):
+            if n.symbol["kind"] in ("func", "proc") and not n.symbol.get("pure"):
+                return None
+    size = sum(1 for _ in walk(node.body))
+    if trips * size <= budget:
+        return None, trips
+    if factor >= 2 and trips >= 2 * factor and factor * size <= budget:
+        return factor, trips
+    return None
@@ -0,0 +1,450 @@
+"""
+Módulo: vm.py
+Descrição: Interpretador local do assembly EWVM gerado pelo compilador.
+Permite executar os ficheiros .vm sem a VM web, o que torna possível medir o
+tempo de execução, testar o output dos programas e comparar otimizações pelo
+número de instruções executadas.
+
+O texto .vm é primeiro descodificado (assemble) para uma lista de pares
+(opcode numérico, operando), com os labels já resolvidos para índices; a
+execução é um ciclo de despacho sobre essa lista.
+
+Modelo de memória (igual ao da EWVM):
+- uma única pilha de operandos; as variáveis globais ocupam as primeiras
+  posições (gp = 0) e as locais são relativas ao frame pointer (fp);
+- CALL guarda (pc, fp) numa pilha de retorno separada e faz fp = sp;
+  RETURN repõe sp = fp e recupera (pc, fp);
+- ALLOCN reserva um bloco na heap e empilha o seu endereço (o próprio bloco).
+
+Uso: python -m src.vm programa.vm [outro.vm ...] [-i entrada.txt] [--stats]
+"""
+
+import argparse
+import io
+import math
+import sys
+import time
+
+from .sem import int_div, int_mod
+
+
+class VMError(Exception):
+    """Erro de execução da VM (ex: divisão por zero, índice fora dos limites, ERR)."""
+    pass
+
+
+# Opcodes suportados, aproximadamente por ordem de frequência (a ordem dos
+# testes no ciclo de despacho segue esta lista).
+OPCODES = (
+    "PUSHG", "PUSHI", "PUSHL", "STOREG", "STOREL", "JZ", "JUMP",
+    "ADD", "SUB", "MUL", "INF", "INFEQ", "SUP", "SUPEQ", "EQUAL", "NOT",
+    "LOADN", "STOREN", "CHECK", "PUSHA", "CALL", "RETURN", "POP", "DUP", "SWAP",
+    "DIV", "MOD", "AND", "OR",
+    "PUSHF", "FADD", "FSUB", "FMUL", "FDIV", "FINF", "FINFEQ", "FSUP", "FSUPEQ",
+    "ITOF", "FTOI", "PUSHS", "CHARAT", "STRLEN", "CONCAT",
+    "WRITEI", "WRITEF", "WRITES", "WRITECHR", "WRITELN", "READ", "ATOI", "ATOF",
+    "PUSHN", "ALLOCN", "START", "NOP", "ERR", "STOP",
+)
+OPCODE_NUM = {name: k for k, name in enumerate(OPCODES)}
+
+# Instruções cujo operando é um label (resolvido para um índice no assemble)
+LABEL_OPS = ("JUMP", "JZ", "PUSHA")
+
+
+class Program:
+    """
+    Programa descodificado, pronto a executar.
+    - code: lista de (opcode numérico, operando); termina sempre com STOP.
+    - labels: nome do label -> índice em code.
+    """
+    __slots__ = ("code", "labels", "lines")
+
+    def __init__(self, code, labels, lines):
+        self.code = code
+        self.labels = labels
+        self.lines = lines  # nº da linha do .vm de cada instrução (mensagens de erro)
+
+    def __len__(self):
+        return len(self.code)
+
+
+def _parse_string(text: str, lineno: int) -> str:
+    """Descodifica o literal de PUSHS/ERR ("..." com \\" para aspas)."""
+    text = text.strip()
+    if len(text) < 2 or text[0] != '"' or text[-1] != '"':
+        raise VMError(f"Literal de string inválido na linha {lineno}: {text}")
+    return text[1:-1].replace('\\"', '"')
+
+
+def _parse_number(text: str, lineno: int):
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        raise VMError(f"Operando inválido na linha {lineno}: {text}")
+
+
+def assemble(text: str) -> Program:
+    """
+    Descodifica o texto .vm numa lista de instruções com labels resolvidos.
+    :param text: Conteúdo de um ficheiro .vm.
+    :return: Program pronto a executar.
+    """
+    raw = []      # (mnemónica, operandos, nº da linha)
+    labels = {}
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("//"):
+            continue
+        if line.endswith(":") and " " not in line:
+            labels[line[:-1]] = len(raw)
+            continue
+        op, _, rest = line.partition(" ")
+        op = op.upper()
+        if op not in OPCODE_NUM:
+            raise VMError(f"Instrução desconhecida na linha {lineno}: {op}")
+        if op in ("PUSHS", "ERR"):
+            args = (_parse_string(rest, lineno),)
+        elif op in LABEL_OPS:
+            args = (rest.strip(),)
+        elif rest.strip():
+            args = tuple(_parse_number(a.strip(), lineno) for a in rest.split(","))
+        else:
+            args = ()
+        raw.append((op, args, lineno))
+
+    code = []
+    lines = []
+    for op, args, lineno in raw:
+        if op in LABEL_OPS:
+            if args[0] not in labels:
+                raise VMError(f"Label inexistente na linha {lineno}: {args[0]}")
+            arg = labels[args[0]]
+        elif op == "CHECK":
+            arg = args
+        elif op in ("DUP", "POP") and not args:
+            arg = 1
+        else:
+            arg = args[0] if args else None
+        code.append((OPCODE_NUM[op], arg))
+        lines.append(lineno)
+    code.append((OPCODE_NUM["STOP"], None))
+    lines.append(0)
+    return Program(code, labels, lines)
+
+
+def format_float(x: float) -> str:
+    """
+    Escreve um real como a EWVM (Number.prototype.toString do JavaScript):
+    3.0 -> '3', 2.5 -> '2.5', 1.5e-05 -> '0.000015', 1e-07 -> '1e-7',
+    1e21 -> '1e+21', e os não finitos como 'Infinity', '-Infinity' e 'NaN'.
+    Os dígitos são os do repr (o mais curto que identifica o valor, como em JS).
+    """
+    if math.isnan(x):
+        return "NaN"
+    if math.isinf(x):
+        return "Infinity" if x > 0 else "-Infinity"
+    if x == 0:
+        return "0"
+    mantissa, _, exp = repr(abs(x)).partition("e")
+    whole, _, frac = mantissa.partition(".")
+    raw = whole + frac
+    digits = raw.lstrip("0")
+    # valor = 0.<digits> * 10**n
+    n = len(whole) + int(exp or 0) - (len(raw) - len(digits))
+    digits = digits.rstrip("0")
+    k = len(digits)
+    if k <= n <= 21:
+        text = digits + "0" * (n - k)
+    elif 0 < n <= 21:
+        text = digits[:n] + "." + digits[n:]
+    elif -6 < n <= 0:
+        text = "0." + "0" * -n + digits
+    else:
+        e = n - 1
+        text = digits[0] + ("." + digits[1:] if k > 1 else "") + ("e+" if e >= 0 else "e-") + str(abs(e))
+    return "-" + text if x < 0 else text
+
+
+class VM:
+    """
+    Máquina virtual de pilha que executa um Program.
+    Depois de run(), 'steps' contém o nº de instruções executadas.
+    """
+
+    def __init__(self, program: Program, stdin=None, stdout=None, max_steps: int = None):
+        self.program = program
+        self.stdin = stdin if stdin is not None else sys.stdin
+        self.stdout = stdout if stdout is not None else sys.stdout
+        self.max_steps = max_steps
+        self.steps = 0
+
+    def run(self) -> int:
+        """
+        Executa o programa até STOP.
+        :return: Nº de instruções executadas.
+        """
+        code = self.program.code
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        calls = []
+        out = []
+        write = out.append
+        stdin = self.stdin
+        fp = 0
+        pc = 0
+        steps = 0
+        limit = self.max_steps if self.max_steps is not None else sys.maxsize  # None: sem limite
+
+        (PUSHG, PUSHI, PUSHL, STOREG, STOREL, JZ, JUMP,
+         ADD, SUB, MUL, INF, INFEQ, SUP, SUPEQ, EQUAL, NOT,
+         LOADN, STOREN, CHECK, PUSHA, CALL, RETURN, POP, DUP, SWAP,
+         DIV, MOD, AND, OR,
+         PUSHF, FADD, FSUB, FMUL, FDIV, FINF, FINFEQ, FSUP, FSUPEQ,
+         ITOF, FTOI, PUSHS, CHARAT, STRLEN, CONCAT,
+         WRITEI, WRITEF, WRITES, WRITECHR, WRITELN, READ, ATOI, ATOF,
+         PUSHN, ALLOCN, START, NOP, ERR, STOP) = range(len(OPCODES))
+
+        try:
+            while True:
+                op, a = code[pc]
+                pc += 1
+                steps += 1
+                if steps > limit:
+                    raise VMError(f"Limite de {limit} instruções excedido")
+
+                if op == PUSHG:
+                    push(stack[a])
+                elif op == PUSHI:
+                    push(a)
+                elif op == PUSHL:
+                    push(stack[fp + a])
+                elif op == STOREG:
+                    stack[a] = pop()
+                elif op == STOREL:
+                    stack[fp + a] = pop()
+                elif op == JZ:
+                    if pop() == 0:
+                        pc = a
+                elif op == JUMP:
+                    pc = a
+                elif op == ADD:
+                    b = pop()
+                    stack[-1] += b
+                elif op == SUB:
+                    b = pop()
+                    stack[-1] -= b
+                elif op == MUL:
+                    b = pop()
+                    stack[-1] *= b
+                elif op == INF or op == FINF:
+                    b = pop()
+                    stack[-1] = int(stack[-1] < b)
+                elif op == INFEQ or op == FINFEQ:
+                    b = pop()
+                    stack[-1] = int(stack[-1] <= b)
+                elif op == SUP or op == FSUP:
+                    b = pop()
+                    stack[-1] = int(stack[-1] > b)
+                elif op == SUPEQ or op == FSUPEQ:
+                    b = pop()
+                    stack[-1] = int(stack[-1] >= b)
+                elif op == EQUAL:
+                    b = pop()
+                    stack[-1] = int(stack[-1] == b)
+                elif op == NOT:
+                    stack[-1] = int(stack[-1] == 0)
+                elif op == LOADN:
+                    n = pop()
+                    block = pop()
+                    if n < 0 or n >= len(block):
+                        raise VMError(f"LOADN: índice {n} fora do bloco de tamanho {len(block)}")
+                    push(block[n])
+                elif op == STOREN:
+                    v = pop()
+                    n = pop()
+                    block = pop()
+                    if n < 0 or n >= len(block):
+                        raise VMError(f"STOREN: índice {n} fora do bloco de tamanho {len(block)}")
+                    block[n] = v
+                elif op == CHECK:
+                    v = stack[-1]
+                    if v < a[0] or v > a[1]:
+                        raise VMError(f"CHECK: índice {v} fora de [{a[0]}, {a[1]}]")
+                elif op == PUSHA:
+                    push(a)
+                elif op == CALL:
+                    calls.append((pc, fp))
+                    pc = pop()
+                    fp = len(stack)
+                elif op == RETURN:
+                    del stack[fp:]
+                    pc, fp = calls.pop()
+                elif op == POP:
+                    del stack[len(stack) - a:]
+                elif op == DUP:
+                    stack.extend(stack[len(stack) - a:])
+                elif op == SWAP:
+                    stack[-1], stack[-2] = stack[-2], stack[-1]
+                elif op == DIV:
+                    b = pop()
+                    if b == 0:
+                        raise VMError("Divisão por zero")
+                    stack[-1] = int_div(stack[-1], b)
+                elif op == MOD:
+                    b = pop()
+                    if b == 0:
+                        raise VMError("Divisão por zero")
+                    stack[-1] = int_mod(stack[-1], b)
+                elif op == AND:
+                    b = pop()
+                    stack[-1] = int(stack[-1] != 0 and b != 0)
+                elif op == OR:
+                    b = pop()
+                    stack[-1] = int(stack[-1] != 0 or b != 0)
+                elif op == PUSHF:
+                    push(float(a))
+                elif op == FADD:
+                    b = pop()
+                    stack[-1] = float(stack[-1] + b)
+                elif op == FSUB:
+                    b = pop()
+                    stack[-1] = float(stack[-1] - b)
+                elif op == FMUL:
+                    b = pop()
+                    stack[-1] = float(stack[-1] * b)
+                elif op == FDIV:
+                    b = pop()
+                    if b == 0:
+                        raise VMError("Divisão por zero")
+                    stack[-1] = stack[-1] / b
+                elif op == ITOF:
+                    stack[-1] = float(stack[-1])
+                elif op == FTOI:
+                    stack[-1] = int(stack[-1])
+                elif op == PUSHS:
+                    push(a)
+                elif op == CHARAT:
+                    n = pop()
+                    s = pop()
+                    if n < 0 or n >= len(s):
+                        raise VMError(f"CHARAT: índice {n} fora da string de tamanho {len(s)}")
+                    push(ord(s[n]))
+                elif op == STRLEN:
+                    stack[-1] = len(stack[-1])
+                elif op == CONCAT:
+                    b = pop()
+                    stack[-1] = stack[-1] + b
+                elif op == WRITEI:
+                    write(str(pop()))
+                elif op == WRITEF:
+                    write(format_float(pop()))
+                elif op == WRITES:
+                    write(pop())
+                elif op == WRITECHR:
+                    write(chr(pop()))
+                elif op == WRITELN:
+                    write("\n")
+                elif op == READ:
+                    self._flush(out)
+                    line = stdin.readline()
+                    if not line:
+                        raise VMError("READ: fim do input")
+                    push(line.rstrip("\r\n"))
+                elif op == ATOI:
+                    s = pop()
+                    try:
+                        push(int(s.strip()))
+                    except ValueError:
+                        raise VMError(f"ATOI: '{s}' não é um inteiro")
+                elif op == ATOF:
+                    s = pop()
+                    try:
+                        push(float(s.strip()))
+                    except ValueError:
+                        raise VMError(f"ATOF: '{s}' não é um real")
+                elif op == PUSHN:
+                    stack.extend([0] * a)
+                elif op == ALLOCN:
+                    n = pop()
+                    if n < 0:
+                        raise VMError(f"ALLOCN: tamanho inválido {n}")
+                    push([0] * n)
+                elif op == START:
+                    fp = len(stack)
+                elif op == NOP:
+                    pass
+                elif op == ERR:
+                    raise VMError(a)
+                elif op == STOP:
+                    break
+        except VMError as e:
+            self.steps = steps
+            self._flush(out)
+            raise VMError(f"{e} (linha {self.program.lines[pc - 1]} do .vm)") from None
+        except IndexError:
+            self.steps = steps
+            self._flush(out)
+            raise VMError(f"Acesso inválido à pilha (linha {self.program.lines[pc - 1]} do .vm)") from None
+        self.steps = steps
+        self._flush(out)
+        return steps
+
+    def _flush(self, out):
+        if out:
+            self.stdout.write("".join(out))
+            out.clear()
+        self.stdout.flush()
+
+
+def run_text(vm_text: str, input_text: str = "", max_steps: int = None):
+    """
+    Executa código .vm com o input dado e captura o output.
+    :return: (output, nº de instruções executadas)
+    """
+    stdout = io.StringIO()
+    vm = VM(assemble(vm_text), stdin=io.StringIO(input_text), stdout=stdout, max_steps=max_steps)
+    vm.run()
+    return stdout.getvalue(), vm.steps
+
+
+def main(argv=None):
+    """CLI: executa um ou mais ficheiros .vm com o mesmo input."""
+    ap = argparse.ArgumentParser(prog="python -m src.vm", description="Interpretador local de código EWVM (.vm).")
+    ap.add_argument("programs", nargs="+", help="ficheiros .vm a executar")
+    ap.add_argument("-i", "--input", help="ficheiro usado como input (por omissão, o stdin)")
+    ap.add_argument("--max-steps", type=int, help="nº máximo de instruções executadas")
+    ap.add_argument("--stats", action="store_true", help="mostra instruções executadas e tempo (no stderr)")
+    args = ap.parse_args(argv)
+
+    if args.input:
+        with open(args.input, "r", encoding="utf-8") as f:
+            input_text = f.read()
+    else:
+        input_text = sys.stdin.read() if len(args.programs) > 1 else None
+
+    failed = 0
+    for path in args.programs:
+        with open(path, "r", encoding="utf-8") as f:
+            program = assemble(f.read())
+        stdin = io.StringIO(input_text) if input_text is not None else sys.stdin
+        vm = VM(program, stdin=stdin, max_steps=args.max_steps)
+        t0 = time.perf_counter()
+        try:
+            vm.run()
+        except VMError as e:
+            print(f"\n{path}: erro de execução: {e}", file=sys.stderr)
+            failed += 1
+        dt = time.perf_counter() - t0
+        if args.stats:
+            print(f"[{path}] {vm.steps} instruções executadas em {dt:.4f}s", file=sys.stderr)
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+program T47;
+var c: char;
+begin
+  c := chr(200 + 56);
+end.
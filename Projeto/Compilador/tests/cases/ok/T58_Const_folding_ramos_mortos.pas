@@ -0,0 +1,11 @@
+program T58;
+var x: integer; r: real;
+begin
+  x := 2*3+4;
+  r := 1.5 * 2 + 1;
+  x := -7 div 2 + (-7 mod 2);
+  if 1 > 2 then x := 1 else x := 3;
+  while false do x := 9;
+  repeat x := x + 1 until true;
+  writeln(x, ' ', r)
+end.
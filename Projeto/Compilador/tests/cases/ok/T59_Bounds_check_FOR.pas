@@ -0,0 +1,29 @@
+program T59;
+var v: array[1..10] of integer;
+    m: array[0..4] of integer;
+    i, j, s: integer;
+
+procedure muda();
+begin
+  i := i + 1
+end;
+
+begin
+  for i := 1 to 10 do v[i] := i * i;
+  for i := 10 downto 6 do v[i - 5] := v[i] - v[11 - i];
+  for i := 0 to 4 do
+    for j := i to 4 do
+      m[j] := m[j] + v[2 * i + 1] + v[j div 2 + 1];
+  s := 0;
+  for i := 1 to 5 do
+  begin
+    j := i + 5;
+    s := s + v[j] + m[i mod 5]
+  end;
+  for i := 1 to 3 do
+  begin
+    muda;
+    s := s + v[i]
+  end;
+  writeln(v[1], ' ', v[5], ' ', v[10], ' ', m[4], ' ', s)
+end.
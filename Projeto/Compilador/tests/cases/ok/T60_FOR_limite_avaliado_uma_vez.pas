@@ -0,0 +1,28 @@
+program T60;
+var n, i, calls, s: integer;
+    txt: string;
+
+function limite(k: integer): integer;
+begin
+  calls := calls + 1;
+  limite := k
+end;
+
+function soma(m: integer): integer;
+var j, acc: integer;
+begin
+  acc := 0;
+  for j := 1 to m * 2 do acc := acc + j;
+  soma := acc
+end;
+
+begin
+  calls := 0;
+  s := 0;
+  for i := 1 to limite(4) do s := s + i;
+  n := 3;
+  for i := 1 to n do n := n + 1;
+  txt := 'abc';
+  for i := length(txt) downto 1 do writeln(txt[i]);
+  writeln(s, ' ', calls, ' ', n, ' ', soma(3))
+end.
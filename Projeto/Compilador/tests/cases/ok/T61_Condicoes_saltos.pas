@@ -0,0 +1,46 @@
+program T61;
+var i, n, calls, s: integer;
+    c: char;
+    b, fim: boolean;
+    x: real;
+    txt: string;
+
+function conta(v: boolean): boolean;
+begin
+  calls := calls + 1;
+  conta := v
+end;
+
+begin
+  calls := 0;
+  n := 0;
+  b := false;
+  if (n = 0) or conta(true) then writeln('a');
+  if (n <> 0) and conta(true) then writeln('X') else writeln('b');
+  if not ((n > 1) or (n < -1)) then writeln('c');
+  if not (n = 0) or conta(false) then writeln('X') else writeln('d');
+  if (n = 0) and not b and (calls = 1) then writeln('e');
+  if b = false then writeln('f');
+  if 0 <> n then writeln('X');
+  writeln(calls);
+
+  c := 'q';
+  x := 2.5;
+  txt := 'abc';
+  if (c <> 'q') or (x <> 2.5) or (txt <> 'abc') then writeln('X')
+  else if (c = 'q') and (x = 2.5) and (txt = 'abc') and (x > 2) then writeln('iguais');
+
+  s := 0;
+  i := 0;
+  while (i < 10) and not ((i > 3) and (i mod 2 = 0) and (i > 6)) do
+  begin
+    s := s + i;
+    i := i + 1
+  end;
+  fim := false;
+  repeat
+    i := i - 1;
+    fim := (i = 2) or (i < 0)
+  until fim and (i mod 2 = 0) or (i < -5);
+  writeln(s, ' ', i)
+end.
@@ -0,0 +1,19 @@
+program T62;
+var v: array[1..5] of integer;
+    i, n: integer;
+    c: char;
+    s: string;
+    r: real;
+begin
+  for i := 1 to 5 do v[i] := i * 10;
+  n := ord('c') - ord('a') + abs(-1);
+  c := chr(ord('A') + 2);
+  s := concat('ab', 'cd');
+  writeln(n, ' ', c, ' ', s, ' ', length('hello'), ' ', length(concat('ab', 'cd')));
+  writeln(odd(7), ' ', odd(-4), ' ', abs(-3), ' ', abs(-2.5));
+  writeln(trunc(2.7), ' ', trunc(-2.7), ' ', round(2.5), ' ', round(-2.5), ' ', round(2.4));
+  writeln(v[ord('d') - ord('a')], ' ', v[length('abcde')], ' ', v[round(1.6) + abs(-1)]);
+  if odd(3) and (length('xy') = 2) then writeln('ramo constante');
+  r := -2.5;
+  writeln(round(r), ' ', trunc(r), ' ', abs(r))
+end.
@@ -0,0 +1,27 @@
+program T63;
+var a, b, i, s: integer;
+    x, y: real;
+
+function dist(p, q: integer): integer;
+begin
+  dist := abs(p - q)
+end;
+
+procedure mostra(v: real);
+begin
+  writeln(round(v * 1.5))
+end;
+
+begin
+  a := -7;
+  b := 3;
+  x := -2.5;
+  y := 2.5;
+  writeln(abs(a), ' ', abs(b), ' ', dist(a, b), ' ', abs(a * b));
+  writeln(round(x), ' ', round(y), ' ', round(x * 1.1), ' ', round(y / 2), ' ', round(x + y));
+  s := 0;
+  for i := -3 to 3 do
+    s := s + abs(i) + round(i * 0.6);
+  writeln(s);
+  mostra(x)
+end.
@@ -0,0 +1,52 @@
+program T64;
+var usado, lixo, soDebug: integer;
+    tabela: array[1..100] of integer;
+    v: array[1..3] of integer;
+    i: integer;
+
+function par(n: integer): boolean;
+begin
+  par := (n mod 2) = 0
+end;
+
+procedure morta(n: integer);
+begin
+  if n > 0 then morta(n - 1) else lixo := n
+end;
+
+procedure chamaMorta();
+begin
+  morta(3)
+end;
+
+procedure debug();
+var k: integer;
+begin
+  for k := 1 to 100 do tabela[k] := soDebug
+end;
+
+function dobro(x: integer): integer;
+var tmp, naoUsada: integer;
+    aux: array[1..10] of integer;
+
+  function interna(y: integer): integer;
+  begin
+    interna := y + 1
+  end;
+
+begin
+  tmp := x * 2;
+  dobro := tmp
+end;
+
+function triplo(x: integer): integer;
+begin
+  triplo := x * 3
+end;
+
+begin
+  usado := dobro(5);
+  if false then debug();
+  for i := 1 to 3 do v[i] := triplo(i);
+  writeln(usado, ' ', v[1] + v[2] + v[3], ' ', par(4))
+end.
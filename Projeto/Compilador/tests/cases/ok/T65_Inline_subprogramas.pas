@@ -0,0 +1,61 @@
+program T65;
+var i, total, contador: integer;
+    media: real;
+
+function quadrado(x: integer): integer;
+begin
+  quadrado := x * x
+end;
+
+function maior(a, b: integer): integer;
+begin
+  if a > b then maior := a else maior := b
+end;
+
+function metade(x: real): real;
+begin
+  metade := x / 2
+end;
+
+procedure conta(passo: integer);
+begin
+  contador := contador + passo
+end;
+
+function somaAte(n: integer): integer;
+var k, s: integer;
+begin
+  for k := 1 to n do s := s + k;
+  somaAte := s
+end;
+
+function distancia(a, b: integer): integer;
+begin
+  distancia := maior(a, b) - maior(b, a) + maior(a - b, b - a)
+end;
+
+function polinomio(x: integer): integer;
+var t: integer;
+begin
+  t := x * x * x;
+  t := t - 2 * x * x;
+  t := t + 3 * x;
+  t := t - 4;
+  if t < 0 then t := -t;
+  polinomio := t + x div 2 + x mod 3
+end;
+
+begin
+  total := 0;
+  contador := 0;
+  for i := 1 to 10 do
+  begin
+    total := total + quadrado(i) + maior(i, 5);
+    conta(2)
+  end;
+  writeln(total, ' ', contador);
+  writeln(quadrado(maior(3, quadrado(2))));
+  writeln(somaAte(4), ' ', somaAte(3));
+  media := metade(7);
+  writeln(media, ' ', distancia(2, 9), ' ', polinomio(5))
+end.
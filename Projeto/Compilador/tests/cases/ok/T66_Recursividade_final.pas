@@ -0,0 +1,55 @@
+program T66;
+var i, total: integer;
+
+function fat(n: integer): integer;
+begin
+  if n <= 1 then fat := 1 else fat := n * fat(n - 1)
+end;
+
+function soma(n: integer): integer;
+begin
+  if n = 0 then soma := 0 else soma := soma(n - 1) + n
+end;
+
+function mdc(a, b: integer): integer;
+begin
+  if b = 0 then mdc := a else mdc := mdc(b, a mod b)
+end;
+
+function passos(n: integer): integer;
+begin
+  if n = 1 then passos := 0
+  else if n mod 2 = 0 then passos := 1 + passos(n div 2)
+  else passos := passos(3 * n + 1) + 1
+end;
+
+function fib(n: integer): integer;
+begin
+  if n < 2 then fib := n else fib := fib(n - 1) + fib(n - 2)
+end;
+
+function pesada(n: integer): integer;
+begin
+  if n = 0 then pesada := 0 else pesada := pesada(n - 1) + total
+end;
+
+procedure acumula(n: integer);
+var marca: integer;
+begin
+  marca := marca + n;
+  if n > 0 then
+  begin
+    total := total + marca;
+    acumula(n - 1)
+  end
+end;
+
+begin
+  writeln(fat(10), ' ', soma(1000), ' ', mdc(1071, 462));
+  total := 0;
+  for i := 1 to 30 do total := total + passos(i);
+  writeln(total, ' ', fib(15));
+  total := 0;
+  acumula(100);
+  writeln(total, ' ', pesada(3))
+end.
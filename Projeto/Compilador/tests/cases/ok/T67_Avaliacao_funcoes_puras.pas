@@ -0,0 +1,77 @@
+program T67;
+var contador, x: integer;
+    media: real;
+
+function fat(n: integer): integer;
+var i, r: integer;
+begin
+  r := 1;
+  for i := 2 to n do r := r * i;
+  fat := r
+end;
+
+function somaQuadrados(n: integer): integer;
+var v: array[1..10] of integer;
+    i, s: integer;
+begin
+  for i := 1 to n do v[i] := i * i;
+  s := 0;
+  for i := 1 to n do s := s + v[i];
+  somaQuadrados := s
+end;
+
+function comb(n, k: integer): integer;
+begin
+  comb := fat(n) div (fat(k) * fat(n - k))
+end;
+
+function ehPrimo(n: integer): boolean;
+var d: integer;
+begin
+  ehPrimo := n >= 2;
+  d := 2;
+  while d * d <= n do
+  begin
+    if n mod d = 0 then ehPrimo := false;
+    d := d + 1
+  end
+end;
+
+function maiuscula(c: char): char;
+begin
+  if (ord(c) >= ord('a')) and (ord(c) <= ord('z')) then maiuscula := chr(ord(c) - 32)
+  else maiuscula := c
+end;
+
+function metade(x: real): real;
+begin
+  metade := x / 2
+end;
+
+function conta(n: integer): integer;
+begin
+  contador := contador + 1;
+  conta := n + 1
+end;
+
+function nuncaTermina(n: integer): integer;
+begin
+  while n > 0 do n := n + 1;
+  nuncaTermina := n
+end;
+
+function inverso(n: integer): integer;
+begin
+  inverso := 100 div n
+end;
+
+begin
+  contador := 0;
+  writeln(fat(10), ' ', somaQuadrados(10), ' ', comb(10, 3));
+  writeln(ehPrimo(97), ' ', ehPrimo(91), ' ', maiuscula('q'));
+  media := metade(7);
+  writeln(media, ' ', conta(1), ' ', contador);
+  if comb(5, 2) = 10 then writeln('dobrado');
+  readln(x);
+  if x < 0 then writeln(nuncaTermina(1), ' ', inverso(0))
+end.
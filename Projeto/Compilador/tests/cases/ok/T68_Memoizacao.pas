@@ -0,0 +1,30 @@
+program T68;
+var n, k, chamadas: integer;
+
+function fib(n: integer): integer;
+begin
+  if n < 2 then fib := n
+  else fib := fib(n - 1) + fib(n - 2)
+end;
+
+function comb(n, k: integer): integer;
+begin
+  if (k = 0) or (k = n) then comb := 1
+  else comb := comb(n - 1, k - 1) + comb(n - 1, k)
+end;
+
+function contaFib(n: integer): integer;
+begin
+  chamadas := chamadas + 1;
+  if n < 2 then contaFib := n
+  else contaFib := contaFib(n - 1) + contaFib(n - 2)
+end;
+
+begin
+  readln(n);
+  readln(k);
+  writeln(fib(n), ' ', fib(n - 1), ' ', fib(-3));
+  writeln(comb(n, k), ' ', comb(70, 2), ' ', comb(n + 50, 3));
+  chamadas := 0;
+  writeln(contaFib(k + 5), ' ', chamadas)
+end.
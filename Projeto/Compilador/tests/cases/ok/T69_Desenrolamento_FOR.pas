@@ -0,0 +1,49 @@
+program T69;
+var v: array[1..5] of integer;
+    m: array[1..9] of integer;
+    i, j, s: integer;
+
+procedure mostra();
+begin
+  writeln('i = ', i)
+end;
+
+procedure escreve(x: integer);
+begin
+  writeln(x)
+end;
+
+procedure pares();
+var k: integer;
+begin
+  for k := 1 to 3 do escreve(2 * k)
+end;
+
+begin
+  for i := 1 to 5 do v[abs(i - 3) + 1] := i * 10;
+  writeln(v[1], ' ', v[2], ' ', v[3], ' ', v[4], ' ', v[5], ' ', i);
+
+  s := 0;
+  for i := 1 to 30 do s := s + i * i;
+  writeln(s, ' ', i);
+
+  s := 0;
+  for i := 50 downto 1 do
+    if i mod 7 = 0 then s := s * 2 + i;
+  writeln(s, ' ', i);
+
+  for i := 1 to 3 do
+    for j := 1 to 3 do m[(i - 1) * 3 + j] := i * j;
+  writeln(m[1], m[5], m[9], ' ', i, ' ', j);
+
+  for i := 1 to 7 do
+    if i <= 5 then v[i] := i;
+  writeln(v[1] + v[5]);
+
+  s := 0;
+  for i := 1 to 100 do s := s + abs(i * 3 - 150);
+  writeln(s);
+
+  for i := 1 to 2 do mostra;
+  pares()
+end.
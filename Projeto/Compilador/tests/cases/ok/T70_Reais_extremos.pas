@@ -0,0 +1,20 @@
+program T70;
+var i: integer;
+    r, p: real;
+
+begin
+  r := 1.0;
+  for i := 1 to 400 do
+    r := r * 10.0;
+  writeln(r);
+  writeln(-r);
+  writeln(r - r);
+  p := 1.0;
+  for i := 1 to 7 do
+    p := p / 10.0;
+  writeln(p);
+  writeln(p * 150.0);
+  writeln(1.5e-7);
+  writeln(1.0e21, ' ', 1.0e20);
+  writeln(0.5, ' ', -2.25)
+end.
@@ -11,17 +11,41 @@ from pathlib import Path
 # Definição de caminhos base do projeto
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "bench"))
 
+import argparse
+import contextlib
+import io
 import json
-from src.compiler import compile_source
+import re
+import socket
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+from src.compiler import compile_source, analyze, generate as generate_code
+from src.codegen import serialize
+from src.cache import CompileCache
+from src.vm import run_text, assemble, VMError
+from src.stats import CompileStats
+from src.context import CompilerOptions
+from src import pascal_analex, fastlex, parser, parsetab, tables
+from progen import GenParams, generate
 
 
 TESTS_DIR = ROOT / "tests"
 OK_DIR = TESTS_DIR / "cases" / "ok" # Ficheiros .pas que devem compilar
 ERR_DIR = TESTS_DIR / "cases" / "error" # Ficheiros .pas que devem gerar erro
 MANIFEST = TESTS_DIR / "manifests" / "error_cases.json" # Lista de erros esperados
+INPUTS_DIR = TESTS_DIR / "inputs" # Input (stdin) dos programas executados na VM
+EXPECTED_DIR = TESTS_DIR / "expected" # Output esperado da execução na VM
 OUT_VM = ROOT / "out_vm" # Destino dos ficheiros .vm gerados
 
+# Cache de compilação opcional (ativada com --cache-dir)
+CACHE = None
+
 
 def read_text(path: Path) -> str:
     """
@@ -79,10 +103,16 @@ def run_ok_cases() -> tuple[int, int]:
         src = read_text(f)
 
         try:
-            vm_code = compile_source(src)  # deve devolver string com VM
+            report = {}
+            vm_code = compile_source(src, report=report, cache=CACHE)  # deve devolver string com VM
             out_path = OUT_VM / (f.stem + ".vm")
             write_text(out_path, vm_code)
-            print(f"OK: {name}  ->  [VM guardada em out_vm/{out_path.name}]")
+            peep = report.get("peephole")
+            saved = f"  (peephole: -{peep['removed']} instr.)" if peep else ""
+            bounds = report.get("bounds")
+            if bounds and bounds["removed"]:
+                saved += f"  (bounds: -{bounds['removed']} CHECK)"
+            print(f"OK: {name}  ->  [VM guardada em out_vm/{out_path.name}]{saved}")
             passed += 1
         except Exception as e:
             print(f"FAIL: {name}  ->  erro inesperado: {e}")
@@ -118,7 +148,7 @@ def run_error_cases() -> tuple[int, int]:
             continue
 
         try:
-            compile_source(src)
+            compile_source(src, cache=CACHE)
             print(f"FAIL: {name}  ->  era esperado erro, mas compilou OK")
             failed += 1
         except Exception as e:
@@ -136,12 +166,644 @@ def run_error_cases() -> tuple[int, int]:
     return passed, failed
 
 
+def _compile_outcome(src: str, cache=None) -> str:
+    """Resultado de uma compilação: o código VM ou a mensagem de erro."""
+    try:
+        return "OK\n" + compile_source(src, cache=cache)
+    except Exception as e:
+        return f"ERRO {type(e).__name__}: {e}"
+
+
+def _warned_outcome(src: str, cache=None) -> tuple[str, list]:
+    """_compile_outcome e os avisos da compilação (recolhidos na sua própria lista)."""
+    messages = []
+    try:
+        return "OK\n" + compile_source(src, cache=cache, messages=messages), messages
+    except Exception as e:
+        return f"ERRO {type(e).__name__}: {e}", messages
+
+
+def run_concurrency_check(threads: int = 8, rounds: int = 4) -> tuple[int, int]:
+    """
+    Verifica a reentrância do compilador.
+    Compila todos os casos (ok e error) em simultâneo num pool de threads,
+    várias vezes, e compara cada resultado com a compilação sequencial.
+    Qualquer estado global partilhado entre compilações faria divergir o output.
+    Repete com uma CompileCache partilhada e fontes com caracteres ilegais:
+    cada compilação (hit ou miss) tem de devolver os seus próprios avisos, sem
+    mexer no sys.stdout do processo.
+    """
+    files = sorted(OK_DIR.glob("*.pas")) + sorted(ERR_DIR.glob("*.pas"))
+    sources = [read_text(f) for f in files]
+    expected = [_compile_outcome(s) for s in sources]
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        got = list(pool.map(_compile_outcome, sources * rounds))
+
+    failed = 0
+    for k, outcome in enumerate(got):
+        idx = k % len(files)
+        if outcome != expected[idx]:
+            print(f"FAIL: {files[idx].name}  ->  resultado diferente em compilação concorrente")
+            failed += 1
+
+    # um '#' ilegal numa linha diferente em cada fonte
+    names = [f.name for f in files] + [f"ilegal{k}" for k in range(50)]
+    sources += [f"program p{k};\nbegin\n{chr(10) * k}  writeln({k}) #\nend.\n" for k in range(50)]
+    expected = [_warned_outcome(s) for s in sources]
+    real_stdout = sys.stdout
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CompileCache(tmp)
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            got = list(pool.map(lambda s: _warned_outcome(s, cache), sources * rounds))
+    for k, outcome in enumerate(got):
+        idx = k % len(sources)
+        if outcome != expected[idx]:
+            print(f"FAIL: {names[idx]}  ->  resultado ou avisos diferentes em compilação concorrente com cache")
+            failed += 1
+    if sys.stdout is not real_stdout:
+        sys.stdout = real_stdout
+        print("FAIL: sys.stdout substituído por compilações concorrentes com cache")
+        failed += 1
+
+    if failed == 0:
+        print(f"OK: {len(files) * rounds} compilações concorrentes ({threads} threads) e "
+              f"{len(got)} com cache iguais às sequenciais")
+        return 1, 0
+    return 0, failed
+
+
+@dataclass
+class PassCase:
+    """
+    Caso de verificação de uma otimização: o programa 'name' (tests/cases/ok,
+    com o input de tests/inputs se existir) é compilado com cada entrada de
+    'runs' (etiqueta -> CompilerOptions; a primeira é a referência) e executado
+    na VM. Todas as compilações têm de dar o mesmo output que a referência e,
+    com 'measure' ("steps": instr. executadas, "size": instr. estáticas, None:
+    nada), as restantes, multiplicadas por 'factor', menos que a referência.
+    'check' recebe as execuções (etiqueta -> PassRun) e devolve a descrição do
+    OK, ou levanta AssertionError com a do FAIL.
+    """
+    name: str
+    runs: dict
+    check: Callable[[dict], str]
+    measure: str | None = "steps"
+    factor: int = 1
+
+
+@dataclass
+class PassRun:
+    """Resultado de uma compilação de um PassCase: relatório, código, output, instr. executadas e estáticas."""
+    report: dict
+    code: str
+    out: str
+    steps: int
+    size: int
+
+
+MEASURE_UNITS = {"steps": "instr. executadas", "size": "instruções"}
+
+
+def run_pass_check(case: PassCase) -> tuple[int, int]:
+    """
+    Executa um PassCase: compila e corre o programa com cada entrada de
+    case.runs e verifica o output, a medida e as asserções próprias do caso.
+    """
+    src = read_text(OK_DIR / case.name)
+    inp_path = INPUTS_DIR / f"{Path(case.name).stem}.in"
+    inp = read_text(inp_path) if inp_path.exists() else ""
+    runs = {}
+    for label, options in case.runs.items():
+        report = {}
+        code = compile_source(src, options, report=report)
+        out, steps = run_text(code, inp)
+        runs[label] = PassRun(report, code, out, steps, len(assemble(code)))
+    (ref_label, ref), *rest = runs.items()
+    for label, run in rest:
+        if run.out != ref.out:
+            print(f"FAIL: {case.name}  ->  output '{label}' {run.out!r} != '{ref_label}' {ref.out!r}")
+            return 0, 1
+        if case.measure and not getattr(run, case.measure) * case.factor < getattr(ref, case.measure):
+            print(f"FAIL: {case.name}  ->  {getattr(run, case.measure)} {MEASURE_UNITS[case.measure]} "
+                  f"'{label}', {getattr(ref, case.measure)} '{ref_label}'")
+            return 0, 1
+    try:
+        detail = case.check(runs)
+    except AssertionError as e:
+        print(f"FAIL: {case.name}  ->  {e}")
+        return 0, 1
+    if case.measure:
+        values = [getattr(run, case.measure) for run in runs.values()]
+        unit = MEASURE_UNITS[case.measure]
+        if len(values) == 2:
+            detail += f", {values[0]} -> {values[1]} {unit}"
+        else:
+            detail += f"; {unit}: " + ", ".join(f"{label} {v}" for label, v in zip(runs, values))
+    print(f"OK: {case.name}  ->  {detail}, output igual")
+    return 1, 0
+
+
+def expect(got, expected, what: str) -> None:
+    """Asserção dos PassCase: falha com 'what' e os dois valores se forem diferentes."""
+    if got != expected:
+        raise AssertionError(f"{what} {got!r}, esperado {expected!r}")
+
+
+def check_bounds(runs: dict) -> str:
+    # Em T59 ficam dois CHECK: um índice que é uma variável simples e um FOR
+    # global cujo corpo chama um procedimento.
+    bounds = runs["com"].report["bounds"]
+    expect((bounds["removed"], bounds["kept"]), (13, 2), "CHECK omitidos/mantidos")
+    return "13 CHECK omitidos, 2 mantidos"
+
+
+def check_runtime(runs: dict) -> str:
+    # T63 não usa abs de reais; em 'inline' nenhuma rotina é ligada. Em 'call',
+    # nem as chamadas das expansões inline de dist e mostra ficam expandidas.
+    expect(set(runs["call"].report["runtime"]), {"round", "abs_i"}, "rotinas ligadas (call)")
+    expect(runs["inline"].report["runtime"], [], "rotinas ligadas (inline)")
+    expect(sorted(e["name"] for e in runs["call"].report["inline"] if e["inlined"]), ["dist", "mostra"],
+           "expandidos inline (call)")
+    expect(re.findall(r"(?m)^(?:ROUNDPOS|ABSIOK|ABSFOK)\d+:", runs["call"].code), [],
+           "round/abs expandidos inline (call)")
+    return "rotinas ['abs_i', 'round']"
+
+
+def check_prune(runs: dict) -> str:
+    # Subprogramas: debug, morta (recursiva), chamaMorta e interna (aninhada);
+    # variáveis: lixo, soDebug, tabela, naoUsada e aux.
+    pruned = runs["com"].report["pruned"]
+    expect((pruned["subprograms"], pruned["variables"]), (4, 5), "removidos (subprogramas, variáveis)")
+    return "4 subprogramas e 5 variáveis removidos"
+
+
+def check_inline(runs: dict) -> str:
+    # subprograma -> (expandido, nº de chamadas expandidas)
+    expected = {
+        "quadrado": (True, 3), "maior": (True, 5), "metade": (True, 1), "conta": (True, 1),
+        "somaAte": (True, 2), "distancia": (False, 0), "polinomio": (False, 0),
+    }
+    expect({e["name"]: (e["inlined"], e["sites"]) for e in runs["com"].report["inline"]}, expected, "decisões")
+    return f"{sum(s for _i, s in expected.values())} chamadas expandidas"
+
+
+def check_tailrec(runs: dict) -> str:
+    # fib (recursividade em árvore) e pesada (lê uma global na parcela) ficam de fora.
+    expected = ["fat", "soma", "mdc", "passos", "acumula"]
+    expect(runs["com"].report["tailrec"], expected, "transformados")
+    return f"{len(expected)} subprogramas em ciclo"
+
+
+def check_consteval(runs: dict) -> str:
+    # As chamadas impuras, as que dividem por zero e as que não terminam ficam para a execução.
+    expect(runs["com"].report["evaluated"], 8, "chamadas avaliadas")
+    return "8 chamadas avaliadas"
+
+
+def check_memo(runs: dict) -> str:
+    # A função impura fica de fora; as memorizadas não passam por tailrec.py.
+    expect(runs["com"].report["memoized"], ["fib", "comb"], "memorizadas")
+    if runs["com"].code != runs["sem tailrec"].code:
+        raise AssertionError("código memorizado diferente com --no-tailrec")
+    return "fib, comb memorizadas"
+
+
+def check_unroll(runs: dict) -> str:
+    # Chamadas a 'escreve' expandidas inline: uma por cópia do corpo de um FOR
+    # desenrolado; o abs no bloco desenrolado continua inline. Ficam menos CHECK
+    # (os índices que passam a constantes).
+    for label, run in runs.items():
+        sites = {e["name"]: e["sites"] for e in run.report["inline"]}.get("escreve")
+        expect(sites, 1 if label == "sem" else 3, f"chamadas a 'escreve' expandidas inline ('{label}')")
+        expect(run.report["runtime"], [], f"rotinas ligadas ('{label}')")
+    kept = (runs["sem"].report["bounds"]["kept"], runs["parcial"].report["bounds"]["kept"])
+    expect(kept, (2, 1), "CHECK mantidos sem/com desenrolamento")
+    return "CHECK mantidos 2 -> 1"
+
+
+# Verificações das otimizações: (título da secção, etiqueta no resumo, caso)
+PASS_CHECKS = [
+    ("BOUNDS CHECKS (eliminação)", "Bounds", PassCase(
+        "T59_Bounds_check_FOR.pas",
+        {"sem": CompilerOptions(check_elim=False, unroll_budget=0), "com": CompilerOptions(unroll_budget=0)},
+        check_bounds, measure=None)),
+    ("ROTINAS DE SUPORTE (round/abs)", "Runtime", PassCase(
+        "T63_Rotinas_builtins.pas",
+        {mode: CompilerOptions(builtins=mode) for mode in ("inline", "call", "auto")},
+        check_runtime, measure="size")),
+    # Sem inlining nem avaliação em compilação, que também tornam subprogramas não usados.
+    ("CÓDIGO NÃO USADO (eliminação)", "Não usado", PassCase(
+        "T64_Codigo_nao_usado.pas",
+        {"sem": CompilerOptions(prune=False, inline_budget=0, eval_fuel=0),
+         "com": CompilerOptions(inline_budget=0, eval_fuel=0)},
+        check_prune, measure="size")),
+    ("INLINING (subprogramas folha)", "Inlining", PassCase(
+        "T65_Inline_subprogramas.pas",
+        {"sem": CompilerOptions(eval_fuel=0, inline_budget=0), "com": CompilerOptions(eval_fuel=0)},
+        check_inline)),
+    ("RECURSIVIDADE FINAL (ciclos)", "Rec. final", PassCase(
+        "T66_Recursividade_final.pas",
+        {"sem": CompilerOptions(eval_fuel=0, tailrec=False), "com": CompilerOptions(eval_fuel=0)},
+        check_tailrec)),
+    ("FUNÇÕES PURAS (avaliação em compilação)", "Avaliação", PassCase(
+        "T67_Avaliacao_funcoes_puras.pas",
+        {"sem": CompilerOptions(eval_fuel=0), "com": CompilerOptions()},
+        check_consteval)),
+    # Inclui chamadas fora do domínio da tabela.
+    ("MEMOIZAÇÃO (funções recursivas puras)", "Memoização", PassCase(
+        "T68_Memoizacao.pas",
+        {"sem": CompilerOptions(), "com": CompilerOptions(memoize=True),
+         "sem tailrec": CompilerOptions(memoize=True, tailrec=False)},
+        check_memo, factor=10)),
+    ("DESENROLAMENTO DE FOR (limites constantes)", "Desenrolar", PassCase(
+        "T69_Desenrolamento_FOR.pas",
+        {"sem": CompilerOptions(unroll_budget=0), "total": CompilerOptions(unroll_factor=0),
+         "parcial": CompilerOptions(), "fator 8": CompilerOptions(unroll_factor=8, unroll_budget=128)},
+        check_unroll)),
+]
+
+
+def _analyze_outcome(prog) -> str:
+    """Análise + geração de código (sem peephole) de uma AST, no formato de _compile_outcome."""
+    try:
+        return "OK\n" + serialize(generate_code(prog, analyze(prog)))
+    except Exception as e:
+        return f"ERRO {type(e).__name__}: {e}"
+
+
+def run_ast_check() -> tuple[int, int]:
+    """
+    Verifica que a AST é reutilizável: cada caso (ok e error) é parsed uma vez
+    e analisado + gerado duas vezes sobre a mesma árvore; ambos os resultados
+    têm de ser iguais à compilação direta (sem peephole).
+    """
+    options = CompilerOptions(peephole=False)
+    failed = 0
+    files = sorted(OK_DIR.glob("*.pas")) + sorted(ERR_DIR.glob("*.pas"))
+    for f in files:
+        source = read_text(f)
+        try:
+            expected = "OK\n" + compile_source(source, options)
+        except Exception as e:
+            expected = f"ERRO {type(e).__name__}: {e}"
+        try:
+            prog = parser.parse_program(source)
+        except Exception as e:
+            got = [f"ERRO {type(e).__name__}: {e}"] * 2
+        else:
+            got = [_analyze_outcome(prog), _analyze_outcome(prog)]
+        if got[0] != expected or got[1] != expected:
+            print(f"FAIL: {f.name}  ->  análise da AST diferente da compilação direta")
+            failed += 1
+
+    if failed == 0:
+        print(f"OK: {len(files)} ASTs analisadas duas vezes, iguais à compilação direta")
+        return 1, 0
+    return 0, failed
+
+
+def run_exec_cases() -> tuple[int, int]:
+    """
+    Executa na VM local os casos OK que têm output esperado (tests/expected/<nome>.out),
+    com o input de tests/inputs/<nome>.in (se existir), e compara o output.
+    """
+    passed = 0
+    failed = 0
+    for exp in sorted(EXPECTED_DIR.glob("*.out")):
+        name = exp.stem
+        inp = INPUTS_DIR / f"{name}.in"
+        try:
+            vm_code = compile_source(read_text(OK_DIR / f"{name}.pas"), cache=CACHE)
+            output, steps = run_text(vm_code, read_text(inp) if inp.exists() else "", max_steps=10_000_000)
+        except Exception as e:
+            print(f"FAIL: {name}  ->  {type(e).__name__}: {e}")
+            failed += 1
+            continue
+        if output == read_text(exp).replace("\r\n", "\n"):
+            print(f"OK: {name}  ({steps} instr. executadas)")
+            passed += 1
+        else:
+            print(f"FAIL: {name}  ->  output diferente do esperado")
+            print(f"   esperado: {read_text(exp)!r}")
+            print(f"   obtido  : {output!r}")
+            failed += 1
+
+    # max_steps é o nº máximo de instruções executadas (inclusivo), 0 não é "sem limite"
+    vm_code = "START\nPUSHI 1\nWRITEI\nSTOP\n"
+    _out, steps = run_text(vm_code)
+    outcomes = []
+    for limit in (steps, steps - 1, 0):
+        try:
+            run_text(vm_code, max_steps=limit)
+            outcomes.append(True)
+        except VMError:
+            outcomes.append(False)
+    if outcomes == [True, False, False]:
+        print(f"OK: limite de instruções ({steps} executadas com max_steps={steps})")
+        passed += 1
+    else:
+        print(f"FAIL: limite de instruções -> execução com max_steps={steps}, {steps - 1}, 0: {outcomes}")
+        failed += 1
+    return passed, failed
+
+
+def run_generated_check(seeds=range(1, 6)) -> tuple[int, int]:
+    """
+    Teste diferencial com programas sintéticos (bench/progen.py): cada programa
+    é compilado com e sem otimizações e executado na VM; os outputs têm de coincidir.
+    """
+    reference = CompilerOptions(peephole=False, check_elim=False)
+    passed = 0
+    failed = 0
+    for seed in seeds:
+        params = GenParams(statements=60, expr_depth=3, subprograms=3, array_size=8, nesting=3, seed=seed)
+        src = generate(params)
+        try:
+            ref, ref_steps = run_text(compile_source(src, reference))
+            out, steps = run_text(compile_source(src))
+        except Exception as e:
+            print(f"FAIL: seed={seed}  ->  {type(e).__name__}: {e}")
+            failed += 1
+            continue
+        if out == ref:
+            print(f"OK: seed={seed}  ({ref_steps} -> {steps} instr. executadas)")
+            passed += 1
+        else:
+            print(f"FAIL: seed={seed}  ->  output otimizado {out!r} != {ref!r}")
+            failed += 1
+    return passed, failed
+
+
+# Fonte com os casos-limite do lexer: comentários multi-linha, maiúsculas,
+# reais/intervalos, strings com '' e caracteres ilegais (reportados e ignorados).
+LEXER_EDGE_SOURCE = (
+    "Program X; { comentário\n em 2 linhas }\n"
+    "VAR a_1, B: Integer; r: real;\t(* outro\n\n comentário *)\n"
+    "BEGIN a_1 := 12; r := 1.5e3 + 2E-2 + 3.25; B := 1..5;\n"
+    "  writeln('it''s', '', 'x'); a_1 := a_1 <= 3 <> 4 >= 5 # 6 ? 7;\n"
+    "  if not (a_1 = 1) then r := 10 / 4 ~\n"
+    "END.   \t"
+)
+
+
+def _token_stream(lexer_base, src: str):
+    """Lista de (tipo, valor, linha, posição) e o texto impresso pelo lexer."""
+    lex = lexer_base.clone()
+    lex.lineno = 1
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        lex.input(src)
+        toks = [(t.type, t.value, t.lineno, t.lexpos) for t in iter(lex.token, None)]
+    return toks, out.getvalue()
+
+
+def run_lexer_check() -> tuple[int, int]:
+    """
+    Equivalência entre o lexer rápido (fastlex.py) e o PLY (pascal_analex.py):
+    a sequência de tokens (tipo, valor, linha, posição) e as mensagens de
+    caracteres ilegais têm de ser idênticas.
+    """
+    sources = [(f.name, read_text(f)) for f in sorted(OK_DIR.glob("*.pas")) + sorted(ERR_DIR.glob("*.pas"))]
+    sources += [(f"gerado seed={s}", generate(GenParams(statements=200, seed=s))) for s in (1, 2)]
+    sources.append(("casos-limite", LEXER_EDGE_SOURCE))
+
+    failed = 0
+    n_tokens = 0
+    for name, src in sources:
+        expected = _token_stream(pascal_analex.lexer, src)
+        got = _token_stream(fastlex.lexer, src)
+        n_tokens += len(expected[0])
+        if got != expected:
+            diff = next((k for k, (a, b) in enumerate(zip(got[0], expected[0])) if a != b), None)
+            detail = f"token {diff}: {got[0][diff]} != {expected[0][diff]}" if diff is not None else "fim/mensagens diferentes"
+            print(f"FAIL: {name}  ->  {detail}")
+            failed += 1
+    if failed == 0:
+        print(f"OK: {len(sources)} fontes, {n_tokens} tokens idênticos aos do PLY")
+        return 1, 0
+    return 0, failed
+
+
+def run_stats_check() -> tuple[int, int]:
+    """
+    Verifica a instrumentação (CompileStats): compilar com estatísticas tem de
+    dar o mesmo código, e as contagens têm de ser coerentes com o output.
+    """
+    failed = 0
+    for f in sorted(OK_DIR.glob("*.pas")):
+        src = read_text(f)
+        stats = CompileStats()
+        vm_code = compile_source(src, stats=stats)
+        n_instr = sum(1 for line in vm_code.splitlines() if line and not line.endswith(":"))
+        problems = []
+        if vm_code != compile_source(src):
+            problems.append("código diferente com estatísticas")
+        if stats.instructions != n_instr:
+            problems.append(f"instruções {stats.instructions} != {n_instr}")
+        if stats.tokens <= 0 or stats.total_reductions <= 0 or stats.peak_memory <= 0:
+            problems.append("contagens vazias")
+        if stats.lex_time + stats.action_time > stats.parse_time:
+            problems.append("tempos incoerentes")
+        if problems:
+            print(f"FAIL: {f.name}  ->  {'; '.join(problems)}")
+            failed += 1
+    if failed == 0:
+        print("OK: estatísticas coerentes em todos os casos OK")
+        return 1, 0
+    return 0, failed
+
+
+def run_cache_check() -> tuple[int, int]:
+    """
+    Verifica a cache de compilação numa diretoria temporária.
+    Compila todos os casos duas vezes: a segunda passagem tem de ser servida
+    inteiramente pela cache (incluindo os erros) e dar o mesmo resultado.
+    Com um limite de 1 byte, a evicção LRU deve deixar apenas a última entrada.
+    Os avisos do lexer (stdout) de uma compilação são repetidos num hit.
+    """
+    files = sorted(OK_DIR.glob("*.pas")) + sorted(ERR_DIR.glob("*.pas"))
+    sources = [read_text(f) for f in files]
+    expected = [_compile_outcome(s) for s in sources]
+
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CompileCache(tmp)
+        first = [_compile_outcome(s, cache) for s in sources]
+        second = [_compile_outcome(s, cache) for s in sources]
+        for f, exp, a, b in zip(files, expected, first, second):
+            if not (exp == a == b):
+                print(f"FAIL: {f.name}  ->  resultado diferente com a cache")
+                failed += 1
+        if cache.hits != len(files) or cache.misses != len(files):
+            print(f"FAIL: esperados {len(files)} hits/misses, obtidos {cache.hits}/{cache.misses}")
+            failed += 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CompileCache(tmp)
+        printed = []
+        for _ in range(2):
+            buf = io.StringIO()
+            with contextlib.redirect_stdout(buf):
+                compile_source("program p; begin @ writeln(1) end.", cache=cache)
+            printed.append(buf.getvalue())
+        if not printed[0] or printed[0] != printed[1]:
+            print(f"FAIL: avisos do lexer com a cache {printed!r}, esperados iguais e não vazios")
+            failed += 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CompileCache(tmp, max_bytes=1)
+        for s in sources[:3]:
+            _compile_outcome(s, cache)
+        left = len(list(Path(tmp).glob("*.json")))
+        if left != 1:
+            print(f"FAIL: evicção LRU deixou {left} entradas (esperada 1)")
+            failed += 1
+
+    if failed == 0:
+        print(f"OK: {len(files)} compilações servidas pela cache, iguais às originais; evicção LRU correta")
+        return 1, 0
+    return 0, failed
+
+
+def run_tables_check() -> tuple[int, int]:
+    """
+    Verifica as tabelas LALR congeladas (parsetab_frozen.py): têm de corresponder
+    à gramática atual (a mesma assinatura que o PLY guarda em parsetab.py) e ser
+    iguais às construídas pelo yacc() do PLY.
+    """
+    problems = []
+    frozen = tables.load_frozen(parser)
+    if frozen is None:
+        problems.append("tabelas congeladas ausentes ou desatualizadas (python -m src.tables)")
+    if tables.grammar_signature(parser) != parsetab._lr_signature:
+        problems.append("assinatura da gramática diferente da do parsetab.py")
+    if frozen is not None:
+        built = tables.build(parser)
+        if frozen.action != built.action or frozen.goto != built.goto:
+            problems.append("tabelas de ação/goto diferentes das do PLY")
+        if [p.str for p in frozen.productions] != [p.str for p in built.productions]:
+            problems.append("produções diferentes das do PLY")
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if not problems:
+        print("OK: tabelas congeladas válidas e iguais às do PLY")
+        return 1, 0
+    return 0, len(problems)
+
+
+def _server_outcome(resp: dict) -> str:
+    """Resposta do servidor no mesmo formato de _compile_outcome."""
+    if resp["ok"]:
+        return "OK\n" + resp["vm"]
+    return f"ERRO {resp['error']['type']}: {resp['error']['message']}"
+
+
+def _connect_unix(path: str, timeout: float = 30):
+    """
+    Liga-se ao socket Unix 'path', repetindo até 'timeout' segundos: o ficheiro
+    é criado no bind(), antes do listen(), e até lá a ligação é recusada.
+    Devolve o socket ligado, ou None se o servidor não aceitou a tempo.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        sock = socket.socket(socket.AF_UNIX)
+        try:
+            sock.connect(path)
+            return sock
+        except (ConnectionRefusedError, FileNotFoundError):
+            sock.close()
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.05)
+
+
+# Pedidos com opções mal formadas (id -> options): um booleano num inteiro e
+# texto/null nas opções booleanas ("false" e "no" seriam verdadeiros)
+BAD_OPTIONS = {
+    "mau inteiro": {"inline_budget": True},
+    "mau booleano": {"peephole": "false", "memoize": "no", "tailrec": None},
+}
+
+
+def run_server_check() -> tuple[int, int]:
+    """
+    Verifica o modo servidor (main.py --serve): todos os casos (ok e error) são
+    enviados de uma vez em linhas JSON, pelo stdin/stdout e por um socket Unix,
+    e cada resposta (identificada pelo id) tem de ser igual à compilação direta.
+    Cada pedido de BAD_OPTIONS recebe um ProtocolError com o seu id.
+    """
+    files = sorted(OK_DIR.glob("*.pas")) + sorted(ERR_DIR.glob("*.pas"))
+    sources = [read_text(f) for f in files]
+    expected = [_compile_outcome(s) for s in sources]
+    requests = "".join(json.dumps({"id": k, "source": s}) + "\n" for k, s in enumerate(sources))
+    requests += "".join(json.dumps({"id": k, "source": sources[0], "options": o}) + "\n"
+                        for k, o in BAD_OPTIONS.items())
+    requests += json.dumps({"id": "stats", "op": "stats"}) + "\n"
+
+    failed = 0
+    transports = {}
+    proc = subprocess.run([sys.executable, str(ROOT / "main.py"), "--serve"], input=requests,
+                          capture_output=True, text=True, encoding="utf-8", timeout=120)
+    transports["stdin/stdout"] = proc.stdout
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "plc.sock")
+        server = subprocess.Popen([sys.executable, str(ROOT / "main.py"), "--serve", "--socket", path],
+                                  stderr=subprocess.DEVNULL)
+        try:
+            sock = _connect_unix(path)
+            if sock is None:
+                print(f"FAIL: o servidor não aceitou ligações em {path}")
+                failed += 1
+            else:
+                with sock:
+                    sock.sendall((requests + json.dumps({"op": "shutdown"}) + "\n").encode("utf-8"))
+                    chunks = []
+                    while chunk := sock.recv(65536):
+                        chunks.append(chunk)
+                transports["socket Unix"] = b"".join(chunks).decode("utf-8")
+                server.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"FAIL: comunicação com o servidor no socket Unix: {type(e).__name__}: {e}")
+            failed += 1
+        finally:
+            server.kill()
+
+    for name, output in transports.items():
+        responses = {r["id"]: r for r in map(json.loads, output.splitlines())}
+        for k, f in enumerate(files):
+            if k not in responses or _server_outcome(responses[k]) != expected[k]:
+                print(f"FAIL: {f.name}  ->  resposta diferente da compilação direta ({name})")
+                failed += 1
+        for k in BAD_OPTIONS:
+            if responses.get(k, {}).get("error", {}).get("type") != "ProtocolError":
+                print(f"FAIL: pedido '{k}' com opções inválidas sem ProtocolError com o seu id ({name})")
+                failed += 1
+        stats = responses.get("stats", {}).get("stats", {})
+        if stats.get("requests", 0) > len(files) + len(BAD_OPTIONS):
+            print(f"FAIL: estatísticas de latência incoerentes ({name})")
+            failed += 1
+
+    if failed == 0:
+        print(f"OK: {len(files)} pedidos por stdin/stdout e por socket Unix, iguais à compilação direta")
+        return 1, 0
+    return 0, failed
+
+
 def main() -> None:
     """
     Função principal que coordena a execução dos testes, realiza verificações
     de diretórios e imprime o resumo final (Passou vs Falhou).
     Se algum teste falhar, o script termina com código de saída 1 (erro).
     """
+    global CACHE
+    ap = argparse.ArgumentParser(description="Testes de regressão do compilador Pascal.")
+    ap.add_argument("--cache-dir", help="usa a cache de compilação nesta diretoria")
+    args = ap.parse_args()
+    if args.cache_dir:
+        CACHE = CompileCache(args.cache_dir)
+
     # sanity checks (mensagens úteis)
     if not OK_DIR.exists():
         raise RuntimeError(f"Diretoria inexistente: {OK_DIR}")
@@ -160,13 +822,80 @@ def main() -> None:
     print("#" * 70)
     err_pass, err_fail = run_error_cases()
 
+    print("\n" + "#" * 70)
+    print("# LEXER (fastlex vs PLY)")
+    print("#" * 70)
+    lex_pass, lex_fail = run_lexer_check()
+
+    print("\n" + "#" * 70)
+    print("# EXECUÇÃO (VM)")
+    print("#" * 70)
+    exec_pass, exec_fail = run_exec_cases()
+
+    pass_results = []
+    for title, label, case in PASS_CHECKS:
+        print("\n" + "#" * 70)
+        print(f"# {title}")
+        print("#" * 70)
+        pass_results.append((label, *run_pass_check(case)))
+
+    print("\n" + "#" * 70)
+    print("# PROGRAMAS GERADOS (diferencial)")
+    print("#" * 70)
+    gen_pass, gen_fail = run_generated_check()
+
+    print("\n" + "#" * 70)
+    print("# REENTRÂNCIA (threads)")
+    print("#" * 70)
+    conc_pass, conc_fail = run_concurrency_check()
+
+    print("\n" + "#" * 70)
+    print("# AST (reanálise)")
+    print("#" * 70)
+    ast_pass, ast_fail = run_ast_check()
+
+    print("\n" + "#" * 70)
+    print("# CACHE DE COMPILAÇÃO")
+    print("#" * 70)
+    cache_pass, cache_fail = run_cache_check()
+
+    print("\n" + "#" * 70)
+    print("# ESTATÍSTICAS (CompileStats)")
+    print("#" * 70)
+    stats_pass, stats_fail = run_stats_check()
+
+    print("\n" + "#" * 70)
+    print("# SERVIDOR (linhas JSON)")
+    print("#" * 70)
+    srv_pass, srv_fail = run_server_check()
+
+    print("\n" + "#" * 70)
+    print("# TABELAS LALR (congeladas)")
+    print("#" * 70)
+    tab_pass, tab_fail = run_tables_check()
+
     print("\n" + "#" * 70)
     print("# RESUMO")
     print("#" * 70)
     print(f"OK cases   : {ok_pass} passed, {ok_fail} failed")
     print(f"Error cases: {err_pass} passed, {err_fail} failed")
-
-    total_fail = ok_fail + err_fail
+    print(f"Lexer      : {lex_pass} passed, {lex_fail} failed")
+    print(f"Execução   : {exec_pass} passed, {exec_fail} failed")
+    for label, p, f in pass_results:
+        print(f"{label:<11}: {p} passed, {f} failed")
+    print(f"Gerados    : {gen_pass} passed, {gen_fail} failed")
+    print(f"Reentrância: {conc_pass} passed, {conc_fail} failed")
+    print(f"AST        : {ast_pass} passed, {ast_fail} failed")
+    print(f"Cache      : {cache_pass} passed, {cache_fail} failed")
+    print(f"Estatística: {stats_pass} passed, {stats_fail} failed")
+    print(f"Servidor   : {srv_pass} passed, {srv_fail} failed")
+    print(f"Tabelas    : {tab_pass} passed, {tab_fail} failed")
+    if CACHE is not None:
+        print(f"Cache (dir): {CACHE.hits} hits, {CACHE.misses} misses ({CACHE.dir})")
+
+    total_fail = ok_fail + err_fail + lex_fail + exec_fail + gen_fail + conc_fail + cache_fail + stats_fail
+    total_fail += srv_fail + tab_fail + ast_fail
+    total_fail += sum(f for _label, _p, f in pass_results)
     if total_fail > 0:
         raise SystemExit(1)
 